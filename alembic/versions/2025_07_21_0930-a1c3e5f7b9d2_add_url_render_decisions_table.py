@@ -0,0 +1,48 @@
+"""Add url_render_decisions table
+
+Revision ID: a1c3e5f7b9d2
+Revises: 9552d354ccf4
+Create Date: 2025-07-21 09:30:12.481516
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.util.alembic_helpers import id_column, url_id_column, created_at_column
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c3e5f7b9d2'
+down_revision: Union[str, None] = '9552d354ccf4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE_NAME = 'url_render_decisions'
+
+render_decision_reason_enum = sa.Enum(
+    'Static',
+    'Near Empty Body',
+    'SPA Root',
+    'Noscript Warning',
+    'High Script Ratio',
+    'Unparseable',
+    name='render_decision_reason'
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        TABLE_NAME,
+        id_column(),
+        url_id_column(),
+        sa.Column('rendered', sa.Boolean(), nullable=False),
+        sa.Column('reason', render_decision_reason_enum, nullable=False),
+        created_at_column(),
+        sa.UniqueConstraint('url_id', name='uq_url_render_decisions_url_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table(TABLE_NAME)
+    render_decision_reason_enum.drop(op.get_bind(), checkfirst=True)
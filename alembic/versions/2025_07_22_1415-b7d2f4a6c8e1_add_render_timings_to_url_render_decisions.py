@@ -0,0 +1,54 @@
+"""Add render timings to url_render_decisions
+
+Revision ID: b7d2f4a6c8e1
+Revises: a1c3e5f7b9d2
+Create Date: 2025-07-22 14:15:47.306928
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2f4a6c8e1'
+down_revision: Union[str, None] = 'a1c3e5f7b9d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE_NAME = 'url_render_decisions'
+
+PROFILE_COLUMN_NAME = 'render_profile'
+DURATION_COLUMN_NAME = 'render_duration_seconds'
+TIMED_OUT_COLUMN_NAME = 'render_timed_out'
+
+render_profile_enum = sa.Enum(
+    'Full',
+    'Lean',
+    name='render_profile'
+)
+
+
+def upgrade() -> None:
+    render_profile_enum.create(op.get_bind(), checkfirst=True)
+    # All three are null for URLs that were not rendered
+    op.add_column(
+        TABLE_NAME,
+        sa.Column(PROFILE_COLUMN_NAME, render_profile_enum, nullable=True)
+    )
+    op.add_column(
+        TABLE_NAME,
+        sa.Column(DURATION_COLUMN_NAME, sa.Float(), nullable=True)
+    )
+    op.add_column(
+        TABLE_NAME,
+        sa.Column(TIMED_OUT_COLUMN_NAME, sa.Boolean(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column(TABLE_NAME, PROFILE_COLUMN_NAME)
+    op.drop_column(TABLE_NAME, DURATION_COLUMN_NAME)
+    op.drop_column(TABLE_NAME, TIMED_OUT_COLUMN_NAME)
+    render_profile_enum.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,46 @@
+"""Add url_body_statuses table
+
+Revision ID: c4e8a1d3f5b7
+Revises: b7d2f4a6c8e1
+Create Date: 2025-07-23 10:02:31.775104
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.util.alembic_helpers import id_column, url_id_column, created_at_column
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a1d3f5b7'
+down_revision: Union[str, None] = 'b7d2f4a6c8e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE_NAME = 'url_body_statuses'
+
+response_body_status_enum = sa.Enum(
+    'Complete',
+    'Truncated',
+    'Skipped',
+    name='response_body_status'
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        TABLE_NAME,
+        id_column(),
+        url_id_column(),
+        sa.Column('status', response_body_status_enum, nullable=False),
+        sa.Column('content_type', sa.String(), nullable=True),
+        sa.Column('bytes_read', sa.Integer(), nullable=False),
+        created_at_column(),
+        sa.UniqueConstraint('url_id', name='uq_url_body_statuses_url_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table(TABLE_NAME)
+    response_body_status_enum.drop(op.get_bind(), checkfirst=True)
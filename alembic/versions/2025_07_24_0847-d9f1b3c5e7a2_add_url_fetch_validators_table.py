@@ -0,0 +1,39 @@
+"""Add url_fetch_validators table
+
+Revision ID: d9f1b3c5e7a2
+Revises: c4e8a1d3f5b7
+Create Date: 2025-07-24 08:47:05.612833
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.util.alembic_helpers import id_column, url_id_column, updated_at_column
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9f1b3c5e7a2'
+down_revision: Union[str, None] = 'c4e8a1d3f5b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE_NAME = 'url_fetch_validators'
+
+
+def upgrade() -> None:
+    op.create_table(
+        TABLE_NAME,
+        id_column(),
+        url_id_column(),
+        sa.Column('etag', sa.String(), nullable=True),
+        sa.Column('last_modified', sa.String(), nullable=True),
+        sa.Column('content_length', sa.BigInteger(), nullable=True),
+        sa.Column('content_hash', sa.String(), nullable=True),
+        updated_at_column(),
+        sa.UniqueConstraint('url_id', name='uq_url_fetch_validators_url_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table(TABLE_NAME)
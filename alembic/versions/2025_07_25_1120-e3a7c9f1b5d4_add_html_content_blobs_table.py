@@ -0,0 +1,89 @@
+"""Add html_content_blobs and content_dedup_savings tables
+
+Revision ID: e3a7c9f1b5d4
+Revises: d9f1b3c5e7a2
+Create Date: 2025-07-25 11:20:41.208617
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.util.alembic_helpers import id_column, created_at_column
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a7c9f1b5d4'
+down_revision: Union[str, None] = 'd9f1b3c5e7a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BLOBS_TABLE_NAME = 'html_content_blobs'
+SAVINGS_TABLE_NAME = 'content_dedup_savings'
+COMPRESSED_HTML_TABLE_NAME = 'url_compressed_html'
+
+SAVING_TYPE_ENUM = sa.Enum(
+    'Storage',
+    'Parse',
+    'Relevancy',
+    'Record Type',
+    name='content_dedup_saving_type'
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        BLOBS_TABLE_NAME,
+        id_column(),
+        sa.Column('content_hash', sa.String(), nullable=False),
+        sa.Column('compressed_html', sa.LargeBinary(), nullable=False),
+        created_at_column(),
+        sa.UniqueConstraint('content_hash', name='uq_html_content_blobs_content_hash')
+    )
+    op.add_column(
+        COMPRESSED_HTML_TABLE_NAME,
+        sa.Column(
+            'content_hash',
+            sa.String(),
+            sa.ForeignKey(f'{BLOBS_TABLE_NAME}.content_hash'),
+            nullable=True
+        )
+    )
+    op.create_index(
+        'ix_url_compressed_html_content_hash',
+        COMPRESSED_HTML_TABLE_NAME,
+        ['content_hash']
+    )
+    op.alter_column(
+        COMPRESSED_HTML_TABLE_NAME,
+        'compressed_html',
+        nullable=True
+    )
+    op.create_table(
+        SAVINGS_TABLE_NAME,
+        id_column(),
+        sa.Column('saving_type', SAVING_TYPE_ENUM, nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        created_at_column()
+    )
+
+
+def downgrade() -> None:
+    op.drop_table(SAVINGS_TABLE_NAME)
+    SAVING_TYPE_ENUM.drop(op.get_bind(), checkfirst=True)
+    # Move deduplicated HTML back onto each URL before dropping the store
+    op.execute(f"""
+        UPDATE {COMPRESSED_HTML_TABLE_NAME} AS u
+        SET compressed_html = b.compressed_html
+        FROM {BLOBS_TABLE_NAME} AS b
+        WHERE u.content_hash = b.content_hash
+        AND u.compressed_html IS NULL
+    """)
+    op.alter_column(
+        COMPRESSED_HTML_TABLE_NAME,
+        'compressed_html',
+        nullable=False
+    )
+    op.drop_index('ix_url_compressed_html_content_hash', COMPRESSED_HTML_TABLE_NAME)
+    op.drop_column(COMPRESSED_HTML_TABLE_NAME, 'content_hash')
+    op.drop_table(BLOBS_TABLE_NAME)
@@ -0,0 +1,47 @@
+"""Add url_task_leases table
+
+Revision ID: f5b8d2e4a6c3
+Revises: e3a7c9f1b5d4
+Create Date: 2025-07-26 09:14:27.530912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from src.util.alembic_helpers import id_column, url_id_column, created_at_column
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5b8d2e4a6c3'
+down_revision: Union[str, None] = 'e3a7c9f1b5d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE_NAME = 'url_task_leases'
+
+
+def upgrade() -> None:
+    op.create_table(
+        TABLE_NAME,
+        id_column(),
+        url_id_column(),
+        sa.Column(
+            'task_type',
+            postgresql.ENUM(name='task_type', create_type=False),
+            nullable=False
+        ),
+        sa.Column('worker_id', sa.String(), nullable=False),
+        sa.Column('expires_at', sa.TIMESTAMP(), nullable=False),
+        created_at_column(),
+        sa.UniqueConstraint(
+            'url_id',
+            'task_type',
+            name='uq_url_task_leases_url_id_task_type'
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table(TABLE_NAME)
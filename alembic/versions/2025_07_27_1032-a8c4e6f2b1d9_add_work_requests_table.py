@@ -0,0 +1,52 @@
+"""Add work_requests table
+
+Revision ID: a8c4e6f2b1d9
+Revises: f5b8d2e4a6c3
+Create Date: 2025-07-27 10:32:05.814263
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.util.alembic_helpers import id_column, batch_id_column, created_at_column
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c4e6f2b1d9'
+down_revision: Union[str, None] = 'f5b8d2e4a6c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE_NAME = 'work_requests'
+
+REQUEST_TYPE_ENUM = sa.Enum(
+    'Run Tasks',
+    'Start Collector',
+    'Abort Collector',
+    name='work_request_type'
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        TABLE_NAME,
+        id_column(),
+        sa.Column('request_type', REQUEST_TYPE_ENUM, nullable=False),
+        batch_id_column(nullable=True),
+        sa.Column('worker_id', sa.String(), nullable=True),
+        sa.Column('claimed_at', sa.TIMESTAMP(), nullable=True),
+        created_at_column()
+    )
+    op.create_index(
+        'ix_work_requests_unclaimed',
+        TABLE_NAME,
+        ['id'],
+        postgresql_where=sa.text('claimed_at IS NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_work_requests_unclaimed', TABLE_NAME)
+    op.drop_table(TABLE_NAME)
+    REQUEST_TYPE_ENUM.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,300 @@
+"""Add pending task counters
+
+Tracks, per URL, which URL tasks still have work to do on it
+(`url_pending_tasks`), and keeps a running count per task type
+(`task_pending_counts`), both maintained by triggers.
+
+Revision ID: b3d7f1a9c5e2
+Revises: a8c4e6f2b1d9
+Create Date: 2025-07-28 08:47:31.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from src.util.alembic_helpers import id_column, url_id_column, created_at_column
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d7f1a9c5e2'
+down_revision: Union[str, None] = 'a8c4e6f2b1d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+URL_PENDING_TASKS_TABLE_NAME = 'url_pending_tasks'
+TASK_PENDING_COUNTS_TABLE_NAME = 'task_pending_counts'
+
+TASK_TYPE_ENUM = postgresql.ENUM(name='task_type', create_type=False)
+
+# Tables whose rows decide whether a URL is pending for a task
+URL_DEPENDENT_TABLE_NAMES = [
+    'url_html_content',
+    'url_compressed_html',
+    'auto_relevant_suggestions',
+    'auto_record_type_suggestions',
+    'automated_url_agency_suggestions',
+    'confirmed_url_agency',
+    'url_optional_data_source_metadata',
+    'link_batch_urls',
+    'url_checked_for_duplicate',
+    'url_probed_for_404',
+    'link_task_urls',
+]
+
+
+def _refresh_trigger_name(table_name: str) -> str:
+    return f'trg_{table_name}_refresh_pending_tasks'
+
+
+def upgrade() -> None:
+    _create_tables()
+    _create_refresh_function()
+    _create_count_trigger()
+    _create_refresh_triggers()
+    # Backfill; the count trigger fills in `task_pending_counts` as it goes
+    op.execute("SELECT refresh_url_pending_tasks(id) FROM urls")
+
+
+def _create_tables():
+    op.create_table(
+        URL_PENDING_TASKS_TABLE_NAME,
+        id_column(),
+        url_id_column(),
+        sa.Column('task_type', TASK_TYPE_ENUM, nullable=False),
+        created_at_column(),
+        sa.UniqueConstraint(
+            'url_id',
+            'task_type',
+            name='uq_url_pending_tasks_url_id_task_type'
+        )
+    )
+    op.create_index(
+        'ix_url_pending_tasks_task_type_url_id',
+        URL_PENDING_TASKS_TABLE_NAME,
+        ['task_type', 'url_id']
+    )
+    # For finding URLs due for a 404 reprobe, which the counters do not cover
+    op.create_index(
+        'ix_url_probed_for_404_last_probed_at',
+        'url_probed_for_404',
+        ['last_probed_at']
+    )
+    op.create_table(
+        TASK_PENDING_COUNTS_TABLE_NAME,
+        id_column(),
+        sa.Column('task_type', TASK_TYPE_ENUM, nullable=False, unique=True),
+        sa.Column('pending_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(),
+            server_default=sa.text('now()'),
+            nullable=False
+        ),
+    )
+
+
+def _create_refresh_function():
+    # Mirrors the filters of each operator's work query, leases aside
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_url_pending_tasks(p_url_id integer)
+    RETURNS void AS $$
+    DECLARE
+        v_outcome text;
+        v_name text;
+        v_description text;
+        v_is_pending boolean;
+        v_has_batch boolean;
+        v_has_compressed_html boolean;
+        v_task_types task_type[];
+    BEGIN
+        SELECT outcome::text, name, description
+        INTO v_outcome, v_name, v_description
+        FROM urls
+        WHERE id = p_url_id;
+
+        IF NOT FOUND THEN
+            DELETE FROM url_pending_tasks WHERE url_id = p_url_id;
+            RETURN;
+        END IF;
+
+        v_is_pending := v_outcome = 'pending';
+        v_has_batch := EXISTS (SELECT 1 FROM link_batch_urls WHERE url_id = p_url_id);
+        v_has_compressed_html := EXISTS (SELECT 1 FROM url_compressed_html WHERE url_id = p_url_id);
+
+        v_task_types := ARRAY(
+            SELECT candidate.task_type
+            FROM (VALUES
+                (
+                    'HTML'::task_type,
+                    v_is_pending
+                    AND NOT EXISTS (SELECT 1 FROM url_html_content WHERE url_id = p_url_id)
+                    AND NOT EXISTS (
+                        SELECT 1
+                        FROM link_task_urls
+                        JOIN tasks ON tasks.id = link_task_urls.task_id
+                        WHERE link_task_urls.url_id = p_url_id
+                        AND tasks.task_type = 'HTML'
+                        AND tasks.task_status = 'ready to label'
+                    )
+                ),
+                (
+                    'Relevancy'::task_type,
+                    v_is_pending
+                    AND v_has_compressed_html
+                    AND NOT EXISTS (SELECT 1 FROM auto_relevant_suggestions WHERE url_id = p_url_id)
+                ),
+                (
+                    'Record Type'::task_type,
+                    v_is_pending
+                    AND v_has_compressed_html
+                    AND NOT EXISTS (SELECT 1 FROM auto_record_type_suggestions WHERE url_id = p_url_id)
+                ),
+                (
+                    'Agency Identification'::task_type,
+                    v_is_pending
+                    AND v_has_batch
+                    AND NOT EXISTS (SELECT 1 FROM automated_url_agency_suggestions WHERE url_id = p_url_id)
+                    AND NOT EXISTS (SELECT 1 FROM confirmed_url_agency WHERE url_id = p_url_id)
+                ),
+                (
+                    'Misc Metadata'::task_type,
+                    v_is_pending
+                    AND v_has_batch
+                    AND v_name IS NULL
+                    AND v_description IS NULL
+                    AND NOT EXISTS (SELECT 1 FROM url_optional_data_source_metadata WHERE url_id = p_url_id)
+                ),
+                (
+                    'Duplicate Detection'::task_type,
+                    v_is_pending
+                    AND NOT EXISTS (SELECT 1 FROM url_checked_for_duplicate WHERE url_id = p_url_id)
+                ),
+                (
+                    '404 Probe'::task_type,
+                    v_is_pending
+                    AND NOT EXISTS (SELECT 1 FROM url_probed_for_404 WHERE url_id = p_url_id)
+                ),
+                (
+                    'Submit Approved URLs'::task_type,
+                    v_outcome = 'validated'
+                )
+            ) AS candidate(task_type, is_pending)
+            WHERE candidate.is_pending
+        );
+
+        DELETE FROM url_pending_tasks
+        WHERE url_id = p_url_id
+        AND task_type <> ALL(v_task_types);
+
+        INSERT INTO url_pending_tasks (url_id, task_type)
+        SELECT p_url_id, unnest(v_task_types)
+        ON CONFLICT (url_id, task_type) DO NOTHING;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+
+def _create_count_trigger():
+    op.execute("""
+    CREATE OR REPLACE FUNCTION update_task_pending_counts()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            INSERT INTO task_pending_counts (task_type, pending_count)
+            VALUES (NEW.task_type, 1)
+            ON CONFLICT (task_type) DO UPDATE
+            SET pending_count = task_pending_counts.pending_count + 1,
+                updated_at = now();
+        ELSIF TG_OP = 'DELETE' THEN
+            UPDATE task_pending_counts
+            SET pending_count = pending_count - 1,
+                updated_at = now()
+            WHERE task_type = OLD.task_type;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+    CREATE TRIGGER trg_url_pending_tasks_update_counts
+    AFTER INSERT OR DELETE ON url_pending_tasks
+    FOR EACH ROW
+    EXECUTE FUNCTION update_task_pending_counts();
+    """)
+
+
+def _create_refresh_triggers():
+    # The column holding the URL id is passed as the trigger argument
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_url_pending_tasks_trigger()
+    RETURNS TRIGGER AS $$
+    DECLARE
+        v_new_url_id integer;
+        v_old_url_id integer;
+    BEGIN
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            v_new_url_id := (to_jsonb(NEW) ->> TG_ARGV[0])::integer;
+            PERFORM refresh_url_pending_tasks(v_new_url_id);
+        END IF;
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            v_old_url_id := (to_jsonb(OLD) ->> TG_ARGV[0])::integer;
+            IF v_old_url_id IS DISTINCT FROM v_new_url_id THEN
+                PERFORM refresh_url_pending_tasks(v_old_url_id);
+            END IF;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+    CREATE TRIGGER trg_urls_refresh_pending_tasks
+    AFTER INSERT OR UPDATE OF outcome, name, description ON urls
+    FOR EACH ROW
+    EXECUTE FUNCTION refresh_url_pending_tasks_trigger('id');
+    """)
+    for table_name in URL_DEPENDENT_TABLE_NAMES:
+        op.execute(f"""
+        CREATE TRIGGER {_refresh_trigger_name(table_name)}
+        AFTER INSERT OR UPDATE OR DELETE ON {table_name}
+        FOR EACH ROW
+        EXECUTE FUNCTION refresh_url_pending_tasks_trigger('url_id');
+        """)
+
+    # Concluding an HTML task takes its URLs out of the HTML backlog
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_task_url_pending_tasks()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        PERFORM refresh_url_pending_tasks(link_task_urls.url_id)
+        FROM link_task_urls
+        WHERE link_task_urls.task_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+    CREATE TRIGGER trg_tasks_refresh_pending_tasks
+    AFTER UPDATE OF task_status ON tasks
+    FOR EACH ROW
+    WHEN (NEW.task_type = 'HTML' AND OLD.task_status IS DISTINCT FROM NEW.task_status)
+    EXECUTE FUNCTION refresh_task_url_pending_tasks();
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_tasks_refresh_pending_tasks ON tasks;")
+    op.execute("DROP FUNCTION IF EXISTS refresh_task_url_pending_tasks;")
+    for table_name in URL_DEPENDENT_TABLE_NAMES:
+        op.execute(f"DROP TRIGGER IF EXISTS {_refresh_trigger_name(table_name)} ON {table_name};")
+    op.execute("DROP TRIGGER IF EXISTS trg_urls_refresh_pending_tasks ON urls;")
+    op.execute("DROP FUNCTION IF EXISTS refresh_url_pending_tasks_trigger;")
+    op.execute("DROP TRIGGER IF EXISTS trg_url_pending_tasks_update_counts ON url_pending_tasks;")
+    op.execute("DROP FUNCTION IF EXISTS update_task_pending_counts;")
+    op.execute("DROP FUNCTION IF EXISTS refresh_url_pending_tasks;")
+
+    op.drop_index('ix_url_probed_for_404_last_probed_at', 'url_probed_for_404')
+    op.drop_index('ix_url_pending_tasks_task_type_url_id', URL_PENDING_TASKS_TABLE_NAME)
+    op.drop_table(TASK_PENDING_COUNTS_TABLE_NAME)
+    op.drop_table(URL_PENDING_TASKS_TABLE_NAME)
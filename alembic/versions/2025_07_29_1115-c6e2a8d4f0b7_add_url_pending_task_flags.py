@@ -0,0 +1,375 @@
+"""Add url pending task flags
+
+Replaces the `url_pending_tasks` rows with a bitmask column on `urls`,
+with one partial index per task type,
+so that each operator's work query is an index range scan.
+
+Revision ID: c6e2a8d4f0b7
+Revises: b3d7f1a9c5e2
+Create Date: 2025-07-29 11:15:42.637190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from src.util.alembic_helpers import id_column, url_id_column, created_at_column
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e2a8d4f0b7'
+down_revision: Union[str, None] = 'b3d7f1a9c5e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+URL_PENDING_TASKS_TABLE_NAME = 'url_pending_tasks'
+COLUMN_NAME = 'pending_task_flags'
+
+TASK_TYPE_ENUM = postgresql.ENUM(name='task_type', create_type=False)
+
+# Mirrors `TASK_PENDING_FLAGS` in `src/db/constants.py`
+TASK_PENDING_FLAGS = {
+    'HTML': 1,
+    'Relevancy': 2,
+    'Record Type': 4,
+    'Agency Identification': 8,
+    'Misc Metadata': 16,
+    'Duplicate Detection': 32,
+    '404 Probe': 64,
+    'Submit Approved URLs': 128,
+}
+
+FLAGS_VALUES_SQL = ",\n".join(
+    f"({flag}, '{task_type}'::task_type)"
+    for task_type, flag in TASK_PENDING_FLAGS.items()
+)
+
+
+def _index_name(task_type: str) -> str:
+    return f"ix_urls_pending_{task_type.lower().replace(' ', '_')}"
+
+
+def upgrade() -> None:
+    op.execute(f"DROP TRIGGER IF EXISTS trg_url_pending_tasks_update_counts ON {URL_PENDING_TASKS_TABLE_NAME};")
+    op.execute("DROP FUNCTION IF EXISTS update_task_pending_counts;")
+    op.drop_index('ix_url_pending_tasks_task_type_url_id', URL_PENDING_TASKS_TABLE_NAME)
+    op.drop_table(URL_PENDING_TASKS_TABLE_NAME)
+
+    op.add_column(
+        'urls',
+        sa.Column(COLUMN_NAME, sa.Integer(), nullable=False, server_default='0')
+    )
+    for task_type, flag in TASK_PENDING_FLAGS.items():
+        op.create_index(
+            _index_name(task_type),
+            'urls',
+            ['id'],
+            postgresql_where=sa.text(f"({COLUMN_NAME} & {flag}) <> 0")
+        )
+
+    # Only the refresh function changes the flags, and that is not an edit to the URL
+    op.execute("DROP TRIGGER IF EXISTS set_updated_at ON urls;")
+    op.execute(f"""
+    CREATE TRIGGER set_updated_at
+    BEFORE UPDATE ON urls
+    FOR EACH ROW
+    WHEN (OLD.{COLUMN_NAME} IS NOT DISTINCT FROM NEW.{COLUMN_NAME})
+    EXECUTE FUNCTION update_updated_at_column();
+    """)
+
+    _create_flags_functions()
+
+    # Backfill, recounting from scratch
+    op.execute("DELETE FROM task_pending_counts")
+    op.execute("SELECT refresh_url_pending_tasks(id) FROM urls")
+
+
+def _create_flags_functions():
+    # Mirrors the filters of each operator's work query, leases aside
+    op.execute("""
+    CREATE OR REPLACE FUNCTION url_pending_task_flags(p_url_id integer)
+    RETURNS integer AS $$
+    DECLARE
+        v_outcome text;
+        v_name text;
+        v_description text;
+        v_has_batch boolean;
+        v_has_compressed_html boolean;
+        v_flags integer := 0;
+    BEGIN
+        SELECT outcome::text, name, description
+        INTO v_outcome, v_name, v_description
+        FROM urls
+        WHERE id = p_url_id;
+
+        IF v_outcome = 'validated' THEN
+            RETURN 128;
+        END IF;
+        IF v_outcome IS DISTINCT FROM 'pending' THEN
+            RETURN 0;
+        END IF;
+
+        v_has_batch := EXISTS (SELECT 1 FROM link_batch_urls WHERE url_id = p_url_id);
+        v_has_compressed_html := EXISTS (SELECT 1 FROM url_compressed_html WHERE url_id = p_url_id);
+
+        IF NOT EXISTS (SELECT 1 FROM url_html_content WHERE url_id = p_url_id)
+        AND NOT EXISTS (
+            SELECT 1
+            FROM link_task_urls
+            JOIN tasks ON tasks.id = link_task_urls.task_id
+            WHERE link_task_urls.url_id = p_url_id
+            AND tasks.task_type = 'HTML'
+            AND tasks.task_status = 'ready to label'
+        ) THEN
+            v_flags := v_flags | 1;
+        END IF;
+        IF v_has_compressed_html
+        AND NOT EXISTS (SELECT 1 FROM auto_relevant_suggestions WHERE url_id = p_url_id) THEN
+            v_flags := v_flags | 2;
+        END IF;
+        IF v_has_compressed_html
+        AND NOT EXISTS (SELECT 1 FROM auto_record_type_suggestions WHERE url_id = p_url_id) THEN
+            v_flags := v_flags | 4;
+        END IF;
+        IF v_has_batch
+        AND NOT EXISTS (SELECT 1 FROM automated_url_agency_suggestions WHERE url_id = p_url_id)
+        AND NOT EXISTS (SELECT 1 FROM confirmed_url_agency WHERE url_id = p_url_id) THEN
+            v_flags := v_flags | 8;
+        END IF;
+        IF v_has_batch
+        AND v_name IS NULL
+        AND v_description IS NULL
+        AND NOT EXISTS (SELECT 1 FROM url_optional_data_source_metadata WHERE url_id = p_url_id) THEN
+            v_flags := v_flags | 16;
+        END IF;
+        IF NOT EXISTS (SELECT 1 FROM url_checked_for_duplicate WHERE url_id = p_url_id) THEN
+            v_flags := v_flags | 32;
+        END IF;
+        IF NOT EXISTS (SELECT 1 FROM url_probed_for_404 WHERE url_id = p_url_id) THEN
+            v_flags := v_flags | 64;
+        END IF;
+        RETURN v_flags;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION adjust_task_pending_counts(p_old_flags integer, p_new_flags integer)
+    RETURNS void AS $$
+    BEGIN
+        INSERT INTO task_pending_counts (task_type, pending_count)
+        SELECT
+            flag.task_type,
+            CASE WHEN (p_new_flags & flag.bit) <> 0 THEN 1 ELSE -1 END
+        FROM (VALUES
+            {FLAGS_VALUES_SQL}
+        ) AS flag(bit, task_type)
+        WHERE ((p_old_flags # p_new_flags) & flag.bit) <> 0
+        ON CONFLICT (task_type) DO UPDATE
+        SET pending_count = task_pending_counts.pending_count + EXCLUDED.pending_count,
+            updated_at = now();
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION refresh_url_pending_tasks(p_url_id integer)
+    RETURNS void AS $$
+    DECLARE
+        v_old_flags integer;
+        v_new_flags integer;
+    BEGIN
+        SELECT {COLUMN_NAME} INTO v_old_flags FROM urls WHERE id = p_url_id;
+        IF NOT FOUND THEN
+            RETURN;
+        END IF;
+
+        v_new_flags := url_pending_task_flags(p_url_id);
+        IF v_new_flags = v_old_flags THEN
+            RETURN;
+        END IF;
+
+        UPDATE urls SET {COLUMN_NAME} = v_new_flags WHERE id = p_url_id;
+        PERFORM adjust_task_pending_counts(v_old_flags, v_new_flags);
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    # A deleted URL leaves every backlog it was in
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION release_url_pending_task_counts()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        PERFORM adjust_task_pending_counts(OLD.{COLUMN_NAME}, 0);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+    CREATE TRIGGER trg_urls_release_pending_task_counts
+    AFTER DELETE ON urls
+    FOR EACH ROW
+    EXECUTE FUNCTION release_url_pending_task_counts();
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_urls_release_pending_task_counts ON urls;")
+    op.execute("DROP FUNCTION IF EXISTS release_url_pending_task_counts;")
+    op.execute("DROP FUNCTION IF EXISTS adjust_task_pending_counts;")
+
+    op.create_table(
+        URL_PENDING_TASKS_TABLE_NAME,
+        id_column(),
+        url_id_column(),
+        sa.Column('task_type', TASK_TYPE_ENUM, nullable=False),
+        created_at_column(),
+        sa.UniqueConstraint(
+            'url_id',
+            'task_type',
+            name='uq_url_pending_tasks_url_id_task_type'
+        )
+    )
+    op.create_index(
+        'ix_url_pending_tasks_task_type_url_id',
+        URL_PENDING_TASKS_TABLE_NAME,
+        ['task_type', 'url_id']
+    )
+    op.execute("""
+    CREATE OR REPLACE FUNCTION update_task_pending_counts()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            INSERT INTO task_pending_counts (task_type, pending_count)
+            VALUES (NEW.task_type, 1)
+            ON CONFLICT (task_type) DO UPDATE
+            SET pending_count = task_pending_counts.pending_count + 1,
+                updated_at = now();
+        ELSIF TG_OP = 'DELETE' THEN
+            UPDATE task_pending_counts
+            SET pending_count = pending_count - 1,
+                updated_at = now()
+            WHERE task_type = OLD.task_type;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+    CREATE TRIGGER trg_url_pending_tasks_update_counts
+    AFTER INSERT OR DELETE ON url_pending_tasks
+    FOR EACH ROW
+    EXECUTE FUNCTION update_task_pending_counts();
+    """)
+    # Back to maintaining one row per URL and task type
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_url_pending_tasks(p_url_id integer)
+    RETURNS void AS $$
+    DECLARE
+        v_outcome text;
+        v_name text;
+        v_description text;
+        v_is_pending boolean;
+        v_has_batch boolean;
+        v_has_compressed_html boolean;
+        v_task_types task_type[];
+    BEGIN
+        SELECT outcome::text, name, description
+        INTO v_outcome, v_name, v_description
+        FROM urls
+        WHERE id = p_url_id;
+
+        IF NOT FOUND THEN
+            DELETE FROM url_pending_tasks WHERE url_id = p_url_id;
+            RETURN;
+        END IF;
+
+        v_is_pending := v_outcome = 'pending';
+        v_has_batch := EXISTS (SELECT 1 FROM link_batch_urls WHERE url_id = p_url_id);
+        v_has_compressed_html := EXISTS (SELECT 1 FROM url_compressed_html WHERE url_id = p_url_id);
+
+        v_task_types := ARRAY(
+            SELECT candidate.task_type
+            FROM (VALUES
+                (
+                    'HTML'::task_type,
+                    v_is_pending
+                    AND NOT EXISTS (SELECT 1 FROM url_html_content WHERE url_id = p_url_id)
+                    AND NOT EXISTS (
+                        SELECT 1
+                        FROM link_task_urls
+                        JOIN tasks ON tasks.id = link_task_urls.task_id
+                        WHERE link_task_urls.url_id = p_url_id
+                        AND tasks.task_type = 'HTML'
+                        AND tasks.task_status = 'ready to label'
+                    )
+                ),
+                (
+                    'Relevancy'::task_type,
+                    v_is_pending
+                    AND v_has_compressed_html
+                    AND NOT EXISTS (SELECT 1 FROM auto_relevant_suggestions WHERE url_id = p_url_id)
+                ),
+                (
+                    'Record Type'::task_type,
+                    v_is_pending
+                    AND v_has_compressed_html
+                    AND NOT EXISTS (SELECT 1 FROM auto_record_type_suggestions WHERE url_id = p_url_id)
+                ),
+                (
+                    'Agency Identification'::task_type,
+                    v_is_pending
+                    AND v_has_batch
+                    AND NOT EXISTS (SELECT 1 FROM automated_url_agency_suggestions WHERE url_id = p_url_id)
+                    AND NOT EXISTS (SELECT 1 FROM confirmed_url_agency WHERE url_id = p_url_id)
+                ),
+                (
+                    'Misc Metadata'::task_type,
+                    v_is_pending
+                    AND v_has_batch
+                    AND v_name IS NULL
+                    AND v_description IS NULL
+                    AND NOT EXISTS (SELECT 1 FROM url_optional_data_source_metadata WHERE url_id = p_url_id)
+                ),
+                (
+                    'Duplicate Detection'::task_type,
+                    v_is_pending
+                    AND NOT EXISTS (SELECT 1 FROM url_checked_for_duplicate WHERE url_id = p_url_id)
+                ),
+                (
+                    '404 Probe'::task_type,
+                    v_is_pending
+                    AND NOT EXISTS (SELECT 1 FROM url_probed_for_404 WHERE url_id = p_url_id)
+                ),
+                (
+                    'Submit Approved URLs'::task_type,
+                    v_outcome = 'validated'
+                )
+            ) AS candidate(task_type, is_pending)
+            WHERE candidate.is_pending
+        );
+
+        DELETE FROM url_pending_tasks
+        WHERE url_id = p_url_id
+        AND task_type <> ALL(v_task_types);
+
+        INSERT INTO url_pending_tasks (url_id, task_type)
+        SELECT p_url_id, unnest(v_task_types)
+        ON CONFLICT (url_id, task_type) DO NOTHING;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute("DROP FUNCTION IF EXISTS url_pending_task_flags;")
+
+    op.execute("DROP TRIGGER IF EXISTS set_updated_at ON urls;")
+    op.execute("""
+    CREATE TRIGGER set_updated_at
+    BEFORE UPDATE ON urls
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+    """)
+    for task_type in TASK_PENDING_FLAGS:
+        op.drop_index(_index_name(task_type), 'urls')
+    op.drop_column('urls', COLUMN_NAME)
+
+    op.execute("DELETE FROM task_pending_counts")
+    op.execute("SELECT refresh_url_pending_tasks(id) FROM urls")
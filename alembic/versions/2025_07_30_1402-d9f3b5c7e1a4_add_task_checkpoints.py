@@ -0,0 +1,137 @@
+"""Add task checkpoints and interrupted status
+
+URL tasks now persist their results and link their URLs chunk by chunk,
+recording a checkpoint on the task each time.
+Tasks left in progress by a process that died are marked `interrupted`.
+
+Revision ID: d9f3b5c7e1a4
+Revises: c6e2a8d4f0b7
+Create Date: 2025-07-30 14:02:18.553027
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9f3b5c7e1a4'
+down_revision: Union[str, None] = 'c6e2a8d4f0b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE_NAME = 'tasks'
+
+OLD_BATCH_STATUSES = ['ready to label', 'error', 'in-process', 'aborted']
+
+
+def _create_flags_function(concluded_html_task_statuses: list[str]):
+    """
+    (Re)create `url_pending_task_flags`, treating URLs linked to HTML tasks
+    in any of the given statuses as already processed by the HTML task.
+    """
+    concluded_statuses = ", ".join(f"'{status}'" for status in concluded_html_task_statuses)
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION url_pending_task_flags(p_url_id integer)
+    RETURNS integer AS $$
+    DECLARE
+        v_outcome text;
+        v_name text;
+        v_description text;
+        v_has_batch boolean;
+        v_has_compressed_html boolean;
+        v_flags integer := 0;
+    BEGIN
+        SELECT outcome::text, name, description
+        INTO v_outcome, v_name, v_description
+        FROM urls
+        WHERE id = p_url_id;
+
+        IF v_outcome = 'validated' THEN
+            RETURN 128;
+        END IF;
+        IF v_outcome IS DISTINCT FROM 'pending' THEN
+            RETURN 0;
+        END IF;
+
+        v_has_batch := EXISTS (SELECT 1 FROM link_batch_urls WHERE url_id = p_url_id);
+        v_has_compressed_html := EXISTS (SELECT 1 FROM url_compressed_html WHERE url_id = p_url_id);
+
+        IF NOT EXISTS (SELECT 1 FROM url_html_content WHERE url_id = p_url_id)
+        AND NOT EXISTS (
+            SELECT 1
+            FROM link_task_urls
+            JOIN tasks ON tasks.id = link_task_urls.task_id
+            WHERE link_task_urls.url_id = p_url_id
+            AND tasks.task_type = 'HTML'
+            AND tasks.task_status::text IN ({concluded_statuses})
+        ) THEN
+            v_flags := v_flags | 1;
+        END IF;
+        IF v_has_compressed_html
+        AND NOT EXISTS (SELECT 1 FROM auto_relevant_suggestions WHERE url_id = p_url_id) THEN
+            v_flags := v_flags | 2;
+        END IF;
+        IF v_has_compressed_html
+        AND NOT EXISTS (SELECT 1 FROM auto_record_type_suggestions WHERE url_id = p_url_id) THEN
+            v_flags := v_flags | 4;
+        END IF;
+        IF v_has_batch
+        AND NOT EXISTS (SELECT 1 FROM automated_url_agency_suggestions WHERE url_id = p_url_id)
+        AND NOT EXISTS (SELECT 1 FROM confirmed_url_agency WHERE url_id = p_url_id) THEN
+            v_flags := v_flags | 8;
+        END IF;
+        IF v_has_batch
+        AND v_name IS NULL
+        AND v_description IS NULL
+        AND NOT EXISTS (SELECT 1 FROM url_optional_data_source_metadata WHERE url_id = p_url_id) THEN
+            v_flags := v_flags | 16;
+        END IF;
+        IF NOT EXISTS (SELECT 1 FROM url_checked_for_duplicate WHERE url_id = p_url_id) THEN
+            v_flags := v_flags | 32;
+        END IF;
+        IF NOT EXISTS (SELECT 1 FROM url_probed_for_404 WHERE url_id = p_url_id) THEN
+            v_flags := v_flags | 64;
+        END IF;
+        RETURN v_flags;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+
+def upgrade() -> None:
+    # Not used by this migration, so it can be added within its transaction
+    op.execute("ALTER TYPE batch_status ADD VALUE IF NOT EXISTS 'interrupted';")
+    op.add_column(
+        TABLE_NAME,
+        sa.Column('checkpointed_url_count', sa.Integer(), nullable=False, server_default='0')
+    )
+    op.add_column(
+        TABLE_NAME,
+        sa.Column('checkpointed_at', sa.TIMESTAMP(), nullable=True)
+    )
+    # URLs checkpointed by an interrupted HTML task were processed before it stopped
+    _create_flags_function(['ready to label', 'interrupted'])
+
+
+def downgrade() -> None:
+    _create_flags_function(['ready to label'])
+    op.drop_column(TABLE_NAME, 'checkpointed_at')
+    op.drop_column(TABLE_NAME, 'checkpointed_url_count')
+
+    op.execute("UPDATE tasks SET task_status = 'error' WHERE task_status = 'interrupted';")
+    op.execute("UPDATE batches SET status = 'error' WHERE status = 'interrupted';")
+    # The type of a column referenced by a trigger cannot be changed
+    op.execute("DROP TRIGGER IF EXISTS trg_tasks_refresh_pending_tasks ON tasks;")
+    op.execute("ALTER TYPE batch_status RENAME TO batch_status_old;")
+    sa.Enum(*OLD_BATCH_STATUSES, name='batch_status').create(op.get_bind())
+    op.execute("ALTER TABLE tasks ALTER COLUMN task_status TYPE batch_status USING task_status::text::batch_status;")
+    op.execute("ALTER TABLE batches ALTER COLUMN status TYPE batch_status USING status::text::batch_status;")
+    op.execute("DROP TYPE batch_status_old;")
+    op.execute("""
+    CREATE TRIGGER trg_tasks_refresh_pending_tasks
+    AFTER UPDATE OF task_status ON tasks
+    FOR EACH ROW
+    WHEN (NEW.task_type = 'HTML' AND OLD.task_status IS DISTINCT FROM NEW.task_status)
+    EXECUTE FUNCTION refresh_task_url_pending_tasks();
+    """)
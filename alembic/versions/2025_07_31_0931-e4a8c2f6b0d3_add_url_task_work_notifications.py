@@ -0,0 +1,47 @@
+"""Add URL task work notifications
+
+Sends a notification on the `url_task_work` channel, with the task type
+as payload, whenever a task type's pending-work count goes up.
+
+Revision ID: e4a8c2f6b0d3
+Revises: d9f3b5c7e1a4
+Create Date: 2025-07-31 09:31:44.182093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a8c2f6b0d3'
+down_revision: Union[str, None] = 'd9f3b5c7e1a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Postgres delivers identical notifications raised in one transaction once,
+    # so a batch of inserted URLs notifies once per task type
+    op.execute("""
+    CREATE OR REPLACE FUNCTION notify_url_task_work()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        IF (TG_OP = 'INSERT' AND NEW.pending_count > 0)
+        OR (TG_OP = 'UPDATE' AND NEW.pending_count > OLD.pending_count) THEN
+            PERFORM pg_notify('url_task_work', NEW.task_type::text);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+    CREATE TRIGGER trg_task_pending_counts_notify
+    AFTER INSERT OR UPDATE OF pending_count ON task_pending_counts
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_url_task_work();
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_task_pending_counts_notify ON task_pending_counts;")
+    op.execute("DROP FUNCTION IF EXISTS notify_url_task_work;")
@@ -0,0 +1,58 @@
+"""Add task phase timings
+
+Records, per task run, how long each named phase of the run took,
+and how many items and bytes it handled.
+
+Revision ID: f1b5d9a3c7e6
+Revises: e4a8c2f6b0d3
+Create Date: 2025-08-01 10:17:52.640218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.util.alembic_helpers import id_column, created_at_column
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1b5d9a3c7e6'
+down_revision: Union[str, None] = 'e4a8c2f6b0d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE_NAME = 'task_phase_timings'
+
+
+def upgrade() -> None:
+    op.create_table(
+        TABLE_NAME,
+        id_column(),
+        sa.Column(
+            'task_id',
+            sa.Integer(),
+            sa.ForeignKey('tasks.id', ondelete='CASCADE'),
+            nullable=False
+        ),
+        sa.Column('phase', sa.String(), nullable=False),
+        sa.Column('duration_seconds', sa.Float(), nullable=False),
+        sa.Column('item_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('byte_count', sa.BigInteger(), nullable=False, server_default='0'),
+        created_at_column(),
+        sa.UniqueConstraint(
+            'task_id',
+            'phase',
+            name='uq_task_phase_timings_task_id_phase'
+        )
+    )
+    # For aggregating phases over recent runs
+    op.create_index(
+        'ix_task_phase_timings_created_at',
+        TABLE_NAME,
+        ['created_at']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_task_phase_timings_created_at', TABLE_NAME)
+    op.drop_table(TABLE_NAME)
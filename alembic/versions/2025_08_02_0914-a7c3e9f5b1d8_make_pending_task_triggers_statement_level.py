@@ -0,0 +1,376 @@
+"""Make pending task triggers statement-level
+
+The pending task triggers ran once per row, each adjusting the same
+`task_pending_counts` rows. Within one transaction every such update
+walks the row's growing chain of versions, so bulk inserts got slower
+with every URL. The triggers now run once per statement, refreshing
+all affected URLs and adjusting each count once.
+
+Revision ID: a7c3e9f5b1d8
+Revises: f1b5d9a3c7e6
+Create Date: 2025-08-02 09:14:26.503817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e9f5b1d8'
+down_revision: Union[str, None] = 'f1b5d9a3c7e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMN_NAME = 'pending_task_flags'
+
+# Mirrors `TASK_PENDING_FLAGS` in `src/db/constants.py`
+TASK_PENDING_FLAGS = {
+    'HTML': 1,
+    'Relevancy': 2,
+    'Record Type': 4,
+    'Agency Identification': 8,
+    'Misc Metadata': 16,
+    'Duplicate Detection': 32,
+    '404 Probe': 64,
+    'Submit Approved URLs': 128,
+}
+FLAGS_VALUES_SQL = ",\n".join(
+    f"({flag}, '{task_type}'::task_type)"
+    for task_type, flag in TASK_PENDING_FLAGS.items()
+)
+
+# Tables whose rows decide whether a URL is pending for a task
+URL_DEPENDENT_TABLE_NAMES = [
+    'url_html_content',
+    'url_compressed_html',
+    'auto_relevant_suggestions',
+    'auto_record_type_suggestions',
+    'automated_url_agency_suggestions',
+    'confirmed_url_agency',
+    'url_optional_data_source_metadata',
+    'link_batch_urls',
+    'url_checked_for_duplicate',
+    'url_probed_for_404',
+    'link_task_urls',
+]
+
+# Transition tables allow only one event per trigger
+TRANSITION_TABLES_BY_EVENT = {
+    'INSERT': 'NEW TABLE AS new_rows',
+    'UPDATE': 'OLD TABLE AS old_rows NEW TABLE AS new_rows',
+    'DELETE': 'OLD TABLE AS old_rows',
+}
+
+
+def _row_trigger_name(table_name: str) -> str:
+    return f'trg_{table_name}_refresh_pending_tasks'
+
+
+def _statement_trigger_name(table_name: str, event: str) -> str:
+    return f'trg_{table_name}_pending_tasks_{event.lower()}'
+
+
+def upgrade() -> None:
+    _create_set_based_functions()
+    _replace_url_triggers()
+    _replace_dependent_table_triggers()
+    op.execute("DROP FUNCTION IF EXISTS refresh_url_pending_tasks_trigger;")
+    op.execute("DROP FUNCTION IF EXISTS release_url_pending_task_counts;")
+    op.execute("DROP FUNCTION IF EXISTS adjust_task_pending_counts;")
+
+
+def _create_set_based_functions():
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION apply_task_pending_count_changes(
+        p_old_flags integer[],
+        p_new_flags integer[]
+    )
+    RETURNS void AS $$
+    BEGIN
+        INSERT INTO task_pending_counts (task_type, pending_count)
+        SELECT
+            flag.task_type,
+            sum(CASE WHEN (change.new_flags & flag.bit) <> 0 THEN 1 ELSE -1 END)
+        FROM unnest(p_old_flags, p_new_flags) AS change(old_flags, new_flags)
+        CROSS JOIN (VALUES
+            {FLAGS_VALUES_SQL}
+        ) AS flag(bit, task_type)
+        WHERE ((change.old_flags # change.new_flags) & flag.bit) <> 0
+        GROUP BY flag.task_type
+        ON CONFLICT (task_type) DO UPDATE
+        SET pending_count = task_pending_counts.pending_count + EXCLUDED.pending_count,
+            updated_at = now();
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION refresh_urls_pending_tasks(p_url_ids integer[])
+    RETURNS void AS $$
+    DECLARE
+        v_old_flags integer[];
+        v_new_flags integer[];
+    BEGIN
+        -- Statement triggers fire even when no rows changed, including for the
+        -- flags update below, so an empty refresh must not update `urls` again
+        IF cardinality(p_url_ids) = 0 THEN
+            RETURN;
+        END IF;
+
+        WITH refreshed AS (
+            SELECT
+                urls.id,
+                urls.{COLUMN_NAME} AS old_flags,
+                url_pending_task_flags(urls.id) AS new_flags
+            FROM urls
+            JOIN (SELECT DISTINCT unnest(p_url_ids) AS id) AS url_ids
+                ON url_ids.id = urls.id
+        ),
+        changed AS (
+            UPDATE urls
+            SET {COLUMN_NAME} = refreshed.new_flags
+            FROM refreshed
+            WHERE urls.id = refreshed.id
+            AND refreshed.new_flags <> refreshed.old_flags
+            RETURNING refreshed.old_flags, refreshed.new_flags
+        )
+        SELECT array_agg(changed.old_flags), array_agg(changed.new_flags)
+        INTO v_old_flags, v_new_flags
+        FROM changed;
+
+        IF v_old_flags IS NOT NULL THEN
+            PERFORM apply_task_pending_count_changes(v_old_flags, v_new_flags);
+        END IF;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_url_pending_tasks(p_url_id integer)
+    RETURNS void AS $$
+    BEGIN
+        PERFORM refresh_urls_pending_tasks(ARRAY[p_url_id]);
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    # The column holding the URL id is passed as the trigger argument
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_pending_tasks_statement_trigger()
+    RETURNS TRIGGER AS $$
+    DECLARE
+        v_url_ids integer[] := '{}';
+        v_old_url_ids integer[];
+    BEGIN
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            EXECUTE format('SELECT array_agg(DISTINCT %I) FROM new_rows', TG_ARGV[0])
+            INTO v_url_ids;
+        END IF;
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            EXECUTE format('SELECT array_agg(DISTINCT %I) FROM old_rows', TG_ARGV[0])
+            INTO v_old_url_ids;
+            v_url_ids := coalesce(v_url_ids, '{}') || coalesce(v_old_url_ids, '{}');
+        END IF;
+        PERFORM refresh_urls_pending_tasks(coalesce(v_url_ids, '{}'));
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    # Updates of other columns, including the flags themselves, change nothing
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_updated_urls_pending_tasks()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        PERFORM refresh_urls_pending_tasks(ARRAY(
+            SELECT new_rows.id
+            FROM new_rows
+            JOIN old_rows ON old_rows.id = new_rows.id
+            WHERE (old_rows.outcome, old_rows.name, old_rows.description)
+                IS DISTINCT FROM (new_rows.outcome, new_rows.name, new_rows.description)
+        ));
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    # A deleted URL leaves every backlog it was in
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION release_urls_pending_task_counts()
+    RETURNS TRIGGER AS $$
+    DECLARE
+        v_old_flags integer[];
+        v_new_flags integer[];
+    BEGIN
+        SELECT array_agg({COLUMN_NAME}), array_agg(0)
+        INTO v_old_flags, v_new_flags
+        FROM old_rows;
+        IF v_old_flags IS NOT NULL THEN
+            PERFORM apply_task_pending_count_changes(v_old_flags, v_new_flags);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_task_url_pending_tasks()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        PERFORM refresh_urls_pending_tasks(ARRAY(
+            SELECT url_id FROM link_task_urls WHERE task_id = NEW.id
+        ));
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+
+def _replace_url_triggers():
+    op.execute("DROP TRIGGER IF EXISTS trg_urls_refresh_pending_tasks ON urls;")
+    op.execute("DROP TRIGGER IF EXISTS trg_urls_release_pending_task_counts ON urls;")
+    op.execute(f"""
+    CREATE TRIGGER {_statement_trigger_name('urls', 'INSERT')}
+    AFTER INSERT ON urls
+    REFERENCING {TRANSITION_TABLES_BY_EVENT['INSERT']}
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION refresh_pending_tasks_statement_trigger('id');
+    """)
+    op.execute(f"""
+    CREATE TRIGGER {_statement_trigger_name('urls', 'UPDATE')}
+    AFTER UPDATE ON urls
+    REFERENCING {TRANSITION_TABLES_BY_EVENT['UPDATE']}
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION refresh_updated_urls_pending_tasks();
+    """)
+    op.execute(f"""
+    CREATE TRIGGER trg_urls_release_pending_task_counts
+    AFTER DELETE ON urls
+    REFERENCING {TRANSITION_TABLES_BY_EVENT['DELETE']}
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION release_urls_pending_task_counts();
+    """)
+
+
+def _replace_dependent_table_triggers():
+    for table_name in URL_DEPENDENT_TABLE_NAMES:
+        op.execute(f"DROP TRIGGER IF EXISTS {_row_trigger_name(table_name)} ON {table_name};")
+        for event, transition_tables in TRANSITION_TABLES_BY_EVENT.items():
+            op.execute(f"""
+            CREATE TRIGGER {_statement_trigger_name(table_name, event)}
+            AFTER {event} ON {table_name}
+            REFERENCING {transition_tables}
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION refresh_pending_tasks_statement_trigger('url_id');
+            """)
+
+
+def downgrade() -> None:
+    _create_row_level_functions()
+    for table_name in URL_DEPENDENT_TABLE_NAMES:
+        for event in TRANSITION_TABLES_BY_EVENT:
+            op.execute(f"DROP TRIGGER IF EXISTS {_statement_trigger_name(table_name, event)} ON {table_name};")
+        op.execute(f"""
+        CREATE TRIGGER {_row_trigger_name(table_name)}
+        AFTER INSERT OR UPDATE OR DELETE ON {table_name}
+        FOR EACH ROW
+        EXECUTE FUNCTION refresh_url_pending_tasks_trigger('url_id');
+        """)
+
+    op.execute(f"DROP TRIGGER IF EXISTS {_statement_trigger_name('urls', 'INSERT')} ON urls;")
+    op.execute(f"DROP TRIGGER IF EXISTS {_statement_trigger_name('urls', 'UPDATE')} ON urls;")
+    op.execute("DROP TRIGGER IF EXISTS trg_urls_release_pending_task_counts ON urls;")
+    op.execute("""
+    CREATE TRIGGER trg_urls_refresh_pending_tasks
+    AFTER INSERT OR UPDATE OF outcome, name, description ON urls
+    FOR EACH ROW
+    EXECUTE FUNCTION refresh_url_pending_tasks_trigger('id');
+    """)
+    op.execute("""
+    CREATE TRIGGER trg_urls_release_pending_task_counts
+    AFTER DELETE ON urls
+    FOR EACH ROW
+    EXECUTE FUNCTION release_url_pending_task_counts();
+    """)
+
+    op.execute("DROP FUNCTION IF EXISTS release_urls_pending_task_counts;")
+    op.execute("DROP FUNCTION IF EXISTS refresh_updated_urls_pending_tasks;")
+    op.execute("DROP FUNCTION IF EXISTS refresh_pending_tasks_statement_trigger;")
+    op.execute("DROP FUNCTION IF EXISTS refresh_urls_pending_tasks;")
+    op.execute("DROP FUNCTION IF EXISTS apply_task_pending_count_changes;")
+
+
+def _create_row_level_functions():
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION adjust_task_pending_counts(p_old_flags integer, p_new_flags integer)
+    RETURNS void AS $$
+    BEGIN
+        INSERT INTO task_pending_counts (task_type, pending_count)
+        SELECT
+            flag.task_type,
+            CASE WHEN (p_new_flags & flag.bit) <> 0 THEN 1 ELSE -1 END
+        FROM (VALUES
+            {FLAGS_VALUES_SQL}
+        ) AS flag(bit, task_type)
+        WHERE ((p_old_flags # p_new_flags) & flag.bit) <> 0
+        ON CONFLICT (task_type) DO UPDATE
+        SET pending_count = task_pending_counts.pending_count + EXCLUDED.pending_count,
+            updated_at = now();
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION refresh_url_pending_tasks(p_url_id integer)
+    RETURNS void AS $$
+    DECLARE
+        v_old_flags integer;
+        v_new_flags integer;
+    BEGIN
+        SELECT {COLUMN_NAME} INTO v_old_flags FROM urls WHERE id = p_url_id;
+        IF NOT FOUND THEN
+            RETURN;
+        END IF;
+        v_new_flags := url_pending_task_flags(p_url_id);
+        IF v_new_flags = v_old_flags THEN
+            RETURN;
+        END IF;
+        UPDATE urls SET {COLUMN_NAME} = v_new_flags WHERE id = p_url_id;
+        PERFORM adjust_task_pending_counts(v_old_flags, v_new_flags);
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION release_url_pending_task_counts()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        PERFORM adjust_task_pending_counts(OLD.{COLUMN_NAME}, 0);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_url_pending_tasks_trigger()
+    RETURNS TRIGGER AS $$
+    DECLARE
+        v_new_url_id integer;
+        v_old_url_id integer;
+    BEGIN
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            v_new_url_id := (to_jsonb(NEW) ->> TG_ARGV[0])::integer;
+            PERFORM refresh_url_pending_tasks(v_new_url_id);
+        END IF;
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            v_old_url_id := (to_jsonb(OLD) ->> TG_ARGV[0])::integer;
+            IF v_old_url_id IS DISTINCT FROM v_new_url_id THEN
+                PERFORM refresh_url_pending_tasks(v_old_url_id);
+            END IF;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_task_url_pending_tasks()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        PERFORM refresh_url_pending_tasks(link_task_urls.url_id)
+        FROM link_task_urls
+        WHERE link_task_urls.task_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
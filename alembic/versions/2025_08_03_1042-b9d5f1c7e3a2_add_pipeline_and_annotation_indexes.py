@@ -0,0 +1,83 @@
+"""Add pipeline and annotation indexes
+
+Revision ID: b9d5f1c7e3a2
+Revises: a7c3e9f5b1d8
+Create Date: 2025-08-03 10:42:17.306518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9d5f1c7e3a2'
+down_revision: Union[str, None] = 'a7c3e9f5b1d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# URL-dependent tables whose unique constraints do not lead with `url_id`,
+# so lookups by URL (including the pending task triggers and cascading deletes)
+# scan the whole table. The other URL-dependent tables are already covered.
+URL_ID_INDEX_TABLE_NAMES = [
+    'automated_url_agency_suggestions',
+    'link_task_urls',
+    'url_optional_data_source_metadata',
+]
+
+
+def _url_id_index_name(table_name: str) -> str:
+    return f'ix_{table_name}_url_id'
+
+
+def upgrade() -> None:
+    # Work selection and annotation queries take pending URLs in id order
+    op.create_index(
+        'ix_urls_pending',
+        'urls',
+        ['id'],
+        postgresql_where=sa.text("outcome = 'pending'")
+    )
+
+    for table_name in URL_ID_INDEX_TABLE_NAMES:
+        op.create_index(
+            _url_id_index_name(table_name),
+            table_name,
+            ['url_id']
+        )
+    op.create_index(
+        'ix_duplicates_original_url_id',
+        'duplicates',
+        ['original_url_id']
+    )
+
+    # Batch filters read the linked URLs from the index alone
+    op.create_index(
+        'ix_link_batch_urls_batch_id',
+        'link_batch_urls',
+        ['batch_id'],
+        postgresql_include=['url_id']
+    )
+    op.create_index(
+        'ix_duplicates_batch_id',
+        'duplicates',
+        ['batch_id'],
+        postgresql_include=['original_url_id']
+    )
+
+    op.create_index(
+        'ix_tasks_task_type_task_status',
+        'tasks',
+        ['task_type', 'task_status']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_task_type_task_status', 'tasks')
+    op.drop_index('ix_duplicates_batch_id', 'duplicates')
+    op.drop_index('ix_link_batch_urls_batch_id', 'link_batch_urls')
+    op.drop_index('ix_duplicates_original_url_id', 'duplicates')
+    for table_name in URL_ID_INDEX_TABLE_NAMES:
+        op.drop_index(_url_id_index_name(table_name), table_name)
+    op.drop_index('ix_urls_pending', 'urls')
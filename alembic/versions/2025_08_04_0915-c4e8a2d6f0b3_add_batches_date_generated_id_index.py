@@ -0,0 +1,30 @@
+"""Add batches date generated id index
+
+Revision ID: c4e8a2d6f0b3
+Revises: b9d5f1c7e3a2
+Create Date: 2025-08-04 09:15:42.581937
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a2d6f0b3'
+down_revision: Union[str, None] = 'b9d5f1c7e3a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Batches breakdown pages are keyed on (date_generated, id)
+    op.create_index(
+        'ix_batches_date_generated_id',
+        'batches',
+        ['date_generated', 'id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_batches_date_generated_id', 'batches')
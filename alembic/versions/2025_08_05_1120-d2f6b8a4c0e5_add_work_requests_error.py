@@ -0,0 +1,31 @@
+"""Add work_requests error
+
+Revision ID: d2f6b8a4c0e5
+Revises: c4e8a2d6f0b3
+Create Date: 2025-08-05 11:20:36.918402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f6b8a4c0e5'
+down_revision: Union[str, None] = 'c4e8a2d6f0b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE_NAME = 'work_requests'
+
+
+def upgrade() -> None:
+    op.add_column(
+        TABLE_NAME,
+        sa.Column('error', sa.Text(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column(TABLE_NAME, 'error')
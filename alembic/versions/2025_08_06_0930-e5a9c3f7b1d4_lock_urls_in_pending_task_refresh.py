@@ -0,0 +1,138 @@
+"""Lock URLs in pending task refresh
+
+Two transactions changing different dependent rows of the same URL each
+read the URL's flags from their own snapshot, so whichever wrote last
+overwrote the other's change, leaving `urls.pending_task_flags` and
+`task_pending_counts` out of step with `url_pending_task_flags()`.
+The refresh now locks the URL rows, in id order, before reading them;
+the flags are then computed from a snapshot taken after the lock.
+
+`FOR NO KEY UPDATE` is the lock the flags update takes anyway, so it
+serializes refreshes of a URL without blocking foreign key checks from
+inserts into its dependent tables. The counts upsert likewise updates
+`task_pending_counts` rows in task type order, so two refreshes cannot
+each hold a count row the other is waiting for.
+
+Revision ID: e5a9c3f7b1d4
+Revises: d2f6b8a4c0e5
+Create Date: 2025-08-06 09:30:12.604913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a9c3f7b1d4'
+down_revision: Union[str, None] = 'd2f6b8a4c0e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMN_NAME = 'pending_task_flags'
+
+# Mirrors `TASK_PENDING_FLAGS` in `src/db/constants.py`
+TASK_PENDING_FLAGS = {
+    'HTML': 1,
+    'Relevancy': 2,
+    'Record Type': 4,
+    'Agency Identification': 8,
+    'Misc Metadata': 16,
+    'Duplicate Detection': 32,
+    '404 Probe': 64,
+    'Submit Approved URLs': 128,
+}
+FLAGS_VALUES_SQL = ",\n".join(
+    f"({flag}, '{task_type}'::task_type)"
+    for task_type, flag in TASK_PENDING_FLAGS.items()
+)
+
+
+def upgrade() -> None:
+    _create_count_changes_function(order_by_task_type=True)
+    _create_refresh_function(lock_urls=True)
+
+
+def downgrade() -> None:
+    _create_count_changes_function(order_by_task_type=False)
+    _create_refresh_function(lock_urls=False)
+
+
+def _create_count_changes_function(order_by_task_type: bool):
+    order_by_sql = "ORDER BY flag.task_type" if order_by_task_type else ""
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION apply_task_pending_count_changes(
+        p_old_flags integer[],
+        p_new_flags integer[]
+    )
+    RETURNS void AS $$
+    BEGIN
+        INSERT INTO task_pending_counts (task_type, pending_count)
+        SELECT
+            flag.task_type,
+            sum(CASE WHEN (change.new_flags & flag.bit) <> 0 THEN 1 ELSE -1 END)
+        FROM unnest(p_old_flags, p_new_flags) AS change(old_flags, new_flags)
+        CROSS JOIN (VALUES
+            {FLAGS_VALUES_SQL}
+        ) AS flag(bit, task_type)
+        WHERE ((change.old_flags # change.new_flags) & flag.bit) <> 0
+        GROUP BY flag.task_type
+        {order_by_sql}
+        ON CONFLICT (task_type) DO UPDATE
+        SET pending_count = task_pending_counts.pending_count + EXCLUDED.pending_count,
+            updated_at = now();
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+
+def _create_refresh_function(lock_urls: bool):
+    # In READ COMMITTED each statement of the function takes a new snapshot,
+    # so the statement after the lock sees whatever the lock waited for
+    lock_sql = """
+        PERFORM 1
+        FROM urls
+        WHERE id = ANY(p_url_ids)
+        ORDER BY id
+        FOR NO KEY UPDATE;
+    """ if lock_urls else ""
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION refresh_urls_pending_tasks(p_url_ids integer[])
+    RETURNS void AS $$
+    DECLARE
+        v_old_flags integer[];
+        v_new_flags integer[];
+    BEGIN
+        -- Statement triggers fire even when no rows changed, including for the
+        -- flags update below, so an empty refresh must not update `urls` again
+        IF cardinality(p_url_ids) = 0 THEN
+            RETURN;
+        END IF;
+        {lock_sql}
+        WITH refreshed AS (
+            SELECT
+                urls.id,
+                urls.{COLUMN_NAME} AS old_flags,
+                url_pending_task_flags(urls.id) AS new_flags
+            FROM urls
+            JOIN (SELECT DISTINCT unnest(p_url_ids) AS id) AS url_ids
+                ON url_ids.id = urls.id
+        ),
+        changed AS (
+            UPDATE urls
+            SET {COLUMN_NAME} = refreshed.new_flags
+            FROM refreshed
+            WHERE urls.id = refreshed.id
+            AND refreshed.new_flags <> refreshed.old_flags
+            RETURNING refreshed.old_flags, refreshed.new_flags
+        )
+        SELECT array_agg(changed.old_flags), array_agg(changed.new_flags)
+        INTO v_old_flags, v_new_flags
+        FROM changed;
+
+        IF v_old_flags IS NOT NULL THEN
+            PERFORM apply_task_pending_count_changes(v_old_flags, v_new_flags);
+        END IF;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
@@ -0,0 +1,244 @@
+"""Count pending tasks from flag indexes
+
+Every write that changed a URL's pending tasks also updated the matching
+`task_pending_counts` rows, one row per task type shared by all writers,
+so an uncommitted insert of new URLs blocked unrelated writes to the same
+counts until it committed. The counts table is dropped: pending work is
+read from the partial index on each bit of `urls.pending_task_flags`
+instead, which only ever locks the URL rows being written.
+
+The `url_task_work` notification, formerly sent by a trigger on the
+counts, is sent by the refresh for each task type a URL gains.
+
+Revision ID: f8c4a2e6d0b9
+Revises: e5a9c3f7b1d4
+Create Date: 2025-08-06 10:45:52.371640
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from src.util.alembic_helpers import id_column
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8c4a2e6d0b9'
+down_revision: Union[str, None] = 'e5a9c3f7b1d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TASK_PENDING_COUNTS_TABLE_NAME = 'task_pending_counts'
+COLUMN_NAME = 'pending_task_flags'
+
+TASK_TYPE_ENUM = postgresql.ENUM(name='task_type', create_type=False)
+
+# Mirrors `TASK_PENDING_FLAGS` in `src/db/constants.py`
+TASK_PENDING_FLAGS = {
+    'HTML': 1,
+    'Relevancy': 2,
+    'Record Type': 4,
+    'Agency Identification': 8,
+    'Misc Metadata': 16,
+    'Duplicate Detection': 32,
+    '404 Probe': 64,
+    'Submit Approved URLs': 128,
+}
+FLAGS_VALUES_SQL = ",\n".join(
+    f"({flag}, '{task_type}'::task_type)"
+    for task_type, flag in TASK_PENDING_FLAGS.items()
+)
+
+
+def upgrade() -> None:
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION refresh_urls_pending_tasks(p_url_ids integer[])
+    RETURNS void AS $$
+    DECLARE
+        v_gained_flags integer;
+    BEGIN
+        -- Statement triggers fire even when no rows changed, including for the
+        -- flags update below, so an empty refresh must not update `urls` again
+        IF cardinality(p_url_ids) = 0 THEN
+            RETURN;
+        END IF;
+
+        -- In READ COMMITTED each statement of the function takes a new snapshot,
+        -- so the statement after the lock sees whatever the lock waited for
+        PERFORM 1
+        FROM urls
+        WHERE id = ANY(p_url_ids)
+        ORDER BY id
+        FOR NO KEY UPDATE;
+
+        WITH refreshed AS (
+            SELECT
+                urls.id,
+                urls.{COLUMN_NAME} AS old_flags,
+                url_pending_task_flags(urls.id) AS new_flags
+            FROM urls
+            JOIN (SELECT DISTINCT unnest(p_url_ids) AS id) AS url_ids
+                ON url_ids.id = urls.id
+        ),
+        changed AS (
+            UPDATE urls
+            SET {COLUMN_NAME} = refreshed.new_flags
+            FROM refreshed
+            WHERE urls.id = refreshed.id
+            AND refreshed.new_flags <> refreshed.old_flags
+            RETURNING refreshed.old_flags, refreshed.new_flags
+        )
+        SELECT bit_or(changed.new_flags & ~changed.old_flags)
+        INTO v_gained_flags
+        FROM changed;
+
+        -- Postgres delivers identical notifications raised in one transaction once,
+        -- so a batch of inserted URLs notifies once per task type
+        PERFORM pg_notify('url_task_work', flag.task_type::text)
+        FROM (VALUES
+            {FLAGS_VALUES_SQL}
+        ) AS flag(bit, task_type)
+        WHERE (coalesce(v_gained_flags, 0) & flag.bit) <> 0;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute("DROP TRIGGER IF EXISTS trg_urls_release_pending_task_counts ON urls;")
+    op.execute("DROP FUNCTION IF EXISTS release_urls_pending_task_counts;")
+    op.execute("DROP FUNCTION IF EXISTS apply_task_pending_count_changes;")
+    op.drop_table(TASK_PENDING_COUNTS_TABLE_NAME)
+    op.execute("DROP FUNCTION IF EXISTS notify_url_task_work;")
+
+
+def downgrade() -> None:
+    op.create_table(
+        TASK_PENDING_COUNTS_TABLE_NAME,
+        id_column(),
+        sa.Column('task_type', TASK_TYPE_ENUM, nullable=False, unique=True),
+        sa.Column('pending_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(),
+            server_default=sa.text('now()'),
+            nullable=False
+        ),
+    )
+    op.execute(f"""
+    INSERT INTO {TASK_PENDING_COUNTS_TABLE_NAME} (task_type, pending_count)
+    SELECT flag.task_type, count(urls.id)
+    FROM (VALUES
+        {FLAGS_VALUES_SQL}
+    ) AS flag(bit, task_type)
+    JOIN urls ON (urls.{COLUMN_NAME} & flag.bit) <> 0
+    GROUP BY flag.task_type
+    """)
+    op.execute("""
+    CREATE OR REPLACE FUNCTION notify_url_task_work()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        IF (TG_OP = 'INSERT' AND NEW.pending_count > 0)
+        OR (TG_OP = 'UPDATE' AND NEW.pending_count > OLD.pending_count) THEN
+            PERFORM pg_notify('url_task_work', NEW.task_type::text);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+    CREATE TRIGGER trg_task_pending_counts_notify
+    AFTER INSERT OR UPDATE OF pending_count ON task_pending_counts
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_url_task_work();
+    """)
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION apply_task_pending_count_changes(
+        p_old_flags integer[],
+        p_new_flags integer[]
+    )
+    RETURNS void AS $$
+    BEGIN
+        INSERT INTO task_pending_counts (task_type, pending_count)
+        SELECT
+            flag.task_type,
+            sum(CASE WHEN (change.new_flags & flag.bit) <> 0 THEN 1 ELSE -1 END)
+        FROM unnest(p_old_flags, p_new_flags) AS change(old_flags, new_flags)
+        CROSS JOIN (VALUES
+            {FLAGS_VALUES_SQL}
+        ) AS flag(bit, task_type)
+        WHERE ((change.old_flags # change.new_flags) & flag.bit) <> 0
+        GROUP BY flag.task_type
+        ORDER BY flag.task_type
+        ON CONFLICT (task_type) DO UPDATE
+        SET pending_count = task_pending_counts.pending_count + EXCLUDED.pending_count,
+            updated_at = now();
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION refresh_urls_pending_tasks(p_url_ids integer[])
+    RETURNS void AS $$
+    DECLARE
+        v_old_flags integer[];
+        v_new_flags integer[];
+    BEGIN
+        IF cardinality(p_url_ids) = 0 THEN
+            RETURN;
+        END IF;
+
+        PERFORM 1
+        FROM urls
+        WHERE id = ANY(p_url_ids)
+        ORDER BY id
+        FOR NO KEY UPDATE;
+
+        WITH refreshed AS (
+            SELECT
+                urls.id,
+                urls.{COLUMN_NAME} AS old_flags,
+                url_pending_task_flags(urls.id) AS new_flags
+            FROM urls
+            JOIN (SELECT DISTINCT unnest(p_url_ids) AS id) AS url_ids
+                ON url_ids.id = urls.id
+        ),
+        changed AS (
+            UPDATE urls
+            SET {COLUMN_NAME} = refreshed.new_flags
+            FROM refreshed
+            WHERE urls.id = refreshed.id
+            AND refreshed.new_flags <> refreshed.old_flags
+            RETURNING refreshed.old_flags, refreshed.new_flags
+        )
+        SELECT array_agg(changed.old_flags), array_agg(changed.new_flags)
+        INTO v_old_flags, v_new_flags
+        FROM changed;
+
+        IF v_old_flags IS NOT NULL THEN
+            PERFORM apply_task_pending_count_changes(v_old_flags, v_new_flags);
+        END IF;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION release_urls_pending_task_counts()
+    RETURNS TRIGGER AS $$
+    DECLARE
+        v_old_flags integer[];
+        v_new_flags integer[];
+    BEGIN
+        SELECT array_agg({COLUMN_NAME}), array_agg(0)
+        INTO v_old_flags, v_new_flags
+        FROM old_rows;
+        IF v_old_flags IS NOT NULL THEN
+            PERFORM apply_task_pending_count_changes(v_old_flags, v_new_flags);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+    CREATE TRIGGER trg_urls_release_pending_task_counts
+    AFTER DELETE ON urls
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION release_urls_pending_task_counts();
+    """)
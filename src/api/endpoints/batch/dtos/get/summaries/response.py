@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 from src.api.endpoints.batch.dtos.get.summaries.summary import BatchSummary
@@ -5,3 +7,5 @@ from src.api.endpoints.batch.dtos.get.summaries.summary import BatchSummary
 
 class GetBatchSummariesResponse(BaseModel):
     results: list[BatchSummary]
+    # Pass as `cursor` to get the next page; None on the last page
+    next_cursor: Optional[str] = None
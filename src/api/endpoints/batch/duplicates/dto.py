@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -6,4 +6,6 @@ from src.db.dtos.duplicate import DuplicateInfo
 
 
 class GetDuplicatesByBatchResponse(BaseModel):
-    duplicates: List[DuplicateInfo]
\ No newline at end of file
+    duplicates: List[DuplicateInfo]
+    # Pass as `cursor` to get the next page; None on the last page
+    next_cursor: Optional[str] = None
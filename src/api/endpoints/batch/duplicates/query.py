@@ -1,13 +1,18 @@
+from typing import Optional
+
 from sqlalchemy import Select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
+from src.api.endpoints.batch.duplicates.dto import GetDuplicatesByBatchResponse
 from src.db.dtos.duplicate import DuplicateInfo
 from src.db.models.instantiations.batch import Batch
 from src.db.models.instantiations.duplicate import Duplicate
 from src.db.models.instantiations.link.link_batch_urls import LinkBatchURL
 from src.db.models.instantiations.url.core import URL
 from src.db.queries.base.builder import QueryBuilderBase
+from src.db.queries.cursor import get_next_cursor
+from src.db.queries.helpers import add_cursor_or_page_offset
 
 
 class GetDuplicatesByBatchIDQueryBuilder(QueryBuilderBase):
@@ -15,18 +20,21 @@ class GetDuplicatesByBatchIDQueryBuilder(QueryBuilderBase):
     def __init__(
         self,
         batch_id: int,
-        page: int
+        page: int,
+        cursor: Optional[str] = None
     ):
         super().__init__()
         self.batch_id = batch_id
         self.page = page
+        self.cursor = cursor
 
-    async def run(self, session: AsyncSession) -> list[DuplicateInfo]:
+    async def run(self, session: AsyncSession) -> GetDuplicatesByBatchResponse:
         original_batch = aliased(Batch)
         duplicate_batch = aliased(Batch)
 
         query = (
             Select(
+                Duplicate.id,
                 URL.url.label("source_url"),
                 URL.id.label("original_url_id"),
                 duplicate_batch.id.label("duplicate_batch_id"),
@@ -40,8 +48,12 @@ class GetDuplicatesByBatchIDQueryBuilder(QueryBuilderBase):
             .join(LinkBatchURL, URL.id == LinkBatchURL.url_id)
             .join(original_batch, LinkBatchURL.batch_id == original_batch.id)
             .filter(duplicate_batch.id == self.batch_id)
-            .limit(100)
-            .offset((self.page - 1) * 100)
+        )
+        query = add_cursor_or_page_offset(
+            query,
+            key_columns=[Duplicate.id],
+            page=self.page,
+            cursor=self.cursor
         )
         raw_results = await session.execute(query)
         results = raw_results.all()
@@ -57,4 +69,7 @@ class GetDuplicatesByBatchIDQueryBuilder(QueryBuilderBase):
                     original_url_id=result.original_url_id
                 )
             )
-        return final_results
+        return GetDuplicatesByBatchResponse(
+            duplicates=final_results,
+            next_cursor=get_next_cursor(results, key=lambda result: [result.id])
+        )
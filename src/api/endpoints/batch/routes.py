@@ -41,6 +41,10 @@ async def get_batch_status(
             description="The page number",
             default=1
         ),
+        cursor: Optional[str] = Query(
+            description="The `next_cursor` of the previous page. Takes precedence over `page`",
+            default=None
+        ),
         core: AsyncCore = Depends(get_async_core),
         access_info: AccessInfo = Depends(get_access_info),
 ) -> GetBatchSummariesResponse:
@@ -51,7 +55,8 @@ async def get_batch_status(
         collector_type=collector_type,
         status=status,
         has_pending_urls=has_pending_urls,
-        page=page
+        page=page,
+        cursor=cursor
     )
 
 
@@ -70,10 +75,14 @@ async def get_urls_by_batch(
             description="The page number",
             default=1
         ),
+        cursor: Optional[str] = Query(
+            description="The `next_cursor` of the previous page. Takes precedence over `page`",
+            default=None
+        ),
         core: AsyncCore = Depends(get_async_core),
         access_info: AccessInfo = Depends(get_access_info),
 ) -> GetURLsByBatchResponse:
-    return await core.get_urls_by_batch(batch_id, page=page)
+    return await core.get_urls_by_batch(batch_id, page=page, cursor=cursor)
 
 @batch_router.get("/{batch_id}/duplicates")
 async def get_duplicates_by_batch(
@@ -82,10 +91,14 @@ async def get_duplicates_by_batch(
             description="The page number",
             default=1
         ),
+        cursor: Optional[str] = Query(
+            description="The `next_cursor` of the previous page. Takes precedence over `page`",
+            default=None
+        ),
         core: AsyncCore = Depends(get_async_core),
         access_info: AccessInfo = Depends(get_access_info),
 ) -> GetDuplicatesByBatchResponse:
-    return await core.get_duplicate_urls_by_batch(batch_id, page=page)
+    return await core.get_duplicate_urls_by_batch(batch_id, page=page, cursor=cursor)
 
 @batch_router.get("/{batch_id}/logs")
 async def get_batch_logs(
@@ -1,7 +1,11 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 from src.db.dtos.url.core import URLInfo
 
 
 class GetURLsByBatchResponse(BaseModel):
-    urls: list[URLInfo]
\ No newline at end of file
+    urls: list[URLInfo]
+    # Pass as `cursor` to get the next page; None on the last page
+    next_cursor: Optional[str] = None
@@ -1,10 +1,15 @@
+from typing import Optional
+
 from sqlalchemy import Select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api.endpoints.batch.urls.dto import GetURLsByBatchResponse
 from src.db.dtos.url.core import URLInfo
 from src.db.models.instantiations.link.link_batch_urls import LinkBatchURL
 from src.db.models.instantiations.url.core import URL
 from src.db.queries.base.builder import QueryBuilderBase
+from src.db.queries.cursor import get_next_cursor
+from src.db.queries.helpers import add_cursor_or_page_offset
 
 
 class GetURLsByBatchQueryBuilder(QueryBuilderBase):
@@ -12,20 +17,30 @@ class GetURLsByBatchQueryBuilder(QueryBuilderBase):
     def __init__(
         self,
         batch_id: int,
-        page: int = 1
+        page: int = 1,
+        cursor: Optional[str] = None
     ):
         super().__init__()
         self.batch_id = batch_id
         self.page = page
+        self.cursor = cursor
 
-    async def run(self, session: AsyncSession) -> list[URLInfo]:
+    async def run(self, session: AsyncSession) -> GetURLsByBatchResponse:
         query = (
             Select(URL)
             .join(LinkBatchURL)
             .where(LinkBatchURL.batch_id == self.batch_id)
-            .order_by(URL.id)
-            .limit(100)
-            .offset((self.page - 1) * 100))
+        )
+        query = add_cursor_or_page_offset(
+            query,
+            key_columns=[URL.id],
+            page=self.page,
+            cursor=self.cursor
+        )
         result = await session.execute(query)
         urls = result.scalars().all()
-        return [URLInfo(**url.__dict__) for url in urls]
\ No newline at end of file
+        url_infos = [URLInfo(**url.__dict__) for url in urls]
+        return GetURLsByBatchResponse(
+            urls=url_infos,
+            next_cursor=get_next_cursor(url_infos, key=lambda url_info: [url_info.id])
+        )
@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class ManualBatchImportInfo(BaseModel):
+    batch_id: int
+    url_count: int
+    duplicate_count: int
+
+
+class ManualBatchImportDuplicateInfo(BaseModel):
+    url: str
+    original_url_id: int
@@ -0,0 +1,7 @@
+# Parsed entries per `COPY` into the staging table
+STAGING_COPY_CHUNK_SIZE = 5000
+
+# Separates the values of list columns, such as `record_formats`, in a CSV cell
+CSV_LIST_SEPARATOR = ";"
+
+DUPLICATE_REPORT_MEDIA_TYPE = "application/x-ndjson"
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class ManualBatchImportFormat(Enum):
+    """Formats accepted by the manual batch import, by request content type."""
+    CSV = "text/csv"
+    NDJSON = "application/x-ndjson"
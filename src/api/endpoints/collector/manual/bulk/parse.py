@@ -0,0 +1,161 @@
+"""
+Incremental parsing of streamed manual batch imports.
+
+Lines are decoded as request chunks arrive, so memory use does not grow with the
+size of the upload.
+"""
+import codecs
+import csv
+import json
+from typing import AsyncIterator, Optional
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from starlette.status import HTTP_400_BAD_REQUEST, HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+from src.api.endpoints.collector.dtos.manual_batch.post import ManualBatchInnerInputDTO
+from src.api.endpoints.collector.manual.bulk.constants import CSV_LIST_SEPARATOR
+from src.api.endpoints.collector.manual.bulk.enums import ManualBatchImportFormat
+
+CSV_COLUMNS = set(ManualBatchInnerInputDTO.model_fields.keys())
+CSV_JSON_COLUMNS = {"collector_metadata"}
+CSV_LIST_COLUMNS = {"record_formats"}
+
+
+def get_import_format(content_type: Optional[str]) -> ManualBatchImportFormat:
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    for import_format in ManualBatchImportFormat:
+        if import_format.value == media_type:
+            return import_format
+    raise HTTPException(
+        status_code=HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        detail=f"Content type must be one of "
+               f"{[import_format.value for import_format in ManualBatchImportFormat]}"
+    )
+
+
+def _raise_line_error(line_number: int, message: str):
+    raise HTTPException(
+        status_code=HTTP_400_BAD_REQUEST,
+        detail=f"Line {line_number}: {message}"
+    )
+
+
+def _to_entry(line_number: int, data: dict) -> ManualBatchInnerInputDTO:
+    try:
+        return ManualBatchInnerInputDTO.model_validate(data)
+    except ValidationError as e:
+        _raise_line_error(line_number, str(e))
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Yield decoded lines, each with its trailing newline, as chunks arrive."""
+    # `utf-8-sig` drops the byte order mark spreadsheet programs add to CSVs
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    try:
+        async for chunk in chunks:
+            buffer += decoder.decode(chunk)
+            *lines, buffer = buffer.split("\n")
+            for line in lines:
+                yield line + "\n"
+        buffer += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as e:
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail=f"Request body is not valid UTF-8: {e}"
+        )
+    if buffer:
+        yield buffer
+
+
+async def iter_ndjson_entries(
+    chunks: AsyncIterator[bytes]
+) -> AsyncIterator[ManualBatchInnerInputDTO]:
+    line_number = 0
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if line.strip() == "":
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            _raise_line_error(line_number, f"Invalid JSON: {e}")
+        if not isinstance(data, dict):
+            _raise_line_error(line_number, "Expected a JSON object")
+        yield _to_entry(line_number, data)
+
+
+def _parse_csv_cell(line_number: int, column: str, value: str):
+    if value == "":
+        return None
+    if column in CSV_JSON_COLUMNS:
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError as e:
+            _raise_line_error(line_number, f"Invalid JSON in column '{column}': {e}")
+    if column in CSV_LIST_COLUMNS:
+        return [item.strip() for item in value.split(CSV_LIST_SEPARATOR) if item.strip()]
+    return value
+
+
+async def iter_csv_records(
+    chunks: AsyncIterator[bytes]
+) -> AsyncIterator[tuple[int, list[str]]]:
+    """Yield each CSV record with the line it starts on.
+
+    A quoted cell may contain newlines, so lines are joined until the quotes balance.
+    """
+    record = ""
+    record_line_number = 0
+    line_number = 0
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if record == "":
+            record_line_number = line_number
+        record += line
+        if record.count('"') % 2 == 1:
+            continue
+        if record.strip() != "":
+            try:
+                row = next(csv.reader([record]))
+            except csv.Error as e:
+                _raise_line_error(record_line_number, f"Invalid CSV: {e}")
+            yield record_line_number, row
+        record = ""
+    if record != "":
+        _raise_line_error(record_line_number, "Unterminated quoted cell")
+
+
+async def iter_csv_entries(
+    chunks: AsyncIterator[bytes]
+) -> AsyncIterator[ManualBatchInnerInputDTO]:
+    header: Optional[list[str]] = None
+    async for line_number, row in iter_csv_records(chunks):
+        if header is None:
+            header = [column.strip() for column in row]
+            unknown_columns = set(header) - CSV_COLUMNS
+            if len(unknown_columns) > 0:
+                _raise_line_error(line_number, f"Unknown columns {sorted(unknown_columns)}")
+            if "url" not in header:
+                _raise_line_error(line_number, "Missing column 'url'")
+            continue
+        if len(row) != len(header):
+            _raise_line_error(
+                line_number,
+                f"Expected {len(header)} cells, found {len(row)}"
+            )
+        data = {
+            column: _parse_csv_cell(line_number, column, value)
+            for column, value in zip(header, row)
+        }
+        yield _to_entry(line_number, data)
+
+
+def iter_entries(
+    chunks: AsyncIterator[bytes],
+    import_format: ManualBatchImportFormat
+) -> AsyncIterator[ManualBatchInnerInputDTO]:
+    if import_format == ManualBatchImportFormat.CSV:
+        return iter_csv_entries(chunks)
+    return iter_ndjson_entries(chunks)
@@ -0,0 +1,220 @@
+import json
+from typing import AsyncIterator
+
+from fastapi import HTTPException
+from sqlalchemy import Table, MetaData, Column, Integer, Text, String, JSON, ARRAY, select, cast, \
+    literal, update, func, insert, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.status import HTTP_400_BAD_REQUEST
+
+from src.api.endpoints.collector.dtos.manual_batch.bulk import ManualBatchImportInfo
+from src.api.endpoints.collector.dtos.manual_batch.post import ManualBatchInnerInputDTO
+from src.api.endpoints.collector.manual.bulk.constants import STAGING_COPY_CHUNK_SIZE
+from src.collectors.enums import CollectorType, URLStatus
+from src.db.bulk_writer import BulkWriter
+from src.core.enums import BatchStatus
+from src.db.models.instantiations.batch import Batch
+from src.db.models.instantiations.duplicate import Duplicate
+from src.db.models.instantiations.link.link_batch_urls import LinkBatchURL
+from src.db.models.instantiations.url.core import URL
+from src.db.models.instantiations.url.optional_data_source_metadata import URLOptionalDataSourceMetadata
+from src.db.queries.base.builder import QueryBuilderBase
+
+# Dropped when the import's transaction ends
+STAGING_TABLE = Table(
+    "manual_batch_import_staging",
+    MetaData(),
+    # Order of the entry in the upload
+    Column("position", Integer, primary_key=True),
+    Column("url", Text, nullable=False),
+    Column("name", String),
+    Column("description", Text),
+    Column("collector_metadata", JSON),
+    Column("record_type", Text),
+    Column("record_formats", ARRAY(String)),
+    Column("data_portal_type", String),
+    Column("supplying_entity", String),
+    # Set for the first entry of each URL not already in `urls`
+    Column("url_id", Integer),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP"
+)
+STAGING_COLUMN_NAMES = [
+    column.name for column in STAGING_TABLE.columns
+    if column.name != "url_id"
+]
+
+
+class ImportManualBatchQueryBuilder(QueryBuilderBase):
+    """
+    Copies streamed entries into a staging table, then merges them into
+    `urls`, `link_batch_urls`, the optional metadata and `duplicates`
+    with one statement each.
+    """
+
+    def __init__(
+        self,
+        user_id: int,
+        name: str,
+        entries: AsyncIterator[ManualBatchInnerInputDTO],
+        chunk_size: int = STAGING_COPY_CHUNK_SIZE
+    ):
+        super().__init__()
+        self.user_id = user_id
+        self.name = name
+        self.entries = entries
+        self.chunk_size = chunk_size
+
+    async def run(self, session: AsyncSession) -> ManualBatchImportInfo:
+        batch = Batch(
+            strategy=CollectorType.MANUAL.value,
+            status=BatchStatus.READY_TO_LABEL.value,
+            parameters={
+                "name": self.name
+            },
+            user_id=self.user_id
+        )
+        session.add(batch)
+        await session.flush()
+
+        entry_count = await self._copy_entries_to_staging(session)
+        if entry_count == 0:
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail="Upload contains no entries"
+            )
+        # Gives the planner row counts for the merge statements below
+        await session.execute(text(f"ANALYZE {STAGING_TABLE.name}"))
+
+        await self._insert_urls(session)
+        await self._link_urls_to_batch(session, batch_id=batch.id)
+        await self._insert_optional_metadata(session)
+        await self._insert_duplicates(session, batch_id=batch.id)
+
+        url_count = await session.scalar(
+            select(func.count(STAGING_TABLE.c.url_id))
+        )
+        return ManualBatchImportInfo(
+            batch_id=batch.id,
+            url_count=url_count,
+            duplicate_count=entry_count - url_count
+        )
+
+    @staticmethod
+    def _get_staging_record(position: int, entry: ManualBatchInnerInputDTO) -> tuple:
+        return (
+            position,
+            entry.url,
+            entry.name,
+            entry.description,
+            json.dumps(entry.collector_metadata) if entry.collector_metadata is not None else None,
+            entry.record_type.value if entry.record_type is not None else None,
+            entry.record_formats,
+            entry.data_portal_type,
+            entry.supplying_entity,
+        )
+
+    async def _copy_entries_to_staging(self, session: AsyncSession) -> int:
+        connection = await session.connection()
+        await connection.run_sync(STAGING_TABLE.create)
+
+        async def copy(records: list[tuple]):
+            await BulkWriter.copy(
+                session,
+                table_name=STAGING_TABLE.name,
+                column_names=STAGING_COLUMN_NAMES,
+                records=records
+            )
+
+        entry_count = 0
+        records = []
+        async for entry in self.entries:
+            records.append(self._get_staging_record(entry_count, entry))
+            entry_count += 1
+            if len(records) >= self.chunk_size:
+                await copy(records)
+                records = []
+        await copy(records)
+        return entry_count
+
+    @staticmethod
+    async def _insert_urls(session: AsyncSession):
+        # The first entry for each URL is the one inserted; later entries are duplicates
+        staging = STAGING_TABLE.c
+        first_entries = (
+            select(STAGING_TABLE)
+            .distinct(staging.url)
+            .order_by(staging.url, staging.position)
+            .cte("first_entries")
+        )
+        inserted_urls = (
+            pg_insert(URL)
+            .from_select(
+                ["url", "name", "description", "collector_metadata", "outcome", "record_type"],
+                select(
+                    first_entries.c.url,
+                    first_entries.c.name,
+                    first_entries.c.description,
+                    first_entries.c.collector_metadata,
+                    cast(literal(URLStatus.PENDING.value), URL.outcome.type),
+                    cast(first_entries.c.record_type, URL.record_type.type),
+                ).order_by(first_entries.c.position)
+            )
+            .on_conflict_do_nothing(index_elements=[URL.url])
+            .returning(URL.id, URL.url)
+            .cte("inserted_urls")
+        )
+        await session.execute(
+            update(STAGING_TABLE)
+            .values(url_id=inserted_urls.c.id)
+            .where(
+                inserted_urls.c.url == first_entries.c.url,
+                staging.position == first_entries.c.position
+            )
+            .add_cte(first_entries)
+            .add_cte(inserted_urls)
+        )
+
+    @staticmethod
+    async def _link_urls_to_batch(session: AsyncSession, batch_id: int):
+        staging = STAGING_TABLE.c
+        await session.execute(
+            insert(LinkBatchURL).from_select(
+                ["batch_id", "url_id"],
+                select(literal(batch_id), staging.url_id)
+                .where(staging.url_id.is_not(None))
+                .order_by(staging.position)
+            )
+        )
+
+    @staticmethod
+    async def _insert_optional_metadata(session: AsyncSession):
+        staging = STAGING_TABLE.c
+        await session.execute(
+            insert(URLOptionalDataSourceMetadata).from_select(
+                ["url_id", "record_formats", "data_portal_type", "supplying_entity"],
+                select(
+                    staging.url_id,
+                    staging.record_formats,
+                    staging.data_portal_type,
+                    staging.supplying_entity
+                )
+                .where(staging.url_id.is_not(None))
+                .order_by(staging.position)
+            )
+        )
+
+    @staticmethod
+    async def _insert_duplicates(session: AsyncSession, batch_id: int):
+        staging = STAGING_TABLE.c
+        await session.execute(
+            insert(Duplicate).from_select(
+                ["batch_id", "original_url_id"],
+                select(literal(batch_id), URL.id)
+                .select_from(STAGING_TABLE)
+                .join(URL, URL.url == staging.url)
+                .where(staging.url_id.is_(None))
+                .order_by(staging.position)
+            )
+        )
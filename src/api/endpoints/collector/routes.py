@@ -1,10 +1,13 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Query
 from fastapi.params import Depends
+from starlette.responses import StreamingResponse
 
 from src.api.dependencies import get_async_core
 from src.api.endpoints.collector.dtos.collector_start import CollectorStartInfo
 from src.api.endpoints.collector.dtos.manual_batch.post import ManualBatchInputDTO
 from src.api.endpoints.collector.dtos.manual_batch.response import ManualBatchResponseDTO
+from src.api.endpoints.collector.manual.bulk.constants import DUPLICATE_REPORT_MEDIA_TYPE
+from src.api.endpoints.collector.manual.bulk.parse import get_import_format, iter_entries
 from src.collectors.source_collectors.auto_googler.dtos.input import AutoGooglerInputDTO
 from src.collectors.source_collectors.common_crawler.input import CommonCrawlerInputDTO
 from src.collectors.source_collectors.example.dtos.input import ExampleInputDTO
@@ -140,4 +143,42 @@ async def upload_manual_collector(
     return await core.upload_manual_batch(
         dto=dto,
         user_id=access_info.user_id
-    )
\ No newline at end of file
+    )
+
+@collector_router.post("/manual/import")
+async def import_manual_collector(
+        request: Request,
+        name: str = Query(description="The name of the batch"),
+        core: AsyncCore = Depends(get_async_core),
+        access_info: AccessInfo = Depends(get_access_info),
+) -> StreamingResponse:
+    """
+    Imports a manual "collector" from a CSV (`text/csv`) or NDJSON (`application/x-ndjson`) body,
+    which is parsed as it is received.
+
+    CSV uploads start with a header row naming the entry fields; list cells separate values with `;`
+    and `collector_metadata` cells hold JSON.
+
+    Responds with the duplicate URLs as NDJSON, with the batch ID and counts in the
+    `X-Batch-ID`, `X-URL-Count` and `X-Duplicate-Count` headers.
+    """
+    import_format = get_import_format(request.headers.get("content-type"))
+    import_info = await core.import_manual_batch(
+        name=name,
+        entries=iter_entries(request.stream(), import_format),
+        user_id=access_info.user_id
+    )
+
+    async def iter_report_lines():
+        async for duplicate in core.stream_batch_duplicates(import_info.batch_id):
+            yield duplicate.model_dump_json() + "\n"
+
+    return StreamingResponse(
+        iter_report_lines(),
+        media_type=DUPLICATE_REPORT_MEDIA_TYPE,
+        headers={
+            "X-Batch-ID": str(import_info.batch_id),
+            "X-URL-Count": str(import_info.url_count),
+            "X-Duplicate-Count": str(import_info.duplicate_count),
+        }
+    )
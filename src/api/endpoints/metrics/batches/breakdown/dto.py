@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional
 
 from pydantic import BaseModel
 
@@ -19,4 +20,6 @@ class GetMetricsBatchesBreakdownInnerResponseDTO(BaseModel):
     count_url_validated: int
 
 class GetMetricsBatchesBreakdownResponseDTO(BaseModel):
-    batches: list[GetMetricsBatchesBreakdownInnerResponseDTO]
\ No newline at end of file
+    batches: list[GetMetricsBatchesBreakdownInnerResponseDTO]
+    # Pass as `cursor` to get the next page; None on the last page
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from sqlalchemy import select, case
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.functions import coalesce
@@ -10,6 +12,8 @@ from src.db.models.instantiations.batch import Batch
 from src.db.models.instantiations.link.link_batch_urls import LinkBatchURL
 from src.db.models.instantiations.url.core import URL
 from src.db.queries.base.builder import QueryBuilderBase
+from src.db.queries.cursor import get_next_cursor
+from src.db.queries.helpers import add_cursor_or_page_offset
 from src.db.statement_composer import StatementComposer
 
 
@@ -17,10 +21,12 @@ class GetBatchesBreakdownMetricsQueryBuilder(QueryBuilderBase):
 
     def __init__(
         self,
-        page: int
+        page: int,
+        cursor: Optional[str] = None
     ):
         super().__init__()
         self.page = page
+        self.cursor = cursor
 
     async def run(self, session: AsyncSession) -> GetMetricsBatchesBreakdownResponseDTO:
         sc = StatementComposer
@@ -69,11 +75,13 @@ class GetBatchesBreakdownMetricsQueryBuilder(QueryBuilderBase):
         ).outerjoin(
             count_query,
             main_query.c.id == count_query.c.batch_id
-        ).offset(
-            (self.page - 1) * 100
-        ).order_by(
-            main_query.c.created_at.asc()
         ))
+        query = add_cursor_or_page_offset(
+            query,
+            key_columns=[main_query.c.created_at, main_query.c.id],
+            page=self.page,
+            cursor=self.cursor
+        )
 
         raw_results = await session.execute(query)
         results = raw_results.all()
@@ -94,4 +102,8 @@ class GetBatchesBreakdownMetricsQueryBuilder(QueryBuilderBase):
             batches.append(dto)
         return GetMetricsBatchesBreakdownResponseDTO(
             batches=batches,
+            next_cursor=get_next_cursor(
+                batches,
+                key=lambda batch: [batch.created_at, batch.batch_id]
+            )
         )
\ No newline at end of file
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class GetMetricsContentDedupResponseDTO(BaseModel):
+    distinct_pages: int
+    urls_with_html: int
+    storage_writes_saved: int
+    parses_saved: int
+    relevancy_calls_saved: int
+    record_type_calls_saved: int
@@ -2,6 +2,8 @@ from datetime import datetime
 
 from pydantic import BaseModel, field_validator
 
+from src.db.enums import TaskType
+
 
 class GetMetricsBacklogResponseInnerDTO(BaseModel):
     month: str
@@ -17,5 +19,11 @@ class GetMetricsBacklogResponseInnerDTO(BaseModel):
             raise ValueError("month must be in the format 'MonthName YYYY' (e.g., 'May 2025')")
         return v
 
+class GetMetricsBacklogTaskResponseInnerDTO(BaseModel):
+    task_type: TaskType
+    count_pending: int
+
 class GetMetricsBacklogResponseDTO(BaseModel):
-    entries: list[GetMetricsBacklogResponseInnerDTO]
\ No newline at end of file
+    entries: list[GetMetricsBacklogResponseInnerDTO]
+    # Current URLs with work outstanding, per URL task
+    tasks: list[GetMetricsBacklogTaskResponseInnerDTO]
\ No newline at end of file
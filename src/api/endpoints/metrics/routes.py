@@ -1,15 +1,22 @@
+from typing import Optional
+
 from fastapi import APIRouter
 from fastapi.params import Query, Depends
 
 from src.api.dependencies import get_async_core
 from src.api.endpoints.metrics.batches.aggregated.dto import GetMetricsBatchesAggregatedResponseDTO
 from src.api.endpoints.metrics.batches.breakdown.dto import GetMetricsBatchesBreakdownResponseDTO
+from src.api.endpoints.metrics.content_dedup.dto import GetMetricsContentDedupResponseDTO
 from src.api.endpoints.metrics.dtos.get.backlog import GetMetricsBacklogResponseDTO
 from src.api.endpoints.metrics.dtos.get.urls.aggregated.core import GetMetricsURLsAggregatedResponseDTO
 from src.api.endpoints.metrics.dtos.get.urls.aggregated.pending import GetMetricsURLsAggregatedPendingResponseDTO
 from src.api.endpoints.metrics.dtos.get.urls.breakdown.pending import GetMetricsURLsBreakdownPendingResponseDTO
 from src.api.endpoints.metrics.dtos.get.urls.breakdown.submitted import GetMetricsURLsBreakdownSubmittedResponseDTO
+from src.api.endpoints.metrics.scraper.browser_pool.dto import GetMetricsScraperBrowserPoolResponseDTO
+from src.api.endpoints.metrics.scraper.hosts.dto import GetMetricsScraperHostsResponseDTO
+from src.api.endpoints.metrics.task_phases.dto import GetMetricsTaskPhasesResponseDTO
 from src.core.core import AsyncCore
+from src.db.enums import TaskType
 from src.security.manager import get_access_info
 from src.security.dtos.access_info import AccessInfo
 
@@ -33,9 +40,13 @@ async def get_batches_breakdown_metrics(
         page: int = Query(
             description="The page number",
             default=1
+        ),
+        cursor: Optional[str] = Query(
+            description="The `next_cursor` of the previous page. Takes precedence over `page`",
+            default=None
         )
 ) -> GetMetricsBatchesBreakdownResponseDTO:
-    return await core.get_batches_breakdown_metrics(page=page)
+    return await core.get_batches_breakdown_metrics(page=page, cursor=cursor)
 
 @metrics_router.get("/urls/aggregate")
 async def get_urls_aggregated_metrics(
@@ -70,4 +81,40 @@ async def get_backlog_metrics(
         core: AsyncCore = Depends(get_async_core),
         access_info: AccessInfo = Depends(get_access_info)
 ) -> GetMetricsBacklogResponseDTO:
-    return await core.get_backlog_metrics()
\ No newline at end of file
+    return await core.get_backlog_metrics()
+
+@metrics_router.get("/scraper/hosts")
+async def get_scraper_hosts_metrics(
+        core: AsyncCore = Depends(get_async_core),
+        access_info: AccessInfo = Depends(get_access_info)
+) -> GetMetricsScraperHostsResponseDTO:
+    return await core.get_scraper_hosts_metrics()
+
+@metrics_router.get("/scraper/browser-pool")
+async def get_scraper_browser_pool_metrics(
+        core: AsyncCore = Depends(get_async_core),
+        access_info: AccessInfo = Depends(get_access_info)
+) -> GetMetricsScraperBrowserPoolResponseDTO:
+    return await core.get_scraper_browser_pool_metrics()
+
+@metrics_router.get("/content-dedup")
+async def get_content_dedup_metrics(
+        core: AsyncCore = Depends(get_async_core),
+        access_info: AccessInfo = Depends(get_access_info)
+) -> GetMetricsContentDedupResponseDTO:
+    return await core.get_content_dedup_metrics()
+
+@metrics_router.get("/task-phases")
+async def get_task_phases_metrics(
+        core: AsyncCore = Depends(get_async_core),
+        access_info: AccessInfo = Depends(get_access_info),
+        days: int = Query(
+            description="How many days back to include",
+            default=30
+        ),
+        task_type: Optional[TaskType] = Query(
+            description="Filter by task type",
+            default=None
+        )
+) -> GetMetricsTaskPhasesResponseDTO:
+    return await core.get_task_phases_metrics(days=days, task_type=task_type)
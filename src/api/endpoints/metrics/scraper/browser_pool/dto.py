@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+from src.core.tasks.url.operators.url_html.scraper.browser_pool.dtos.metrics import BrowserPoolMetricsInfo
+
+
+class GetMetricsScraperBrowserPoolResponseDTO(BaseModel):
+    browser_pool: BrowserPoolMetricsInfo
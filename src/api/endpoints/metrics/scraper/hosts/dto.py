@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+from src.core.tasks.url.operators.url_html.scraper.fetch_scheduler.dtos.host_throughput import HostThroughputInfo
+
+
+class GetMetricsScraperHostsResponseDTO(BaseModel):
+    hosts: list[HostThroughputInfo]
@@ -0,0 +1,25 @@
+import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+from src.db.enums import TaskType
+
+
+class GetMetricsTaskPhasesInnerResponseDTO(BaseModel):
+    task_type: TaskType
+    phase: str
+    # Day the runs ended
+    date: datetime.date
+    run_count: int
+    p50_seconds: float
+    p95_seconds: float
+    # Runs whose phase handled no items are left out
+    p50_seconds_per_item: Optional[float]
+    p95_seconds_per_item: Optional[float]
+    item_count: int
+    byte_count: int
+
+
+class GetMetricsTaskPhasesResponseDTO(BaseModel):
+    entries: list[GetMetricsTaskPhasesInnerResponseDTO]
@@ -0,0 +1,77 @@
+from datetime import timedelta
+from typing import Optional
+
+from sqlalchemy import select, func, cast, Date, Float
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.endpoints.metrics.task_phases.dto import GetMetricsTaskPhasesResponseDTO, \
+    GetMetricsTaskPhasesInnerResponseDTO
+from src.db.enums import TaskType
+from src.db.models.instantiations.task.core import Task
+from src.db.models.instantiations.task.phase_timing import TaskPhaseTiming
+from src.db.queries.base.builder import QueryBuilderBase
+
+
+class GetTaskPhasesMetricsQueryBuilder(QueryBuilderBase):
+    """
+    Daily p50 and p95 durations of each phase of each task type,
+    over the last `days` days.
+    """
+
+    def __init__(
+        self,
+        days: int,
+        task_type: Optional[TaskType] = None
+    ):
+        super().__init__()
+        self.days = days
+        self.task_type = task_type
+
+    async def run(self, session: AsyncSession) -> GetMetricsTaskPhasesResponseDTO:
+        date = cast(TaskPhaseTiming.created_at, Date).label("date")
+        duration = TaskPhaseTiming.duration_seconds
+        duration_per_item = duration / func.nullif(cast(TaskPhaseTiming.item_count, Float), 0)
+
+        def percentile(fraction: float, column, label: str):
+            return func.percentile_cont(fraction).within_group(column).label(label)
+
+        query = (
+            select(
+                Task.task_type,
+                TaskPhaseTiming.phase,
+                date,
+                func.count(TaskPhaseTiming.id).label("run_count"),
+                percentile(0.5, duration, "p50_seconds"),
+                percentile(0.95, duration, "p95_seconds"),
+                percentile(0.5, duration_per_item, "p50_seconds_per_item"),
+                percentile(0.95, duration_per_item, "p95_seconds_per_item"),
+                func.sum(TaskPhaseTiming.item_count).label("item_count"),
+                func.sum(TaskPhaseTiming.byte_count).label("byte_count")
+            )
+            .join(Task, Task.id == TaskPhaseTiming.task_id)
+            .where(TaskPhaseTiming.created_at >= func.now() - timedelta(days=self.days))
+            .group_by(Task.task_type, TaskPhaseTiming.phase, date)
+            .order_by(date, Task.task_type, TaskPhaseTiming.phase)
+        )
+        if self.task_type is not None:
+            query = query.where(Task.task_type == self.task_type.value)
+
+        raw_results = await session.execute(query)
+        mappings = raw_results.mappings().all()
+        return GetMetricsTaskPhasesResponseDTO(
+            entries=[
+                GetMetricsTaskPhasesInnerResponseDTO(
+                    task_type=TaskType(mapping["task_type"]),
+                    phase=mapping["phase"],
+                    date=mapping["date"],
+                    run_count=mapping["run_count"],
+                    p50_seconds=mapping["p50_seconds"],
+                    p95_seconds=mapping["p95_seconds"],
+                    p50_seconds_per_item=mapping["p50_seconds_per_item"],
+                    p95_seconds_per_item=mapping["p95_seconds_per_item"],
+                    item_count=mapping["item_count"],
+                    byte_count=mapping["byte_count"]
+                )
+                for mapping in mappings
+            ]
+        )
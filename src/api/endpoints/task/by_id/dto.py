@@ -5,6 +5,7 @@ from pydantic import BaseModel
 
 from src.db.dtos.url.error import URLErrorPydanticInfo
 from src.db.dtos.url.core import URLInfo
+from src.db.dtos.task_phase_timing import TaskPhaseTimingInfo
 from src.db.enums import TaskType
 from src.core.enums import BatchStatus
 
@@ -13,6 +14,9 @@ class TaskInfo(BaseModel):
     task_type: TaskType
     task_status: BatchStatus
     updated_at: datetime.datetime
+    checkpointed_url_count: int = 0
+    checkpointed_at: Optional[datetime.datetime] = None
     error_info: Optional[str] = None
     urls: list[URLInfo]
-    url_errors: list[URLErrorPydanticInfo]
\ No newline at end of file
+    url_errors: list[URLErrorPydanticInfo]
+    phase_timings: list[TaskPhaseTimingInfo] = []
\ No newline at end of file
@@ -5,6 +5,7 @@ from sqlalchemy.orm import selectinload
 from src.api.endpoints.task.by_id.dto import TaskInfo
 from src.collectors.enums import URLStatus
 from src.core.enums import BatchStatus
+from src.db.dtos.task_phase_timing import TaskPhaseTimingInfo
 from src.db.dtos.url.core import URLInfo
 from src.db.dtos.url.error import URLErrorPydanticInfo
 from src.db.enums import TaskType
@@ -28,7 +29,8 @@ class GetTaskInfoQueryBuilder(QueryBuilderBase):
                 selectinload(Task.urls)
                 .selectinload(URL.batch),
                 selectinload(Task.error),
-                selectinload(Task.errored_urls)
+                selectinload(Task.errored_urls),
+                selectinload(Task.phase_timings)
             )
         )
         task = result.scalars().first()
@@ -62,6 +64,17 @@ class GetTaskInfoQueryBuilder(QueryBuilderBase):
             task_status=BatchStatus(task.task_status),
             error_info=error,
             updated_at=task.updated_at,
+            checkpointed_url_count=task.checkpointed_url_count,
+            checkpointed_at=task.checkpointed_at,
             urls=url_infos,
-            url_errors=errored_urls
+            url_errors=errored_urls,
+            phase_timings=[
+                TaskPhaseTimingInfo(
+                    phase=timing.phase,
+                    duration_seconds=timing.duration_seconds,
+                    item_count=timing.item_count,
+                    byte_count=timing.byte_count
+                )
+                for timing in sorted(task.phase_timings, key=lambda timing: timing.id)
+            ]
         )
\ No newline at end of file
@@ -1,7 +1,7 @@
 from pydantic import BaseModel
 
-from src.db.enums import TaskType
+from src.core.tasks.dtos.operator_status import TaskOperatorStatusInfo
 
 
 class GetTaskStatusResponseInfo(BaseModel):
-    status: TaskType
\ No newline at end of file
+    operators: list[TaskOperatorStatusInfo]
@@ -1,4 +1,5 @@
 import datetime
+from typing import Optional
 
 from pydantic import BaseModel
 
@@ -17,3 +18,5 @@ class GetTasksResponseTaskInfo(BaseModel):
 
 class GetTasksResponse(BaseModel):
     tasks: list[GetTasksResponseTaskInfo]
+    # Pass as `cursor` to get the next page; None on the last page
+    next_cursor: Optional[str] = None
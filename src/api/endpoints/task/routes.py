@@ -25,6 +25,10 @@ async def get_tasks(
             description="The page number",
             default=1
         ),
+        cursor: Optional[str] = Query(
+            description="The `next_cursor` of the previous page. Takes precedence over `page`",
+            default=None
+        ),
         task_status: Optional[BatchStatus] = Query(
             description="Filter by task status",
             default=None
@@ -39,7 +43,8 @@ async def get_tasks(
     return await async_core.get_tasks(
         page=page,
         task_type=task_type,
-        task_status=task_status
+        task_status=task_status,
+        cursor=cursor
     )
 
 @task_router.get("/status")
@@ -33,3 +33,5 @@ class GetURLsResponseInnerInfo(BaseModel):
 class GetURLsResponseInfo(BaseModel):
     urls: list[GetURLsResponseInnerInfo]
     count: int
+    # Pass as `cursor` to get the next page; None on the last page
+    next_cursor: Optional[str] = None
@@ -1,13 +1,16 @@
+from typing import Optional
+
 from sqlalchemy import select, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.api.endpoints.url.get.dto import GetURLsResponseInfo, GetURLsResponseErrorInfo, GetURLsResponseInnerInfo
 from src.collectors.enums import URLStatus
-from src.db.client.helpers import add_standard_limit_and_offset
 from src.db.models.instantiations.url.core import URL
 from src.db.models.instantiations.url.error_info import URLErrorInfo
 from src.db.queries.base.builder import QueryBuilderBase
+from src.db.queries.cursor import get_next_cursor
+from src.db.queries.helpers import add_cursor_or_page_offset
 
 
 class GetURLsQueryBuilder(QueryBuilderBase):
@@ -15,17 +18,19 @@ class GetURLsQueryBuilder(QueryBuilderBase):
     def __init__(
         self,
         page: int,
-        errors: bool
+        errors: bool,
+        cursor: Optional[str] = None
     ):
         super().__init__()
         self.page = page
         self.errors = errors
+        self.cursor = cursor
 
     async def run(self, session: AsyncSession) -> GetURLsResponseInfo:
         statement = select(URL).options(
             selectinload(URL.error_info),
             selectinload(URL.batch)
-        ).order_by(URL.id)
+        )
         if self.errors:
             # Only return URLs with errors
             statement = statement.where(
@@ -33,7 +38,12 @@ class GetURLsQueryBuilder(QueryBuilderBase):
                     select(URLErrorInfo).where(URLErrorInfo.url_id == URL.id)
                 )
             )
-        add_standard_limit_and_offset(statement, self.page)
+        statement = add_cursor_or_page_offset(
+            statement,
+            key_columns=[URL.id],
+            page=self.page,
+            cursor=self.cursor
+        )
         execute_result = await session.execute(statement)
         all_results = execute_result.scalars().all()
         final_results = []
@@ -61,5 +71,6 @@ class GetURLsQueryBuilder(QueryBuilderBase):
 
         return GetURLsResponseInfo(
             urls=final_results,
-            count=len(final_results)
+            count=len(final_results),
+            next_cursor=get_next_cursor(final_results, key=lambda url: [url.id])
         )
\ No newline at end of file
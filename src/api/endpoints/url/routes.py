@@ -1,3 +1,5 @@
+from typing import Optional
+
 from fastapi import APIRouter, Query, Depends
 
 from src.api.dependencies import get_async_core
@@ -18,6 +20,10 @@ async def get_urls(
             description="The page number",
             default=1
         ),
+        cursor: Optional[str] = Query(
+            description="The `next_cursor` of the previous page. Takes precedence over `page`",
+            default=None
+        ),
         errors: bool = Query(
             description="Retrieve only URLs with errors",
             default=False
@@ -25,5 +31,5 @@ async def get_urls(
         async_core: AsyncCore = Depends(get_async_core),
         access_info: AccessInfo = Depends(get_access_info),
 ) -> GetURLsResponseInfo:
-    result = await async_core.get_urls(page=page, errors=errors)
+    result = await async_core.get_urls(page=page, errors=errors, cursor=cursor)
     return result
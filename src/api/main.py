@@ -1,10 +1,7 @@
 from contextlib import asynccontextmanager
 
-import aiohttp
 import uvicorn
-from discord_poster import DiscordPoster
 from fastapi import FastAPI
-from pdap_access_manager import AccessManager
 from starlette.responses import RedirectResponse
 
 from src.api.endpoints.annotate.routes import annotate_router
@@ -16,110 +13,43 @@ from src.api.endpoints.root import root_router
 from src.api.endpoints.search.routes import search_router
 from src.api.endpoints.task.routes import task_router
 from src.api.endpoints.url.routes import url_router
-from src.collectors.manager import AsyncCollectorManager
-from src.collectors.source_collectors.muckrock.api_interface.core import MuckrockAPIInterface
-from src.core.core import AsyncCore
-from src.core.logger import AsyncCoreLogger
+from src.core.dependencies import CoreDependencies
 from src.core.env_var_manager import EnvVarManager
-from src.core.tasks.handler import TaskHandler
-from src.core.tasks.scheduled.loader import ScheduledTaskOperatorLoader
-from src.core.tasks.scheduled.manager import AsyncScheduledTaskManager
-from src.core.tasks.url.loader import URLTaskOperatorLoader
-from src.core.tasks.url.manager import TaskManager
-from src.core.tasks.url.operators.url_html.scraper.parser.core import HTMLResponseParser
-from src.core.tasks.url.operators.url_html.scraper.request_interface.core import URLRequestInterface
-from src.db.client.async_ import AsyncDatabaseClient
+from src.core.worker.enums import WorkerModeEnum
 from src.db.client.sync import DatabaseClient
-from src.core.tasks.url.operators.url_html.scraper.root_url_cache.core import RootURLCache
-from src.external.huggingface.inference.client import HuggingFaceInferenceClient
-from src.external.pdap.client import PDAPClient
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     env_var_manager = EnvVarManager.get()
+    worker_mode = WorkerModeEnum(env_var_manager.worker_mode)
 
     # Initialize shared dependencies
     db_client = DatabaseClient(
         db_url=env_var_manager.get_postgres_connection_string()
     )
-    adb_client = AsyncDatabaseClient(
-        db_url=env_var_manager.get_postgres_connection_string(is_async=True)
-    )
     await setup_database(db_client)
-    core_logger = AsyncCoreLogger(adb_client=adb_client)
-
-    session = aiohttp.ClientSession()
-
-    task_handler = TaskHandler(
-        adb_client=adb_client,
-        discord_poster=DiscordPoster(
-            webhook_url=env_var_manager.discord_webhook_url
-        )
-    )
-    pdap_client = PDAPClient(
-        access_manager=AccessManager(
-            data_sources_url=env_var_manager.pdap_api_url,
-            email=env_var_manager.pdap_email,
-            password=env_var_manager.pdap_password,
-            api_key=env_var_manager.pdap_api_key,
-            session=session
-        )
-    )
-
-    task_manager = TaskManager(
-        handler=task_handler,
-        loader=URLTaskOperatorLoader(
-            adb_client=adb_client,
-            url_request_interface=URLRequestInterface(),
-            html_parser=HTMLResponseParser(
-                root_url_cache=RootURLCache()
-            ),
-            pdap_client=pdap_client,
-            muckrock_api_interface=MuckrockAPIInterface(
-                session=session
-            ),
-            hf_inference_client=HuggingFaceInferenceClient(
-                session=session,
-                token=env_var_manager.hf_inference_api_key
-            )
-        ),
-    )
-    async_collector_manager = AsyncCollectorManager(
-        logger=core_logger,
-        adb_client=adb_client,
-        post_collection_function_trigger=task_manager.task_trigger
-    )
-
-    async_core = AsyncCore(
-        adb_client=adb_client,
-        task_manager=task_manager,
-        collector_manager=async_collector_manager
-    )
-    async_scheduled_task_manager = AsyncScheduledTaskManager(
-        async_core=async_core,
-        handler=task_handler,
-        loader=ScheduledTaskOperatorLoader(
-            adb_client=adb_client,
-            pdap_client=pdap_client
-        )
+    dependencies = CoreDependencies(
+        env_var_manager=env_var_manager,
+        worker_mode=worker_mode
     )
-    await async_scheduled_task_manager.setup()
+    # In separate mode, scheduled tasks and task notifications are handled by the task worker
+    if worker_mode == WorkerModeEnum.IN_PROCESS:
+        await dependencies.async_scheduled_task_manager.setup()
+        await dependencies.task_notification_listener.start()
 
     # Pass dependencies into the app state
-    app.state.async_core = async_core
-    app.state.async_scheduled_task_manager = async_scheduled_task_manager
-    app.state.logger = core_logger
+    app.state.async_core = dependencies.async_core
+    app.state.async_scheduled_task_manager = dependencies.async_scheduled_task_manager
+    app.state.task_notification_listener = dependencies.task_notification_listener
+    app.state.logger = dependencies.core_logger
 
     # Startup logic
     yield  # Code here runs before shutdown
 
     # Shutdown logic (if needed)
     # Clean up resources, close connections, etc.
-    await core_logger.shutdown()
-    await async_core.shutdown()
-    await session.close()
-    pass
+    await dependencies.shutdown()
 
 
 async def setup_database(db_client):
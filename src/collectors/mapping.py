@@ -1,11 +1,18 @@
 from src.collectors.enums import CollectorType
 from src.collectors.source_collectors.auto_googler.collector import AutoGooglerCollector
+from src.collectors.source_collectors.auto_googler.dtos.input import AutoGooglerInputDTO
 from src.collectors.source_collectors.ckan.collector import CKANCollector
+from src.collectors.source_collectors.ckan.dtos.input import CKANInputDTO
 from src.collectors.source_collectors.common_crawler.collector import CommonCrawlerCollector
+from src.collectors.source_collectors.common_crawler.input import CommonCrawlerInputDTO
 from src.collectors.source_collectors.example.core import ExampleCollector
+from src.collectors.source_collectors.example.dtos.input import ExampleInputDTO
 from src.collectors.source_collectors.muckrock.collectors.all_foia.core import MuckrockAllFOIARequestsCollector
+from src.collectors.source_collectors.muckrock.collectors.all_foia.dto import MuckrockAllFOIARequestsCollectorInputDTO
 from src.collectors.source_collectors.muckrock.collectors.county.core import MuckrockCountyLevelSearchCollector
+from src.collectors.source_collectors.muckrock.collectors.county.dto import MuckrockCountySearchCollectorInputDTO
 from src.collectors.source_collectors.muckrock.collectors.simple.core import MuckrockSimpleSearchCollector
+from src.collectors.source_collectors.muckrock.collectors.simple.dto import MuckrockSimpleSearchCollectorInputDTO
 
 COLLECTOR_MAPPING = {
     CollectorType.EXAMPLE: ExampleCollector,
@@ -16,3 +23,14 @@ COLLECTOR_MAPPING = {
     CollectorType.MUCKROCK_ALL_SEARCH: MuckrockAllFOIARequestsCollector,
     CollectorType.CKAN: CKANCollector
 }
+
+# Used to rebuild a collector's input from its batch's stored parameters
+COLLECTOR_INPUT_DTO_MAPPING = {
+    CollectorType.EXAMPLE: ExampleInputDTO,
+    CollectorType.AUTO_GOOGLER: AutoGooglerInputDTO,
+    CollectorType.COMMON_CRAWLER: CommonCrawlerInputDTO,
+    CollectorType.MUCKROCK_SIMPLE_SEARCH: MuckrockSimpleSearchCollectorInputDTO,
+    CollectorType.MUCKROCK_COUNTY_SEARCH: MuckrockCountySearchCollectorInputDTO,
+    CollectorType.MUCKROCK_ALL_SEARCH: MuckrockAllFOIARequestsCollectorInputDTO,
+    CollectorType.CKAN: CKANInputDTO
+}
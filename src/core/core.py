@@ -1,5 +1,5 @@
 from http import HTTPStatus
-from typing import Optional
+from typing import Optional, AsyncIterator
 
 from fastapi import HTTPException
 from pydantic import BaseModel
@@ -18,15 +18,20 @@ from src.api.endpoints.batch.dtos.post.abort import MessageResponse
 from src.api.endpoints.batch.duplicates.dto import GetDuplicatesByBatchResponse
 from src.api.endpoints.batch.urls.dto import GetURLsByBatchResponse
 from src.api.endpoints.collector.dtos.collector_start import CollectorStartInfo
-from src.api.endpoints.collector.dtos.manual_batch.post import ManualBatchInputDTO
+from src.api.endpoints.collector.dtos.manual_batch.post import ManualBatchInputDTO, ManualBatchInnerInputDTO
+from src.api.endpoints.collector.dtos.manual_batch.bulk import ManualBatchImportInfo, ManualBatchImportDuplicateInfo
 from src.api.endpoints.collector.dtos.manual_batch.response import ManualBatchResponseDTO
 from src.api.endpoints.metrics.batches.aggregated.dto import GetMetricsBatchesAggregatedResponseDTO
 from src.api.endpoints.metrics.batches.breakdown.dto import GetMetricsBatchesBreakdownResponseDTO
+from src.api.endpoints.metrics.content_dedup.dto import GetMetricsContentDedupResponseDTO
+from src.api.endpoints.metrics.task_phases.dto import GetMetricsTaskPhasesResponseDTO
 from src.api.endpoints.metrics.dtos.get.backlog import GetMetricsBacklogResponseDTO
 from src.api.endpoints.metrics.dtos.get.urls.aggregated.core import GetMetricsURLsAggregatedResponseDTO
 from src.api.endpoints.metrics.dtos.get.urls.aggregated.pending import GetMetricsURLsAggregatedPendingResponseDTO
 from src.api.endpoints.metrics.dtos.get.urls.breakdown.pending import GetMetricsURLsBreakdownPendingResponseDTO
 from src.api.endpoints.metrics.dtos.get.urls.breakdown.submitted import GetMetricsURLsBreakdownSubmittedResponseDTO
+from src.api.endpoints.metrics.scraper.browser_pool.dto import GetMetricsScraperBrowserPoolResponseDTO
+from src.api.endpoints.metrics.scraper.hosts.dto import GetMetricsScraperHostsResponseDTO
 from src.api.endpoints.review.approve.dto import FinalReviewApprovalInfo
 from src.api.endpoints.review.enums import RejectionReason
 from src.api.endpoints.review.next.dto import GetNextURLForFinalReviewOuterResponse
@@ -37,10 +42,11 @@ from src.api.endpoints.url.get.dto import GetURLsResponseInfo
 from src.db.client.async_ import AsyncDatabaseClient
 from src.db.dtos.batch import BatchInfo
 from src.api.endpoints.task.dtos.get.task_status import GetTaskStatusResponseInfo
-from src.db.enums import TaskType
+from src.db.enums import TaskType, WorkRequestType
 from src.collectors.manager import AsyncCollectorManager
 from src.collectors.enums import CollectorType
 from src.core.tasks.url.manager import TaskManager
+from src.core.worker.enums import WorkerModeEnum
 from src.core.error_manager.core import ErrorManager
 from src.core.enums import BatchStatus, RecordType, AnnotationType, SuggestedStatus
 
@@ -53,16 +59,21 @@ class AsyncCore:
             self,
             adb_client: AsyncDatabaseClient,
             collector_manager: AsyncCollectorManager,
-            task_manager: TaskManager
+            task_manager: TaskManager,
+            worker_mode: WorkerModeEnum = WorkerModeEnum.IN_PROCESS
     ):
         self.task_manager = task_manager
         self.adb_client = adb_client
 
         self.collector_manager = collector_manager
+        self.worker_mode = worker_mode
 
+    def dispatches_to_worker(self) -> bool:
+        return self.worker_mode == WorkerModeEnum.SEPARATE
 
-    async def get_urls(self, page: int, errors: bool) -> GetURLsResponseInfo:
-        return await self.adb_client.get_urls(page=page, errors=errors)
+
+    async def get_urls(self, page: int, errors: bool, cursor: Optional[str] = None) -> GetURLsResponseInfo:
+        return await self.adb_client.get_urls(page=page, errors=errors, cursor=cursor)
 
     async def shutdown(self):
         await self.collector_manager.shutdown_all_collectors()
@@ -77,30 +88,46 @@ class AsyncCore:
             )
         return result
 
-    async def get_urls_by_batch(self, batch_id: int, page: int = 1) -> GetURLsByBatchResponse:
-        url_infos = await self.adb_client.get_urls_by_batch(batch_id, page)
-        return GetURLsByBatchResponse(urls=url_infos)
+    async def get_urls_by_batch(
+            self,
+            batch_id: int,
+            page: int = 1,
+            cursor: Optional[str] = None
+    ) -> GetURLsByBatchResponse:
+        return await self.adb_client.get_urls_by_batch(batch_id, page=page, cursor=cursor)
 
     async def abort_batch(self, batch_id: int) -> MessageResponse:
+        if self.dispatches_to_worker():
+            await self.adb_client.add_work_request(
+                request_type=WorkRequestType.ABORT_COLLECTOR,
+                batch_id=batch_id
+            )
+            return MessageResponse(message="Batch abort requested.")
         await self.collector_manager.abort_collector_async(cid=batch_id)
         return MessageResponse(message=f"Batch aborted.")
 
-    async def get_duplicate_urls_by_batch(self, batch_id: int, page: int = 1) -> GetDuplicatesByBatchResponse:
-        dup_infos = await self.adb_client.get_duplicates_by_batch_id(batch_id, page=page)
-        return GetDuplicatesByBatchResponse(duplicates=dup_infos)
+    async def get_duplicate_urls_by_batch(
+            self,
+            batch_id: int,
+            page: int = 1,
+            cursor: Optional[str] = None
+    ) -> GetDuplicatesByBatchResponse:
+        return await self.adb_client.get_duplicates_by_batch_id(batch_id, page=page, cursor=cursor)
 
     async def get_batch_statuses(
             self,
             collector_type: Optional[CollectorType],
             status: Optional[BatchStatus],
             has_pending_urls: Optional[bool],
-            page: int
+            page: int,
+            cursor: Optional[str] = None
     ) -> GetBatchSummariesResponse:
         results = await self.adb_client.get_batch_summaries(
             collector_type=collector_type,
             status=status,
             page=page,
-            has_pending_urls=has_pending_urls
+            has_pending_urls=has_pending_urls,
+            cursor=cursor
         )
         return results
 
@@ -130,6 +157,15 @@ class AsyncCore:
         )
 
         batch_id = await self.adb_client.insert_batch(batch_info)
+        if self.dispatches_to_worker():
+            await self.adb_client.add_work_request(
+                request_type=WorkRequestType.START_COLLECTOR,
+                batch_id=batch_id
+            )
+            return CollectorStartInfo(
+                batch_id=batch_id,
+                message=f"Queued {collector_type.value} collector."
+            )
         await self.collector_manager.start_async_collector(
             collector_type=collector_type,
             batch_id=batch_id,
@@ -142,21 +178,32 @@ class AsyncCore:
 
     # endregion
     async def get_current_task_status(self) -> GetTaskStatusResponseInfo:
-        return GetTaskStatusResponseInfo(status=self.task_manager.manager_status)
+        if self.dispatches_to_worker():
+            # The task managers run in the worker processes, so only what
+            # the task records show, the operators with runs in process, is known here
+            return GetTaskStatusResponseInfo(
+                operators=await self.adb_client.get_running_task_operator_statuses()
+            )
+        return GetTaskStatusResponseInfo(operators=self.task_manager.get_operator_statuses())
 
     async def run_tasks(self):
+        if self.dispatches_to_worker():
+            await self.adb_client.add_work_request(request_type=WorkRequestType.RUN_TASKS)
+            return
         await self.task_manager.trigger_task_run()
 
     async def get_tasks(
             self,
             page: int,
             task_type: TaskType,
-            task_status: BatchStatus
+            task_status: BatchStatus,
+            cursor: Optional[str] = None
     ) -> GetTasksResponse:
         return await self.adb_client.get_tasks(
             page=page,
             task_type=task_type,
-            task_status=task_status
+            task_status=task_status,
+            cursor=cursor
         )
 
 
@@ -320,14 +367,36 @@ class AsyncCore:
             dto=dto
         )
 
+    async def import_manual_batch(
+            self,
+            name: str,
+            entries: AsyncIterator[ManualBatchInnerInputDTO],
+            user_id: int
+    ) -> ManualBatchImportInfo:
+        return await self.adb_client.import_manual_batch(
+            user_id=user_id,
+            name=name,
+            entries=entries
+        )
+
+    def stream_batch_duplicates(
+            self,
+            batch_id: int
+    ) -> AsyncIterator[ManualBatchImportDuplicateInfo]:
+        return self.adb_client.stream_batch_duplicates(batch_id=batch_id)
+
     async def search_for_url(self, url: str) -> SearchURLResponse:
         return await self.adb_client.search_for_url(url)
 
     async def get_batches_aggregated_metrics(self) -> GetMetricsBatchesAggregatedResponseDTO:
         return await self.adb_client.get_batches_aggregated_metrics()
 
-    async def get_batches_breakdown_metrics(self, page: int) -> GetMetricsBatchesBreakdownResponseDTO:
-        return await self.adb_client.get_batches_breakdown_metrics(page=page)
+    async def get_batches_breakdown_metrics(
+            self,
+            page: int,
+            cursor: Optional[str] = None
+    ) -> GetMetricsBatchesBreakdownResponseDTO:
+        return await self.adb_client.get_batches_breakdown_metrics(page=page, cursor=cursor)
 
     async def get_urls_breakdown_submitted_metrics(self) -> GetMetricsURLsBreakdownSubmittedResponseDTO:
         return await self.adb_client.get_urls_breakdown_submitted_metrics()
@@ -342,4 +411,29 @@ class AsyncCore:
         return await self.adb_client.get_backlog_metrics()
 
     async def get_urls_aggregated_pending_metrics(self) -> GetMetricsURLsAggregatedPendingResponseDTO:
-        return await self.adb_client.get_urls_aggregated_pending_metrics()
\ No newline at end of file
+        return await self.adb_client.get_urls_aggregated_pending_metrics()
+
+    async def get_content_dedup_metrics(self) -> GetMetricsContentDedupResponseDTO:
+        return await self.adb_client.get_content_dedup_metrics()
+
+    async def get_task_phases_metrics(
+            self,
+            days: int,
+            task_type: Optional[TaskType]
+    ) -> GetMetricsTaskPhasesResponseDTO:
+        return await self.adb_client.get_task_phases_metrics(
+            days=days,
+            task_type=task_type
+        )
+
+    async def get_scraper_hosts_metrics(self) -> GetMetricsScraperHostsResponseDTO:
+        fetch_scheduler = self.task_manager.loader.url_request_interface.fetch_scheduler
+        return GetMetricsScraperHostsResponseDTO(
+            hosts=fetch_scheduler.get_host_throughput()
+        )
+
+    async def get_scraper_browser_pool_metrics(self) -> GetMetricsScraperBrowserPoolResponseDTO:
+        browser_pool = self.task_manager.loader.url_request_interface.browser_pool
+        return GetMetricsScraperBrowserPoolResponseDTO(
+            browser_pool=browser_pool.get_metrics()
+        )
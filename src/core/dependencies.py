@@ -0,0 +1,132 @@
+import aiohttp
+from discord_poster import DiscordPoster
+from pdap_access_manager import AccessManager
+
+from src.collectors.manager import AsyncCollectorManager
+from src.collectors.source_collectors.muckrock.api_interface.core import MuckrockAPIInterface
+from src.core.core import AsyncCore
+from src.core.env_var_manager import EnvVarManager
+from src.core.logger import AsyncCoreLogger
+from src.core.tasks.handler import TaskHandler
+from src.core.tasks.scheduled.loader import ScheduledTaskOperatorLoader
+from src.core.tasks.scheduled.manager import AsyncScheduledTaskManager
+from src.core.tasks.url.listener.core import TaskNotificationListener
+from src.core.tasks.url.loader import URLTaskOperatorLoader
+from src.core.tasks.url.manager import TaskManager
+from src.core.tasks.url.operators.url_html.scraper.browser_pool.core import BrowserPool
+from src.core.tasks.url.operators.url_html.scraper.fetch_scheduler.core import FetchScheduler
+from src.core.tasks.url.operators.url_html.scraper.parse_executor.core import ParseExecutor
+from src.core.tasks.url.operators.url_html.scraper.parser.core import HTMLResponseParser
+from src.core.tasks.url.operators.url_html.scraper.parser.enums import ParserEngineEnum
+from src.core.tasks.url.operators.url_html.scraper.request_interface.core import URLRequestInterface
+from src.core.tasks.url.operators.url_html.scraper.root_url_cache.core import RootURLCache
+from src.core.worker.enums import WorkerModeEnum
+from src.db.client.async_ import AsyncDatabaseClient
+from src.external.huggingface.inference.client import HuggingFaceInferenceClient
+from src.external.pdap.client import PDAPClient
+
+
+class CoreDependencies:
+    """
+    Builds the core and everything it depends on,
+    shared by the API process and the task worker process.
+    """
+
+    def __init__(
+            self,
+            env_var_manager: EnvVarManager,
+            worker_mode: WorkerModeEnum
+    ):
+        self.adb_client = AsyncDatabaseClient(
+            db_url=env_var_manager.get_postgres_connection_string(is_async=True)
+        )
+        self.core_logger = AsyncCoreLogger(adb_client=self.adb_client)
+
+        self.session = aiohttp.ClientSession()
+        # Shared across task runs so connections and DNS lookups are reused
+        self.fetch_scheduler = FetchScheduler()
+        # Launches Chromium on first render, then keeps it alive until shutdown
+        self.browser_pool = BrowserPool()
+        # Worker processes are spawned on first parse
+        self.parse_executor = ParseExecutor(
+            max_workers=env_var_manager.html_parse_workers
+        )
+
+        task_handler = TaskHandler(
+            adb_client=self.adb_client,
+            discord_poster=DiscordPoster(
+                webhook_url=env_var_manager.discord_webhook_url
+            )
+        )
+        pdap_client = PDAPClient(
+            access_manager=AccessManager(
+                data_sources_url=env_var_manager.pdap_api_url,
+                email=env_var_manager.pdap_email,
+                password=env_var_manager.pdap_password,
+                api_key=env_var_manager.pdap_api_key,
+                session=self.session
+            )
+        )
+
+        task_manager = TaskManager(
+            handler=task_handler,
+            loader=URLTaskOperatorLoader(
+                adb_client=self.adb_client,
+                url_request_interface=URLRequestInterface(
+                    fetch_scheduler=self.fetch_scheduler,
+                    browser_pool=self.browser_pool,
+                    max_body_bytes=env_var_manager.html_max_body_mb * 1024 * 1024
+                ),
+                html_parser=HTMLResponseParser(
+                    root_url_cache=RootURLCache(
+                        fetch_scheduler=self.fetch_scheduler
+                    ),
+                    parse_executor=self.parse_executor,
+                    engine=ParserEngineEnum(env_var_manager.html_parser_engine)
+                ),
+                pdap_client=pdap_client,
+                muckrock_api_interface=MuckrockAPIInterface(
+                    session=self.session
+                ),
+                hf_inference_client=HuggingFaceInferenceClient(
+                    session=self.session,
+                    token=env_var_manager.hf_inference_api_key
+                ),
+                html_body_memory_budget_bytes=env_var_manager.html_body_memory_budget_mb * 1024 * 1024
+            ),
+        )
+        async_collector_manager = AsyncCollectorManager(
+            logger=self.core_logger,
+            adb_client=self.adb_client,
+            post_collection_function_trigger=task_manager.task_trigger
+        )
+
+        self.async_core = AsyncCore(
+            adb_client=self.adb_client,
+            task_manager=task_manager,
+            collector_manager=async_collector_manager,
+            worker_mode=worker_mode
+        )
+        # Started by whichever process runs URL tasks itself
+        self.task_notification_listener = TaskNotificationListener(
+            db_url=env_var_manager.get_postgres_connection_string(),
+            on_work=self.async_core.run_tasks
+        )
+        self.async_scheduled_task_manager = AsyncScheduledTaskManager(
+            async_core=self.async_core,
+            handler=task_handler,
+            loader=ScheduledTaskOperatorLoader(
+                adb_client=self.adb_client,
+                pdap_client=pdap_client
+            )
+        )
+
+    async def shutdown(self):
+        await self.task_notification_listener.shutdown()
+        self.async_scheduled_task_manager.shutdown()
+        await self.core_logger.shutdown()
+        await self.async_core.shutdown()
+        await self.session.close()
+        await self.fetch_scheduler.close()
+        await self.browser_pool.close()
+        self.parse_executor.shutdown()
@@ -11,6 +11,7 @@ class BatchStatus(Enum):
     IN_PROCESS = "in-process"
     ERROR = "error"
     ABORTED = "aborted"
+    INTERRUPTED = "interrupted"
 
 class RecordType(Enum):
     """
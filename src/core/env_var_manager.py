@@ -37,6 +37,17 @@ class EnvVarManager:
         self.postgres_port = self.require_env("POSTGRES_PORT")
         self.postgres_db = self.require_env("POSTGRES_DB")
 
+        html_parse_workers = self.require_env("HTML_PARSE_WORKERS", allow_none=True)
+        self.html_parse_workers = int(html_parse_workers) if html_parse_workers is not None else None
+        html_parser_engine = self.require_env("HTML_PARSER_ENGINE", allow_none=True)
+        self.html_parser_engine = html_parser_engine if html_parser_engine is not None else "beautiful_soup"
+        html_body_memory_budget_mb = self.require_env("HTML_BODY_MEMORY_BUDGET_MB", allow_none=True)
+        self.html_body_memory_budget_mb = int(html_body_memory_budget_mb) if html_body_memory_budget_mb is not None else 64
+        html_max_body_mb = self.require_env("HTML_MAX_BODY_MB", allow_none=True)
+        self.html_max_body_mb = int(html_max_body_mb) if html_max_body_mb is not None else 10
+        worker_mode = self.require_env("WORKER_MODE", allow_none=True)
+        self.worker_mode = worker_mode if worker_mode is not None else "in_process"
+
     @classmethod
     def get(cls):
         """
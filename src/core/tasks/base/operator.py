@@ -1,6 +1,8 @@
+import time
 import traceback
 from abc import ABC, abstractmethod
 
+from src.core.tasks.base.phase_timer import TaskPhaseTimer
 from src.core.tasks.base.run_info import TaskOperatorRunInfo
 from src.core.tasks.url.enums import TaskOperatorOutcome
 from src.db.client.async_ import AsyncDatabaseClient
@@ -11,6 +13,8 @@ class TaskOperatorBase(ABC):
     def __init__(self, adb_client: AsyncDatabaseClient):
         self.adb_client = adb_client
         self.task_id = None
+        # Per-run phase timings, saved with the task when the run ends
+        self.phase_timer = TaskPhaseTimer()
 
     @property
     @abstractmethod
@@ -29,6 +33,8 @@ class TaskOperatorBase(ABC):
 
     async def run_task(self, task_id: int) -> TaskOperatorRunInfo:
         self.task_id = task_id
+        self.phase_timer = TaskPhaseTimer()
+        start = time.perf_counter()
         try:
             await self.inner_task_logic()
             return await self.conclude_task()
@@ -38,6 +44,19 @@ class TaskOperatorBase(ABC):
                 outcome=TaskOperatorOutcome.ERROR,
                 message=str(e) + "\n" + stack_trace
             )
+        finally:
+            self.phase_timer.add("run", duration_seconds=time.perf_counter() - start)
+            await self.save_phase_timings()
+
+    async def save_phase_timings(self):
+        try:
+            await self.adb_client.add_task_phase_timings(
+                task_id=self.task_id,
+                timings=self.phase_timer.get_timings()
+            )
+        except Exception as e:
+            # Timings are diagnostic, and never fail the task
+            print(f"Error saving task phase timings: {e}")
 
     @abstractmethod
     async def run_info(self, outcome: TaskOperatorOutcome, message: str) -> TaskOperatorRunInfo:
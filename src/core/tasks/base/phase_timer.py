@@ -0,0 +1,60 @@
+import time
+from contextlib import contextmanager
+from typing import Awaitable, TypeVar
+
+from src.db.dtos.task_phase_timing import TaskPhaseTimingInfo
+
+T = TypeVar("T")
+
+
+class TaskPhaseTimer:
+    """
+    Accumulates, for one task run, the time spent in each named phase
+    and the number of items and bytes each phase handled.
+
+    Durations from concurrent work in one phase are summed,
+    so a phase can add up to more than the run's wall time.
+    """
+
+    def __init__(self):
+        self._phases: dict[str, TaskPhaseTimingInfo] = {}
+
+    def add(
+            self,
+            phase: str,
+            duration_seconds: float = 0,
+            item_count: int = 0,
+            byte_count: int = 0
+    ):
+        if phase not in self._phases:
+            self._phases[phase] = TaskPhaseTimingInfo(phase=phase, duration_seconds=0)
+        info = self._phases[phase]
+        info.duration_seconds += duration_seconds
+        info.item_count += item_count
+        info.byte_count += byte_count
+
+    @contextmanager
+    def phase(self, phase: str, item_count: int = 0, byte_count: int = 0):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(
+                phase,
+                duration_seconds=time.perf_counter() - start,
+                item_count=item_count,
+                byte_count=byte_count
+            )
+
+    async def measure(
+            self,
+            phase: str,
+            awaitable: Awaitable[T],
+            item_count: int = 1,
+            byte_count: int = 0
+    ) -> T:
+        with self.phase(phase, item_count=item_count, byte_count=byte_count):
+            return await awaitable
+
+    def get_timings(self) -> list[TaskPhaseTimingInfo]:
+        return [info.model_copy() for info in self._phases.values()]
@@ -0,0 +1,18 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from src.core.tasks.url.enums import TaskOperatorState, TaskOperatorOutcome
+from src.db.enums import TaskType
+
+
+class TaskOperatorStatusInfo(BaseModel):
+    task_type: TaskType
+    state: TaskOperatorState = TaskOperatorState.IDLE
+    runs_in_progress: int = 0
+    # Counted since the task manager was last triggered
+    runs_completed: int = 0
+    last_task_id: Optional[int] = None
+    last_outcome: Optional[TaskOperatorOutcome] = None
+    # The batch size for the operator's next run
+    batch_size: Optional[int] = None
@@ -33,6 +33,14 @@ class TaskHandler:
         task_id = await self.adb_client.initiate_task(task_type=task_type)
         return task_id
 
+    async def mark_interrupted_tasks(self, task_types: list[TaskType], stale_seconds: int):
+        task_ids = await self.adb_client.mark_interrupted_tasks(
+            task_types=task_types,
+            stale_seconds=stale_seconds
+        )
+        for task_id in task_ids:
+            self.logger.info(f"Marked stale task {task_id} as interrupted")
+
     async def handle_outcome(self, run_info: TaskOperatorRunInfo):  #
         match run_info.outcome:
             case TaskOperatorOutcome.ERROR:
@@ -0,0 +1,17 @@
+# Bounds on the number of URLs one task run takes on,
+# for operators without their own in `TASK_BATCH_SIZE_LIMITS`
+DEFAULT_MIN_BATCH_SIZE = 10
+DEFAULT_INITIAL_BATCH_SIZE = 100
+DEFAULT_MAX_BATCH_SIZE = 1000
+
+# Batches are sized so that a task run takes roughly this long
+TARGET_RUN_SECONDS = 60
+
+# Weight given to the latest run when averaging per-URL latency
+LATENCY_SMOOTHING = 0.5
+
+# Batches are halved when more of a run's URLs than this errored
+MAX_ERROR_RATE = 0.25
+
+# Batches are halved when the process's resident memory exceeds this
+MAX_RSS_BYTES = 2 * 1024 * 1024 * 1024
@@ -0,0 +1,111 @@
+from typing import Optional
+
+from src.core.tasks.url.batch_sizer.constants import TARGET_RUN_SECONDS, LATENCY_SMOOTHING, MAX_ERROR_RATE, \
+    MAX_RSS_BYTES
+from src.core.tasks.url.batch_sizer.dtos.limits import BatchSizeLimitsInfo
+from src.core.tasks.url.batch_sizer.dtos.state import BatchSizeStateInfo
+from src.db.enums import TaskType
+
+
+class AdaptiveBatchSizer:
+    """
+    Chooses how many URLs each operator's next task run takes on.
+
+    Batches are sized from each operator's average per-URL latency,
+    so that a run takes about `target_run_seconds`,
+    and are halved after a run with too many errors, or while memory is high.
+    A batch at most doubles from one run to the next,
+    and only grows after a run which was given a full batch.
+    """
+
+    def __init__(
+            self,
+            limits: dict[TaskType, BatchSizeLimitsInfo],
+            target_run_seconds: float = TARGET_RUN_SECONDS,
+            latency_smoothing: float = LATENCY_SMOOTHING,
+            max_error_rate: float = MAX_ERROR_RATE,
+            max_rss_bytes: int = MAX_RSS_BYTES
+    ):
+        self.limits = limits
+        self.target_run_seconds = target_run_seconds
+        self.latency_smoothing = latency_smoothing
+        self.max_error_rate = max_error_rate
+        self.max_rss_bytes = max_rss_bytes
+        self._states: dict[TaskType, BatchSizeStateInfo] = {}
+
+    def get_limits(self, task_type: TaskType) -> BatchSizeLimitsInfo:
+        return self.limits.get(task_type, BatchSizeLimitsInfo())
+
+    def _get_state(self, task_type: TaskType) -> BatchSizeStateInfo:
+        if task_type not in self._states:
+            self._states[task_type] = BatchSizeStateInfo(
+                batch_size=self.get_limits(task_type).initial_size
+            )
+        return self._states[task_type]
+
+    def get_batch_size(self, task_type: TaskType) -> int:
+        return self._get_state(task_type).batch_size
+
+    def record_run(
+            self,
+            task_type: TaskType,
+            batch_size: int,
+            url_count: int,
+            error_count: int,
+            duration_seconds: float,
+            rss_bytes: Optional[int] = None
+    ) -> int:
+        """
+        Update the operator's batch size from a finished run,
+        and return the new size.
+        """
+        state = self._get_state(task_type)
+        if url_count == 0:
+            return state.batch_size
+
+        seconds_per_url = duration_seconds / url_count
+        if state.seconds_per_url is None:
+            state.seconds_per_url = seconds_per_url
+        else:
+            state.seconds_per_url = (
+                self.latency_smoothing * seconds_per_url
+                + (1 - self.latency_smoothing) * state.seconds_per_url
+            )
+
+        state.batch_size = self._clamp(
+            task_type,
+            self._get_next_size(
+                state=state,
+                batch_size=batch_size,
+                url_count=url_count,
+                error_rate=error_count / url_count,
+                rss_bytes=rss_bytes
+            )
+        )
+        return state.batch_size
+
+    def _get_next_size(
+            self,
+            state: BatchSizeStateInfo,
+            batch_size: int,
+            url_count: int,
+            error_rate: float,
+            rss_bytes: Optional[int]
+    ) -> int:
+        if error_rate > self.max_error_rate:
+            return batch_size // 2
+        if rss_bytes is not None and rss_bytes > self.max_rss_bytes:
+            return batch_size // 2
+
+        if state.seconds_per_url > 0:
+            target_size = int(self.target_run_seconds / state.seconds_per_url)
+        else:
+            target_size = batch_size * 2
+        if url_count < batch_size:
+            # Fewer URLs were pending than asked for, so there is no evidence a larger batch would be handled
+            target_size = min(target_size, batch_size)
+        return max(batch_size // 2, min(target_size, batch_size * 2))
+
+    def _clamp(self, task_type: TaskType, batch_size: int) -> int:
+        limits = self.get_limits(task_type)
+        return max(limits.min_size, min(batch_size, limits.max_size))
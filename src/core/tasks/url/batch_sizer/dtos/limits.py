@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+from src.core.tasks.url.batch_sizer.constants import DEFAULT_MIN_BATCH_SIZE, DEFAULT_INITIAL_BATCH_SIZE, \
+    DEFAULT_MAX_BATCH_SIZE
+
+
+class BatchSizeLimitsInfo(BaseModel):
+    min_size: int = DEFAULT_MIN_BATCH_SIZE
+    initial_size: int = DEFAULT_INITIAL_BATCH_SIZE
+    max_size: int = DEFAULT_MAX_BATCH_SIZE
@@ -0,0 +1,9 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class BatchSizeStateInfo(BaseModel):
+    batch_size: int
+    # Averaged over recent runs
+    seconds_per_url: Optional[float] = None
@@ -0,0 +1,40 @@
+from src.core.tasks.url.batch_sizer.dtos.limits import BatchSizeLimitsInfo
+from src.db.enums import TaskType
+
+# Consecutive runs of one operator, within one trigger, before its loop is stopped
+TASK_REPEAT_THRESHOLD = 20
+
+# Task runs, across all operators, in progress at once
+MAX_CONCURRENT_TASK_RUNS = 4
+
+# Operators which only start once the listed operators have finished,
+# because they read what those operators write
+TASK_DEPENDENCIES: dict[TaskType, list[TaskType]] = {
+    TaskType.RELEVANCY: [TaskType.HTML],
+    TaskType.RECORD_TYPE: [TaskType.HTML],
+    # Falls back to the page's title and description for the name and description
+    TaskType.MISC_METADATA: [TaskType.HTML],
+}
+
+# Runs of one operator in progress at once. Operators not listed run one at a time.
+# Concurrent runs of one operator claim disjoint URLs, see `URLTaskOperatorBase.claim_urls`.
+TASK_CONCURRENCY_LIMITS: dict[TaskType, int] = {}
+
+# Seconds a worker holds its claim on a task run's URLs.
+# Claims left behind by crashed workers are reclaimed once this passes.
+URL_TASK_LEASE_SECONDS = 15 * 60
+
+# URLs whose results a task run persists together, before recording a checkpoint.
+# A run that dies loses at most one chunk of work.
+TASK_CHUNK_SIZE = 25
+
+# Bounds on the URLs one task run takes on, where they differ from the defaults.
+# Batches grow and shrink within these from observed latency, errors and memory.
+TASK_BATCH_SIZE_LIMITS: dict[TaskType, BatchSizeLimitsInfo] = {
+    # Page bodies are held in memory while fetched
+    TaskType.HTML: BatchSizeLimitsInfo(max_size=500),
+    # Rate-limited external APIs
+    TaskType.DUPLICATE_DETECTION: BatchSizeLimitsInfo(max_size=100),
+    TaskType.SUBMIT_APPROVED: BatchSizeLimitsInfo(max_size=100),
+    TaskType.RECORD_TYPE: BatchSizeLimitsInfo(max_size=200),
+}
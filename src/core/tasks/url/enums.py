@@ -4,3 +4,12 @@ from enum import Enum
 class TaskOperatorOutcome(Enum):
     SUCCESS = "success"
     ERROR = "error"
+
+
+class TaskOperatorState(Enum):
+    IDLE = "idle"
+    # Waiting for the operators it depends on to finish
+    BLOCKED = "blocked"
+    # Waiting for a free run slot
+    WAITING = "waiting"
+    RUNNING = "running"
@@ -0,0 +1,11 @@
+# Channel notified, with the task type as payload, when a task type's pending work grows
+URL_TASK_WORK_CHANNEL = "url_task_work"
+
+# Task runs start once no further notification has arrived for this long
+DEBOUNCE_SECONDS = 2
+
+# ...but no later than this after the first notification of a burst
+MAX_DEBOUNCE_DELAY_SECONDS = 10
+
+# Seconds waited before reconnecting after the listening connection is lost
+RECONNECT_DELAY_SECONDS = 5
@@ -0,0 +1,113 @@
+import asyncio
+import logging
+from typing import Callable, Awaitable
+
+import asyncpg
+
+from src.core.tasks.url.listener.constants import URL_TASK_WORK_CHANNEL, DEBOUNCE_SECONDS, \
+    MAX_DEBOUNCE_DELAY_SECONDS, RECONNECT_DELAY_SECONDS
+
+
+class TaskNotificationListener:
+    """
+    Starts URL task runs when new work is announced over Postgres `LISTEN/NOTIFY`,
+    rather than waiting for the hourly scheduled run.
+
+    A database trigger notifies `channel` whenever a task type's pending-work count goes up,
+    so new URLs are picked up whichever process or import wrote them.
+    Notifications are debounced: `on_work` is called once no notification
+    has arrived for `debounce_seconds`, or `max_delay_seconds` after the first of a burst.
+    Notifications sent while disconnected are lost, so `on_work` is also called on each (re)connection.
+    """
+
+    def __init__(
+            self,
+            db_url: str,
+            on_work: Callable[[], Awaitable[None]],
+            channel: str = URL_TASK_WORK_CHANNEL,
+            debounce_seconds: float = DEBOUNCE_SECONDS,
+            max_delay_seconds: float = MAX_DEBOUNCE_DELAY_SECONDS,
+            reconnect_delay_seconds: float = RECONNECT_DELAY_SECONDS
+    ):
+        self.db_url = db_url
+        self.on_work = on_work
+        self.channel = channel
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.reconnect_delay_seconds = reconnect_delay_seconds
+
+        self.logger = logging.getLogger(__name__)
+        self.logger.addHandler(logging.StreamHandler())
+        self.logger.setLevel(logging.INFO)
+
+        # Task types notified since `on_work` was last called
+        self.pending_task_types: set[str] = set()
+        self._last_notified_at: float = 0
+        self._debounce_task: asyncio.Task | None = None
+        self._listen_task: asyncio.Task | None = None
+        self._background_tasks: set[asyncio.Task] = set()
+
+    async def start(self):
+        self._listen_task = asyncio.create_task(self._listen())
+
+    async def _listen(self):
+        while True:
+            try:
+                await self._listen_until_disconnected()
+            except Exception as e:
+                self.logger.error(f"Error listening for task notifications: {e}")
+            await asyncio.sleep(self.reconnect_delay_seconds)
+
+    async def _listen_until_disconnected(self):
+        connection = await asyncpg.connect(self.db_url)
+        connection_lost = asyncio.Event()
+        try:
+            connection.add_termination_listener(lambda _: connection_lost.set())
+            await connection.add_listener(self.channel, self._on_notification)
+            self.logger.info(f"Listening for task notifications on {self.channel}")
+            self._run_in_background(self._run_work())
+            await connection_lost.wait()
+            self.logger.error("Lost the connection listening for task notifications")
+        finally:
+            await connection.close()
+
+    def _on_notification(self, connection, pid: int, channel: str, payload: str):
+        self.pending_task_types.add(payload)
+        self._last_notified_at = asyncio.get_running_loop().time()
+        if self._debounce_task is None or self._debounce_task.done():
+            self._debounce_task = asyncio.create_task(self._debounce())
+
+    async def _debounce(self):
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        while True:
+            now = loop.time()
+            remaining = min(
+                self._last_notified_at + self.debounce_seconds - now,
+                started_at + self.max_delay_seconds - now
+            )
+            if remaining <= 0:
+                break
+            await asyncio.sleep(remaining)
+        self.logger.info(f"New work for {sorted(self.pending_task_types)}, starting task run")
+        self.pending_task_types = set()
+        # Runs apart from the debounce, so notifications arriving during the run start a new burst
+        self._run_in_background(self._run_work())
+
+    async def _run_work(self):
+        try:
+            await self.on_work()
+        except Exception as e:
+            self.logger.error(f"Error starting task run from notification: {e}")
+
+    def _run_in_background(self, coroutine):
+        task = asyncio.create_task(coroutine)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def shutdown(self):
+        tasks = [self._listen_task, self._debounce_task, *self._background_tasks]
+        tasks = [task for task in tasks if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -12,6 +12,7 @@ from src.core.tasks.url.operators.submit_approved_url.core import SubmitApproved
 from src.core.tasks.url.operators.url_404_probe.core import URL404ProbeTaskOperator
 from src.core.tasks.url.operators.url_duplicate.core import URLDuplicateTaskOperator
 from src.core.tasks.url.operators.url_html.core import URLHTMLTaskOperator
+from src.core.tasks.url.operators.url_html.pipeline.constants import MAX_IN_FLIGHT_BODY_BYTES
 from src.core.tasks.url.operators.url_html.scraper.parser.core import HTMLResponseParser
 from src.core.tasks.url.operators.url_html.scraper.request_interface.core import URLRequestInterface
 from src.core.tasks.url.operators.url_miscellaneous_metadata.core import URLMiscellaneousMetadataTaskOperator
@@ -29,12 +30,14 @@ class URLTaskOperatorLoader:
             html_parser: HTMLResponseParser,
             pdap_client: PDAPClient,
             muckrock_api_interface: MuckrockAPIInterface,
-            hf_inference_client: HuggingFaceInferenceClient
+            hf_inference_client: HuggingFaceInferenceClient,
+            html_body_memory_budget_bytes: int = MAX_IN_FLIGHT_BODY_BYTES
     ):
         # Dependencies
         self.adb_client = adb_client
         self.url_request_interface = url_request_interface
         self.html_parser = html_parser
+        self.html_body_memory_budget_bytes = html_body_memory_budget_bytes
 
         # External clients and interfaces
         self.pdap_client = pdap_client
@@ -45,7 +48,8 @@ class URLTaskOperatorLoader:
         operator = URLHTMLTaskOperator(
             adb_client=self.adb_client,
             url_request_interface=self.url_request_interface,
-            html_parser=self.html_parser
+            html_parser=self.html_parser,
+            body_memory_budget_bytes=self.html_body_memory_budget_bytes
         )
         return operator
 
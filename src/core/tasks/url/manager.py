@@ -1,58 +1,176 @@
+import asyncio
+import copy
 import logging
+import time
 
+from src.core.tasks.dtos.operator_status import TaskOperatorStatusInfo
 from src.core.tasks.handler import TaskHandler
+from src.core.tasks.url.batch_sizer.core import AdaptiveBatchSizer
+from src.core.tasks.url.constants import TASK_REPEAT_THRESHOLD, MAX_CONCURRENT_TASK_RUNS, TASK_DEPENDENCIES, \
+    TASK_CONCURRENCY_LIMITS, TASK_BATCH_SIZE_LIMITS, URL_TASK_LEASE_SECONDS
 from src.core.tasks.url.loader import URLTaskOperatorLoader
+from src.core.tasks.url.operators.base import URLTaskOperatorBase
 from src.db.enums import TaskType
 from src.core.tasks.dtos.run_info import URLTaskOperatorRunInfo
-from src.core.tasks.url.enums import TaskOperatorOutcome
+from src.core.tasks.url.enums import TaskOperatorOutcome, TaskOperatorState
 from src.core.function_trigger import FunctionTrigger
+from src.util.helper_functions import get_rss_bytes
 
-TASK_REPEAT_THRESHOLD = 20
 
 class TaskManager:
+    """
+    Runs URL task operators, each until its prerequisites are no longer met.
+
+    Operators run concurrently, except that an operator listed in `dependencies`
+    waits until the operators it depends on have finished.
+    Every task run takes one of `max_concurrent_runs` shared slots,
+    and gives it up before its operator's next run,
+    so that an operator with a large backlog cannot starve the others.
+    Each run's batch size is chosen by `batch_sizer`, from how earlier runs went.
+    """
 
     def __init__(
             self,
             loader: URLTaskOperatorLoader,
-            handler: TaskHandler
+            handler: TaskHandler,
+            dependencies: dict[TaskType, list[TaskType]] = TASK_DEPENDENCIES,
+            concurrency_limits: dict[TaskType, int] = TASK_CONCURRENCY_LIMITS,
+            max_concurrent_runs: int = MAX_CONCURRENT_TASK_RUNS,
+            batch_sizer: AdaptiveBatchSizer | None = None
     ):
+        if batch_sizer is None:
+            batch_sizer = AdaptiveBatchSizer(limits=TASK_BATCH_SIZE_LIMITS)
         # Dependencies
         self.loader = loader
         self.handler = handler
 
+        self.dependencies = dependencies
+        self.concurrency_limits = concurrency_limits
+        self.max_concurrent_runs = max_concurrent_runs
+        self.batch_sizer = batch_sizer
+
         self.logger = logging.getLogger(__name__)
         self.logger.addHandler(logging.StreamHandler())
         self.logger.setLevel(logging.INFO)
         self.task_trigger = FunctionTrigger(self.run_tasks)
-        self.manager_status: TaskType = TaskType.IDLE
+        self.operator_statuses: dict[TaskType, TaskOperatorStatusInfo] = {}
+        self._run_slots = asyncio.Semaphore(max_concurrent_runs)
 
 
     #region Tasks
-    async def set_manager_status(self, task_type: TaskType):
-        self.manager_status = task_type
+    def get_operator_statuses(self) -> list[TaskOperatorStatusInfo]:
+        return list(self.operator_statuses.values())
 
     async def run_tasks(self):
         operators = await self.loader.get_task_operators()
-        for operator in operators:
-            count = 0
-            await self.set_manager_status(task_type=operator.task_type)
-
-            meets_prereq = await operator.meets_task_prerequisites()
-            while meets_prereq:
-                print(f"Running {operator.task_type.value} Task")
-                if count > TASK_REPEAT_THRESHOLD:
-                    message = f"Task {operator.task_type.value} has been run more than {TASK_REPEAT_THRESHOLD} times in a row. Task loop terminated."
+        # Tasks left in process by a worker that died are closed out first.
+        # Their URLs' leases expire at the same age, so this run picks up
+        # whatever their last checkpoint had not yet persisted.
+        await self.handler.mark_interrupted_tasks(
+            task_types=[operator.task_type for operator in operators],
+            stale_seconds=URL_TASK_LEASE_SECONDS
+        )
+        self.operator_statuses = {
+            operator.task_type: TaskOperatorStatusInfo(task_type=operator.task_type)
+            for operator in operators
+        }
+        finished = {operator.task_type: asyncio.Event() for operator in operators}
+        async with asyncio.TaskGroup() as task_group:
+            for operator in operators:
+                task_group.create_task(self.run_operator(operator, finished))
+
+    async def run_operator(
+            self,
+            operator: URLTaskOperatorBase,
+            finished: dict[TaskType, asyncio.Event]
+    ):
+        task_type = operator.task_type
+        status = self.operator_statuses[task_type]
+        try:
+            # Dependencies not loaded this time are not waited on
+            dependencies = [
+                finished[dependency] for dependency in self.dependencies.get(task_type, [])
+                if dependency in finished
+            ]
+            status.state = TaskOperatorState.BLOCKED
+            for dependency in dependencies:
+                await dependency.wait()
+
+            status.state = TaskOperatorState.WAITING
+            concurrency_limit = self.concurrency_limits.get(task_type, 1)
+            # Each concurrent run needs its own operator, as operators hold per-run state
+            lane_operators = [operator] + [copy.copy(operator) for _ in range(concurrency_limit - 1)]
+            async with asyncio.TaskGroup() as task_group:
+                for lane_operator in lane_operators:
+                    task_group.create_task(self.run_operator_loop(lane_operator, status))
+        finally:
+            status.state = TaskOperatorState.IDLE
+            finished[task_type].set()
+
+    async def run_operator_loop(
+            self,
+            operator: URLTaskOperatorBase,
+            status: TaskOperatorStatusInfo
+    ):
+        task_type = operator.task_type
+        while True:
+            async with self._run_slots:
+                if status.last_outcome == TaskOperatorOutcome.ERROR:
+                    return
+                if not await operator.meets_task_prerequisites():
+                    return
+                if status.runs_completed + status.runs_in_progress > TASK_REPEAT_THRESHOLD:
+                    message = f"Task {task_type.value} has been run more than {TASK_REPEAT_THRESHOLD} times in a row. Task loop terminated."
                     print(message)
                     await self.handler.post_to_discord(message=message)
-                    break
-                task_id = await self.handler.initiate_task_in_db(task_type=operator.task_type)
-                run_info: URLTaskOperatorRunInfo = await operator.run_task(task_id)
-                await self.conclude_task(run_info)
-                if run_info.outcome == TaskOperatorOutcome.ERROR:
-                    break
-                count += 1
-                meets_prereq = await operator.meets_task_prerequisites()
-        await self.set_manager_status(task_type=TaskType.IDLE)
+                    # Stops the operator's other runs too
+                    status.last_outcome = TaskOperatorOutcome.ERROR
+                    return
+                print(f"Running {task_type.value} Task")
+                status.runs_in_progress += 1
+                status.state = TaskOperatorState.RUNNING
+                try:
+                    task_id = await self.handler.initiate_task_in_db(task_type=task_type)
+                    status.last_task_id = task_id
+                    operator.batch_size = self.batch_sizer.get_batch_size(task_type)
+                    start_time = time.monotonic()
+                    run_info: URLTaskOperatorRunInfo = await operator.run_task(task_id)
+                    duration_seconds = time.monotonic() - start_time
+                    await self.conclude_task(run_info)
+                    status.batch_size = await self.update_batch_size(
+                        operator=operator,
+                        run_info=run_info,
+                        duration_seconds=duration_seconds
+                    )
+                finally:
+                    status.runs_in_progress -= 1
+                    if status.runs_in_progress == 0:
+                        status.state = TaskOperatorState.WAITING
+                status.runs_completed += 1
+                status.last_outcome = run_info.outcome
+                if not run_info.linked_url_ids:
+                    # The counted work is leased to other workers, so stop until the next trigger
+                    return
+
+    async def update_batch_size(
+            self,
+            operator: URLTaskOperatorBase,
+            run_info: URLTaskOperatorRunInfo,
+            duration_seconds: float
+    ) -> int:
+        url_count = len(run_info.linked_url_ids)
+        if run_info.outcome == TaskOperatorOutcome.ERROR:
+            error_count = url_count
+        else:
+            error_count = await self.handler.adb_client.count_url_errors_for_task(run_info.task_id)
+        return self.batch_sizer.record_run(
+            task_type=operator.task_type,
+            batch_size=operator.batch_size,
+            url_count=url_count,
+            error_count=error_count,
+            duration_seconds=duration_seconds,
+            rss_bytes=get_rss_bytes()
+        )
 
     async def trigger_task_run(self):
         await self.task_trigger.trigger_or_rerun()
@@ -64,7 +182,3 @@ class TaskManager:
             url_ids=run_info.linked_url_ids
         )
         await self.handler.handle_outcome(run_info)
-
-
-
-
@@ -32,12 +32,8 @@ class AgencyIdentificationTaskOperator(URLTaskOperatorBase):
     def task_type(self):
         return TaskType.AGENCY_IDENTIFICATION
 
-    async def meets_task_prerequisites(self):
-        has_urls_without_agency_suggestions = await self.adb_client.has_urls_without_agency_suggestions()
-        return has_urls_without_agency_suggestions
-
     async def get_pending_urls_without_agency_identification(self):
-        return await self.adb_client.get_urls_without_agency_suggestions()
+        return await self.adb_client.get_urls_without_agency_suggestions(limit=self.batch_size)
 
     async def get_muckrock_subtask(self):
         return MuckrockAgencyIdentificationSubtask(
@@ -69,16 +65,27 @@ class AgencyIdentificationTaskOperator(URLTaskOperatorBase):
 
     async def inner_task_logic(self):
         tdos: list[AgencyIdentificationTDO] = await self.get_pending_urls_without_agency_identification()
+        tdos = await self.claim_urls(tdos, get_url_id=lambda tdo: tdo.url_id)
         await self.link_urls_to_task(url_ids=[tdo.url_id for tdo in tdos])
+        await self.process_in_chunks(
+            tdos,
+            get_url_id=lambda tdo: tdo.url_id,
+            process_chunk=self.process_chunk
+        )
+
+    async def process_chunk(self, tdos: list[AgencyIdentificationTDO]):
         error_infos = []
         all_agency_suggestions = []
         for tdo in tdos:
             subtask = await self.get_subtask(tdo.collector_type)
             try:
-                new_agency_suggestions = await self.run_subtask(
-                    subtask,
-                    tdo.url_id,
-                    tdo.collector_metadata
+                new_agency_suggestions = await self.phase_timer.measure(
+                    "identify",
+                    self.run_subtask(
+                        subtask,
+                        tdo.url_id,
+                        tdo.collector_metadata
+                    )
                 )
                 all_agency_suggestions.extend(new_agency_suggestions)
             except Exception as e:
@@ -89,12 +96,13 @@ class AgencyIdentificationTaskOperator(URLTaskOperatorBase):
                 )
                 error_infos.append(error_info)
 
-        non_unknown_agency_suggestions = [suggestion for suggestion in all_agency_suggestions if suggestion.suggestion_type != SuggestionType.UNKNOWN]
-        await self.adb_client.upsert_new_agencies(non_unknown_agency_suggestions)
-        confirmed_suggestions = [suggestion for suggestion in all_agency_suggestions if suggestion.suggestion_type == SuggestionType.CONFIRMED]
-        await self.adb_client.add_confirmed_agency_url_links(confirmed_suggestions)
-        non_confirmed_suggestions = [suggestion for suggestion in all_agency_suggestions if suggestion.suggestion_type != SuggestionType.CONFIRMED]
-        await self.adb_client.add_agency_auto_suggestions(non_confirmed_suggestions)
-        await self.adb_client.add_url_error_infos(error_infos)
+        with self.phase_timer.phase("persist", item_count=len(tdos)):
+            non_unknown_agency_suggestions = [suggestion for suggestion in all_agency_suggestions if suggestion.suggestion_type != SuggestionType.UNKNOWN]
+            await self.adb_client.upsert_new_agencies(non_unknown_agency_suggestions)
+            confirmed_suggestions = [suggestion for suggestion in all_agency_suggestions if suggestion.suggestion_type == SuggestionType.CONFIRMED]
+            await self.adb_client.add_confirmed_agency_url_links(confirmed_suggestions)
+            non_confirmed_suggestions = [suggestion for suggestion in all_agency_suggestions if suggestion.suggestion_type != SuggestionType.CONFIRMED]
+            await self.adb_client.add_agency_auto_suggestions(non_confirmed_suggestions)
+            await self.adb_client.add_url_error_infos(error_infos)
 
 
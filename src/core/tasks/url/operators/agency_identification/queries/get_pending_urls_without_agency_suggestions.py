@@ -3,8 +3,10 @@ from typing import Any
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.collectors.enums import URLStatus, CollectorType
+from src.collectors.enums import CollectorType
 from src.core.tasks.url.operators.agency_identification.dtos.tdo import AgencyIdentificationTDO
+from src.db.constants import STANDARD_ROW_LIMIT
+from src.db.enums import TaskType
 from src.db.models.instantiations.batch import Batch
 from src.db.models.instantiations.link.link_batch_urls import LinkBatchURL
 from src.db.models.instantiations.url.core import URL
@@ -14,17 +16,21 @@ from src.db.statement_composer import StatementComposer
 
 class GetPendingURLsWithoutAgencySuggestionsQueryBuilder(QueryBuilderBase):
 
+    def __init__(self, limit: int = STANDARD_ROW_LIMIT):
+        super().__init__()
+        self.limit = limit
+
     async def run(self, session: AsyncSession) -> list[AgencyIdentificationTDO]:
 
         statement = (
             select(URL.id, URL.collector_metadata, Batch.strategy)
             .select_from(URL)
-            .where(URL.outcome == URLStatus.PENDING.value)
+            .where(StatementComposer.url_pending_for(TaskType.AGENCY_IDENTIFICATION))
             .join(LinkBatchURL)
             .join(Batch)
         )
-        statement = StatementComposer.exclude_urls_with_agency_suggestions(statement)
-        statement = statement.limit(100)
+        statement = StatementComposer.exclude_leased_urls(statement, TaskType.AGENCY_IDENTIFICATION)
+        statement = statement.limit(self.limit)
         raw_results = await session.execute(statement)
         return [
             AgencyIdentificationTDO(
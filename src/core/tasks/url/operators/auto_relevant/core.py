@@ -5,7 +5,7 @@ from src.core.tasks.url.operators.base import URLTaskOperatorBase
 from src.db.client.async_ import AsyncDatabaseClient
 from src.db.dtos.url.annotations.auto.relevancy import AutoRelevancyAnnotationInput
 from src.db.dtos.url.error import URLErrorPydanticInfo
-from src.db.enums import TaskType
+from src.db.enums import TaskType, ContentDedupSavingType
 from src.external.huggingface.inference.client import HuggingFaceInferenceClient
 from src.external.huggingface.inference.models.input import BasicInput
 
@@ -24,30 +24,53 @@ class URLAutoRelevantTaskOperator(URLTaskOperatorBase):
     def task_type(self):
         return TaskType.RELEVANCY
 
-    async def meets_task_prerequisites(self):
-        return await self.adb_client.has_urls_with_html_data_and_without_auto_relevant_suggestion()
-
     async def get_tdos(self) -> list[URLRelevantTDO]:
-        return await self.adb_client.get_tdos_for_auto_relevancy()
+        return await self.adb_client.get_tdos_for_auto_relevancy(limit=self.batch_size)
 
     async def inner_task_logic(self):
         tdos = await self.get_tdos()
+        tdos = await self.claim_urls(tdos, get_url_id=lambda tdo: tdo.url_id)
         url_ids = [tdo.url_id for tdo in tdos]
         await self.link_urls_to_task(url_ids=url_ids)
 
+        await self.process_in_chunks(
+            tdos,
+            get_url_id=lambda tdo: tdo.url_id,
+            process_chunk=self.process_chunk
+        )
+
+    async def process_chunk(self, tdos: list[URLRelevantTDO]):
         await self.get_ml_classifications(tdos)
         subsets = await separate_success_and_error_subsets(tdos)
 
-        await self.put_results_into_database(subsets.success)
-        await self.update_errors_in_database(subsets.error)
+        with self.phase_timer.phase("persist", item_count=len(tdos)):
+            await self.put_results_into_database(subsets.success)
+            await self.update_errors_in_database(subsets.error)
 
     async def get_ml_classifications(self, tdos: list[URLRelevantTDO]):
+        # Pages already classified under another URL are not sent again
+        annotations_by_hash = await self.phase_timer.measure(
+            "dedup_lookup",
+            self.adb_client.get_auto_relevant_annotations_by_content_hash(
+                [tdo.content_hash for tdo in tdos if tdo.content_hash is not None]
+            ),
+            item_count=len(tdos)
+        )
+        reused_count = 0
         for tdo in tdos:
+            if tdo.content_hash in annotations_by_hash:
+                tdo.annotation = annotations_by_hash[tdo.content_hash]
+                reused_count += 1
+                continue
             try:
                 input_ = BasicInput(
                     html=tdo.html
                 )
-                output = await self.hf_client.get_relevancy_annotation(input_)
+                output = await self.phase_timer.measure(
+                    "classify",
+                    self.hf_client.get_relevancy_annotation(input_),
+                    byte_count=len(tdo.html)
+                )
             except Exception as e:
                 tdo.error = str(e)
                 continue
@@ -58,6 +81,13 @@ class URLAutoRelevantTaskOperator(URLTaskOperatorBase):
                 model_name=output.model
             )
             tdo.annotation = annotation_info
+            if tdo.content_hash is not None:
+                annotations_by_hash[tdo.content_hash] = annotation_info
+
+        await self.adb_client.add_content_dedup_saving(
+            saving_type=ContentDedupSavingType.RELEVANCY,
+            count=reused_count
+        )
 
     async def put_results_into_database(self, tdos: list[URLRelevantTDO]):
         inputs = []
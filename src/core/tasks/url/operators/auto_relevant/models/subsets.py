@@ -1,6 +1,8 @@
+from pydantic import BaseModel
+
 from src.core.tasks.url.operators.auto_relevant.models.tdo import URLRelevantTDO
 
 
-class URLRelevantAnnotationOutcomeSubsets:
+class URLRelevantAnnotationOutcomeSubsets(BaseModel):
     success: list[URLRelevantTDO] = []
     error: list[URLRelevantTDO] = []
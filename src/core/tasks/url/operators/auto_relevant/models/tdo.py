@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 from src.core.tasks.url.operators.auto_relevant.models.annotation import RelevanceAnnotationInfo
@@ -6,6 +8,7 @@ from src.core.tasks.url.operators.auto_relevant.models.annotation import Relevan
 class URLRelevantTDO(BaseModel):
     url_id: int
     html: str
+    content_hash: Optional[str] = None
     annotation: RelevanceAnnotationInfo | None = None
     error: str | None = None
 
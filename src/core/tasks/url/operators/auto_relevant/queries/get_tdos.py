@@ -4,11 +4,11 @@ from sqlalchemy import select, Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from src.collectors.enums import URLStatus
+from src.db.constants import STANDARD_ROW_LIMIT
+from src.db.enums import TaskType
 from src.core.tasks.url.operators.auto_relevant.models.tdo import URLRelevantTDO
 from src.db.models.instantiations.url.compressed_html import URLCompressedHTML
 from src.db.models.instantiations.url.core import URL
-from src.db.models.instantiations.url.suggestion.relevant.auto import AutoRelevantSuggestion
 from src.db.queries.base.builder import QueryBuilderBase
 from src.db.statement_composer import StatementComposer
 from src.db.utils.compression import decompress_html
@@ -16,8 +16,9 @@ from src.db.utils.compression import decompress_html
 
 class GetAutoRelevantTDOsQueryBuilder(QueryBuilderBase):
 
-    def __init__(self):
+    def __init__(self, limit: int = STANDARD_ROW_LIMIT):
         super().__init__()
+        self.limit = limit
 
     async def run(self, session: AsyncSession) -> list[URLRelevantTDO]:
         query = (
@@ -26,17 +27,14 @@ class GetAutoRelevantTDOsQueryBuilder(QueryBuilderBase):
             )
             .options(
                 selectinload(URL.compressed_html)
+                .selectinload(URLCompressedHTML.content_blob)
             )
-            .join(URLCompressedHTML)
             .where(
-                URL.outcome == URLStatus.PENDING.value,
+                StatementComposer.url_pending_for(TaskType.RELEVANCY)
             )
         )
-        query = StatementComposer.exclude_urls_with_extant_model(
-            query,
-            model=AutoRelevantSuggestion
-        )
-        query = query.limit(100).order_by(URL.id)
+        query = StatementComposer.exclude_leased_urls(query, TaskType.RELEVANCY)
+        query = query.limit(self.limit).order_by(URL.id)
         raw_result = await session.execute(query)
         urls: Sequence[Row[URL]] = raw_result.unique().scalars().all()
         tdos = []
@@ -44,7 +42,8 @@ class GetAutoRelevantTDOsQueryBuilder(QueryBuilderBase):
             tdos.append(
                 URLRelevantTDO(
                     url_id=url.id,
-                    html=decompress_html(url.compressed_html.compressed_html),
+                    html=decompress_html(url.compressed_html.get_compressed_html()),
+                    content_hash=url.compressed_html.content_hash
                 )
             )
 
@@ -1,12 +1,20 @@
+import time
 import traceback
-from abc import ABC, abstractmethod
+from abc import ABC
+from typing import Callable, TypeVar, Awaitable
 
 from src.core.tasks.base.operator import TaskOperatorBase
+from src.core.tasks.base.phase_timer import TaskPhaseTimer
 from src.db.client.async_ import AsyncDatabaseClient
 from src.db.enums import TaskType
 from src.core.tasks.dtos.run_info import URLTaskOperatorRunInfo
+from src.core.tasks.url.batch_sizer.constants import DEFAULT_INITIAL_BATCH_SIZE
+from src.core.tasks.url.constants import URL_TASK_LEASE_SECONDS, TASK_CHUNK_SIZE
 from src.core.tasks.url.enums import TaskOperatorOutcome
 from src.core.enums import BatchStatus
+from src.util.helper_functions import get_worker_id
+
+T = TypeVar("T")
 
 
 class URLTaskOperatorBase(TaskOperatorBase):
@@ -15,19 +23,117 @@ class URLTaskOperatorBase(TaskOperatorBase):
         super().__init__(adb_client)
         self.tasks_linked = False
         self.linked_url_ids = []
+        self.worker_id = get_worker_id()
+        self.lease_seconds = URL_TASK_LEASE_SECONDS
+        self.claimed_url_ids = []
+        self.checkpointed_url_ids = set()
+        self.nothing_claimed = False
+        # The most URLs a run takes on, set by the task manager before each run
+        self.batch_size = DEFAULT_INITIAL_BATCH_SIZE
+        self.chunk_size = TASK_CHUNK_SIZE
 
-    @abstractmethod
     async def meets_task_prerequisites(self):
         """
         A task should not be initiated unless certain
-        conditions are met
+        conditions are met.
+        By default, that some URL has work outstanding for the task type,
+        per the pending-work counters.
+        """
+        return await self.adb_client.has_pending_work(self.task_type)
+
+    async def claim_urls(
+        self,
+        tdos: list[T],
+        get_url_id: Callable[[T], int]
+    ) -> list[T]:
+        """
+        Lease the URLs of the given TDOs to this worker,
+        returning only the TDOs whose URLs were claimed.
+        Other workers skip claimed URLs until this run releases them,
+        or until the lease expires.
+        """
+        claimed_url_ids = await self.phase_timer.measure(
+            "claim",
+            self.adb_client.claim_urls(
+                task_type=self.task_type,
+                url_ids=[get_url_id(tdo) for tdo in tdos],
+                worker_id=self.worker_id,
+                lease_seconds=self.lease_seconds
+            ),
+            item_count=len(tdos)
+        )
+        self.claimed_url_ids = claimed_url_ids
+        # The counters include URLs leased to other workers,
+        # so a run can find nothing left to claim
+        self.nothing_claimed = len(claimed_url_ids) == 0
+        claimed = set(claimed_url_ids)
+        return [tdo for tdo in tdos if get_url_id(tdo) in claimed]
+
+    async def release_claimed_urls(self):
+        if not self.claimed_url_ids:
+            return
+        try:
+            await self.adb_client.release_url_leases(
+                task_type=self.task_type,
+                worker_id=self.worker_id,
+                url_ids=self.claimed_url_ids
+            )
+        except Exception as e:
+            # The leases will expire on their own
+            print(f"Error releasing URL leases: {e}")
+        self.claimed_url_ids = []
+
+    async def process_in_chunks(
+        self,
+        tdos: list[T],
+        get_url_id: Callable[[T], int],
+        process_chunk: Callable[[list[T]], Awaitable[None]]
+    ):
+        """
+        Process and persist the TDOs one chunk at a time,
+        recording a checkpoint after each chunk.
+        If the run dies, the URLs of checkpointed chunks are no longer pending,
+        so the next run resumes with the rest.
         """
-        raise NotImplementedError
+        for start in range(0, len(tdos), self.chunk_size):
+            chunk = tdos[start:start + self.chunk_size]
+            await process_chunk(chunk)
+            await self.checkpoint([get_url_id(tdo) for tdo in chunk])
+
+    async def checkpoint(self, url_ids: list[int]):
+        self.checkpointed_url_ids.update(url_ids)
+        await self.phase_timer.measure(
+            "checkpoint",
+            self.record_checkpoint(url_ids),
+            item_count=len(url_ids)
+        )
+
+    async def record_checkpoint(self, url_ids: list[int]):
+        await self.adb_client.checkpoint_task(
+            task_id=self.task_id,
+            url_ids=url_ids
+        )
+        # Renewed so that runs longer than a lease keep their remaining URLs
+        # from being taken over by other workers
+        await self.adb_client.renew_url_leases(
+            task_type=self.task_type,
+            worker_id=self.worker_id,
+            url_ids=[
+                url_id for url_id in self.claimed_url_ids
+                if url_id not in self.checkpointed_url_ids
+            ],
+            lease_seconds=self.lease_seconds
+        )
 
     async def link_urls_to_task(self, url_ids: list[int]):
         self.linked_url_ids = url_ids
 
     async def conclude_task(self):
+        if not self.linked_url_ids and self.nothing_claimed:
+            return await self.run_info(
+                outcome=TaskOperatorOutcome.SUCCESS,
+                message="No unclaimed pending URLs were left to process"
+            )
         if not self.linked_url_ids:
             raise Exception("Task has not been linked to any URLs")
         return await self.run_info(
@@ -37,6 +143,11 @@ class URLTaskOperatorBase(TaskOperatorBase):
 
     async def run_task(self, task_id: int) -> URLTaskOperatorRunInfo:
         self.task_id = task_id
+        self.claimed_url_ids = []
+        self.checkpointed_url_ids = set()
+        self.nothing_claimed = False
+        self.phase_timer = TaskPhaseTimer()
+        start = time.perf_counter()
         try:
             await self.inner_task_logic()
             return await self.conclude_task()
@@ -46,6 +157,14 @@ class URLTaskOperatorBase(TaskOperatorBase):
                 outcome=TaskOperatorOutcome.ERROR,
                 message=str(e) + "\n" + stack_trace
             )
+        finally:
+            await self.release_claimed_urls()
+            self.phase_timer.add(
+                "run",
+                duration_seconds=time.perf_counter() - start,
+                item_count=len(self.linked_url_ids)
+            )
+            await self.save_phase_timings()
 
     async def run_info(
         self,
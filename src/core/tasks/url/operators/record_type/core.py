@@ -1,6 +1,6 @@
 from src.db.client.async_ import AsyncDatabaseClient
 from src.db.dtos.url.error import URLErrorPydanticInfo
-from src.db.enums import TaskType
+from src.db.enums import TaskType, ContentDedupSavingType
 from src.core.tasks.url.operators.record_type.tdo import URLRecordTypeTDO
 from src.core.tasks.url.operators.base import URLTaskOperatorBase
 from src.core.enums import RecordType
@@ -21,11 +21,10 @@ class URLRecordTypeTaskOperator(URLTaskOperatorBase):
     def task_type(self):
         return TaskType.RECORD_TYPE
 
-    async def meets_task_prerequisites(self):
-        return await self.adb_client.has_urls_with_html_data_and_without_auto_record_type_suggestion()
-
     async def get_tdos(self) -> list[URLRecordTypeTDO]:
-        urls_with_html = await self.adb_client.get_urls_with_html_data_and_without_auto_record_type_suggestion()
+        urls_with_html = await self.adb_client.get_urls_with_html_data_and_without_auto_record_type_suggestion(
+            limit=self.batch_size
+        )
         tdos = [URLRecordTypeTDO(url_with_html=url_with_html) for url_with_html in urls_with_html]
         return tdos
 
@@ -33,13 +32,22 @@ class URLRecordTypeTaskOperator(URLTaskOperatorBase):
         # Get pending urls from Source Collector
         # with HTML data and without Record Type Metadata
         tdos = await self.get_tdos()
+        tdos = await self.claim_urls(tdos, get_url_id=lambda tdo: tdo.url_with_html.url_id)
         url_ids = [tdo.url_with_html.url_id for tdo in tdos]
         await self.link_urls_to_task(url_ids=url_ids)
 
+        await self.process_in_chunks(
+            tdos,
+            get_url_id=lambda tdo: tdo.url_with_html.url_id,
+            process_chunk=self.process_chunk
+        )
+
+    async def process_chunk(self, tdos: list[URLRecordTypeTDO]):
         await self.get_ml_classifications(tdos)
         success_subset, error_subset = await self.separate_success_and_error_subsets(tdos)
-        await self.put_results_into_database(success_subset)
-        await self.update_errors_in_database(error_subset)
+        with self.phase_timer.phase("persist", item_count=len(tdos)):
+            await self.put_results_into_database(success_subset)
+            await self.update_errors_in_database(error_subset)
 
     async def update_errors_in_database(self, tdos: list[URLRecordTypeTDO]):
         error_infos = []
@@ -66,9 +74,37 @@ class URLRecordTypeTaskOperator(URLTaskOperatorBase):
         return success_subset, error_subset
 
     async def get_ml_classifications(self, tdos: list[URLRecordTypeTDO]):
+        # Pages already classified under another URL are not sent again
+        record_types_by_hash = await self.phase_timer.measure(
+            "dedup_lookup",
+            self.adb_client.get_auto_record_types_by_content_hash(
+                [
+                    tdo.url_with_html.content_hash for tdo in tdos
+                    if tdo.url_with_html.content_hash is not None
+                ]
+            ),
+            item_count=len(tdos)
+        )
+        reused_count = 0
         for tdo in tdos:
+            content_hash = tdo.url_with_html.content_hash
+            if content_hash in record_types_by_hash:
+                tdo.record_type = record_types_by_hash[content_hash]
+                reused_count += 1
+                continue
             try:
-                record_type_str = await self.classifier.classify_url(tdo.url_with_html.html_infos)
+                record_type_str = await self.phase_timer.measure(
+                    "classify",
+                    self.classifier.classify_url(tdo.url_with_html.html_infos)
+                )
                 tdo.record_type = RecordType(record_type_str)
             except Exception as e:
-                tdo.error = str(e)
\ No newline at end of file
+                tdo.error = str(e)
+                continue
+            if content_hash is not None:
+                record_types_by_hash[content_hash] = tdo.record_type
+
+        await self.adb_client.add_content_dedup_saving(
+            saving_type=ContentDedupSavingType.RECORD_TYPE,
+            count=reused_count
+        )
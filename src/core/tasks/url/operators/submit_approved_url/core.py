@@ -20,27 +20,37 @@ class SubmitApprovedURLTaskOperator(URLTaskOperatorBase):
     def task_type(self):
         return TaskType.SUBMIT_APPROVED
 
-    async def meets_task_prerequisites(self):
-        return await self.adb_client.has_validated_urls()
-
     async def inner_task_logic(self):
         # Retrieve all URLs that are validated and not submitted
-        tdos: list[SubmitApprovedURLTDO] = await self.adb_client.get_validated_urls()
+        tdos: list[SubmitApprovedURLTDO] = await self.adb_client.get_validated_urls(limit=self.batch_size)
+        tdos = await self.claim_urls(tdos, get_url_id=lambda tdo: tdo.url_id)
 
         # Link URLs to this task
         await self.link_urls_to_task(url_ids=[tdo.url_id for tdo in tdos])
 
+        await self.process_in_chunks(
+            tdos,
+            get_url_id=lambda tdo: tdo.url_id,
+            process_chunk=self.process_chunk
+        )
+
+    async def process_chunk(self, tdos: list[SubmitApprovedURLTDO]):
         # Submit each URL, recording errors if they exist
-        submitted_url_infos = await self.pdap_client.submit_urls(tdos)
+        submitted_url_infos = await self.phase_timer.measure(
+            "submit",
+            self.pdap_client.submit_urls(tdos),
+            item_count=len(tdos)
+        )
 
         error_infos = await self.get_error_infos(submitted_url_infos)
         success_infos = await self.get_success_infos(submitted_url_infos)
 
-        # Update the database for successful submissions
-        await self.adb_client.mark_urls_as_submitted(infos=success_infos)
+        with self.phase_timer.phase("persist", item_count=len(tdos)):
+            # Update the database for successful submissions
+            await self.adb_client.mark_urls_as_submitted(infos=success_infos)
 
-        # Update the database for failed submissions
-        await self.adb_client.add_url_error_infos(error_infos)
+            # Update the database for failed submissions
+            await self.adb_client.add_url_error_infos(error_infos)
 
     async def get_success_infos(self, submitted_url_infos):
         success_infos = [
@@ -30,11 +30,16 @@ class URL404ProbeTaskOperator(URLTaskOperatorBase):
         return TaskType.PROBE_404
 
     async def meets_task_prerequisites(self):
-        return await self.adb_client.has_pending_urls_not_recently_probed_for_404()
+        # The counters track URLs never probed; reprobes are due by age instead
+        if await self.adb_client.has_pending_work(self.task_type):
+            return True
+        return await self.adb_client.has_pending_urls_due_for_404_reprobe()
 
     async def probe_urls_for_404(self, tdos: list[URL404ProbeTDO]):
-        responses = await self.url_request_interface.make_simple_requests(
-            urls=[tdo.url for tdo in tdos]
+        # Conditional HEAD requests, so unchanged pages answer 304 without a body
+        responses = await self.url_request_interface.make_probe_requests(
+            urls=[tdo.url for tdo in tdos],
+            validators=[tdo.validators for tdo in tdos]
         )
         for tdo, response in zip(tdos, responses):
             if response.status is None:
@@ -44,16 +49,25 @@ class URL404ProbeTaskOperator(URLTaskOperatorBase):
 
     async def inner_task_logic(self):
         tdos = await self.get_pending_urls_not_recently_probed_for_404()
+        tdos = await self.claim_urls(tdos, get_url_id=lambda tdo: tdo.url_id)
         url_ids = [task_info.url_id for task_info in tdos]
         await self.link_urls_to_task(url_ids=url_ids)
-        await self.probe_urls_for_404(tdos)
+        await self.process_in_chunks(
+            tdos,
+            get_url_id=lambda tdo: tdo.url_id,
+            process_chunk=self.process_chunk
+        )
+
+    async def process_chunk(self, tdos: list[URL404ProbeTDO]):
+        await self.phase_timer.measure("probe", self.probe_urls_for_404(tdos), item_count=len(tdos))
         url_ids_404 = [tdo.url_id for tdo in tdos if tdo.is_404]
 
-        await self.update_404s_in_database(url_ids_404)
-        await self.mark_as_recently_probed_for_404(url_ids)
+        with self.phase_timer.phase("persist", item_count=len(tdos)):
+            await self.update_404s_in_database(url_ids_404)
+            await self.mark_as_recently_probed_for_404([tdo.url_id for tdo in tdos])
 
     async def get_pending_urls_not_recently_probed_for_404(self) -> list[URL404ProbeTDO]:
-        return await self.adb_client.get_pending_urls_not_recently_probed_for_404()
+        return await self.adb_client.get_pending_urls_not_recently_probed_for_404(limit=self.batch_size)
 
     async def update_404s_in_database(self, url_ids_404: list[int]):
         await self.adb_client.mark_all_as_404(url_ids_404)
@@ -2,8 +2,11 @@ from typing import Optional
 
 from pydantic import BaseModel
 
+from src.core.tasks.url.operators.url_html.scraper.request_interface.dtos.validators import FetchValidatorsInfo
+
 
 class URL404ProbeTDO(BaseModel):
     url_id: int
     url: str
-    is_404: Optional[bool] = None
\ No newline at end of file
+    is_404: Optional[bool] = None
+    validators: Optional[FetchValidatorsInfo] = None
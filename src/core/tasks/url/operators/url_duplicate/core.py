@@ -23,25 +23,45 @@ class URLDuplicateTaskOperator(URLTaskOperatorBase):
     def task_type(self):
         return TaskType.DUPLICATE_DETECTION
 
-    async def meets_task_prerequisites(self):
-        return await self.adb_client.has_pending_urls_not_checked_for_duplicates()
-
     async def inner_task_logic(self):
-        tdos: list[URLDuplicateTDO] = await self.adb_client.get_pending_urls_not_checked_for_duplicates()
+        tdos: list[URLDuplicateTDO] = await self.adb_client.get_pending_urls_not_checked_for_duplicates(
+            limit=self.batch_size
+        )
+        tdos = await self.claim_urls(tdos, get_url_id=lambda tdo: tdo.url_id)
         url_ids = [tdo.url_id for tdo in tdos]
         await self.link_urls_to_task(url_ids=url_ids)
+        for start in range(0, len(tdos), self.chunk_size):
+            chunk = tdos[start:start + self.chunk_size]
+            rate_limited = await self.process_chunk(chunk)
+            if rate_limited:
+                break
+
+    async def process_chunk(self, tdos: list[URLDuplicateTDO]) -> bool:
+        """
+        Check and persist one chunk of URLs, returning whether
+        the check was cut short by rate limiting.
+        Only the URLs checked are checkpointed.
+        """
         checked_tdos = []
+        rate_limited = False
         for tdo in tdos:
             try:
-                tdo.is_duplicate = await self.pdap_client.is_url_duplicate(tdo.url)
+                tdo.is_duplicate = await self.phase_timer.measure(
+                    "check",
+                    self.pdap_client.is_url_duplicate(tdo.url)
+                )
                 checked_tdos.append(tdo)
             except ClientResponseError as e:
                 print("ClientResponseError:", e.status)
                 if e.status == HTTPStatus.TOO_MANY_REQUESTS:
+                    rate_limited = True
                     break
                 raise e
 
         duplicate_url_ids = [tdo.url_id for tdo in checked_tdos if tdo.is_duplicate]
         checked_url_ids = [tdo.url_id for tdo in checked_tdos]
-        await self.adb_client.mark_all_as_duplicates(duplicate_url_ids)
-        await self.adb_client.mark_as_checked_for_duplicates(checked_url_ids)
+        with self.phase_timer.phase("persist", item_count=len(checked_url_ids)):
+            await self.adb_client.mark_all_as_duplicates(duplicate_url_ids)
+            await self.adb_client.mark_as_checked_for_duplicates(checked_url_ids)
+        await self.checkpoint(checked_url_ids)
+        return rate_limited
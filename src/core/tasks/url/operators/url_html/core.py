@@ -1,10 +1,24 @@
+import asyncio
+import contextlib
+import time
 from http import HTTPStatus
 
+from src.core.tasks.url.operators.url_html.pipeline.constants import MAX_IN_FLIGHT_BODY_BYTES, FETCH_WORKERS, \
+    PARSE_WORKERS, COMPRESS_WORKERS
+from src.core.tasks.url.operators.url_html.pipeline.core import StagePipeline
+from src.core.tasks.url.operators.url_html.pipeline.dtos.stage import PipelineStageInfo
+from src.core.tasks.url.operators.url_html.pipeline.memory_budget import BodyMemoryBudget
 from src.db.client.async_ import AsyncDatabaseClient
+from src.db.dtos.url.body_status import URLBodyStatusInfo
+from src.db.dtos.url.compressed_html import CompressedHTMLInfo
 from src.db.dtos.url.error import URLErrorPydanticInfo
+from src.db.dtos.url.fetch_validators import URLFetchValidatorsInfo
+from src.db.dtos.url.html_content import URLHTMLContentInfo
 from src.db.dtos.url.core import URLInfo
-from src.db.dtos.url.raw_html import RawHTMLInfo
-from src.db.enums import TaskType
+from src.db.dtos.url.render_decision import URLRenderDecisionInfo
+from src.db.enums import TaskType, ResponseBodyStatus, ContentDedupSavingType
+from src.db.utils.compression import compress_html
+from src.db.utils.content_hash import get_content_hash
 from src.core.tasks.url.operators.url_html.tdo import UrlHtmlTDO
 from src.core.tasks.url.operators.url_html.content_info_getter import HTMLContentInfoGetter
 from src.core.tasks.url.operators.base import URLTaskOperatorBase
@@ -13,33 +27,176 @@ from src.core.tasks.url.operators.url_html.scraper.request_interface.core import
 
 
 class URLHTMLTaskOperator(URLTaskOperatorBase):
+    """
+    Fetches, parses and stores the HTML of pending URLs.
+
+    URLs stream through fetch, parse and compress stages and are then persisted in small batches,
+    so that one slow host does not hold up the rest of the run.
+    Raw bodies between the fetch and compress stages count against `body_memory_budget_bytes`,
+    from before they are read.
+    """
 
     def __init__(
             self,
             url_request_interface: URLRequestInterface,
             adb_client: AsyncDatabaseClient,
-            html_parser: HTMLResponseParser
+            html_parser: HTMLResponseParser,
+            body_memory_budget_bytes: int = MAX_IN_FLIGHT_BODY_BYTES
     ):
         super().__init__(adb_client)
         self.url_request_interface = url_request_interface
         self.html_parser = html_parser
+        self.body_memory_budget_bytes = body_memory_budget_bytes
+
+        # Per-run state, reset by `inner_task_logic`
+        self.body_memory_budget = BodyMemoryBudget(body_memory_budget_bytes)
+        self.html_content_by_hash: dict[str, asyncio.Future] = {}
+        self.parses_saved = 0
+        self.storage_writes_saved = 0
 
     @property
     def task_type(self):
         return TaskType.HTML
 
-    async def meets_task_prerequisites(self):
-        return await self.adb_client.has_pending_urls_without_html_data()
-
     async def inner_task_logic(self):
         tdos = await self.get_pending_urls_without_html_data()
+        tdos = await self.claim_urls(tdos, get_url_id=lambda tdo: tdo.url_info.id)
         url_ids = [task_info.url_info.id for task_info in tdos]
         await self.link_urls_to_task(url_ids=url_ids)
-        await self.get_raw_html_data_for_urls(tdos)
+
+        self.body_memory_budget = BodyMemoryBudget(self.body_memory_budget_bytes)
+        self.html_content_by_hash = {}
+        self.parses_saved = 0
+        self.storage_writes_saved = 0
+
+        pipeline = StagePipeline(
+            stages=[
+                PipelineStageInfo(name="fetch", handler=self.fetch, workers=FETCH_WORKERS),
+                PipelineStageInfo(name="parse", handler=self.parse, workers=PARSE_WORKERS),
+                PipelineStageInfo(name="compress", handler=self.compress, workers=COMPRESS_WORKERS),
+            ],
+            sink=self.persist
+        )
+        # Root page titles are looked up while pages are fetched, so the parse stage rarely waits on them.
+        # Lookups of the same root share one fetch, with the parse stage's too.
+        prefetch = asyncio.ensure_future(
+            self.html_parser.prefetch_root_page_titles([tdo.url_info.url for tdo in tdos])
+        )
+        try:
+            await pipeline.run(tdos)
+        finally:
+            # Titles still outstanding are only needed by URLs whose fetch failed
+            prefetch.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await prefetch
+        await self.update_content_dedup_savings_in_database()
+
+    async def fetch(self, tdo: UrlHtmlTDO):
+        start = time.perf_counter()
+        # The body is reserved against the budget before it is read
+        tdo.url_response_info = await self.url_request_interface.fetch_and_render(
+            tdo.url_info.url,
+            body_budget=self.body_memory_budget
+        )
+        self.record_fetch_timing(tdo, duration_seconds=time.perf_counter() - start)
+        tdo.reserved_body_bytes = tdo.url_response_info.reserved_body_bytes
+        html = tdo.url_response_info.html
+        if html is None:
+            await self.release_body(tdo)
+            return
+        if len(html) > tdo.reserved_body_bytes:
+            # Rendered HTML can outgrow the static body reserved for it.
+            # The reservation is given up while waiting, so waits cannot deadlock
+            await self.release_body(tdo)
+            await self.body_memory_budget.acquire(len(html))
+            tdo.reserved_body_bytes = len(html)
+
+    async def release_body(self, tdo: UrlHtmlTDO):
+        await self.body_memory_budget.release(tdo.reserved_body_bytes)
+        tdo.reserved_body_bytes = 0
+
+    def record_fetch_timing(self, tdo: UrlHtmlTDO, duration_seconds: float):
+        # Rendering in the browser is counted apart from the plain HTTP fetch before it
+        render_timing = tdo.url_response_info.render_timing
+        if render_timing is not None:
+            self.phase_timer.add(
+                "render",
+                duration_seconds=render_timing.duration_seconds,
+                item_count=1
+            )
+            duration_seconds -= render_timing.duration_seconds
+        self.phase_timer.add(
+            "fetch",
+            duration_seconds=duration_seconds,
+            item_count=1,
+            byte_count=tdo.url_response_info.bytes_read or 0
+        )
+
+    async def parse(self, tdo: UrlHtmlTDO):
+        response_info = tdo.url_response_info
+        if not response_info.success:
+            return
+        # Skipped bodies were never downloaded
+        if response_info.html is None:
+            tdo.html_content_infos = await self.parse_html_content(tdo)
+            return
+
+        tdo.content_hash = get_content_hash(response_info.html)
+        # The first URL with a given page looks it up or parses it, and later ones share the result
+        if tdo.content_hash in self.html_content_by_hash:
+            self.parses_saved += 1
+        else:
+            self.html_content_by_hash[tdo.content_hash] = asyncio.ensure_future(
+                self.get_or_parse_html_content(tdo)
+            )
+        html_content_infos = await self.html_content_by_hash[tdo.content_hash]
+        tdo.html_content_infos = [
+            html_content_info.model_copy(update={"url_id": tdo.url_info.id})
+            for html_content_info in html_content_infos
+        ]
+
+    async def get_or_parse_html_content(self, tdo: UrlHtmlTDO) -> list[URLHTMLContentInfo]:
+        known_html_content_infos = await self.phase_timer.measure(
+            "dedup_lookup",
+            self.adb_client.get_html_content_infos_by_content_hash([tdo.content_hash])
+        )
+        if tdo.content_hash in known_html_content_infos:
+            self.parses_saved += 1
+            return known_html_content_infos[tdo.content_hash]
+        return await self.parse_html_content(tdo)
+
+    async def parse_html_content(self, tdo: UrlHtmlTDO) -> list[URLHTMLContentInfo]:
+        tdo.html_tag_info = await self.html_parser.parse(
+            url=tdo.url_info.url,
+            html_content=tdo.url_response_info.html,
+            content_type=tdo.url_response_info.content_type,
+            phase_timer=self.phase_timer
+        )
+        hcig = HTMLContentInfoGetter(
+            response_html_info=tdo.html_tag_info,
+            url_id=tdo.url_info.id
+        )
+        return hcig.get_all_html_content()
+
+    async def compress(self, tdo: UrlHtmlTDO):
+        response_info = tdo.url_response_info
+        if response_info.html is None:
+            return
+        if tdo.content_hash is None:
+            tdo.content_hash = get_content_hash(response_info.html)
+        # Brotli runs off the event loop, so fetches keep flowing meanwhile
+        with self.phase_timer.phase("compress", item_count=1, byte_count=len(response_info.html)):
+            tdo.compressed_html = await asyncio.to_thread(compress_html, response_info.html)
+        # Only the compressed copy is kept until the URL is persisted
+        response_info.html = None
+        await self.release_body(tdo)
+
+    async def persist(self, tdos: list[UrlHtmlTDO]):
         success_subset, error_subset = await self.separate_success_and_error_subsets(tdos)
         non_404_error_subset, is_404_error_subset = await self.separate_error_and_404_subsets(error_subset)
-        await self.process_html_data(success_subset)
-        await self.update_database(is_404_error_subset, non_404_error_subset, success_subset)
+        with self.phase_timer.phase("persist", item_count=len(tdos)):
+            await self.update_database(is_404_error_subset, non_404_error_subset, success_subset)
+        await self.checkpoint([tdo.url_info.id for tdo in tdos])
 
     async def update_database(
         self,
@@ -50,12 +207,12 @@ class URLHTMLTaskOperator(URLTaskOperatorBase):
         await self.update_errors_in_database(non_404_error_subset)
         await self.update_404s_in_database(is_404_error_subset)
         await self.update_html_data_in_database(success_subset)
-
-    async def get_just_urls(self, tdos: list[UrlHtmlTDO]):
-        return [task_info.url_info.url for task_info in tdos]
+        await self.update_render_decisions_in_database(
+            success_subset + non_404_error_subset + is_404_error_subset
+        )
 
     async def get_pending_urls_without_html_data(self):
-        pending_urls: list[URLInfo] = await self.adb_client.get_pending_urls_without_html_data()
+        pending_urls: list[URLInfo] = await self.adb_client.get_pending_urls_without_html_data(limit=self.batch_size)
         tdos = [
             UrlHtmlTDO(
                 url_info=url_info,
@@ -63,12 +220,6 @@ class URLHTMLTaskOperator(URLTaskOperatorBase):
         ]
         return tdos
 
-    async def get_raw_html_data_for_urls(self, tdos: list[UrlHtmlTDO]):
-        just_urls = await self.get_just_urls(tdos)
-        url_response_infos = await self.url_request_interface.make_requests_with_html(just_urls)
-        for tdto, url_response_info in zip(tdos, url_response_infos):
-            tdto.url_response_info = url_response_info
-
     async def separate_success_and_error_subsets(
             self,
             tdos: list[UrlHtmlTDO]
@@ -119,31 +270,83 @@ class URLHTMLTaskOperator(URLTaskOperatorBase):
             error_infos.append(error_info)
         await self.adb_client.add_url_error_infos(error_infos)
 
-    async def process_html_data(self, tdos: list[UrlHtmlTDO]):
-        for tdto in tdos:
-
-            html_tag_info = await self.html_parser.parse(
-                url=tdto.url_info.url,
-                html_content=tdto.url_response_info.html,
-                content_type=tdto.url_response_info.content_type
+    async def update_render_decisions_in_database(self, tdos: list[UrlHtmlTDO]):
+        render_decision_infos = []
+        for tdo in tdos:
+            render_decision = tdo.url_response_info.render_decision
+            # Only HTML responses are classified
+            if render_decision is None:
+                continue
+            render_decision_info = URLRenderDecisionInfo(
+                url_id=tdo.url_info.id,
+                rendered=render_decision.render,
+                reason=render_decision.reason
             )
-            tdto.html_tag_info = html_tag_info
+            render_timing = tdo.url_response_info.render_timing
+            if render_timing is not None:
+                render_decision_info.render_profile = render_timing.profile_type
+                render_decision_info.render_duration_seconds = render_timing.duration_seconds
+                render_decision_info.render_timed_out = render_timing.timed_out
+            render_decision_infos.append(render_decision_info)
+        await self.adb_client.add_url_render_decisions(render_decision_infos)
 
     async def update_html_data_in_database(self, tdos: list[UrlHtmlTDO]):
         html_content_infos = []
-        raw_html_data = []
+        compressed_html_infos = []
         for tdto in tdos:
-            hcig = HTMLContentInfoGetter(
-                response_html_info=tdto.html_tag_info,
-                url_id=tdto.url_info.id
-            )
-            rhi = RawHTMLInfo(
-                url_id=tdto.url_info.id,
-                html=tdto.url_response_info.html
+            html_content_infos.extend(tdto.html_content_infos)
+            # Skipped bodies were never downloaded
+            if tdto.compressed_html is None:
+                continue
+            compressed_html_infos.append(
+                CompressedHTMLInfo(
+                    url_id=tdto.url_info.id,
+                    content_hash=tdto.content_hash,
+                    compressed_html=tdto.compressed_html
+                )
             )
-            raw_html_data.append(rhi)
-            results = hcig.get_all_html_content()
-            html_content_infos.extend(results)
 
         await self.adb_client.add_html_content_infos(html_content_infos)
-        await self.adb_client.add_raw_html(raw_html_data)
+        self.storage_writes_saved += await self.adb_client.add_compressed_html(compressed_html_infos)
+        await self.update_body_statuses_in_database(tdos)
+        await self.update_fetch_validators_in_database(tdos)
+
+    async def update_content_dedup_savings_in_database(self):
+        await self.adb_client.add_content_dedup_saving(
+            saving_type=ContentDedupSavingType.PARSE,
+            count=self.parses_saved
+        )
+        await self.adb_client.add_content_dedup_saving(
+            saving_type=ContentDedupSavingType.STORAGE,
+            count=self.storage_writes_saved
+        )
+
+    async def update_fetch_validators_in_database(self, tdos: list[UrlHtmlTDO]):
+        fetch_validators_infos = []
+        for tdo in tdos:
+            validators = tdo.url_response_info.validators
+            if validators is None:
+                continue
+            fetch_validators_infos.append(
+                URLFetchValidatorsInfo(
+                    url_id=tdo.url_info.id,
+                    **validators.model_dump()
+                )
+            )
+        await self.adb_client.upsert_url_fetch_validators(fetch_validators_infos)
+
+    async def update_body_statuses_in_database(self, tdos: list[UrlHtmlTDO]):
+        body_status_infos = []
+        for tdo in tdos:
+            response_info = tdo.url_response_info
+            if response_info.body_status not in (ResponseBodyStatus.TRUNCATED, ResponseBodyStatus.SKIPPED):
+                continue
+            body_status_infos.append(
+                URLBodyStatusInfo(
+                    url_id=tdo.url_info.id,
+                    status=response_info.body_status,
+                    content_type=response_info.content_type,
+                    bytes_read=response_info.bytes_read
+                )
+            )
+        await self.adb_client.add_url_body_statuses(body_status_infos)
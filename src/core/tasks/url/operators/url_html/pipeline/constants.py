@@ -0,0 +1,10 @@
+# Items waiting between two stages
+STAGE_QUEUE_SIZE = 16
+# Concurrent workers per stage
+FETCH_WORKERS = 20
+PARSE_WORKERS = 8
+COMPRESS_WORKERS = 4
+# Most URLs written to the database in one persist call
+PERSIST_BATCH_SIZE = 25
+# Fetched bodies held between the fetch and compress stages
+MAX_IN_FLIGHT_BODY_BYTES = 64 * 1024 * 1024
@@ -0,0 +1,99 @@
+import asyncio
+from typing import Any, Callable, Awaitable
+
+from src.core.tasks.url.operators.url_html.pipeline.constants import STAGE_QUEUE_SIZE, PERSIST_BATCH_SIZE
+from src.core.tasks.url.operators.url_html.pipeline.dtos.stage import PipelineStageInfo
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+def _get_first_error(error: BaseException) -> BaseException:
+    while isinstance(error, BaseExceptionGroup):
+        error = error.exceptions[0]
+    return error
+
+
+class StagePipeline:
+    """
+    Passes items through a series of concurrent stages,
+    connected by bounded queues, and then into a batching sink.
+
+    Each item moves on as soon as its own stage completes,
+    so throughput is limited by the slowest stage rather than the slowest item,
+    and a full queue holds back the stages upstream of it.
+    """
+
+    def __init__(
+            self,
+            stages: list[PipelineStageInfo],
+            sink: Callable[[list[Any]], Awaitable[None]],
+            queue_size: int = STAGE_QUEUE_SIZE,
+            sink_batch_size: int = PERSIST_BATCH_SIZE
+    ):
+        self.stages = stages
+        self.sink = sink
+        self.queue_size = queue_size
+        self.sink_batch_size = sink_batch_size
+
+    async def _feed(self, items: list[Any], queue: asyncio.Queue, consumers: int):
+        for item in items:
+            await queue.put(item)
+        for _ in range(consumers):
+            await queue.put(_DONE)
+
+    @staticmethod
+    async def _work(stage: PipelineStageInfo, in_queue: asyncio.Queue, out_queue: asyncio.Queue):
+        while True:
+            item = await in_queue.get()
+            if item is _DONE:
+                return
+            await stage.handler(item)
+            await out_queue.put(item)
+
+    async def _run_stage(
+            self,
+            stage: PipelineStageInfo,
+            in_queue: asyncio.Queue,
+            out_queue: asyncio.Queue,
+            consumers: int
+    ):
+        async with asyncio.TaskGroup() as task_group:
+            for _ in range(stage.workers):
+                task_group.create_task(self._work(stage, in_queue, out_queue))
+        for _ in range(consumers):
+            await out_queue.put(_DONE)
+
+    async def _drain(self, queue: asyncio.Queue):
+        done = False
+        while not done:
+            batch = [await queue.get()]
+            # Take whatever else is already waiting, up to the batch size
+            while len(batch) < self.sink_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            if batch[-1] is _DONE:
+                batch.pop()
+                done = True
+            if batch:
+                await self.sink(batch)
+
+    async def run(self, items: list[Any]):
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        # The sink is a single consumer
+        consumer_counts = [stage.workers for stage in self.stages] + [1]
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                task_group.create_task(self._feed(items, queues[0], consumer_counts[0]))
+                for idx, stage in enumerate(self.stages):
+                    task_group.create_task(
+                        self._run_stage(
+                            stage=stage,
+                            in_queue=queues[idx],
+                            out_queue=queues[idx + 1],
+                            consumers=consumer_counts[idx + 1]
+                        )
+                    )
+                task_group.create_task(self._drain(queues[-1]))
+        except ExceptionGroup as e:
+            # Surface the error that stopped the pipeline, rather than the groups wrapping it
+            raise _get_first_error(e) from e
@@ -0,0 +1,9 @@
+from typing import Callable, Awaitable, Any
+
+from pydantic import BaseModel
+
+
+class PipelineStageInfo(BaseModel):
+    name: str
+    handler: Callable[[Any], Awaitable[None]]
+    workers: int
@@ -0,0 +1,28 @@
+import asyncio
+
+
+class BodyMemoryBudget:
+    """
+    Caps the total size of response bodies held in memory at once.
+
+    A body larger than the whole budget is still admitted,
+    but only once nothing else is held, so it cannot stall the pipeline.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.bytes_in_use = 0
+        self._condition = asyncio.Condition()
+
+    def _has_room(self, size: int) -> bool:
+        return self.bytes_in_use == 0 or self.bytes_in_use + size <= self.max_bytes
+
+    async def acquire(self, size: int):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._has_room(size))
+            self.bytes_in_use += size
+
+    async def release(self, size: int):
+        async with self._condition:
+            self.bytes_in_use -= size
+            self._condition.notify_all()
@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.db.constants import STANDARD_ROW_LIMIT
 from src.db.dto_converter import DTOConverter
 from src.db.dtos.url.core import URLInfo
 from src.db.models.instantiations.url.core import URL
@@ -9,9 +10,13 @@ from src.db.statement_composer import StatementComposer
 
 class GetPendingURLsWithoutHTMLDataQueryBuilder(QueryBuilderBase):
 
+    def __init__(self, limit: int = STANDARD_ROW_LIMIT):
+        super().__init__()
+        self.limit = limit
+
     async def run(self, session: AsyncSession) -> list[URLInfo]:
         statement = StatementComposer.pending_urls_without_html_data()
-        statement = statement.limit(100).order_by(URL.id)
+        statement = statement.limit(self.limit).order_by(URL.id)
         scalar_result = await session.scalars(statement)
         url_results: list[URL] = scalar_result.all()
 
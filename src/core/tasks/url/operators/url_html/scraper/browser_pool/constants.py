@@ -0,0 +1,6 @@
+# Number of browser contexts, and so the number of pages rendered at once
+POOL_SIZE = 5
+# Contexts are replaced after rendering this many pages
+MAX_PAGES_PER_CONTEXT = 50
+# Contexts are replaced once a page's JS heap exceeds this many bytes
+MAX_JS_HEAP_BYTES = 256 * 1024 * 1024
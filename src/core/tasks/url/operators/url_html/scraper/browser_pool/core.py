@@ -0,0 +1,159 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from playwright.async_api import async_playwright, Playwright, Browser, Page
+
+from src.core.tasks.url.operators.url_html.scraper.browser_pool.constants import POOL_SIZE, MAX_PAGES_PER_CONTEXT, \
+    MAX_JS_HEAP_BYTES
+from src.core.tasks.url.operators.url_html.scraper.browser_pool.dtos.context import PooledContextInfo
+from src.core.tasks.url.operators.url_html.scraper.browser_pool.dtos.metrics import BrowserPoolMetricsInfo
+
+# Chromium-only; returns 0 where `performance.memory` is unavailable
+JS_HEAP_SCRIPT = "() => performance.memory ? performance.memory.usedJSHeapSize : 0"
+
+
+class BrowserPool:
+    """
+    Keeps a single headless Chromium and up to `pool_size` browser contexts
+    alive across HTML task runs, so the browser is not cold-started per run.
+
+    The browser is launched on first use rather than at construction,
+    so that processes which never render pages never pay for it.
+    Contexts are recycled after `max_pages_per_context` pages,
+    or once a page's JS heap exceeds `max_js_heap_bytes`.
+    """
+
+    def __init__(
+            self,
+            pool_size: int = POOL_SIZE,
+            max_pages_per_context: int = MAX_PAGES_PER_CONTEXT,
+            max_js_heap_bytes: int = MAX_JS_HEAP_BYTES
+    ):
+        self.pool_size = pool_size
+        self.max_pages_per_context = max_pages_per_context
+        self.max_js_heap_bytes = max_js_heap_bytes
+
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._idle: list[PooledContextInfo] = []
+        self._slots = asyncio.Semaphore(pool_size)
+        self._start_lock = asyncio.Lock()
+
+        # Metrics
+        self._in_use = 0
+        self._waiting = 0
+        self._browser_launches = 0
+        self._pages_served = 0
+        self._contexts_recycled = 0
+
+    def _browser_running(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
+    async def _ensure_started(self):
+        async with self._start_lock:
+            if self._browser_running():
+                return
+            await self._close_browser()
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            self._browser_launches += 1
+
+    async def _checkout(self) -> PooledContextInfo:
+        if self._idle:
+            return self._idle.pop()
+        context = await self._browser.new_context()
+        return PooledContextInfo(context=context)
+
+    async def _close_context(self, pooled: PooledContextInfo):
+        try:
+            await pooled.context.close()
+        except Exception as e:
+            print(f"Error closing browser context: {e}")
+
+    def _needs_recycling(self, pooled: PooledContextInfo) -> bool:
+        if pooled.pages_served >= self.max_pages_per_context:
+            return True
+        return pooled.max_js_heap_bytes >= self.max_js_heap_bytes
+
+    async def _record_js_heap(self, pooled: PooledContextInfo, page: Page):
+        try:
+            heap_bytes = await page.evaluate(JS_HEAP_SCRIPT)
+        except Exception:
+            return
+        pooled.max_js_heap_bytes = max(pooled.max_js_heap_bytes, int(heap_bytes))
+
+    async def _checkin(self, pooled: PooledContextInfo, launch_number: int):
+        if launch_number != self._browser_launches or not self._browser_running():
+            # The browser went away while this context was checked out
+            return
+        if self._needs_recycling(pooled):
+            self._contexts_recycled += 1
+            await self._close_context(pooled)
+            return
+        self._idle.append(pooled)
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """
+        Check out a context from the pool, and yield a fresh page in it.
+        Waits while every context is in use.
+        """
+        self._waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+
+        try:
+            await self._ensure_started()
+            launch_number = self._browser_launches
+            pooled = await self._checkout()
+            self._in_use += 1
+            page = None
+            try:
+                page = await pooled.context.new_page()
+                yield page
+                await self._record_js_heap(pooled, page)
+            finally:
+                if page is not None:
+                    try:
+                        await page.close()
+                    except Exception as e:
+                        print(f"Error closing page: {e}")
+                pooled.pages_served += 1
+                self._pages_served += 1
+                self._in_use -= 1
+                await self._checkin(pooled, launch_number)
+        finally:
+            self._slots.release()
+
+    def get_metrics(self) -> BrowserPoolMetricsInfo:
+        return BrowserPoolMetricsInfo(
+            pool_size=self.pool_size,
+            contexts_in_use=self._in_use,
+            contexts_idle=len(self._idle),
+            waiting=self._waiting,
+            saturation=self._in_use / self.pool_size,
+            browser_running=self._browser_running(),
+            browser_launches=self._browser_launches,
+            pages_served=self._pages_served,
+            contexts_recycled=self._contexts_recycled
+        )
+
+    async def _close_browser(self):
+        self._idle = []
+        if self._browser is None:
+            return
+        try:
+            await self._browser.close()
+        except Exception as e:
+            print(f"Error closing browser: {e}")
+        self._browser = None
+
+    async def close(self):
+        await self._close_browser()
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+from playwright.async_api import BrowserContext
+
+
+class PooledContextInfo(BaseModel):
+    class Config:
+        arbitrary_types_allowed = True
+
+    context: BrowserContext
+    pages_served: int = 0
+    max_js_heap_bytes: int = 0
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+
+class BrowserPoolMetricsInfo(BaseModel):
+    pool_size: int
+    contexts_in_use: int
+    contexts_idle: int
+    # Callers currently waiting for a context to be released
+    waiting: int
+    # Fraction of contexts in use, from 0 to 1
+    saturation: float
+    browser_running: bool
+    browser_launches: int
+    pages_served: int
+    contexts_recycled: int
@@ -0,0 +1,8 @@
+# Maximum number of requests in flight across all hosts
+MAX_IN_FLIGHT = 100
+# Maximum number of requests in flight against a single host
+MAX_PER_HOST = 4
+# How long resolved hostnames are kept before being looked up again
+DNS_CACHE_TTL_SECONDS = 300
+# How long idle connections are kept open for reuse
+KEEPALIVE_TIMEOUT_SECONDS = 60
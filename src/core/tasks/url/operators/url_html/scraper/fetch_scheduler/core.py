@@ -0,0 +1,123 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from urllib.parse import urlparse
+
+from aiohttp import ClientSession, TCPConnector, ClientResponse
+
+from src.core.tasks.url.operators.url_html.scraper.fetch_scheduler.constants import MAX_IN_FLIGHT, MAX_PER_HOST, \
+    DNS_CACHE_TTL_SECONDS, KEEPALIVE_TIMEOUT_SECONDS
+from src.core.tasks.url.operators.url_html.scraper.fetch_scheduler.dtos.host_throughput import HostThroughputInfo
+
+
+class FetchScheduler:
+    """
+    Long-lived scheduler for outbound page requests.
+
+    Shared by the HTML, 404 probe, and root URL cache logic so that
+    connections and DNS lookups are reused across task runs,
+    and so that no single host receives more than `max_per_host`
+    concurrent requests.
+    """
+
+    def __init__(
+            self,
+            max_in_flight: int = MAX_IN_FLIGHT,
+            max_per_host: int = MAX_PER_HOST,
+            dns_cache_ttl: int = DNS_CACHE_TTL_SECONDS,
+            keepalive_timeout: int = KEEPALIVE_TIMEOUT_SECONDS
+    ):
+        self.max_in_flight = max_in_flight
+        self.max_per_host = max_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+
+        self._session: Optional[ClientSession] = None
+        self._global_semaphore = asyncio.Semaphore(max_in_flight)
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._host_stats: dict[str, HostThroughputInfo] = {}
+        self._host_busy_since: dict[str, float] = {}
+
+    async def get_session(self) -> ClientSession:
+        if self._session is None or self._session.closed:
+            connector = TCPConnector(
+                limit=self.max_in_flight,
+                limit_per_host=self.max_per_host,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = ClientSession(connector=connector)
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    @staticmethod
+    def get_host(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def _get_host_semaphore(self, host: str) -> asyncio.Semaphore:
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.max_per_host)
+        return self._host_semaphores[host]
+
+    def _get_host_stats(self, host: str) -> HostThroughputInfo:
+        if host not in self._host_stats:
+            self._host_stats[host] = HostThroughputInfo(host=host)
+        return self._host_stats[host]
+
+    def _mark_started(self, host: str, stats: HostThroughputInfo):
+        if stats.in_flight == 0:
+            self._host_busy_since[host] = time.monotonic()
+        stats.in_flight += 1
+
+    def _mark_finished(self, host: str, stats: HostThroughputInfo):
+        stats.in_flight -= 1
+        stats.request_count += 1
+        if stats.in_flight == 0:
+            stats.active_seconds += time.monotonic() - self._host_busy_since.pop(host)
+
+    @asynccontextmanager
+    async def request(
+            self,
+            method: str,
+            url: str,
+            **kwargs
+    ) -> AsyncIterator[ClientResponse]:
+        """
+        Issue a request once both a per-host and a global slot are free.
+        The per-host slot is acquired first, so that requests queued
+        for a busy host do not hold global slots other hosts could use.
+        """
+        host = self.get_host(url)
+        session = await self.get_session()
+        stats = self._get_host_stats(host)
+        async with self._get_host_semaphore(host):
+            async with self._global_semaphore:
+                self._mark_started(host, stats)
+                try:
+                    async with session.request(method, url, **kwargs) as response:
+                        yield response
+                        stats.bytes_received += response.content.total_bytes
+                except Exception:
+                    stats.error_count += 1
+                    raise
+                finally:
+                    self._mark_finished(host, stats)
+
+    def get_host_throughput(self) -> list[HostThroughputInfo]:
+        results = []
+        for stats in self._host_stats.values():
+            requests_per_second = 0
+            if stats.active_seconds > 0:
+                requests_per_second = stats.request_count / stats.active_seconds
+            results.append(
+                stats.model_copy(
+                    update={"requests_per_second": requests_per_second}
+                )
+            )
+        return sorted(results, key=lambda info: info.request_count, reverse=True)
@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class HostThroughputInfo(BaseModel):
+    host: str
+    request_count: int = 0
+    error_count: int = 0
+    in_flight: int = 0
+    bytes_received: int = 0
+    # Seconds during which at least one request to the host was in flight
+    active_seconds: float = 0
+    requests_per_second: float = 0
@@ -0,0 +1,57 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from src.core.tasks.url.operators.url_html.scraper.parser.dtos.response_html import ResponseHTMLInfo
+from src.core.tasks.url.operators.url_html.scraper.parser.enums import ParserTypeEnum, ParserEngineEnum
+from src.core.tasks.url.operators.url_html.scraper.parser.single_pass import parse_with_lxml
+from src.core.tasks.url.operators.url_html.scraper.parser.soup import parse_with_beautiful_soup
+
+ENGINE_TO_PARSE_FUNCTION = {
+    ParserEngineEnum.BEAUTIFUL_SOUP: parse_with_beautiful_soup,
+    ParserEngineEnum.LXML: parse_with_lxml
+}
+
+
+class ParseExecutor:
+    """
+    Runs HTML parsing in a pool of worker processes,
+    so that large pages do not block the event loop
+    and parsing of a batch spreads across cores.
+
+    The pool is started on first use.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        # None defers to the number of CPUs
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                # Forking a process running an event loop and threads is unsafe
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    async def parse(
+            self,
+            html_content: bytes,
+            parser_type: ParserTypeEnum,
+            engine: ParserEngineEnum = ParserEngineEnum.BEAUTIFUL_SOUP
+    ) -> ResponseHTMLInfo:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(),
+            ENGINE_TO_PARSE_FUNCTION[engine],
+            html_content,
+            parser_type
+        )
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
@@ -1,97 +1,62 @@
-import json
+import asyncio
 from typing import Optional
 
-from bs4 import BeautifulSoup
-
+from src.core.tasks.base.phase_timer import TaskPhaseTimer
+from src.core.tasks.url.operators.url_html.scraper.parse_executor.core import ParseExecutor
 from src.core.tasks.url.operators.url_html.scraper.parser.dtos.response_html import ResponseHTMLInfo
-from src.core.tasks.url.operators.url_html.scraper.parser.enums import ParserTypeEnum
-from src.core.tasks.url.operators.url_html.scraper.parser.constants import HEADER_TAGS
+from src.core.tasks.url.operators.url_html.scraper.parser.enums import ParserTypeEnum, ParserEngineEnum
 from src.core.tasks.url.operators.url_html.scraper.root_url_cache.core import RootURLCache
 from src.core.tasks.url.operators.url_html.scraper.parser.util import remove_excess_whitespace, add_https, remove_trailing_backslash, \
-    drop_hostname
+    drop_hostname, get_parser_type
 
 
 class HTMLResponseParser:
 
-    def __init__(self, root_url_cache: RootURLCache):
+    def __init__(
+            self,
+            root_url_cache: RootURLCache,
+            parse_executor: Optional[ParseExecutor] = None,
+            engine: ParserEngineEnum = ParserEngineEnum.BEAUTIFUL_SOUP
+    ):
+        if parse_executor is None:
+            parse_executor = ParseExecutor()
         self.root_url_cache = root_url_cache
+        self.parse_executor = parse_executor
+        self.engine = engine
 
-    async def parse(self, url: str, html_content: str, content_type: str) -> ResponseHTMLInfo:
-        html_info = ResponseHTMLInfo()
+    async def parse(
+            self,
+            url: str,
+            html_content: str,
+            content_type: str,
+            phase_timer: Optional[TaskPhaseTimer] = None
+    ) -> ResponseHTMLInfo:
+        parse_html_content = self.parse_html_content(html_content, content_type)
+        get_root_page_title = self.get_root_page_title(url)
+        if phase_timer is not None:
+            parse_html_content = phase_timer.measure(
+                "parse",
+                parse_html_content,
+                byte_count=len(html_content)
+            )
+            get_root_page_title = phase_timer.measure("root_title", get_root_page_title)
+        html_info, root_page_title = await asyncio.gather(
+            parse_html_content,
+            get_root_page_title
+        )
         self.add_url_and_path(html_info, html_content=html_content, url=url)
-        await self.add_root_page_titles(html_info)
+        html_info.root_page_title = root_page_title
+        return html_info
+
+    async def parse_html_content(self, html_content: str, content_type: str) -> ResponseHTMLInfo:
         parser_type = self.get_parser_type(content_type)
         if parser_type is None:
-            return html_info
-        self.add_html_from_beautiful_soup(
-            html_info=html_info,
+            return ResponseHTMLInfo()
+        return await self.parse_executor.parse(
+            html_content=html_content.encode("utf-8"),
             parser_type=parser_type,
-            html_content=html_content
-        )
-        return html_info
-
-    def add_html_from_beautiful_soup(
-            self,
-            html_info: ResponseHTMLInfo,
-            parser_type: ParserTypeEnum,
-            html_content: str
-    ):
-        soup = BeautifulSoup(
-            markup=html_content,
-            features=parser_type.value,
+            engine=self.engine
         )
-        html_info.title = self.get_html_title(soup)
-        html_info.description = self.get_meta_description(soup)
-        self.add_header_tags(html_info, soup)
-        html_info.div = self.get_div_text(soup)
-        # Prevents most bs4 memory leaks
-        if soup.html is not None:
-            soup.html.decompose()
-
-    def get_div_text(self, soup):
-        div_text = ""
-        MAX_WORDS = 500
-        for div in soup.find_all("div"):
-            text = div.get_text(" ", strip=True)
-            if text is None:
-                continue
-            # Check if adding the current text exceeds the word limit
-            if len(div_text.split()) + len(text.split()) <= MAX_WORDS:
-                div_text += text + " "
-            else:
-                break  # Stop adding text if word limit is reached
-
-        # Truncate to 5000 characters in case of run-on 'words'
-        div_text = div_text[: MAX_WORDS * 10]
-
-        return div_text
-
-    def get_meta_description(self, soup: BeautifulSoup) -> str:
-        meta_tag = soup.find("meta", attrs={"name": "description"})
-        if meta_tag is None:
-            return ""
-        try:
-            return remove_excess_whitespace(meta_tag["content"])
-        except KeyError:
-            return ""
-
-    def add_header_tags(self, html_info: ResponseHTMLInfo, soup: BeautifulSoup):
-        for header_tag in HEADER_TAGS:
-            headers = soup.find_all(header_tag)
-            # Retrieves and drops headers containing links to reduce training bias
-            header_content = [header.get_text(" ", strip=True) for header in headers if not header.a]
-            tag_content = json.dumps(header_content, ensure_ascii=False)
-            if tag_content == "[]":
-                continue
-            setattr(html_info, header_tag, tag_content)
-
-    def get_html_title(self, soup: BeautifulSoup) -> Optional[str]:
-        if soup.title is None:
-            return None
-        if soup.title.string is None:
-            return None
-        return remove_excess_whitespace(soup.title.string)
-
 
     def add_url_and_path(self, html_info: ResponseHTMLInfo, html_content: str, url: str):
         url = add_https(url)
@@ -101,20 +66,12 @@ class HTMLResponseParser:
         url_path = remove_trailing_backslash(url_path)
         html_info.url_path = url_path
 
-    async def add_root_page_titles(self, html_info: ResponseHTMLInfo):
-        root_page_title = await self.root_url_cache.get_title(html_info.url)
-        html_info.root_page_title = remove_excess_whitespace(
-            root_page_title
-        )
+    async def prefetch_root_page_titles(self, urls: list[str]):
+        await self.root_url_cache.prefetch(urls)
 
-    def get_parser_type(self, content_type: str) -> ParserTypeEnum or None:
-        try:
-            # If content type does not contain "html" or "xml" then we can assume that the content is unreadable
-            if "html" in content_type:
-                return ParserTypeEnum.LXML
-            if "xml" in content_type:
-                return ParserTypeEnum.LXML_XML
-            return None
-        except KeyError:
-            return None
+    async def get_root_page_title(self, url: str) -> str:
+        root_page_title = await self.root_url_cache.get_title(add_https(url))
+        return remove_excess_whitespace(root_page_title)
 
+    def get_parser_type(self, content_type: Optional[str]) -> Optional[ParserTypeEnum]:
+        return get_parser_type(content_type)
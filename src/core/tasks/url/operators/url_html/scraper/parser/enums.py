@@ -4,3 +4,8 @@ from enum import Enum
 class ParserTypeEnum(Enum):
     LXML = "lxml"
     LXML_XML = "lxml-xml"
+
+
+class ParserEngineEnum(Enum):
+    BEAUTIFUL_SOUP = "beautiful_soup"
+    LXML = "lxml"
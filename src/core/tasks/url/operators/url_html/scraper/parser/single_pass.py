@@ -0,0 +1,176 @@
+"""
+Single-pass lxml extraction of the tags stored for each URL.
+
+Produces the same fields as `parser/soup.py`, but walks the tree once.
+Header and div text is gathered during the walk,
+and div text stops being gathered as soon as it would exceed the word budget.
+Div text is taken from outermost divs only, so text in nested divs
+is not repeated.
+"""
+import json
+from typing import Optional
+
+from lxml import etree
+
+from src.core.tasks.url.operators.url_html.scraper.parser.constants import HEADER_TAGS
+from src.core.tasks.url.operators.url_html.scraper.parser.dtos.response_html import ResponseHTMLInfo
+from src.core.tasks.url.operators.url_html.scraper.parser.enums import ParserTypeEnum
+from src.core.tasks.url.operators.url_html.scraper.parser.util import remove_excess_whitespace
+
+MAX_DIV_WORDS = 500
+# Truncates div text in case of run-on 'words'
+MAX_DIV_CHARS = MAX_DIV_WORDS * 10
+
+# Text in these tags is not visible, and BeautifulSoup's `get_text` skips it in HTML documents
+SKIPPED_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+
+def _local_name(element) -> Optional[str]:
+    """Return the tag name without namespace, or None for comments and processing instructions."""
+    tag = element.tag
+    if not isinstance(tag, str):
+        return None
+    if tag.startswith("{"):
+        return tag.split("}", 1)[1]
+    return tag
+
+
+def _get_title(element) -> Optional[str]:
+    # Mirrors BeautifulSoup's `.string`, which is None unless the title holds only text
+    if len(element) > 0 or element.text is None:
+        return None
+    return remove_excess_whitespace(element.text)
+
+
+def _parse_tree(html_content: bytes, parser_type: ParserTypeEnum, encoding: str):
+    if parser_type == ParserTypeEnum.LXML_XML:
+        parser = etree.XMLParser(encoding=encoding, recover=True)
+    else:
+        parser = etree.HTMLParser(encoding=encoding)
+    try:
+        return etree.fromstring(html_content, parser)
+    except etree.XMLSyntaxError:
+        return None
+
+
+class _TextCollector:
+    """Gathers the text of one element as the walk passes through it."""
+
+    def __init__(self, element, skip_depth: int):
+        self.element = element
+        # Text is only taken outside skipped tags nested within the element
+        self.skip_depth = skip_depth
+        self.pieces: list[str] = []
+        self.word_count = 0
+        self.has_link = False
+
+    def add(self, piece: str):
+        self.pieces.append(piece)
+        self.word_count += len(piece.split())
+
+    def get_text(self) -> str:
+        return " ".join(self.pieces)
+
+
+def _non_element_tails(node):
+    """Tails of the comments and processing instructions from `node` on, which `iterwalk` does not visit."""
+    while node is not None and not isinstance(node.tag, str):
+        yield node.tail
+        node = node.getnext()
+
+
+def parse_with_lxml(
+        html_content: bytes,
+        parser_type: ParserTypeEnum,
+        encoding: str = "utf-8"
+) -> ResponseHTMLInfo:
+    html_info = ResponseHTMLInfo()
+    # Matches the BeautifulSoup parser, which sets None when there is no usable title
+    html_info.title = None
+    root = _parse_tree(html_content, parser_type, encoding)
+    if root is None:
+        return html_info
+
+    skipped_tags = SKIPPED_TEXT_TAGS if parser_type == ParserTypeEnum.LXML else frozenset()
+    title_found = False
+    description_found = False
+    # A slot is kept per header in document order, and left None if the header is dropped
+    headers: dict[str, list[Optional[str]]] = {header_tag: [] for header_tag in HEADER_TAGS}
+    header_collectors: list[tuple[_TextCollector, str, int]] = []
+    div_collector: Optional[_TextCollector] = None
+    div_pieces = []
+    div_words = 0
+    div_budget_spent = False
+    div_depth = 0
+    skip_depth = 0
+
+    def add_text(text: Optional[str]):
+        nonlocal div_collector, div_budget_spent
+        if not text:
+            return
+        piece = text.strip()
+        if not piece:
+            return
+        for collector, _, _ in header_collectors:
+            if collector.skip_depth == skip_depth and not collector.has_link:
+                collector.add(piece)
+        if div_collector is not None and div_collector.skip_depth == skip_depth:
+            div_collector.add(piece)
+            if div_words + div_collector.word_count > MAX_DIV_WORDS:
+                # The div no longer fits, so neither it nor any later div is kept
+                div_collector = None
+                div_budget_spent = True
+
+    for event, element in etree.iterwalk(root, events=("start", "end")):
+        name = _local_name(element)
+        if event == "end":
+            if header_collectors and header_collectors[-1][0].element is element:
+                collector, header_tag, slot = header_collectors.pop()
+                if not collector.has_link:
+                    headers[header_tag][slot] = collector.get_text()
+            if div_collector is not None and div_collector.element is element:
+                text = div_collector.get_text()
+                div_pieces.append(text + " ")
+                div_words += div_collector.word_count
+                div_collector = None
+            if name == "div":
+                div_depth -= 1
+            if name in skipped_tags:
+                skip_depth -= 1
+            add_text(element.tail)
+            for tail in _non_element_tails(element.getnext()):
+                add_text(tail)
+            continue
+
+        if name == "title" and not title_found:
+            title_found = True
+            html_info.title = _get_title(element)
+        elif name == "meta" and not description_found and element.get("name") == "description":
+            description_found = True
+            html_info.description = remove_excess_whitespace(element.get("content", ""))
+        elif name in headers:
+            header_collectors.append((_TextCollector(element, skip_depth), name, len(headers[name])))
+            headers[name].append(None)
+        elif name == "a":
+            # Drops headers containing links to reduce training bias
+            for collector, _, _ in header_collectors:
+                collector.has_link = True
+        elif name == "div":
+            if div_depth == 0 and not div_budget_spent:
+                div_collector = _TextCollector(element, skip_depth)
+            div_depth += 1
+
+        if name in skipped_tags:
+            skip_depth += 1
+        add_text(element.text)
+        if len(element) > 0:
+            for tail in _non_element_tails(element[0]):
+                add_text(tail)
+
+    for header_tag, header_content in headers.items():
+        header_content = [header_text for header_text in header_content if header_text is not None]
+        if len(header_content) == 0:
+            continue
+        setattr(html_info, header_tag, json.dumps(header_content, ensure_ascii=False))
+    html_info.div = "".join(div_pieces)[:MAX_DIV_CHARS]
+    return html_info
@@ -0,0 +1,84 @@
+"""
+BeautifulSoup extraction of the tags stored for each URL.
+
+Kept free of any async or database dependencies,
+so it can run in parse executor worker processes.
+"""
+import json
+from typing import Optional
+
+from bs4 import BeautifulSoup
+
+from src.core.tasks.url.operators.url_html.scraper.parser.constants import HEADER_TAGS
+from src.core.tasks.url.operators.url_html.scraper.parser.dtos.response_html import ResponseHTMLInfo
+from src.core.tasks.url.operators.url_html.scraper.parser.enums import ParserTypeEnum
+from src.core.tasks.url.operators.url_html.scraper.parser.util import remove_excess_whitespace
+
+
+def parse_with_beautiful_soup(
+        html_content: bytes,
+        parser_type: ParserTypeEnum,
+        encoding: str = "utf-8"
+) -> ResponseHTMLInfo:
+    html_info = ResponseHTMLInfo()
+    soup = BeautifulSoup(
+        markup=html_content,
+        features=parser_type.value,
+        from_encoding=encoding
+    )
+    html_info.title = get_html_title(soup)
+    html_info.description = get_meta_description(soup)
+    add_header_tags(html_info, soup)
+    html_info.div = get_div_text(soup)
+    # Prevents most bs4 memory leaks
+    if soup.html is not None:
+        soup.html.decompose()
+    return html_info
+
+
+def get_div_text(soup: BeautifulSoup) -> str:
+    div_text = ""
+    MAX_WORDS = 500
+    for div in soup.find_all("div"):
+        text = div.get_text(" ", strip=True)
+        if text is None:
+            continue
+        # Check if adding the current text exceeds the word limit
+        if len(div_text.split()) + len(text.split()) <= MAX_WORDS:
+            div_text += text + " "
+        else:
+            break  # Stop adding text if word limit is reached
+
+    # Truncate to 5000 characters in case of run-on 'words'
+    div_text = div_text[: MAX_WORDS * 10]
+
+    return div_text
+
+
+def get_meta_description(soup: BeautifulSoup) -> str:
+    meta_tag = soup.find("meta", attrs={"name": "description"})
+    if meta_tag is None:
+        return ""
+    try:
+        return remove_excess_whitespace(meta_tag["content"])
+    except KeyError:
+        return ""
+
+
+def add_header_tags(html_info: ResponseHTMLInfo, soup: BeautifulSoup):
+    for header_tag in HEADER_TAGS:
+        headers = soup.find_all(header_tag)
+        # Retrieves and drops headers containing links to reduce training bias
+        header_content = [header.get_text(" ", strip=True) for header in headers if not header.a]
+        tag_content = json.dumps(header_content, ensure_ascii=False)
+        if tag_content == "[]":
+            continue
+        setattr(html_info, header_tag, tag_content)
+
+
+def get_html_title(soup: BeautifulSoup) -> Optional[str]:
+    if soup.title is None:
+        return None
+    if soup.title.string is None:
+        return None
+    return remove_excess_whitespace(soup.title.string)
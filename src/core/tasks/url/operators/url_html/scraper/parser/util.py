@@ -1,8 +1,10 @@
+from typing import Optional
 from urllib.parse import urlparse
 
 from src.db.dtos.url.html_content import URLHTMLContentInfo
 from src.core.tasks.url.operators.url_html.scraper.parser.mapping import ENUM_TO_ATTRIBUTE_MAPPING
 from src.core.tasks.url.operators.url_html.scraper.parser.dtos.response_html import ResponseHTMLInfo
+from src.core.tasks.url.operators.url_html.scraper.parser.enums import ParserTypeEnum
 
 
 def convert_to_response_html_info(html_content_infos: list[URLHTMLContentInfo]):
@@ -41,3 +43,14 @@ def remove_trailing_backslash(url_path):
 def drop_hostname(new_url):
     url_path = urlparse(new_url).path[1:]
     return url_path
+
+
+def get_parser_type(content_type: Optional[str]) -> Optional[ParserTypeEnum]:
+    if content_type is None:
+        return None
+    # If content type does not contain "html" or "xml" then we can assume that the content is unreadable
+    if "html" in content_type:
+        return ParserTypeEnum.LXML
+    if "xml" in content_type:
+        return ParserTypeEnum.LXML_XML
+    return None
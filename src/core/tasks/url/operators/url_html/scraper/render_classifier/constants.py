@@ -0,0 +1,32 @@
+# Pages with less visible body text than this are assumed to be JS shells
+MIN_BODY_TEXT_CHARS = 200
+
+# Inline script characters per visible text character above which a page is rendered
+MAX_SCRIPT_TO_TEXT_RATIO = 10.0
+
+# Mount points used by common client-side frameworks
+SPA_ROOT_IDS = {
+    "root",
+    "app",
+    "__next",
+    "__nuxt",
+    "___gatsby",
+    "svelte",
+}
+SPA_ROOT_ATTRIBUTES = {
+    "ng-app",
+    "ng-version",
+    "data-reactroot",
+}
+
+NOSCRIPT_WARNING_PHRASES = (
+    "enable javascript",
+    "javascript enabled",
+    "javascript is required",
+    "javascript is disabled",
+    "requires javascript",
+    "need javascript",
+    "turn on javascript",
+)
+
+NON_VISIBLE_TAGS = ("script", "style", "noscript", "template")
@@ -0,0 +1,90 @@
+from typing import Optional
+
+from lxml import html as lxml_html
+from lxml.etree import ParserError, _Element
+
+from src.core.tasks.url.operators.url_html.scraper.render_classifier.constants import MIN_BODY_TEXT_CHARS, \
+    MAX_SCRIPT_TO_TEXT_RATIO, SPA_ROOT_IDS, SPA_ROOT_ATTRIBUTES, NOSCRIPT_WARNING_PHRASES, NON_VISIBLE_TAGS
+from src.core.tasks.url.operators.url_html.scraper.render_classifier.dtos.decision import RenderDecisionInfo
+from src.db.enums import RenderDecisionReason
+
+
+def _visible_text_length(element: _Element) -> int:
+    return len(" ".join(element.text_content().split()))
+
+
+class RenderClassifier:
+    """
+    Decides, from the static HTML of a page, whether the page
+    needs to be rendered in a browser to get its content.
+
+    Most pages are served fully formed, so rendering is reserved for
+    pages that look like client-rendered shells.
+    """
+
+    def __init__(
+            self,
+            min_body_text_chars: int = MIN_BODY_TEXT_CHARS,
+            max_script_to_text_ratio: float = MAX_SCRIPT_TO_TEXT_RATIO
+    ):
+        self.min_body_text_chars = min_body_text_chars
+        self.max_script_to_text_ratio = max_script_to_text_ratio
+
+    @staticmethod
+    def _decision(reason: RenderDecisionReason) -> RenderDecisionInfo:
+        return RenderDecisionInfo(
+            render=reason != RenderDecisionReason.STATIC,
+            reason=reason
+        )
+
+    @staticmethod
+    def _parse(html: str) -> Optional[_Element]:
+        try:
+            return lxml_html.document_fromstring(html)
+        except (ParserError, ValueError):
+            return None
+
+    @staticmethod
+    def _has_noscript_warning(noscript_text: str) -> bool:
+        noscript_text = noscript_text.lower()
+        return any(phrase in noscript_text for phrase in NOSCRIPT_WARNING_PHRASES)
+
+    def _has_empty_spa_root(self, body: _Element) -> bool:
+        for element in body.iter():
+            if not isinstance(element.tag, str):
+                continue
+            is_root = (
+                element.get("id") in SPA_ROOT_IDS
+                or any(attribute in element.attrib for attribute in SPA_ROOT_ATTRIBUTES)
+            )
+            if is_root and _visible_text_length(element) < self.min_body_text_chars:
+                return True
+        return False
+
+    def classify(self, html: str) -> RenderDecisionInfo:
+        document = self._parse(html)
+        if document is None:
+            return self._decision(RenderDecisionReason.UNPARSEABLE)
+        body = document.find("body")
+        if body is None:
+            body = document
+
+        script_chars = 0
+        noscript_text = ""
+        for element in list(document.iter(*NON_VISIBLE_TAGS)):
+            if element.tag == "script":
+                script_chars += len(element.text or "")
+            elif element.tag == "noscript":
+                noscript_text += element.text_content()
+            element.drop_tree()
+
+        body_text_chars = _visible_text_length(body)
+        if body_text_chars < self.min_body_text_chars:
+            return self._decision(RenderDecisionReason.NEAR_EMPTY_BODY)
+        if self._has_empty_spa_root(body):
+            return self._decision(RenderDecisionReason.SPA_ROOT)
+        if self._has_noscript_warning(noscript_text):
+            return self._decision(RenderDecisionReason.NOSCRIPT_WARNING)
+        if script_chars / body_text_chars > self.max_script_to_text_ratio:
+            return self._decision(RenderDecisionReason.HIGH_SCRIPT_RATIO)
+        return self._decision(RenderDecisionReason.STATIC)
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+from src.db.enums import RenderDecisionReason
+
+
+class RenderDecisionInfo(BaseModel):
+    render: bool
+    reason: RenderDecisionReason
@@ -0,0 +1,31 @@
+from src.core.tasks.url.operators.url_html.scraper.render_profile.dtos.profile import RenderProfileInfo
+from src.db.enums import RenderProfileType
+
+# Everything except the document, scripts and the data requests scripts make
+BLOCKED_RESOURCE_TYPES = frozenset({
+    "image",
+    "media",
+    "font",
+    "stylesheet",
+    "texttrack",
+    "manifest",
+    "ping",
+    "other",
+})
+SETTLE_SECONDS = 1.0
+PAGE_BUDGET_SECONDS = 15.0
+
+# Loads every resource and waits for the network to go quiet
+FULL_RENDER_PROFILE = RenderProfileInfo(
+    profile_type=RenderProfileType.FULL,
+    wait_for_network_idle=True
+)
+
+# Captures the DOM shortly after it is parsed, without non-document resources
+LEAN_RENDER_PROFILE = RenderProfileInfo(
+    profile_type=RenderProfileType.LEAN,
+    blocked_resource_types=BLOCKED_RESOURCE_TYPES,
+    wait_until="domcontentloaded",
+    settle_seconds=SETTLE_SECONDS,
+    page_budget_seconds=PAGE_BUDGET_SECONDS
+)
@@ -0,0 +1,17 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from src.db.enums import RenderProfileType
+
+
+class RenderProfileInfo(BaseModel):
+    profile_type: RenderProfileType
+    # Playwright resource types aborted before they are requested
+    blocked_resource_types: frozenset[str] = frozenset()
+    # Load state `page.goto` waits for before the DOM is captured
+    wait_until: str = "load"
+    wait_for_network_idle: bool = False
+    settle_seconds: float = 0
+    # Hard limit on the time spent rendering a single page
+    page_budget_seconds: Optional[float] = None
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+from src.db.enums import RenderProfileType
+
+
+class RenderTimingInfo(BaseModel):
+    profile_type: RenderProfileType
+    duration_seconds: float
+    timed_out: bool = False
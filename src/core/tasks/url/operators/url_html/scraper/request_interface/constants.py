@@ -1,2 +1,8 @@
 HTML_CONTENT_TYPE = "text/html"
-MAX_CONCURRENCY = 5
+
+# Bodies larger than this are cut off, since only their start is parsed
+MAX_BODY_BYTES = 10 * 1024 * 1024
+READ_CHUNK_BYTES = 64 * 1024
+
+# Statuses for which a HEAD probe is retried as a GET, since some servers mishandle HEAD
+HEAD_FALLBACK_STATUSES = {403, 405, 501}
@@ -1,27 +1,141 @@
+import asyncio
+import hashlib
+import time
 from http import HTTPStatus
 from typing import Optional
 
-from aiohttp import ClientSession, ClientResponseError
-from playwright.async_api import async_playwright
+from aiohttp import ClientResponseError, ClientResponse, hdrs
+from playwright.async_api import Page, Route
 from tqdm.asyncio import tqdm
 
-from src.core.tasks.url.operators.url_html.scraper.request_interface.constants import HTML_CONTENT_TYPE
-from src.core.tasks.url.operators.url_html.scraper.request_interface.dtos.request_resources import RequestResources
+from src.core.tasks.url.operators.url_html.pipeline.memory_budget import BodyMemoryBudget
+from src.core.tasks.url.operators.url_html.scraper.browser_pool.core import BrowserPool
+from src.core.tasks.url.operators.url_html.scraper.fetch_scheduler.core import FetchScheduler
+from src.core.tasks.url.operators.url_html.scraper.parser.util import get_parser_type
+from src.core.tasks.url.operators.url_html.scraper.render_classifier.core import RenderClassifier
+from src.core.tasks.url.operators.url_html.scraper.render_profile.constants import LEAN_RENDER_PROFILE
+from src.core.tasks.url.operators.url_html.scraper.render_profile.dtos.profile import RenderProfileInfo
+from src.core.tasks.url.operators.url_html.scraper.render_profile.dtos.timing import RenderTimingInfo
+from src.core.tasks.url.operators.url_html.scraper.request_interface.constants import HTML_CONTENT_TYPE, MAX_BODY_BYTES, \
+    HEAD_FALLBACK_STATUSES
 from src.core.tasks.url.operators.url_html.scraper.request_interface.dtos.url_response import URLResponseInfo
+from src.core.tasks.url.operators.url_html.scraper.request_interface.dtos.validators import FetchValidatorsInfo
+from src.core.tasks.url.operators.url_html.scraper.request_interface.util import read_body, decode_body
+from src.db.enums import ResponseBodyStatus
 
 
 class URLRequestInterface:
 
-    async def get_response(self, session: ClientSession, url: str) -> URLResponseInfo:
+    def __init__(
+            self,
+            fetch_scheduler: Optional[FetchScheduler] = None,
+            browser_pool: Optional[BrowserPool] = None,
+            render_classifier: Optional[RenderClassifier] = None,
+            render_profile: RenderProfileInfo = LEAN_RENDER_PROFILE,
+            max_body_bytes: int = MAX_BODY_BYTES
+    ):
+        if fetch_scheduler is None:
+            fetch_scheduler = FetchScheduler()
+        if browser_pool is None:
+            browser_pool = BrowserPool()
+        if render_classifier is None:
+            render_classifier = RenderClassifier()
+        self.fetch_scheduler = fetch_scheduler
+        self.browser_pool = browser_pool
+        self.render_classifier = render_classifier
+        self.render_profile = render_profile
+        self.max_body_bytes = max_body_bytes
+
+    async def _read_body(self, response: ClientResponse) -> tuple[bytes, bool]:
+        """Read at most `max_body_bytes` of the body, and report whether it was cut off."""
+        return await read_body(response, max_bytes=self.max_body_bytes)
+
+    def _get_body_reservation(self, response: ClientResponse) -> int:
+        """The most bytes `_read_body` can return for the response."""
+        # An encoded body is decoded as it is read, so can outgrow its Content-Length
+        if response.content_length is not None and hdrs.CONTENT_ENCODING not in response.headers:
+            return min(response.content_length, self.max_body_bytes)
+        return self.max_body_bytes
+
+    async def _read_body_within_budget(
+            self,
+            response: ClientResponse,
+            body_budget: BodyMemoryBudget
+    ) -> tuple[bytes, bool]:
+        """
+        Read the body once the budget has room for the most it can be,
+        keeping only its actual size reserved.
+        """
+        reserved_bytes = self._get_body_reservation(response)
+        await body_budget.acquire(reserved_bytes)
+        try:
+            body, truncated = await self._read_body(response)
+        except Exception:
+            await body_budget.release(reserved_bytes)
+            raise
+        await body_budget.release(reserved_bytes - len(body))
+        return body, truncated
+
+    @staticmethod
+    def _get_validators(response: ClientResponse, body: Optional[bytes] = None) -> FetchValidatorsInfo:
+        content_hash = None
+        if body is not None:
+            content_hash = hashlib.sha256(body).hexdigest()
+        return FetchValidatorsInfo(
+            etag=response.headers.get(hdrs.ETAG),
+            last_modified=response.headers.get(hdrs.LAST_MODIFIED),
+            content_length=response.content_length,
+            content_hash=content_hash
+        )
+
+    @staticmethod
+    def _get_conditional_headers(validators: Optional[FetchValidatorsInfo]) -> dict[str, str]:
+        headers = {}
+        if validators is None:
+            return headers
+        if validators.etag is not None:
+            headers[hdrs.IF_NONE_MATCH] = validators.etag
+        if validators.last_modified is not None:
+            headers[hdrs.IF_MODIFIED_SINCE] = validators.last_modified
+        return headers
+
+    async def get_response(
+            self,
+            url: str,
+            body_budget: Optional[BodyMemoryBudget] = None
+    ) -> URLResponseInfo:
+        """
+        Fetch a URL's body. With `body_budget`, the body is only read once the budget
+        has room for it, and the response's `reserved_body_bytes` stay held.
+        """
         try:
-            async with session.get(url, timeout=20) as response:
+            async with self.fetch_scheduler.request("GET", url, timeout=20) as response:
                 response.raise_for_status()
-                text = await response.text()
+                content_type = response.headers.get("content-type")
+                status = HTTPStatus(response.status)
+                # Bodies the parser would ignore are never downloaded
+                if content_type is not None and get_parser_type(content_type) is None:
+                    return URLResponseInfo(
+                        success=True,
+                        content_type=content_type,
+                        status=status,
+                        body_status=ResponseBodyStatus.SKIPPED,
+                        bytes_read=0,
+                        validators=self._get_validators(response)
+                    )
+                if body_budget is None:
+                    body, truncated = await self._read_body(response)
+                else:
+                    body, truncated = await self._read_body_within_budget(response, body_budget)
                 return URLResponseInfo(
                     success=True,
-                    html=text,
-                    content_type=response.headers.get("content-type"),
-                    status=HTTPStatus(response.status)
+                    html=decode_body(body, response.charset),
+                    content_type=content_type,
+                    status=status,
+                    body_status=ResponseBodyStatus.TRUNCATED if truncated else ResponseBodyStatus.COMPLETE,
+                    bytes_read=len(body),
+                    validators=self._get_validators(response, body),
+                    reserved_body_bytes=len(body) if body_budget is not None else 0
                 )
         except ClientResponseError as e:
             return URLResponseInfo(success=False, status=HTTPStatus(e.status), exception=str(e))
@@ -29,43 +143,129 @@ class URLRequestInterface:
             print(f"An error occurred while fetching {url}: {e}")
             return URLResponseInfo(success=False, exception=str(e))
 
-    async def fetch_and_render(self, rr: RequestResources, url: str) -> Optional[URLResponseInfo]:
-        simple_response = await self.get_response(rr.session, url)
+    async def _get_status(self, method: str, url: str, headers: dict[str, str]) -> URLResponseInfo:
+        """Request `url` without reading the body, for when only the status matters."""
+        try:
+            async with self.fetch_scheduler.request(method, url, headers=headers, timeout=20) as response:
+                response.raise_for_status()
+                return URLResponseInfo(
+                    success=True,
+                    content_type=response.headers.get("content-type"),
+                    status=HTTPStatus(response.status),
+                    body_status=ResponseBodyStatus.SKIPPED,
+                    bytes_read=0
+                )
+        except ClientResponseError as e:
+            return URLResponseInfo(success=False, status=HTTPStatus(e.status), exception=str(e))
+        except Exception as e:
+            print(f"An error occurred while probing {url}: {e}")
+            return URLResponseInfo(success=False, exception=str(e))
+
+    async def probe(
+            self,
+            url: str,
+            validators: Optional[FetchValidatorsInfo] = None
+    ) -> URLResponseInfo:
+        """
+        Check whether a URL is still alive, without downloading its body.
+
+        Sends a conditional HEAD request, and falls back to a conditional GET
+        for servers that reject HEAD. A 304 Not Modified counts as alive.
+        """
+        headers = self._get_conditional_headers(validators)
+        response = await self._get_status("HEAD", url, headers)
+        if response.status is not None and response.status.value in HEAD_FALLBACK_STATUSES:
+            response = await self._get_status("GET", url, headers)
+        return response
+
+    async def fetch_and_render(
+            self,
+            url: str,
+            body_budget: Optional[BodyMemoryBudget] = None
+    ) -> Optional[URLResponseInfo]:
+        simple_response = await self.get_response(url, body_budget=body_budget)
         if not simple_response.success:
             return simple_response
 
         if simple_response.content_type != HTML_CONTENT_TYPE:
             return simple_response
 
-        return await self.get_dynamic_html_content(rr, url)
+        # Only render pages whose static HTML looks like a client-rendered shell.
+        # Classifying parses the whole body, so it is kept off the event loop
+        render_decision = await asyncio.to_thread(self.render_classifier.classify, simple_response.html)
+        if not render_decision.render:
+            simple_response.render_decision = render_decision
+            return simple_response
+
+        dynamic_response = await self.get_dynamic_html_content(url)
+        if dynamic_response.render_timing is not None and dynamic_response.render_timing.timed_out:
+            # A page too slow to render still has its static HTML
+            simple_response.render_decision = render_decision
+            simple_response.render_timing = dynamic_response.render_timing
+            return simple_response
+        dynamic_response.render_decision = render_decision
+        dynamic_response.validators = simple_response.validators
+        # Left for the caller to settle against the rendered HTML
+        dynamic_response.reserved_body_bytes = simple_response.reserved_body_bytes
+        return dynamic_response
+
+    async def _block_resource(self, route: Route):
+        if route.request.resource_type in self.render_profile.blocked_resource_types:
+            await route.abort()
+            return
+        await route.continue_()
 
-    async def get_dynamic_html_content(self, rr, url):
+    async def _render(self, page: Page, url: str) -> str:
+        profile = self.render_profile
+        if profile.blocked_resource_types:
+            await page.route("**/*", self._block_resource)
+        await page.goto(url, wait_until=profile.wait_until)
+        if profile.wait_for_network_idle:
+            await page.wait_for_load_state("networkidle")
+        if profile.settle_seconds > 0:
+            await asyncio.sleep(profile.settle_seconds)
+        return await page.content()
+
+    async def get_dynamic_html_content(self, url: str) -> URLResponseInfo:
         # For HTML responses, attempt to load the page to check for dynamic html content
-        async with rr.semaphore:
-            page = await rr.browser.new_page()
-            try:
-                await page.goto(url)
-                await page.wait_for_load_state("networkidle")
-                html_content = await page.content()
-                return URLResponseInfo(
+        profile = self.render_profile
+        start = None
+        timed_out = False
+        try:
+            async with self.browser_pool.page() as page:
+                start = time.perf_counter()
+                html_content = await asyncio.wait_for(
+                    self._render(page, url),
+                    timeout=profile.page_budget_seconds
+                )
+                response = URLResponseInfo(
                     success=True,
                     html=html_content,
                     content_type=HTML_CONTENT_TYPE,
                     status=HTTPStatus.OK
                 )
-            except Exception as e:
-                return URLResponseInfo(success=False, exception=str(e))
-            finally:
-                await page.close()
+        except asyncio.TimeoutError:
+            timed_out = True
+            response = URLResponseInfo(
+                success=False,
+                exception=f"Render exceeded budget of {profile.page_budget_seconds} seconds"
+            )
+        except Exception as e:
+            response = URLResponseInfo(success=False, exception=str(e))
+
+        # Time spent waiting for a browser context is not part of the render
+        if start is not None:
+            response.render_timing = RenderTimingInfo(
+                profile_type=profile.profile_type,
+                duration_seconds=time.perf_counter() - start,
+                timed_out=timed_out
+            )
+        return response
 
     async def fetch_urls(self, urls: list[str]) -> list[URLResponseInfo]:
-        async with ClientSession() as session:
-            async with async_playwright() as playwright:
-                browser = await playwright.chromium.launch(headless=True)
-                request_resources = RequestResources(session=session, browser=browser)
-                tasks = [self.fetch_and_render(request_resources, url) for url in urls]
-                results = await tqdm.gather(*tasks)
-                return results
+        tasks = [self.fetch_and_render(url) for url in urls]
+        results = await tqdm.gather(*tasks)
+        return results
 
     async def make_requests_with_html(
             self,
@@ -74,7 +274,15 @@ class URLRequestInterface:
         return await self.fetch_urls(urls)
 
     async def make_simple_requests(self, urls: list[str]) -> list[URLResponseInfo]:
-        async with ClientSession() as session:
-            tasks = [self.get_response(session, url) for url in urls]
-            results = await tqdm.gather(*tasks)
-            return results
+        tasks = [self.get_response(url) for url in urls]
+        results = await tqdm.gather(*tasks)
+        return results
+
+    async def make_probe_requests(
+            self,
+            urls: list[str],
+            validators: list[Optional[FetchValidatorsInfo]]
+    ) -> list[URLResponseInfo]:
+        tasks = [self.probe(url, url_validators) for url, url_validators in zip(urls, validators)]
+        results = await tqdm.gather(*tasks)
+        return results
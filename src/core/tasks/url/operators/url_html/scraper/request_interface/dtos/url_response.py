@@ -3,6 +3,11 @@ from typing import Optional
 
 from pydantic import BaseModel
 
+from src.core.tasks.url.operators.url_html.scraper.render_classifier.dtos.decision import RenderDecisionInfo
+from src.core.tasks.url.operators.url_html.scraper.render_profile.dtos.timing import RenderTimingInfo
+from src.core.tasks.url.operators.url_html.scraper.request_interface.dtos.validators import FetchValidatorsInfo
+from src.db.enums import ResponseBodyStatus
+
 
 class URLResponseInfo(BaseModel):
     success: bool
@@ -10,3 +15,11 @@ class URLResponseInfo(BaseModel):
     html: Optional[str] = None
     content_type: Optional[str] = None
     exception: Optional[str] = None
+    body_status: Optional[ResponseBodyStatus] = None
+    bytes_read: Optional[int] = None
+    validators: Optional[FetchValidatorsInfo] = None
+    render_decision: Optional[RenderDecisionInfo] = None
+    render_timing: Optional[RenderTimingInfo] = None
+    # Bytes still held against the body memory budget the body was read under,
+    # for the caller to release
+    reserved_body_bytes: int = 0
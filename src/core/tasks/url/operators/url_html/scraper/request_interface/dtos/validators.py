@@ -0,0 +1,12 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class FetchValidatorsInfo(BaseModel):
+    """Values used to tell whether a page has changed since it was last fetched."""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_length: Optional[int] = None
+    # SHA-256 of the body as read, which is capped at the fetcher's body size limit
+    content_hash: Optional[str] = None
@@ -0,0 +1,27 @@
+from typing import Optional
+
+from aiohttp import ClientResponse
+
+from src.core.tasks.url.operators.url_html.scraper.request_interface.constants import READ_CHUNK_BYTES
+
+
+async def read_body(response: ClientResponse, max_bytes: int) -> tuple[bytes, bool]:
+    """Read at most `max_bytes` of the body, and report whether it was cut off."""
+    chunks = []
+    bytes_read = 0
+    async for chunk in response.content.iter_chunked(READ_CHUNK_BYTES):
+        remaining = max_bytes - bytes_read
+        if len(chunk) > remaining:
+            chunks.append(chunk[:remaining])
+            return b"".join(chunks), True
+        chunks.append(chunk)
+        bytes_read += len(chunk)
+    return b"".join(chunks), False
+
+
+def decode_body(body: bytes, charset: Optional[str]) -> str:
+    try:
+        return body.decode(charset or "utf-8", errors="replace")
+    except LookupError:
+        # Unknown charset declared by the server
+        return body.decode("utf-8", errors="replace")
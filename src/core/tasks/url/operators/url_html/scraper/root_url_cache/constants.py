@@ -8,3 +8,14 @@ REQUEST_HEADERS = {
         # Make sure there's no pre-mature closing of responses before a redirect completes
         "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.9",
     }
+
+# Maximum number of root URLs held in memory
+MAX_CACHE_SIZE = 10_000
+# How long a title stays in memory before it is re-read from the database
+CACHE_TTL_SECONDS = 24 * 60 * 60
+# How long a failed root fetch is remembered before it is retried
+NEGATIVE_CACHE_TTL_SECONDS = 60 * 60
+# Root pages are fetched only for their title, which sits near the start of the page,
+# so a slow or large root page is cut short rather than holding up the URLs under it
+REQUEST_TIMEOUT_SECONDS = 10
+MAX_BODY_BYTES = 512 * 1024
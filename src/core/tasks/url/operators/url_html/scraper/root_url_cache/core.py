@@ -1,60 +1,121 @@
+import asyncio
+import time
+from collections import OrderedDict
 from typing import Optional
 from urllib.parse import urlparse
 
-from aiohttp import ClientSession
 from bs4 import BeautifulSoup
 
+from src.core.tasks.url.operators.url_html.scraper.fetch_scheduler.core import FetchScheduler
+from src.core.tasks.url.operators.url_html.scraper.request_interface.util import read_body, decode_body
+from src.core.tasks.url.operators.url_html.scraper.root_url_cache.dtos.entry import RootURLCacheEntryInfo
 from src.db.client.async_ import AsyncDatabaseClient
-from src.core.tasks.url.operators.url_html.scraper.root_url_cache.constants import REQUEST_HEADERS
+from src.core.tasks.url.operators.url_html.scraper.root_url_cache.constants import REQUEST_HEADERS, MAX_CACHE_SIZE, \
+    CACHE_TTL_SECONDS, NEGATIVE_CACHE_TTL_SECONDS, REQUEST_TIMEOUT_SECONDS, MAX_BODY_BYTES
 from src.core.tasks.url.operators.url_html.scraper.root_url_cache.dtos.response import RootURLCacheResponseInfo
 
 DEBUG = False
 
 
 class RootURLCache:
-    def __init__(self, adb_client: Optional[AsyncDatabaseClient] = None):
+    """
+    Caches the page titles of root URLs.
+
+    Titles are kept in a bounded in-memory LRU with a TTL, backed by the
+    `root_url_cache` table. Concurrent lookups for the same root share a
+    single fetch, and failed fetches are remembered for a shorter TTL so
+    that a dead domain is not re-fetched for every URL under it.
+    """
+
+    def __init__(
+            self,
+            adb_client: Optional[AsyncDatabaseClient] = None,
+            fetch_scheduler: Optional[FetchScheduler] = None,
+            max_size: int = MAX_CACHE_SIZE,
+            ttl_seconds: float = CACHE_TTL_SECONDS,
+            negative_ttl_seconds: float = NEGATIVE_CACHE_TTL_SECONDS,
+            request_timeout_seconds: float = REQUEST_TIMEOUT_SECONDS,
+            max_body_bytes: int = MAX_BODY_BYTES
+    ):
         if adb_client is None:
             adb_client = AsyncDatabaseClient()
+        if fetch_scheduler is None:
+            fetch_scheduler = FetchScheduler()
         self.adb_client = adb_client
-        self.cache = None
+        self.fetch_scheduler = fetch_scheduler
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.request_timeout_seconds = request_timeout_seconds
+        self.max_body_bytes = max_body_bytes
+        self.cache: OrderedDict[str, RootURLCacheEntryInfo] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def get_root_url(url: str) -> str:
+        if not url.startswith('http'):
+            url = "https://" + url
+        parsed_url = urlparse(url)
+        return f"{parsed_url.scheme}://{parsed_url.netloc}"
+
+    def _store(self, url: str, title: str, negative: bool = False):
+        ttl = self.negative_ttl_seconds if negative else self.ttl_seconds
+        self.cache[url] = RootURLCacheEntryInfo(
+            title=title,
+            expires_at=time.monotonic() + ttl,
+            negative=negative
+        )
+        self.cache.move_to_end(url)
+        while len(self.cache) > self.max_size:
+            self.cache.popitem(last=False)
+
+    def _get_from_memory(self, url: str) -> Optional[RootURLCacheEntryInfo]:
+        entry = self.cache.get(url)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self.cache[url]
+            return None
+        self.cache.move_to_end(url)
+        return entry
 
     async def save_to_cache(self, url: str, title: str):
-        if url in self.cache:
-            return
-        self.cache[url] = title
+        self._store(url, title)
         await self.adb_client.add_to_root_url_cache(url=url, page_title=title)
 
     async def get_from_cache(self, url: str) -> Optional[str]:
-        if self.cache is None:
-            self.cache = await self.adb_client.load_root_url_cache()
+        entry = self._get_from_memory(url)
+        if entry is not None:
+            return entry.title
 
-        if url in self.cache:
-            return self.cache[url]
-        return None
+        title = await self.adb_client.get_root_url_title(url)
+        if title is not None:
+            self._store(url, title)
+        return title
 
     async def get_request(self, url: str) -> RootURLCacheResponseInfo:
-        async with ClientSession() as session:
-            try:
-                async with session.get(url, headers=REQUEST_HEADERS, timeout=120) as response:
-                    response.raise_for_status()
-                    text = await response.text()
-                    return RootURLCacheResponseInfo(text=text)
-            except Exception as e:
-                return RootURLCacheResponseInfo(exception=e)
-
-    async def get_title(self, url) -> str:
-        if not url.startswith('http'):
-            url = "https://" + url
-
-        parsed_url = urlparse(url)
-        root_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-
+        try:
+            async with self.fetch_scheduler.request(
+                "GET",
+                url,
+                headers=REQUEST_HEADERS,
+                timeout=self.request_timeout_seconds
+            ) as response:
+                response.raise_for_status()
+                # A truncated page still parses, and its title is near the start
+                body, _ = await read_body(response, max_bytes=self.max_body_bytes)
+                return RootURLCacheResponseInfo(text=decode_body(body, response.charset))
+        except Exception as e:
+            return RootURLCacheResponseInfo(exception=e)
+
+    async def _look_up_title(self, root_url: str) -> str:
         title = await self.get_from_cache(root_url)
         if title is not None:
             return title
 
         response_info = await self.get_request(root_url)
         if response_info.exception is not None:
+            self._store(root_url, "", negative=True)
             return self.handle_exception(response_info.exception)
 
         title = await self.get_title_from_soup(response_info.text)
@@ -63,6 +124,22 @@ class RootURLCache:
 
         return title
 
+    async def get_title(self, url) -> str:
+        root_url = self.get_root_url(url)
+
+        # Concurrent lookups for the same root wait on the first one
+        task = self._in_flight.get(root_url)
+        if task is None:
+            task = asyncio.ensure_future(self._look_up_title(root_url))
+            self._in_flight[root_url] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(root_url, None))
+        return await asyncio.shield(task)
+
+    async def prefetch(self, urls: list[str]):
+        """Look up the titles of all distinct roots of `urls` concurrently."""
+        root_urls = {self.get_root_url(url) for url in urls}
+        await asyncio.gather(*[self.get_title(root_url) for root_url in root_urls])
+
     async def get_title_from_soup(self, text: str) -> str:
         soup = BeautifulSoup(text, 'html.parser')
         try:
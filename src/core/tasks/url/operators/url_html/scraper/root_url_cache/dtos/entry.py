@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class RootURLCacheEntryInfo(BaseModel):
+    title: str
+    expires_at: float
+    # Whether the entry records a failed fetch rather than a title
+    negative: bool = False
@@ -4,6 +4,7 @@ from pydantic import BaseModel
 
 from src.core.tasks.url.operators.url_html.scraper.parser.dtos.response_html import ResponseHTMLInfo
 from src.db.dtos.url.core import URLInfo
+from src.db.dtos.url.html_content import URLHTMLContentInfo
 from src.core.tasks.url.operators.url_html.scraper.request_interface.dtos.url_response import URLResponseInfo
 
 
@@ -11,4 +12,10 @@ class UrlHtmlTDO(BaseModel):
     url_info: URLInfo
     url_response_info: Optional[URLResponseInfo] = None
     html_tag_info: Optional[ResponseHTMLInfo] = None
-
+    content_hash: Optional[str] = None
+    # Parsed content, or that of an earlier URL with the same content hash
+    html_content_infos: list[URLHTMLContentInfo] = []
+    # Replaces the raw body once compressed
+    compressed_html: Optional[bytes] = None
+    # Bytes of the raw body counted against the pipeline's memory budget
+    reserved_body_bytes: int = 0
@@ -25,9 +25,6 @@ class URLMiscellaneousMetadataTaskOperator(URLTaskOperatorBase):
     def task_type(self):
         return TaskType.MISC_METADATA
 
-    async def meets_task_prerequisites(self):
-        return await self.adb_client.has_pending_urls_missing_miscellaneous_metadata()
-
     async def get_subtask(
             self,
             collector_type: CollectorType
@@ -53,7 +50,10 @@ class URLMiscellaneousMetadataTaskOperator(URLTaskOperatorBase):
             tdo.description = tdo.html_metadata_info.description
 
     async def inner_task_logic(self):
-        tdos: list[URLMiscellaneousMetadataTDO] = await self.adb_client.get_pending_urls_missing_miscellaneous_metadata()
+        tdos: list[URLMiscellaneousMetadataTDO] = await self.adb_client.get_pending_urls_missing_miscellaneous_metadata(
+            limit=self.batch_size
+        )
+        tdos = await self.claim_urls(tdos, get_url_id=lambda tdo: tdo.url_id)
         await self.link_urls_to_task(url_ids=[tdo.url_id for tdo in tdos])
 
         error_infos = []
@@ -71,5 +71,6 @@ class URLMiscellaneousMetadataTaskOperator(URLTaskOperatorBase):
                 )
                 error_infos.append(error_info)
 
-        await self.adb_client.add_miscellaneous_metadata(tdos)
-        await self.adb_client.add_url_error_infos(error_infos)
\ No newline at end of file
+        with self.phase_timer.phase("persist", item_count=len(tdos)):
+            await self.adb_client.add_miscellaneous_metadata(tdos)
+            await self.adb_client.add_url_error_infos(error_infos)
\ No newline at end of file
@@ -5,6 +5,7 @@ from sqlalchemy.orm import selectinload
 
 from src.collectors.enums import CollectorType
 from src.core.tasks.url.operators.url_miscellaneous_metadata.tdo import URLMiscellaneousMetadataTDO, URLHTMLMetadataInfo
+from src.db.constants import STANDARD_ROW_LIMIT
 from src.db.dtos.url.html_content import HTMLContentType
 from src.db.models.instantiations.url.core import URL
 from src.db.queries.base.builder import QueryBuilderBase
@@ -13,6 +14,9 @@ from src.db.statement_composer import StatementComposer
 
 class GetPendingURLsMissingMiscellaneousDataQueryBuilder(QueryBuilderBase):
 
+    def __init__(self, limit: int = STANDARD_ROW_LIMIT):
+        super().__init__()
+        self.limit = limit
 
     async def run(self, session: AsyncSession) -> list[URLMiscellaneousMetadataTDO]:
         query = StatementComposer.pending_urls_missing_miscellaneous_metadata_query()
@@ -20,7 +24,7 @@ class GetPendingURLsMissingMiscellaneousDataQueryBuilder(QueryBuilderBase):
             query.options(
                 selectinload(URL.batch),
                 selectinload(URL.html_content)
-            ).limit(100).order_by(URL.id)
+            ).limit(self.limit).order_by(URL.id)
         )
 
         scalar_result = await session.scalars(query)
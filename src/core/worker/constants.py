@@ -0,0 +1,9 @@
+# Seconds a task worker waits between checks for new work requests
+POLL_INTERVAL_SECONDS = 5
+
+# Work requests claimed by a task worker per check
+CLAIM_LIMIT = 10
+
+# Seconds after which an abort request no worker has claimed is closed out,
+# as no live worker is running its collector
+ABORT_REQUEST_EXPIRY_SECONDS = 60
@@ -0,0 +1,124 @@
+import asyncio
+import logging
+
+from src.collectors.enums import CollectorType
+from src.collectors.mapping import COLLECTOR_INPUT_DTO_MAPPING
+from src.core.core import AsyncCore
+from src.core.worker.constants import POLL_INTERVAL_SECONDS, CLAIM_LIMIT, ABORT_REQUEST_EXPIRY_SECONDS
+from src.db.dtos.work_request import WorkRequestInfo
+from src.db.enums import WorkRequestType
+from src.util.helper_functions import get_worker_id
+
+
+class TaskWorker:
+    """
+    Carries out the work requests the API records in separate worker mode:
+    running URL tasks, and starting and aborting collectors.
+
+    Requests are claimed with `FOR UPDATE SKIP LOCKED`,
+    so several workers can poll the same table.
+    A request that fails is recorded with its error, and the rest are still carried out.
+    """
+
+    def __init__(
+            self,
+            async_core: AsyncCore,
+            worker_id: str | None = None,
+            poll_interval_seconds: float = POLL_INTERVAL_SECONDS,
+            claim_limit: int = CLAIM_LIMIT
+    ):
+        if worker_id is None:
+            worker_id = get_worker_id()
+        self.async_core = async_core
+        self.worker_id = worker_id
+        self.poll_interval_seconds = poll_interval_seconds
+        self.claim_limit = claim_limit
+
+        self.logger = logging.getLogger(__name__)
+        self.logger.addHandler(logging.StreamHandler())
+        self.logger.setLevel(logging.INFO)
+        self._stopped = asyncio.Event()
+        self._background_tasks: set[asyncio.Task] = set()
+
+    def stop(self):
+        self._stopped.set()
+
+    async def run(self):
+        self.logger.info(f"Task worker {self.worker_id} started")
+        while not self._stopped.is_set():
+            try:
+                await self.poll_once()
+            except Exception as e:
+                self.logger.error(f"Error polling for work requests: {e}")
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout=self.poll_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+        self.logger.info(f"Task worker {self.worker_id} stopped")
+
+    def get_running_batch_ids(self) -> list[int]:
+        async_tasks = self.async_core.collector_manager.async_tasks
+        return [
+            batch_id for batch_id, task in async_tasks.items()
+            if not task.done()
+        ]
+
+    async def poll_once(self) -> list[WorkRequestInfo]:
+        requests = await self.async_core.adb_client.claim_work_requests(
+            worker_id=self.worker_id,
+            running_batch_ids=self.get_running_batch_ids(),
+            limit=self.claim_limit,
+            abort_expiry_seconds=ABORT_REQUEST_EXPIRY_SECONDS
+        )
+        for request in requests:
+            try:
+                await self.handle_request(request)
+            except Exception as e:
+                self.logger.error(
+                    f"Error handling {request.request_type.value} work request {request.id}: {e}"
+                )
+                await self.async_core.adb_client.fail_work_request(
+                    request_id=request.id,
+                    error=str(e)
+                )
+        return requests
+
+    async def handle_request(self, request: WorkRequestInfo):
+        match request.request_type:
+            case WorkRequestType.RUN_TASKS:
+                # Runs in the background so that polling carries on meanwhile
+                self._run_in_background(self.async_core.run_tasks())
+            case WorkRequestType.START_COLLECTOR:
+                await self.start_collector(request.batch_id)
+            case WorkRequestType.ABORT_COLLECTOR:
+                await self.abort_collector(request.batch_id)
+
+    async def abort_collector(self, batch_id: int):
+        if batch_id in self.get_running_batch_ids():
+            await self.async_core.collector_manager.abort_collector_async(cid=batch_id)
+            return
+        # The collector has finished, or the worker running it stopped
+        # without finishing it, in which case nothing else will close out its batch
+        await self.async_core.adb_client.abort_unattended_batch(batch_id)
+
+    async def start_collector(self, batch_id: int):
+        batch = await self.async_core.adb_client.get_batch_by_id(batch_id)
+        if batch is None:
+            raise ValueError(f"Batch {batch_id} does not exist")
+        collector_type = CollectorType(batch.strategy)
+        dto = COLLECTOR_INPUT_DTO_MAPPING[collector_type](**batch.parameters)
+        await self.async_core.collector_manager.start_async_collector(
+            collector_type=collector_type,
+            batch_id=batch_id,
+            dto=dto
+        )
+
+    def _run_in_background(self, coroutine):
+        task = asyncio.create_task(coroutine)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def shutdown(self):
+        for task in self._background_tasks:
+            task.cancel()
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
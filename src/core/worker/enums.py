@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class WorkerModeEnum(Enum):
+    # The API process runs tasks, collectors and scheduled tasks itself
+    IN_PROCESS = "in_process"
+    # The API records work requests for a separate task worker process
+    SEPARATE = "separate"
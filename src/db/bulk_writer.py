@@ -0,0 +1,116 @@
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import update, values, column, Row, ColumnElement
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.constants import MAX_BIND_PARAMETERS
+from src.db.models.templates import Base
+
+
+class BulkWriter:
+    """
+    Writes many rows with a few set-based statements.
+
+    Rows are dictionaries of column name to value. Rows naming different
+    columns are written in separate statements, and each statement is kept
+    within the Postgres limit on bind parameters.
+    """
+
+    @staticmethod
+    def _group_by_columns(rows: Sequence[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(tuple(row.keys()), []).append(row)
+        return list(groups.values())
+
+    @staticmethod
+    def _chunk(rows: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+        chunk_size = max(1, MAX_BIND_PARAMETERS // len(rows[0]))
+        return [
+            rows[start:start + chunk_size]
+            for start in range(0, len(rows), chunk_size)
+        ]
+
+    @staticmethod
+    async def insert(
+        session: AsyncSession,
+        model: type[Base],
+        rows: Sequence[dict[str, Any]],
+        conflict_columns: Optional[list[str]] = None,
+        returning: Optional[list[ColumnElement]] = None
+    ) -> list[Row]:
+        """
+        Insert the rows with multi-row `INSERT` statements.
+        With `conflict_columns`, rows conflicting on those columns are skipped.
+        With `returning`, the given columns of the inserted rows are returned.
+        """
+        results = []
+        for group in BulkWriter._group_by_columns(rows):
+            for chunk in BulkWriter._chunk(group):
+                statement = pg_insert(model).values(chunk)
+                if conflict_columns is not None:
+                    statement = statement.on_conflict_do_nothing(index_elements=conflict_columns)
+                if returning is not None:
+                    statement = statement.returning(*returning)
+                result = await session.execute(statement)
+                if returning is not None:
+                    results.extend(result.all())
+        return results
+
+    @staticmethod
+    async def update(
+        session: AsyncSession,
+        model: type[Base],
+        rows: Sequence[dict[str, Any]],
+        key: str = "id"
+    ) -> None:
+        """
+        Update each row matching `key` with the row's other values,
+        using `UPDATE ... FROM (VALUES ...)`.
+        """
+        table = model.__table__
+        for group in BulkWriter._group_by_columns(rows):
+            column_names = list(group[0].keys())
+            for chunk in BulkWriter._chunk(group):
+                row_values = values(
+                    *[
+                        column(column_name, table.c[column_name].type)
+                        for column_name in column_names
+                    ],
+                    name="row_values"
+                ).data([
+                    tuple(row[column_name] for column_name in column_names)
+                    for row in chunk
+                ])
+                await session.execute(
+                    update(table)
+                    .where(table.c[key] == row_values.c[key])
+                    .values({
+                        column_name: row_values.c[column_name]
+                        for column_name in column_names
+                        if column_name != key
+                    })
+                )
+
+    @staticmethod
+    async def copy(
+        session: AsyncSession,
+        table_name: str,
+        column_names: list[str],
+        records: Sequence[tuple]
+    ) -> None:
+        """
+        Load the records with `COPY`, through the driver connection
+        so that it runs in the session's transaction.
+        Values are passed to the driver as is, so JSON must already be serialized.
+        """
+        if len(records) == 0:
+            return
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table_name,
+            records=records,
+            columns=column_names
+        )
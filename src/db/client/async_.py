@@ -1,12 +1,11 @@
 from datetime import datetime, timedelta
 from functools import wraps
-from operator import or_
-from typing import Optional, Type, Any, List, Sequence
+from typing import Optional, Any, List, Sequence, AsyncIterator
 
-from sqlalchemy import select, exists, func, case, Select, and_, update, delete, literal, text, Row
+from sqlalchemy import select, exists, func, case, Select, and_, or_, update, delete, literal, text, Row, union_all
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects.postgresql import insert as pg_insert
-from sqlalchemy.exc import IntegrityError, NoResultFound
+from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import selectinload, QueryableAttribute
 
@@ -23,16 +22,25 @@ from src.api.endpoints.annotate.relevance.get.dto import GetNextRelevanceAnnotat
 from src.api.endpoints.annotate.relevance.get.query import GetNextUrlForRelevanceAnnotationQueryBuilder
 from src.api.endpoints.batch.dtos.get.summaries.response import GetBatchSummariesResponse
 from src.api.endpoints.batch.dtos.get.summaries.summary import BatchSummary
+from src.api.endpoints.batch.duplicates.dto import GetDuplicatesByBatchResponse
 from src.api.endpoints.batch.duplicates.query import GetDuplicatesByBatchIDQueryBuilder
+from src.api.endpoints.batch.urls.dto import GetURLsByBatchResponse
 from src.api.endpoints.batch.urls.query import GetURLsByBatchQueryBuilder
 from src.api.endpoints.collector.dtos.manual_batch.post import ManualBatchInputDTO
 from src.api.endpoints.collector.dtos.manual_batch.response import ManualBatchResponseDTO
+from src.api.endpoints.collector.dtos.manual_batch.bulk import ManualBatchImportInfo, ManualBatchImportDuplicateInfo
+from src.api.endpoints.collector.dtos.manual_batch.post import ManualBatchInnerInputDTO
+from src.api.endpoints.collector.manual.bulk.query import ImportManualBatchQueryBuilder
 from src.api.endpoints.collector.manual.query import UploadManualBatchQueryBuilder
 from src.api.endpoints.metrics.batches.aggregated.dto import GetMetricsBatchesAggregatedResponseDTO
 from src.api.endpoints.metrics.batches.aggregated.query import GetBatchesAggregatedMetricsQueryBuilder
 from src.api.endpoints.metrics.batches.breakdown.dto import GetMetricsBatchesBreakdownResponseDTO
 from src.api.endpoints.metrics.batches.breakdown.query import GetBatchesBreakdownMetricsQueryBuilder
-from src.api.endpoints.metrics.dtos.get.backlog import GetMetricsBacklogResponseDTO, GetMetricsBacklogResponseInnerDTO
+from src.api.endpoints.metrics.content_dedup.dto import GetMetricsContentDedupResponseDTO
+from src.api.endpoints.metrics.task_phases.dto import GetMetricsTaskPhasesResponseDTO
+from src.api.endpoints.metrics.task_phases.query import GetTaskPhasesMetricsQueryBuilder
+from src.api.endpoints.metrics.dtos.get.backlog import GetMetricsBacklogResponseDTO, GetMetricsBacklogResponseInnerDTO, \
+    GetMetricsBacklogTaskResponseInnerDTO
 from src.api.endpoints.metrics.dtos.get.urls.aggregated.core import GetMetricsURLsAggregatedResponseDTO
 from src.api.endpoints.metrics.dtos.get.urls.breakdown.pending import GetMetricsURLsBreakdownPendingResponseDTO, \
     GetMetricsURLsBreakdownPendingResponseInnerDTO
@@ -59,11 +67,13 @@ from src.core.tasks.url.operators.agency_identification.dtos.suggestion import U
 from src.core.tasks.url.operators.agency_identification.dtos.tdo import AgencyIdentificationTDO
 from src.core.tasks.url.operators.agency_identification.queries.get_pending_urls_without_agency_suggestions import \
     GetPendingURLsWithoutAgencySuggestionsQueryBuilder
+from src.core.tasks.url.operators.auto_relevant.models.annotation import RelevanceAnnotationInfo
 from src.core.tasks.url.operators.auto_relevant.models.tdo import URLRelevantTDO
 from src.core.tasks.url.operators.auto_relevant.queries.get_tdos import GetAutoRelevantTDOsQueryBuilder
 from src.core.tasks.url.operators.submit_approved_url.tdo import SubmitApprovedURLTDO, SubmittedURLInfo
 from src.core.tasks.url.operators.url_404_probe.tdo import URL404ProbeTDO
 from src.core.tasks.url.operators.url_duplicate.tdo import URLDuplicateTDO
+from src.core.tasks.url.operators.url_html.scraper.request_interface.dtos.validators import FetchValidatorsInfo
 from src.core.tasks.url.operators.url_html.queries.get_pending_urls_without_html_data import \
     GetPendingURLsWithoutHTMLDataQueryBuilder
 from src.core.tasks.url.operators.url_miscellaneous_metadata.queries.get_pending_urls_missing_miscellaneous_data import \
@@ -71,27 +81,38 @@ from src.core.tasks.url.operators.url_miscellaneous_metadata.queries.get_pending
 from src.core.tasks.url.operators.url_miscellaneous_metadata.queries.has_pending_urls_missing_miscellaneous_data import \
     HasPendingURsMissingMiscellaneousDataQueryBuilder
 from src.core.tasks.url.operators.url_miscellaneous_metadata.tdo import URLMiscellaneousMetadataTDO
-from src.db.client.helpers import add_standard_limit_and_offset
+from src.core.tasks.dtos.operator_status import TaskOperatorStatusInfo
+from src.core.tasks.url.enums import TaskOperatorState
+from src.db.bulk_writer import BulkWriter
 from src.db.client.types import UserSuggestionModel
 from src.db.config_manager import ConfigManager
-from src.db.constants import PLACEHOLDER_AGENCY_NAME
+from src.db.constants import PLACEHOLDER_AGENCY_NAME, STANDARD_ROW_LIMIT, TASK_PENDING_FLAGS
 from src.db.dto_converter import DTOConverter
 from src.db.dtos.batch import BatchInfo
-from src.db.dtos.duplicate import DuplicateInsertInfo, DuplicateInfo
+from src.db.dtos.duplicate import DuplicateInsertInfo
 from src.db.dtos.log import LogInfo, LogOutputInfo
 from src.db.dtos.url.annotations.auto.relevancy import AutoRelevancyAnnotationInput
+from src.db.dtos.url.body_status import URLBodyStatusInfo
+from src.db.dtos.url.compressed_html import CompressedHTMLInfo
 from src.db.dtos.url.core import URLInfo
 from src.db.dtos.url.error import URLErrorPydanticInfo
-from src.db.dtos.url.html_content import URLHTMLContentInfo
+from src.db.dtos.url.fetch_validators import URLFetchValidatorsInfo
+from src.db.dtos.work_request import WorkRequestInfo
+from src.db.dtos.task_pending_count import TaskPendingCountInfo
+from src.db.dtos.task_phase_timing import TaskPhaseTimingInfo
+from src.db.dtos.url.html_content import URLHTMLContentInfo, HTMLContentType
 from src.db.dtos.url.insert import InsertURLsInfo
 from src.db.dtos.url.mapping import URLMapping
 from src.db.dtos.url.raw_html import RawHTMLInfo
-from src.db.enums import TaskType
+from src.db.dtos.url.render_decision import URLRenderDecisionInfo
+from src.db.enums import TaskType, ContentDedupSavingType, WorkRequestType
 from src.db.models.instantiations.agency import Agency
 from src.db.models.instantiations.backlog_snapshot import BacklogSnapshot
 from src.db.models.instantiations.batch import Batch
 from src.db.models.instantiations.confirmed_url_agency import ConfirmedURLAgency
+from src.db.models.instantiations.content_dedup_saving import ContentDedupSaving
 from src.db.models.instantiations.duplicate import Duplicate
+from src.db.models.instantiations.html_content_blob import HTMLContentBlob
 from src.db.models.instantiations.link.link_batch_urls import LinkBatchURL
 from src.db.models.instantiations.link.link_task_url import LinkTaskURL
 from src.db.models.instantiations.log import Log
@@ -99,14 +120,20 @@ from src.db.models.instantiations.root_url_cache import RootURL
 from src.db.models.instantiations.sync_state_agencies import AgenciesSyncState
 from src.db.models.instantiations.task.core import Task
 from src.db.models.instantiations.task.error import TaskError
+from src.db.models.instantiations.task.phase_timing import TaskPhaseTiming
+from src.db.models.instantiations.url.body_status import URLBodyStatus
 from src.db.models.instantiations.url.checked_for_duplicate import URLCheckedForDuplicate
 from src.db.models.instantiations.url.compressed_html import URLCompressedHTML
 from src.db.models.instantiations.url.core import URL
 from src.db.models.instantiations.url.data_source import URLDataSource
 from src.db.models.instantiations.url.error_info import URLErrorInfo
+from src.db.models.instantiations.url.fetch_validators import URLFetchValidators
+from src.db.models.instantiations.url.task_lease import URLTaskLease
+from src.db.models.instantiations.work_request import WorkRequest
 from src.db.models.instantiations.url.html_content import URLHTMLContent
 from src.db.models.instantiations.url.optional_data_source_metadata import URLOptionalDataSourceMetadata
 from src.db.models.instantiations.url.probed_for_404 import URLProbedFor404
+from src.db.models.instantiations.url.render_decision import URLRenderDecision
 from src.db.models.instantiations.url.suggestion.agency.auto import AutomatedUrlAgencySuggestion
 from src.db.models.instantiations.url.suggestion.agency.user import UserUrlAgencySuggestion
 from src.db.models.instantiations.url.suggestion.record_type.auto import AutoRecordTypeSuggestion
@@ -115,7 +142,10 @@ from src.db.models.instantiations.url.suggestion.relevant.auto import AutoReleva
 from src.db.models.instantiations.url.suggestion.relevant.user import UserRelevantSuggestion
 from src.db.models.templates import Base
 from src.db.queries.base.builder import QueryBuilderBase
+from src.db.queries.cursor import get_next_cursor
+from src.db.queries.helpers import add_cursor_or_page_offset
 from src.api.endpoints.review.next.query import GetNextURLForFinalReviewQueryBuilder
+from src.db.queries.implementations.core.insert.urls import InsertURLsQueryBuilder
 from src.db.queries.implementations.core.get.html_content_info import GetHTMLContentInfoQueryBuilder
 from src.db.queries.implementations.core.get.recent_batch_summaries.builder import GetRecentBatchSummariesQueryBuilder
 from src.db.queries.implementations.core.metrics.urls.aggregated.pending import \
@@ -123,6 +153,7 @@ from src.db.queries.implementations.core.metrics.urls.aggregated.pending import
 from src.db.queries.implementations.core.tasks.agency_sync.upsert import get_upsert_agencies_mappings
 from src.db.statement_composer import StatementComposer
 from src.db.utils.compression import decompress_html, compress_html
+from src.db.utils.content_hash import get_content_hash
 from src.external.pdap.dtos.agencies_sync import AgenciesSyncResponseInnerInfo
 
 
@@ -291,8 +322,8 @@ class AsyncDatabaseClient:
             )
         )
 
-    async def get_tdos_for_auto_relevancy(self) -> list[URLRelevantTDO]:
-        return await self.run_query_builder(builder=GetAutoRelevantTDOsQueryBuilder())
+    async def get_tdos_for_auto_relevancy(self, limit: int = STANDARD_ROW_LIMIT) -> list[URLRelevantTDO]:
+        return await self.run_query_builder(builder=GetAutoRelevantTDOsQueryBuilder(limit=limit))
 
     @session_manager
     async def add_user_relevant_suggestion(
@@ -425,14 +456,23 @@ class AsyncDatabaseClient:
 
     @session_manager
     async def add_url_error_infos(self, session: AsyncSession, url_error_infos: list[URLErrorPydanticInfo]):
-        for url_error_info in url_error_infos:
-            statement = select(URL).where(URL.id == url_error_info.url_id)
-            scalar_result = await session.scalars(statement)
-            url = scalar_result.first()
-            url.outcome = URLStatus.ERROR.value
+        if len(url_error_infos) == 0:
+            return
+        await session.execute(
+            update(URL)
+            .where(URL.id.in_([info.url_id for info in url_error_infos]))
+            .values(outcome=URLStatus.ERROR.value)
+        )
+        await BulkWriter.insert(
+            session,
+            model=URLErrorInfo,
+            rows=[info.model_dump(exclude_none=True) for info in url_error_infos]
+        )
 
-            url_error = URLErrorInfo(**url_error_info.model_dump())
-            session.add(url_error)
+    @session_manager
+    async def count_url_errors_for_task(self, session: AsyncSession, task_id: int) -> int:
+        statement = select(func.count(URLErrorInfo.id)).where(URLErrorInfo.task_id == task_id)
+        return await session.scalar(statement)
 
     @session_manager
     async def get_urls_with_errors(self, session: AsyncSession) -> list[URLErrorPydanticInfo]:
@@ -459,6 +499,65 @@ class AsyncDatabaseClient:
     async def add_html_content_infos(self, session: AsyncSession, html_content_infos: list[URLHTMLContentInfo]):
         await self._add_models(session, URLHTMLContent, html_content_infos)
 
+    async def upsert_url_fetch_validators(
+        self,
+        fetch_validators_infos: list[URLFetchValidatorsInfo]
+    ):
+        if len(fetch_validators_infos) == 0:
+            return
+        values = [info.model_dump() for info in fetch_validators_infos]
+        stmt = pg_insert(URLFetchValidators).values(values)
+        update_stmt = stmt.on_conflict_do_update(
+            index_elements=['url_id'],
+            set_={
+                "etag": stmt.excluded.etag,
+                "last_modified": stmt.excluded.last_modified,
+                "content_length": stmt.excluded.content_length,
+                "content_hash": stmt.excluded.content_hash,
+                "updated_at": func.now()
+            }
+        )
+        await self.execute(update_stmt)
+
+    async def add_url_body_statuses(
+        self,
+        body_status_infos: list[URLBodyStatusInfo]
+    ):
+        if len(body_status_infos) == 0:
+            return
+        values = [info.model_dump() for info in body_status_infos]
+        stmt = pg_insert(URLBodyStatus).values(values)
+        update_stmt = stmt.on_conflict_do_update(
+            index_elements=['url_id'],
+            set_={
+                "status": stmt.excluded.status,
+                "content_type": stmt.excluded.content_type,
+                "bytes_read": stmt.excluded.bytes_read
+            }
+        )
+        await self.execute(update_stmt)
+
+    async def add_url_render_decisions(
+        self,
+        render_decision_infos: list[URLRenderDecisionInfo]
+    ):
+        if len(render_decision_infos) == 0:
+            return
+        values = [info.model_dump() for info in render_decision_infos]
+        stmt = pg_insert(URLRenderDecision).values(values)
+        # URLs retried after a failed task keep their latest decision
+        update_stmt = stmt.on_conflict_do_update(
+            index_elements=['url_id'],
+            set_={
+                "rendered": stmt.excluded.rendered,
+                "reason": stmt.excluded.reason,
+                "render_profile": stmt.excluded.render_profile,
+                "render_duration_seconds": stmt.excluded.render_duration_seconds,
+                "render_timed_out": stmt.excluded.render_timed_out
+            }
+        )
+        await self.execute(update_stmt)
+
     @session_manager
     async def has_pending_urls_without_html_data(self, session: AsyncSession) -> bool:
         statement = self.statement_composer.pending_urls_without_html_data()
@@ -471,53 +570,57 @@ class AsyncDatabaseClient:
 
     async def get_pending_urls_missing_miscellaneous_metadata(
         self,
+        limit: int = STANDARD_ROW_LIMIT
     ) -> list[URLMiscellaneousMetadataTDO]:
-        return await self.run_query_builder(GetPendingURLsMissingMiscellaneousDataQueryBuilder())
+        return await self.run_query_builder(GetPendingURLsMissingMiscellaneousDataQueryBuilder(limit=limit))
 
     @session_manager
     async def add_miscellaneous_metadata(self, session: AsyncSession, tdos: list[URLMiscellaneousMetadataTDO]):
-        updates = []
-
-        for tdo in tdos:
-            update_query = update(
-                URL
-            ).where(
-                URL.id == tdo.url_id
-            ).values(
-                name=tdo.name,
-                description=tdo.description,
-            )
-
-            updates.append(update_query)
-
-        for stmt in updates:
-            await session.execute(stmt)
-
-        for tdo in tdos:
-            metadata_object = URLOptionalDataSourceMetadata(
-                url_id=tdo.url_id,
-                record_formats=tdo.record_formats,
-                data_portal_type=tdo.data_portal_type,
-                supplying_entity=tdo.supplying_entity
-            )
-            session.add(metadata_object)
+        if len(tdos) == 0:
+            return
+        await BulkWriter.update(
+            session,
+            model=URL,
+            rows=[
+                {
+                    "id": tdo.url_id,
+                    "name": tdo.name,
+                    "description": tdo.description
+                }
+                for tdo in tdos
+            ]
+        )
+        await BulkWriter.insert(
+            session,
+            model=URLOptionalDataSourceMetadata,
+            rows=[
+                {
+                    "url_id": tdo.url_id,
+                    "record_formats": tdo.record_formats,
+                    "data_portal_type": tdo.data_portal_type,
+                    "supplying_entity": tdo.supplying_entity
+                }
+                for tdo in tdos
+            ]
+        )
 
-    async def get_pending_urls_without_html_data(self) -> list[URLInfo]:
-        return await self.run_query_builder(GetPendingURLsWithoutHTMLDataQueryBuilder())
+    async def get_pending_urls_without_html_data(self, limit: int = STANDARD_ROW_LIMIT) -> list[URLInfo]:
+        return await self.run_query_builder(GetPendingURLsWithoutHTMLDataQueryBuilder(limit=limit))
 
     async def get_urls_with_html_data_and_without_models(
         self,
         session: AsyncSession,
-        model: Type[Base]
+        task_type: TaskType,
+        limit: int = STANDARD_ROW_LIMIT
     ):
         statement = (select(URL)
-                     .options(selectinload(URL.html_content))
-                     .where(URL.outcome == URLStatus.PENDING.value))
-        statement = self.statement_composer.exclude_urls_with_extant_model(
-            statement=statement,
-            model=model
-        )
-        statement = statement.limit(100).order_by(URL.id)
+                     .options(
+                         selectinload(URL.html_content),
+                         selectinload(URL.compressed_html)
+                     )
+                     .where(self.statement_composer.url_pending_for(task_type)))
+        statement = self.statement_composer.exclude_leased_urls(statement, task_type)
+        statement = statement.limit(limit).order_by(URL.id)
         raw_result = await session.execute(statement)
         urls: Sequence[Row[URL]] = raw_result.unique().scalars().all()
         final_results = DTOConverter.url_list_to_url_with_html_list(urls)
@@ -527,27 +630,24 @@ class AsyncDatabaseClient:
     @session_manager
     async def get_urls_with_html_data_and_without_auto_record_type_suggestion(
         self,
-        session: AsyncSession
+        session: AsyncSession,
+        limit: int = STANDARD_ROW_LIMIT
     ):
         return await self.get_urls_with_html_data_and_without_models(
             session=session,
-            model=AutoRecordTypeSuggestion
+            task_type=TaskType.RECORD_TYPE,
+            limit=limit
         )
 
 
     async def has_urls_with_html_data_and_without_models(
         self,
         session: AsyncSession,
-        model: Type[Base]
+        task_type: TaskType
     ) -> bool:
         statement = (select(URL)
-                     .join(URLCompressedHTML)
-                     .where(URL.outcome == URLStatus.PENDING.value))
-        # Exclude URLs with auto suggested record types
-        statement = self.statement_composer.exclude_urls_with_extant_model(
-            statement=statement,
-            model=model
-        )
+                     .where(self.statement_composer.url_pending_for(task_type)))
+        statement = self.statement_composer.exclude_leased_urls(statement, task_type)
         statement = statement.limit(1)
         scalar_result = await session.scalars(statement)
         return bool(scalar_result.first())
@@ -556,14 +656,14 @@ class AsyncDatabaseClient:
     async def has_urls_with_html_data_and_without_auto_relevant_suggestion(self, session: AsyncSession) -> bool:
         return await self.has_urls_with_html_data_and_without_models(
             session=session,
-            model=AutoRelevantSuggestion
+            task_type=TaskType.RELEVANCY
         )
 
     @session_manager
     async def has_urls_with_html_data_and_without_auto_record_type_suggestion(self, session: AsyncSession) -> bool:
         return await self.has_urls_with_html_data_and_without_models(
             session=session,
-            model=AutoRecordTypeSuggestion
+            task_type=TaskType.RECORD_TYPE
         )
 
     @session_manager
@@ -593,17 +693,27 @@ class AsyncDatabaseClient:
             d[result.url] = result.page_title
         return d
 
+    @session_manager
+    async def get_root_url_title(self, session: AsyncSession, url: str) -> Optional[str]:
+        statement = select(RootURL.page_title).where(RootURL.url == url)
+        return await session.scalar(statement)
+
     async def add_to_root_url_cache(self, url: str, page_title: str) -> None:
-        cache = RootURL(url=url, page_title=page_title)
-        await self.add(cache)
+        # Another process may have cached the same root in the meantime
+        statement = pg_insert(RootURL).values(
+            url=url,
+            page_title=page_title
+        ).on_conflict_do_nothing(index_elements=['url'])
+        await self.execute(statement)
 
     async def get_urls(
         self,
         page: int,
-        errors: bool
+        errors: bool,
+        cursor: Optional[str] = None
     ) -> GetURLsResponseInfo:
         return await self.run_query_builder(GetURLsQueryBuilder(
-            page=page, errors=errors
+            page=page, errors=errors, cursor=cursor
         ))
 
 
@@ -636,6 +746,33 @@ class AsyncDatabaseClient:
         )
         await self.add(task_error)
 
+    @session_manager
+    async def add_task_phase_timings(
+        self,
+        session: AsyncSession,
+        task_id: int,
+        timings: list[TaskPhaseTimingInfo]
+    ):
+        if len(timings) == 0:
+            return
+        statement = pg_insert(TaskPhaseTiming).values([
+            {
+                "task_id": task_id,
+                **timing.model_dump()
+            }
+            for timing in timings
+        ])
+        # A phase saved again for the same task adds to what it saved before
+        statement = statement.on_conflict_do_update(
+            constraint="uq_task_phase_timings_task_id_phase",
+            set_={
+                "duration_seconds": TaskPhaseTiming.duration_seconds + statement.excluded.duration_seconds,
+                "item_count": TaskPhaseTiming.item_count + statement.excluded.item_count,
+                "byte_count": TaskPhaseTiming.byte_count + statement.excluded.byte_count
+            }
+        )
+        await session.execute(statement)
+
     async def get_task_info(
         self,
         task_id: int
@@ -647,12 +784,264 @@ class AsyncDatabaseClient:
 
     @session_manager
     async def link_urls_to_task(self, session: AsyncSession, task_id: int, url_ids: list[int]):
-        for url_id in url_ids:
-            link = LinkTaskURL(
-                url_id=url_id,
-                task_id=task_id
+        await self._link_urls_to_task(session, task_id=task_id, url_ids=url_ids)
+
+    @staticmethod
+    async def _link_urls_to_task(session: AsyncSession, task_id: int, url_ids: list[int]):
+        # URLs already linked by a checkpoint are skipped
+        await BulkWriter.insert(
+            session,
+            model=LinkTaskURL,
+            rows=[
+                {
+                    "url_id": url_id,
+                    "task_id": task_id
+                }
+                for url_id in url_ids
+            ],
+            conflict_columns=["task_id", "url_id"]
+        )
+
+    @session_manager
+    async def checkpoint_task(self, session: AsyncSession, task_id: int, url_ids: list[int]):
+        """
+        Record that the results for `url_ids` have been persisted,
+        linking them to the task so a crash does not lose the progress.
+        """
+        await self._link_urls_to_task(session, task_id=task_id, url_ids=url_ids)
+        statement = (
+            update(Task)
+            .where(Task.id == task_id)
+            .values(
+                checkpointed_url_count=Task.checkpointed_url_count + len(url_ids),
+                checkpointed_at=func.now()
+            )
+        )
+        await session.execute(statement)
+
+    @session_manager
+    async def get_running_task_operator_statuses(self, session: AsyncSession) -> list[TaskOperatorStatusInfo]:
+        """Get the status of each task type with runs in process, from the task records."""
+        statement = (
+            select(
+                Task.task_type,
+                func.count(Task.id).label("runs_in_progress"),
+                func.max(Task.id).label("last_task_id")
             )
-            session.add(link)
+            .where(Task.task_status == BatchStatus.IN_PROCESS.value)
+            .group_by(Task.task_type)
+        )
+        raw_results = await session.execute(statement)
+        return [
+            TaskOperatorStatusInfo(
+                task_type=TaskType(raw_result.task_type),
+                state=TaskOperatorState.RUNNING,
+                runs_in_progress=raw_result.runs_in_progress,
+                last_task_id=raw_result.last_task_id
+            )
+            for raw_result in raw_results
+        ]
+
+    @session_manager
+    async def mark_interrupted_tasks(
+        self,
+        session: AsyncSession,
+        task_types: list[TaskType],
+        stale_seconds: int
+    ) -> list[int]:
+        """
+        Mark in-process tasks of the given types that have not been
+        updated in `stale_seconds` as interrupted, and return their IDs.
+        """
+        statement = (
+            update(Task)
+            .where(
+                Task.task_type.in_([task_type.value for task_type in task_types]),
+                Task.task_status == BatchStatus.IN_PROCESS.value,
+                Task.updated_at < func.now() - timedelta(seconds=stale_seconds)
+            )
+            .values(task_status=BatchStatus.INTERRUPTED.value)
+            .returning(Task.id)
+        )
+        task_ids = (await session.scalars(statement)).all()
+        return sorted(task_ids)
+
+    async def add_work_request(
+        self,
+        request_type: WorkRequestType,
+        batch_id: Optional[int] = None
+    ):
+        await self.add(
+            WorkRequest(
+                request_type=request_type.value,
+                batch_id=batch_id
+            )
+        )
+
+    @session_manager
+    async def claim_work_requests(
+        self,
+        session: AsyncSession,
+        worker_id: str,
+        running_batch_ids: list[int],
+        limit: int,
+        abort_expiry_seconds: int
+    ) -> list[WorkRequestInfo]:
+        """
+        Claim the oldest unclaimed work requests for `worker_id`.
+        Requests to abort a collector are only claimed by the worker running it,
+        or by any worker once older than `abort_expiry_seconds`.
+        """
+        claimable_query = (
+            select(WorkRequest.id)
+            .where(
+                WorkRequest.claimed_at == None,
+                or_(
+                    WorkRequest.request_type != WorkRequestType.ABORT_COLLECTOR.value,
+                    WorkRequest.batch_id.in_(running_batch_ids),
+                    WorkRequest.created_at < func.now() - timedelta(seconds=abort_expiry_seconds)
+                )
+            )
+            .order_by(WorkRequest.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        statement = (
+            update(WorkRequest)
+            .where(WorkRequest.id.in_(claimable_query.scalar_subquery()))
+            .values(
+                worker_id=worker_id,
+                claimed_at=func.now()
+            )
+            .returning(
+                WorkRequest.id,
+                WorkRequest.request_type,
+                WorkRequest.batch_id
+            )
+        )
+        raw_results = await session.execute(statement)
+        infos = [
+            WorkRequestInfo(
+                id=raw_result.id,
+                request_type=WorkRequestType(raw_result.request_type),
+                batch_id=raw_result.batch_id
+            )
+            for raw_result in raw_results
+        ]
+        return sorted(infos, key=lambda info: info.id)
+
+    @session_manager
+    async def fail_work_request(
+        self,
+        session: AsyncSession,
+        request_id: int,
+        error: str
+    ):
+        statement = (
+            update(WorkRequest)
+            .where(WorkRequest.id == request_id)
+            .values(error=error)
+        )
+        await session.execute(statement)
+
+    @session_manager
+    async def abort_unattended_batch(self, session: AsyncSession, batch_id: int) -> bool:
+        """
+        Mark a batch aborted if it is still in process with no collector running it.
+        Returns whether the batch was aborted.
+        """
+        statement = (
+            update(Batch)
+            .where(
+                Batch.id == batch_id,
+                Batch.status == BatchStatus.IN_PROCESS.value
+            )
+            .values(status=BatchStatus.ABORTED.value)
+            .returning(Batch.id)
+        )
+        batch_ids = (await session.scalars(statement)).all()
+        return len(batch_ids) > 0
+
+    @session_manager
+    async def claim_urls(
+        self,
+        session: AsyncSession,
+        task_type: TaskType,
+        url_ids: list[int],
+        worker_id: str,
+        lease_seconds: int
+    ) -> list[int]:
+        """
+        Lease the given URLs to `worker_id` for the task type, and return
+        the IDs actually claimed. URLs locked by a concurrent claim,
+        or leased to another worker and not yet expired, are skipped.
+        """
+        if len(url_ids) == 0:
+            return []
+        lock_query = (
+            select(URL.id)
+            .where(URL.id.in_(url_ids))
+            .order_by(URL.id)
+            .with_for_update(skip_locked=True)
+        )
+        locked_url_ids = (await session.scalars(lock_query)).all()
+        if len(locked_url_ids) == 0:
+            return []
+
+        expires_at = func.now() + timedelta(seconds=lease_seconds)
+        stmt = pg_insert(URLTaskLease).values([
+            {
+                "url_id": url_id,
+                "task_type": task_type.value,
+                "worker_id": worker_id,
+                "expires_at": expires_at
+            }
+            for url_id in locked_url_ids
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["url_id", "task_type"],
+            set_={
+                "worker_id": stmt.excluded.worker_id,
+                "expires_at": stmt.excluded.expires_at
+            },
+            where=URLTaskLease.expires_at <= func.now()
+        ).returning(URLTaskLease.url_id)
+        claimed_url_ids = (await session.scalars(stmt)).all()
+        return sorted(claimed_url_ids)
+
+    async def renew_url_leases(
+        self,
+        task_type: TaskType,
+        worker_id: str,
+        url_ids: list[int],
+        lease_seconds: int
+    ):
+        """Extend the leases `worker_id` still holds on the given URLs."""
+        if len(url_ids) == 0:
+            return
+        statement = (
+            update(URLTaskLease)
+            .where(
+                URLTaskLease.task_type == task_type.value,
+                URLTaskLease.worker_id == worker_id,
+                URLTaskLease.url_id.in_(url_ids)
+            )
+            .values(expires_at=func.now() + timedelta(seconds=lease_seconds))
+        )
+        await self.execute(statement)
+
+    async def release_url_leases(
+        self,
+        task_type: TaskType,
+        worker_id: str,
+        url_ids: list[int]
+    ):
+        statement = delete(URLTaskLease).where(
+            URLTaskLease.task_type == task_type.value,
+            URLTaskLease.worker_id == worker_id,
+            URLTaskLease.url_id.in_(url_ids)
+        )
+        await self.execute(statement)
 
     @session_manager
     async def get_tasks(
@@ -660,7 +1049,8 @@ class AsyncDatabaseClient:
         session: AsyncSession,
         task_type: Optional[TaskType] = None,
         task_status: Optional[BatchStatus] = None,
-        page: int = 1
+        page: int = 1,
+        cursor: Optional[str] = None
     ) -> GetTasksResponse:
         url_count_subquery = self.statement_composer.simple_count_subquery(
             LinkTaskURL,
@@ -689,7 +1079,12 @@ class AsyncDatabaseClient:
             statement = statement.where(Task.task_type == task_type.value)
         if task_status is not None:
             statement = statement.where(Task.task_status == task_status.value)
-        add_standard_limit_and_offset(statement, page)
+        statement = add_cursor_or_page_offset(
+            statement,
+            key_columns=[Task.id],
+            page=page,
+            cursor=cursor
+        )
 
         execute_result = await session.execute(statement)
         all_results = execute_result.all()
@@ -706,7 +1101,8 @@ class AsyncDatabaseClient:
                 )
             )
         return GetTasksResponse(
-            tasks=final_results
+            tasks=final_results,
+            next_cursor=get_next_cursor(final_results, key=lambda task: [task.task_id])
         )
 
     @session_manager
@@ -718,20 +1114,22 @@ class AsyncDatabaseClient:
             select(
                 URL.id
             ).where(
-                URL.outcome == URLStatus.PENDING.value
+                self.statement_composer.url_pending_for(TaskType.AGENCY_IDENTIFICATION)
             )
         )
 
-        statement = self.statement_composer.exclude_urls_with_agency_suggestions(statement)
+        statement = self.statement_composer.exclude_leased_urls(statement, TaskType.AGENCY_IDENTIFICATION)
+        statement = statement.limit(1)
         raw_result = await session.execute(statement)
         result = raw_result.all()
         return len(result) != 0
 
     async def get_urls_without_agency_suggestions(
-        self
+        self,
+        limit: int = STANDARD_ROW_LIMIT
     ) -> list[AgencyIdentificationTDO]:
         """Retrieve URLs without confirmed or suggested agencies."""
-        return await self.run_query_builder(GetPendingURLsWithoutAgencySuggestionsQueryBuilder())
+        return await self.run_query_builder(GetPendingURLsWithoutAgencySuggestionsQueryBuilder(limit=limit))
 
 
     async def get_next_url_agency_for_annotation(
@@ -876,11 +1274,17 @@ class AsyncDatabaseClient:
         batch_summary = summaries[0]
         return batch_summary
 
-    async def get_urls_by_batch(self, batch_id: int, page: int = 1) -> list[URLInfo]:
-        """Retrieve all URLs associated with a batch."""
+    async def get_urls_by_batch(
+        self,
+        batch_id: int,
+        page: int = 1,
+        cursor: Optional[str] = None
+    ) -> GetURLsByBatchResponse:
+        """Retrieve a page of the URLs associated with a batch."""
         return await self.run_query_builder(GetURLsByBatchQueryBuilder(
             batch_id=batch_id,
-            page=page
+            page=page,
+            cursor=cursor
         ))
 
     @session_manager
@@ -899,6 +1303,7 @@ class AsyncDatabaseClient:
             batch_id=url_info.batch_id,
             url_id=url_entry.id
         )
+        session.add(link)
         return url_entry.id
 
     @session_manager
@@ -917,20 +1322,28 @@ class AsyncDatabaseClient:
 
     @session_manager
     async def insert_logs(self, session, log_infos: List[LogInfo]):
-        for log_info in log_infos:
-            log = Log(log=log_info.log, batch_id=log_info.batch_id)
-            if log_info.created_at is not None:
-                log.created_at = log_info.created_at
-            session.add(log)
+        await BulkWriter.insert(
+            session,
+            model=Log,
+            rows=[
+                log_info.model_dump(include={"log", "batch_id", "created_at"}, exclude_none=True)
+                for log_info in log_infos
+            ]
+        )
 
     @session_manager
     async def insert_duplicates(self, session, duplicate_infos: list[DuplicateInsertInfo]):
-        for duplicate_info in duplicate_infos:
-            duplicate = Duplicate(
-                batch_id=duplicate_info.duplicate_batch_id,
-                original_url_id=duplicate_info.original_url_id,
-            )
-            session.add(duplicate)
+        await BulkWriter.insert(
+            session,
+            model=Duplicate,
+            rows=[
+                {
+                    "batch_id": duplicate_info.duplicate_batch_id,
+                    "original_url_id": duplicate_info.original_url_id
+                }
+                for duplicate_info in duplicate_infos
+            ]
+        )
 
     @session_manager
     async def insert_batch(self, session: AsyncSession, batch_info: BatchInfo) -> int:
@@ -954,28 +1367,12 @@ class AsyncDatabaseClient:
         return batch.id
 
     async def insert_urls(self, url_infos: List[URLInfo], batch_id: int) -> InsertURLsInfo:
-        url_mappings = []
-        duplicates = []
-        for url_info in url_infos:
-            url_info.batch_id = batch_id
-            try:
-                url_id = await self.insert_url(url_info)
-                url_mappings.append(URLMapping(url_id=url_id, url=url_info.url))
-            except IntegrityError:
-                orig_url_info = await self.get_url_info_by_url(url_info.url)
-                duplicate_info = DuplicateInsertInfo(
-                    duplicate_batch_id=batch_id,
-                    original_url_id=orig_url_info.id
-                )
-                duplicates.append(duplicate_info)
-        await self.insert_duplicates(duplicates)
-
-        return InsertURLsInfo(
-            url_mappings=url_mappings,
-            total_count=len(url_infos),
-            original_count=len(url_mappings),
-            duplicate_count=len(duplicates),
-            url_ids=[url_mapping.url_id for url_mapping in url_mappings]
+        """Insert a batch's URLs, linking new ones to the batch and recording duplicates."""
+        return await self.run_query_builder(
+            InsertURLsQueryBuilder(
+                url_infos=url_infos,
+                batch_id=batch_id
+            )
         )
 
     @session_manager
@@ -1003,9 +1400,11 @@ class AsyncDatabaseClient:
     @session_manager
     async def has_validated_urls(self, session: AsyncSession) -> bool:
         query = (
-            select(URL)
-            .where(URL.outcome == URLStatus.VALIDATED.value)
+            select(URL.id)
+            .where(self.statement_composer.url_pending_for(TaskType.SUBMIT_APPROVED))
         )
+        query = self.statement_composer.exclude_leased_urls(query, TaskType.SUBMIT_APPROVED)
+        query = query.limit(1)
         urls = await session.execute(query)
         urls = urls.scalars().all()
         return len(urls) > 0
@@ -1013,16 +1412,18 @@ class AsyncDatabaseClient:
     @session_manager
     async def get_validated_urls(
         self,
-        session: AsyncSession
+        session: AsyncSession,
+        limit: int = STANDARD_ROW_LIMIT
     ) -> list[SubmitApprovedURLTDO]:
         query = (
             select(URL)
-            .where(URL.outcome == URLStatus.VALIDATED.value)
+            .where(self.statement_composer.url_pending_for(TaskType.SUBMIT_APPROVED))
+            .where(self.statement_composer.url_not_leased(TaskType.SUBMIT_APPROVED))
             .options(
                 selectinload(URL.optional_data_source_metadata),
                 selectinload(URL.confirmed_agencies),
                 selectinload(URL.reviewing_user)
-            ).limit(100)
+            ).limit(limit)
         )
         urls = await session.execute(query)
         urls = urls.scalars().all()
@@ -1059,32 +1460,34 @@ class AsyncDatabaseClient:
 
     @session_manager
     async def mark_urls_as_submitted(self, session: AsyncSession, infos: list[SubmittedURLInfo]):
+        if len(infos) == 0:
+            return
+        await session.execute(
+            update(URL)
+            .where(URL.id.in_([info.url_id for info in infos]))
+            .values(outcome=URLStatus.SUBMITTED.value)
+        )
+        rows = []
         for info in infos:
-            url_id = info.url_id
-            data_source_id = info.data_source_id
-
-            query = (
-                update(URL)
-                .where(URL.id == url_id)
-                .values(
-                    outcome=URLStatus.SUBMITTED.value
-                )
-            )
-
-            url_data_source_object = URLDataSource(
-                url_id=url_id,
-                data_source_id=data_source_id
-            )
+            row = {
+                "url_id": info.url_id,
+                "data_source_id": info.data_source_id
+            }
             if info.submitted_at is not None:
-                url_data_source_object.created_at = info.submitted_at
-            session.add(url_data_source_object)
-
-            await session.execute(query)
+                row["created_at"] = info.submitted_at
+            rows.append(row)
+        await BulkWriter.insert(session, model=URLDataSource, rows=rows)
 
-    async def get_duplicates_by_batch_id(self, batch_id: int, page: int) -> list[DuplicateInfo]:
+    async def get_duplicates_by_batch_id(
+        self,
+        batch_id: int,
+        page: int,
+        cursor: Optional[str] = None
+    ) -> GetDuplicatesByBatchResponse:
         return await self.run_query_builder(GetDuplicatesByBatchIDQueryBuilder(
             batch_id=batch_id,
-            page=page
+            page=page,
+            cursor=cursor
         ))
 
     @session_manager
@@ -1094,18 +1497,21 @@ class AsyncDatabaseClient:
         page: int,
         collector_type: Optional[CollectorType] = None,
         status: Optional[BatchStatus] = None,
-        has_pending_urls: Optional[bool] = None
+        has_pending_urls: Optional[bool] = None,
+        cursor: Optional[str] = None
     ) -> GetBatchSummariesResponse:
         # Get only the batch_id, collector_type, status, and created_at
         builder = GetRecentBatchSummariesQueryBuilder(
             page=page,
             collector_type=collector_type,
             status=status,
-            has_pending_urls=has_pending_urls
+            has_pending_urls=has_pending_urls,
+            cursor=cursor
         )
         summaries = await builder.run(session)
         return GetBatchSummariesResponse(
-            results=summaries
+            results=summaries,
+            next_cursor=get_next_cursor(summaries, key=lambda summary: [summary.id])
         )
 
     @session_manager
@@ -1175,6 +1581,38 @@ class AsyncDatabaseClient:
             dto=dto
         ))
 
+    async def import_manual_batch(
+        self,
+        user_id: int,
+        name: str,
+        entries: AsyncIterator[ManualBatchInnerInputDTO]
+    ) -> ManualBatchImportInfo:
+        return await self.run_query_builder(ImportManualBatchQueryBuilder(
+            user_id=user_id,
+            name=name,
+            entries=entries
+        ))
+
+    async def stream_batch_duplicates(
+        self,
+        batch_id: int
+    ) -> AsyncIterator[ManualBatchImportDuplicateInfo]:
+        """Yield the batch's duplicate URLs in the order they were recorded."""
+        query = (
+            select(URL.url, Duplicate.original_url_id)
+            .join(URL, URL.id == Duplicate.original_url_id)
+            .where(Duplicate.batch_id == batch_id)
+            .order_by(Duplicate.id)
+            .execution_options(yield_per=STANDARD_ROW_LIMIT)
+        )
+        async with self.session_maker() as session:
+            result = await session.stream(query)
+            async for row in result:
+                yield ManualBatchImportDuplicateInfo(
+                    url=row.url,
+                    original_url_id=row.original_url_id
+                )
+
 
     @session_manager
     async def search_for_url(self, session: AsyncSession, url: str) -> SearchURLResponse:
@@ -1199,11 +1637,13 @@ class AsyncDatabaseClient:
 
     async def get_batches_breakdown_metrics(
         self,
-        page: int
+        page: int,
+        cursor: Optional[str] = None
     ) -> GetMetricsBatchesBreakdownResponseDTO:
         return await self.run_query_builder(
             GetBatchesBreakdownMetricsQueryBuilder(
-                page=page
+                page=page,
+                cursor=cursor
             )
         )
 
@@ -1372,6 +1812,37 @@ class AsyncDatabaseClient:
             entries=final_results,
         )
 
+    @session_manager
+    async def get_task_pending_counts(self, session: AsyncSession) -> list[TaskPendingCountInfo]:
+        """
+        The number of URLs with work outstanding for each URL task type,
+        counted from each flag's partial index on `urls`.
+        """
+        query = union_all(*[
+            select(
+                literal(task_type.value).label("task_type"),
+                func.count().label("pending_count")
+            ).where(
+                StatementComposer.url_pending_for(task_type)
+            )
+            for task_type in TASK_PENDING_FLAGS
+        ])
+        raw_result = await session.execute(query)
+        return [
+            TaskPendingCountInfo(
+                task_type=TaskType(row.task_type),
+                pending_count=row.pending_count
+            )
+            for row in raw_result.all()
+        ]
+
+    @session_manager
+    async def has_pending_work(self, session: AsyncSession, task_type: TaskType) -> bool:
+        query = select(
+            exists().where(StatementComposer.url_pending_for(task_type))
+        )
+        return await session.scalar(query)
+
     @session_manager
     async def get_backlog_metrics(
         self,
@@ -1418,7 +1889,17 @@ class AsyncDatabaseClient:
                 )
             )
 
-        return GetMetricsBacklogResponseDTO(entries=final_results)
+        task_pending_counts = await self.get_task_pending_counts()
+        return GetMetricsBacklogResponseDTO(
+            entries=final_results,
+            tasks=[
+                GetMetricsBacklogTaskResponseInnerDTO(
+                    task_type=task_pending_count.task_type,
+                    count_pending=task_pending_count.pending_count
+                )
+                for task_pending_count in task_pending_counts
+            ]
+        )
 
     @session_manager
     async def populate_backlog_snapshot(
@@ -1450,12 +1931,9 @@ class AsyncDatabaseClient:
     async def has_pending_urls_not_checked_for_duplicates(self, session: AsyncSession) -> bool:
         query = (select(
             URL.id
-        ).outerjoin(
-            URLCheckedForDuplicate,
-            URL.id == URLCheckedForDuplicate.url_id
         ).where(
-            URL.outcome == URLStatus.PENDING.value,
-            URLCheckedForDuplicate.id == None
+            self.statement_composer.url_pending_for(TaskType.DUPLICATE_DETECTION),
+            self.statement_composer.url_not_leased(TaskType.DUPLICATE_DETECTION)
         ).limit(1)
                  )
 
@@ -1464,16 +1942,17 @@ class AsyncDatabaseClient:
         return result is not None
 
     @session_manager
-    async def get_pending_urls_not_checked_for_duplicates(self, session: AsyncSession) -> List[URLDuplicateTDO]:
+    async def get_pending_urls_not_checked_for_duplicates(
+        self,
+        session: AsyncSession,
+        limit: int = STANDARD_ROW_LIMIT
+    ) -> List[URLDuplicateTDO]:
         query = (select(
             URL
-        ).outerjoin(
-            URLCheckedForDuplicate,
-            URL.id == URLCheckedForDuplicate.url_id
         ).where(
-            URL.outcome == URLStatus.PENDING.value,
-            URLCheckedForDuplicate.id == None
-        ).limit(100)
+            self.statement_composer.url_pending_for(TaskType.DUPLICATE_DETECTION),
+            self.statement_composer.url_not_leased(TaskType.DUPLICATE_DETECTION)
+        ).order_by(URL.id).limit(limit)
                  )
 
         raw_result = await session.execute(query)
@@ -1519,11 +1998,14 @@ class AsyncDatabaseClient:
                 URLProbedFor404
             ).where(
                 and_(
-                    URL.outcome == URLStatus.PENDING.value,
                     or_(
-                        URLProbedFor404.id == None,
-                        URLProbedFor404.last_probed_at < month_ago
-                    )
+                        self.statement_composer.url_pending_for(TaskType.PROBE_404),
+                        and_(
+                            URL.outcome == URLStatus.PENDING.value,
+                            URLProbedFor404.last_probed_at < month_ago
+                        )
+                    ),
+                    self.statement_composer.url_not_leased(TaskType.PROBE_404)
                 )
             ).limit(1)
         )
@@ -1533,7 +2015,34 @@ class AsyncDatabaseClient:
         return result is not None
 
     @session_manager
-    async def get_pending_urls_not_recently_probed_for_404(self, session: AsyncSession) -> List[URL404ProbeTDO]:
+    async def has_pending_urls_due_for_404_reprobe(self, session: AsyncSession) -> bool:
+        """
+        Whether any pending URL was last probed for 404 over a month ago.
+        URLs never probed are tracked by the pending-work counters instead.
+        """
+        month_ago = func.now() - timedelta(days=30)
+        query = (
+            select(
+                URLProbedFor404.url_id
+            ).join(
+                URL
+            ).where(
+                URLProbedFor404.last_probed_at < month_ago,
+                URL.outcome == URLStatus.PENDING.value,
+                self.statement_composer.url_not_leased(TaskType.PROBE_404)
+            ).limit(1)
+        )
+
+        raw_result = await session.execute(query)
+        result = raw_result.one_or_none()
+        return result is not None
+
+    @session_manager
+    async def get_pending_urls_not_recently_probed_for_404(
+        self,
+        session: AsyncSession,
+        limit: int = STANDARD_ROW_LIMIT
+    ) -> List[URL404ProbeTDO]:
         month_ago = func.now() - timedelta(days=30)
         query = (
             select(
@@ -1542,18 +2051,34 @@ class AsyncDatabaseClient:
                 URLProbedFor404
             ).where(
                 and_(
-                    URL.outcome == URLStatus.PENDING.value,
                     or_(
-                        URLProbedFor404.id == None,
-                        URLProbedFor404.last_probed_at < month_ago
-                    )
+                        self.statement_composer.url_pending_for(TaskType.PROBE_404),
+                        and_(
+                            URL.outcome == URLStatus.PENDING.value,
+                            URLProbedFor404.last_probed_at < month_ago
+                        )
+                    ),
+                    self.statement_composer.url_not_leased(TaskType.PROBE_404)
                 )
-            ).limit(100)
+            ).options(
+                selectinload(URL.fetch_validators)
+            ).order_by(URL.id).limit(limit)
         )
 
         raw_result = await session.execute(query)
         urls = raw_result.scalars().all()
-        return [URL404ProbeTDO(url=url.url, url_id=url.id) for url in urls]
+        tdos = []
+        for url in urls:
+            validators = None
+            if url.fetch_validators is not None:
+                validators = FetchValidatorsInfo(
+                    etag=url.fetch_validators.etag,
+                    last_modified=url.fetch_validators.last_modified,
+                    content_length=url.fetch_validators.content_length,
+                    content_hash=url.fetch_validators.content_hash
+                )
+            tdos.append(URL404ProbeTDO(url=url.url, url_id=url.id, validators=validators))
+        return tdos
 
     @session_manager
     async def get_urls_aggregated_pending_metrics(
@@ -1624,7 +2149,16 @@ class AsyncDatabaseClient:
         url_id: int
     ) -> str:
         query = (
-            select(URLCompressedHTML.compressed_html)
+            select(
+                func.coalesce(
+                    URLCompressedHTML.compressed_html,
+                    HTMLContentBlob.compressed_html
+                ).label("compressed_html")
+            )
+            .outerjoin(
+                HTMLContentBlob,
+                HTMLContentBlob.content_hash == URLCompressedHTML.content_hash
+            )
             .where(URLCompressedHTML.url_id == url_id)
         )
         execution_result = await session.execute(query)
@@ -1633,15 +2167,220 @@ class AsyncDatabaseClient:
             return None
         return decompress_html(row["compressed_html"])
 
-    @session_manager
     async def add_raw_html(
         self,
-        session: AsyncSession,
         info_list: list[RawHTMLInfo]
-    ):
-        for info in info_list:
-            compressed_html = URLCompressedHTML(
+    ) -> int:
+        compressed_html_infos = [
+            CompressedHTMLInfo(
                 url_id=info.url_id,
+                content_hash=info.content_hash or get_content_hash(info.html),
                 compressed_html=compress_html(info.html)
             )
-            session.add(compressed_html)
+            for info in info_list
+        ]
+        return await self.add_compressed_html(compressed_html_infos)
+
+    @session_manager
+    async def add_compressed_html(
+        self,
+        session: AsyncSession,
+        info_list: list[CompressedHTMLInfo]
+    ) -> int:
+        """
+        Store each page once in `html_content_blobs`, keyed by its content hash,
+        and point each URL at its page.
+        Returns the number of pages which did not need storing,
+        because identical content was already stored.
+        """
+        if len(info_list) == 0:
+            return 0
+        blob_values = {}
+        for info in info_list:
+            blob_values.setdefault(
+                info.content_hash,
+                {
+                    "content_hash": info.content_hash,
+                    "compressed_html": info.compressed_html
+                }
+            )
+        stored_blobs = await BulkWriter.insert(
+            session,
+            model=HTMLContentBlob,
+            rows=list(blob_values.values()),
+            conflict_columns=['content_hash'],
+            returning=[HTMLContentBlob.content_hash]
+        )
+        stored_count = len(stored_blobs)
+
+        await BulkWriter.insert(
+            session,
+            model=URLCompressedHTML,
+            rows=[
+                {
+                    "url_id": info.url_id,
+                    "content_hash": info.content_hash
+                }
+                for info in info_list
+            ]
+        )
+        return len(info_list) - stored_count
+
+    @session_manager
+    async def get_html_content_infos_by_content_hash(
+        self,
+        session: AsyncSession,
+        content_hashes: list[str]
+    ) -> dict[str, list[URLHTMLContentInfo]]:
+        """
+        For each content hash already parsed, get the HTML content
+        of one URL sharing that hash, with the URL id removed.
+        """
+        if len(content_hashes) == 0:
+            return {}
+        query = (
+            select(
+                URLCompressedHTML.content_hash,
+                URLHTMLContent.url_id,
+                URLHTMLContent.content_type,
+                URLHTMLContent.content
+            )
+            .join(
+                URLHTMLContent,
+                URLHTMLContent.url_id == URLCompressedHTML.url_id
+            )
+            .where(URLCompressedHTML.content_hash.in_(set(content_hashes)))
+            .order_by(URLHTMLContent.url_id)
+        )
+        result = await session.execute(query)
+        source_url_ids: dict[str, int] = {}
+        html_content_infos: dict[str, list[URLHTMLContentInfo]] = {}
+        for row in result.mappings().all():
+            content_hash = row["content_hash"]
+            source_url_id = source_url_ids.setdefault(content_hash, row["url_id"])
+            if row["url_id"] != source_url_id:
+                continue
+            html_content_infos.setdefault(content_hash, []).append(
+                URLHTMLContentInfo(
+                    content_type=HTMLContentType(row["content_type"]),
+                    content=row["content"]
+                )
+            )
+        return html_content_infos
+
+    @session_manager
+    async def get_auto_relevant_annotations_by_content_hash(
+        self,
+        session: AsyncSession,
+        content_hashes: list[str]
+    ) -> dict[str, RelevanceAnnotationInfo]:
+        if len(content_hashes) == 0:
+            return {}
+        query = (
+            select(
+                URLCompressedHTML.content_hash,
+                AutoRelevantSuggestion.relevant,
+                AutoRelevantSuggestion.confidence,
+                AutoRelevantSuggestion.model_name
+            )
+            .join(
+                AutoRelevantSuggestion,
+                AutoRelevantSuggestion.url_id == URLCompressedHTML.url_id
+            )
+            .where(URLCompressedHTML.content_hash.in_(set(content_hashes)))
+            .order_by(AutoRelevantSuggestion.id)
+        )
+        result = await session.execute(query)
+        annotations = {}
+        for row in result.mappings().all():
+            if row["content_hash"] in annotations:
+                continue
+            annotations[row["content_hash"]] = RelevanceAnnotationInfo(
+                is_relevant=row["relevant"],
+                confidence=row["confidence"],
+                model_name=row["model_name"]
+            )
+        return annotations
+
+    @session_manager
+    async def get_auto_record_types_by_content_hash(
+        self,
+        session: AsyncSession,
+        content_hashes: list[str]
+    ) -> dict[str, RecordType]:
+        if len(content_hashes) == 0:
+            return {}
+        query = (
+            select(
+                URLCompressedHTML.content_hash,
+                AutoRecordTypeSuggestion.record_type
+            )
+            .join(
+                AutoRecordTypeSuggestion,
+                AutoRecordTypeSuggestion.url_id == URLCompressedHTML.url_id
+            )
+            .where(URLCompressedHTML.content_hash.in_(set(content_hashes)))
+            .order_by(AutoRecordTypeSuggestion.id)
+        )
+        result = await session.execute(query)
+        record_types = {}
+        for row in result.mappings().all():
+            if row["content_hash"] in record_types:
+                continue
+            record_types[row["content_hash"]] = RecordType(row["record_type"])
+        return record_types
+
+    async def add_content_dedup_saving(
+        self,
+        saving_type: ContentDedupSavingType,
+        count: int
+    ):
+        if count == 0:
+            return
+        await self.add(
+            ContentDedupSaving(
+                saving_type=saving_type.value,
+                count=count
+            )
+        )
+
+    async def get_task_phases_metrics(
+        self,
+        days: int,
+        task_type: Optional[TaskType] = None
+    ) -> GetMetricsTaskPhasesResponseDTO:
+        return await self.run_query_builder(
+            GetTaskPhasesMetricsQueryBuilder(
+                days=days,
+                task_type=task_type
+            )
+        )
+
+    @session_manager
+    async def get_content_dedup_metrics(
+        self,
+        session: AsyncSession
+    ) -> GetMetricsContentDedupResponseDTO:
+        savings_query = (
+            select(
+                ContentDedupSaving.saving_type,
+                func.sum(ContentDedupSaving.count).label("count")
+            )
+            .group_by(ContentDedupSaving.saving_type)
+        )
+        savings_result = await session.execute(savings_query)
+        savings = {
+            row["saving_type"]: row["count"]
+            for row in savings_result.mappings().all()
+        }
+        distinct_pages_query = select(func.count(HTMLContentBlob.id))
+        urls_with_html_query = select(func.count(URLCompressedHTML.id))
+
+        return GetMetricsContentDedupResponseDTO(
+            distinct_pages=await session.scalar(distinct_pages_query),
+            urls_with_html=await session.scalar(urls_with_html_query),
+            storage_writes_saved=savings.get(ContentDedupSavingType.STORAGE.value, 0),
+            parses_saved=savings.get(ContentDedupSavingType.PARSE.value, 0),
+            relevancy_calls_saved=savings.get(ContentDedupSavingType.RELEVANCY.value, 0),
+            record_type_calls_saved=savings.get(ContentDedupSavingType.RECORD_TYPE.value, 0)
+        )
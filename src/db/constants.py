@@ -1,3 +1,4 @@
+from src.db.enums import TaskType
 from src.db.models.instantiations.url.suggestion.agency.auto import AutomatedUrlAgencySuggestion
 from src.db.models.instantiations.url.suggestion.agency.user import UserUrlAgencySuggestion
 from src.db.models.instantiations.url.suggestion.record_type.auto import AutoRecordTypeSuggestion
@@ -9,6 +10,26 @@ PLACEHOLDER_AGENCY_NAME = "PLACEHOLDER_AGENCY_NAME"
 
 STANDARD_ROW_LIMIT = 100
 
+# Postgres accepts at most this many bind parameters in one statement
+MAX_BIND_PARAMETERS = 32767
+
+# Rows per multi-row `INSERT` when bulk inserting URLs, keeping each statement
+# well under the Postgres limit on bind parameters
+URL_INSERT_CHUNK_SIZE = 1000
+
+# Bits of `urls.pending_task_flags`, set while a URL has work outstanding for the task type.
+# Maintained by database triggers, and each bit has its own partial index.
+TASK_PENDING_FLAGS = {
+    TaskType.HTML: 1,
+    TaskType.RELEVANCY: 2,
+    TaskType.RECORD_TYPE: 4,
+    TaskType.AGENCY_IDENTIFICATION: 8,
+    TaskType.MISC_METADATA: 16,
+    TaskType.DUPLICATE_DETECTION: 32,
+    TaskType.PROBE_404: 64,
+    TaskType.SUBMIT_APPROVED: 128,
+}
+
 ALL_ANNOTATION_MODELS = [
     AutoRecordTypeSuggestion,
     AutoRelevantSuggestion,
@@ -188,10 +188,15 @@ class DTOConverter:
                 )
             )
 
+        content_hash = None
+        if url.compressed_html is not None:
+            content_hash = url.compressed_html.content_hash
+
         return URLWithHTML(
             url=url_val,
             url_id=url_id,
-            html_infos=html_infos
+            html_infos=html_infos,
+            content_hash=content_hash
         )
 
     @staticmethod
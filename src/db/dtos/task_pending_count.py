@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+from src.db.enums import TaskType
+
+
+class TaskPendingCountInfo(BaseModel):
+    task_type: TaskType
+    pending_count: int
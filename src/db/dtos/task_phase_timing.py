@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class TaskPhaseTimingInfo(BaseModel):
+    phase: str
+    duration_seconds: float
+    item_count: int = 0
+    byte_count: int = 0
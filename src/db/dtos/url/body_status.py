@@ -0,0 +1,12 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from src.db.enums import ResponseBodyStatus
+
+
+class URLBodyStatusInfo(BaseModel):
+    url_id: int
+    status: ResponseBodyStatus
+    content_type: Optional[str] = None
+    bytes_read: int
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class CompressedHTMLInfo(BaseModel):
+    url_id: int
+    content_hash: str
+    compressed_html: bytes
@@ -0,0 +1,11 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class URLFetchValidatorsInfo(BaseModel):
+    url_id: int
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_length: Optional[int] = None
+    content_hash: Optional[str] = None
@@ -1,6 +1,10 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 
 class RawHTMLInfo(BaseModel):
     url_id: int
-    html: str
\ No newline at end of file
+    html: str
+    # Computed from `html` when not provided
+    content_hash: Optional[str] = None
@@ -0,0 +1,14 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from src.db.enums import RenderDecisionReason, RenderProfileType
+
+
+class URLRenderDecisionInfo(BaseModel):
+    url_id: int
+    rendered: bool
+    reason: RenderDecisionReason
+    render_profile: Optional[RenderProfileType] = None
+    render_duration_seconds: Optional[float] = None
+    render_timed_out: Optional[bool] = None
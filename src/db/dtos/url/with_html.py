@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 from src.db.dtos.url.html_content import URLHTMLContentInfo
@@ -6,4 +8,5 @@ from src.db.dtos.url.html_content import URLHTMLContentInfo
 class URLWithHTML(BaseModel):
     url_id: int
     url: str
-    html_infos: list[URLHTMLContentInfo]
\ No newline at end of file
+    html_infos: list[URLHTMLContentInfo]
+    content_hash: Optional[str] = None
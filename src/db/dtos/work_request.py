@@ -0,0 +1,11 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from src.db.enums import WorkRequestType
+
+
+class WorkRequestInfo(BaseModel):
+    id: int
+    request_type: WorkRequestType
+    batch_id: Optional[int] = None
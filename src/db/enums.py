@@ -31,6 +31,29 @@ class URLHTMLContentType(PyEnum):
     H6 = "H6"
     DIV = "Div"
 
+class RenderDecisionReason(PyEnum):
+    STATIC = "Static"
+    NEAR_EMPTY_BODY = "Near Empty Body"
+    SPA_ROOT = "SPA Root"
+    NOSCRIPT_WARNING = "Noscript Warning"
+    HIGH_SCRIPT_RATIO = "High Script Ratio"
+    UNPARSEABLE = "Unparseable"
+
+class RenderProfileType(PyEnum):
+    FULL = "Full"
+    LEAN = "Lean"
+
+class ResponseBodyStatus(PyEnum):
+    COMPLETE = "Complete"
+    TRUNCATED = "Truncated"
+    SKIPPED = "Skipped"
+
+class ContentDedupSavingType(PyEnum):
+    STORAGE = "Storage"
+    PARSE = "Parse"
+    RELEVANCY = "Relevancy"
+    RECORD_TYPE = "Record Type"
+
 class TaskType(PyEnum):
     HTML = "HTML"
     RELEVANCY = "Relevancy"
@@ -43,6 +66,11 @@ class TaskType(PyEnum):
     PROBE_404 = "404 Probe"
     SYNC_AGENCIES = "Sync Agencies"
 
+class WorkRequestType(PyEnum):
+    RUN_TASKS = "Run Tasks"
+    START_COLLECTOR = "Start Collector"
+    ABORT_COLLECTOR = "Abort Collector"
+
 class PGEnum(TypeDecorator):
     impl = postgresql.ENUM
 
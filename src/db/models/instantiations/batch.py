@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, TIMESTAMP, Float, JSON
+from sqlalchemy import Column, Integer, TIMESTAMP, Float, JSON, Index
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import relationship
 
@@ -9,6 +9,9 @@ from src.db.models.types import batch_status_enum
 
 class Batch(StandardModel):
     __tablename__ = 'batches'
+    __table_args__ = (
+        Index('ix_batches_date_generated_id', 'date_generated', 'id'),
+    )
 
     strategy = Column(
         postgresql.ENUM(
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer
+
+from src.db.enums import PGEnum
+from src.db.models.mixins import CreatedAtMixin
+from src.db.models.templates import StandardModel
+
+
+class ContentDedupSaving(CreatedAtMixin, StandardModel):
+    """
+    Records work skipped because a URL's HTML matched content already seen.
+    """
+    __tablename__ = 'content_dedup_savings'
+
+    saving_type = Column(
+        PGEnum('Storage', 'Parse', 'Relevancy', 'Record Type', name='content_dedup_saving_type'),
+        nullable=False
+    )
+    count = Column(Integer, nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy import Column, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from src.db.models.mixins import BatchDependentMixin
@@ -10,6 +10,10 @@ class Duplicate(BatchDependentMixin, StandardModel):
     Identifies duplicates which occur within a batch
     """
     __tablename__ = 'duplicates'
+    __table_args__ = (
+        Index('ix_duplicates_original_url_id', 'original_url_id'),
+        Index('ix_duplicates_batch_id', 'batch_id', postgresql_include=['original_url_id']),
+    )
 
     original_url_id = Column(
         Integer,
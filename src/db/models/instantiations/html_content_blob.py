@@ -0,0 +1,21 @@
+from sqlalchemy import Column, LargeBinary, String, UniqueConstraint
+
+from src.db.models.mixins import CreatedAtMixin
+from src.db.models.templates import StandardModel
+
+
+class HTMLContentBlob(CreatedAtMixin, StandardModel):
+    """
+    Content-addressed store of fetched HTML,
+    keyed by the hash of the normalized page,
+    so that identical pages served at many URLs are stored once.
+    """
+    __tablename__ = 'html_content_blobs'
+    __table_args__ = (
+        UniqueConstraint(
+        "content_hash",
+        name="uq_html_content_blobs_content_hash"),
+    )
+
+    content_hash = Column(String, nullable=False)
+    compressed_html = Column(LargeBinary, nullable=False)
@@ -1,3 +1,4 @@
+from sqlalchemy import Index
 from sqlalchemy.orm import relationship
 
 from src.db.models.mixins import CreatedAtMixin, UpdatedAtMixin, BatchDependentMixin, URLDependentMixin
@@ -12,6 +13,9 @@ class LinkBatchURL(
     StandardModel
 ):
     __tablename__ = "link_batch_urls"
+    __table_args__ = (
+        Index("ix_link_batch_urls_batch_id", "batch_id", postgresql_include=["url_id"]),
+    )
 
     url = relationship('URL')
     batch = relationship('Batch')
\ No newline at end of file
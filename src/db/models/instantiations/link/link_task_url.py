@@ -1,14 +1,17 @@
-from sqlalchemy import UniqueConstraint, Column, Integer, ForeignKey
+from sqlalchemy import UniqueConstraint, Column, Integer, ForeignKey, Index
 
 from src.db.models.templates import Base
 
 
 class LinkTaskURL(Base):
     __tablename__ = 'link_task_urls'
-    __table_args__ = (UniqueConstraint(
-        "task_id",
-        "url_id",
-        name="uq_task_id_url_id"),
+    __table_args__ = (
+        UniqueConstraint(
+            "task_id",
+            "url_id",
+            name="uq_task_id_url_id"
+        ),
+        Index("ix_link_task_urls_url_id", "url_id"),
     )
 
     task_id = Column(Integer, ForeignKey('tasks.id', ondelete="CASCADE"), primary_key=True)
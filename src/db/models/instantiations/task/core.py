@@ -1,4 +1,4 @@
-from sqlalchemy import Column
+from sqlalchemy import Column, Integer, TIMESTAMP, Index
 from sqlalchemy.orm import relationship
 
 from src.db.enums import PGEnum, TaskType
@@ -9,6 +9,9 @@ from src.db.models.types import batch_status_enum
 
 class Task(UpdatedAtMixin, StandardModel):
     __tablename__ = 'tasks'
+    __table_args__ = (
+        Index('ix_tasks_task_type_task_status', 'task_type', 'task_status'),
+    )
 
     task_type = Column(
         PGEnum(
@@ -16,6 +19,9 @@ class Task(UpdatedAtMixin, StandardModel):
             name='task_type'
         ), nullable=False)
     task_status = Column(batch_status_enum, nullable=False)
+    # Number of URLs whose results were persisted by chunk checkpoints so far
+    checkpointed_url_count = Column(Integer, nullable=False, server_default='0')
+    checkpointed_at = Column(TIMESTAMP, nullable=True)
 
     # Relationships
     urls = relationship(
@@ -25,3 +31,4 @@ class Task(UpdatedAtMixin, StandardModel):
     )
     error = relationship("TaskError", back_populates="task")
     errored_urls = relationship("URLErrorInfo", back_populates="task")
+    phase_timings = relationship("TaskPhaseTiming", back_populates="task")
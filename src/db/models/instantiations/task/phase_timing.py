@@ -0,0 +1,30 @@
+from sqlalchemy import Column, String, Float, Integer, BigInteger, UniqueConstraint, Index
+from sqlalchemy.orm import relationship
+
+from src.db.models.mixins import CreatedAtMixin, TaskDependentMixin
+from src.db.models.templates import StandardModel
+
+
+class TaskPhaseTiming(CreatedAtMixin, TaskDependentMixin, StandardModel):
+    """
+    Time spent in one named phase of a task run,
+    with the number of items and bytes the phase handled.
+    """
+    __tablename__ = 'task_phase_timings'
+
+    phase = Column(String, nullable=False)
+    duration_seconds = Column(Float, nullable=False)
+    item_count = Column(Integer, nullable=False, server_default='0')
+    byte_count = Column(BigInteger, nullable=False, server_default='0')
+
+    # Relationships
+    task = relationship("Task", back_populates="phase_timings")
+
+    __table_args__ = (
+        UniqueConstraint(
+            "task_id",
+            "phase",
+            name="uq_task_phase_timings_task_id_phase"
+        ),
+        Index('ix_task_phase_timings_created_at', 'created_at'),
+    )
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.orm import relationship
+
+from src.db.enums import PGEnum
+from src.db.models.mixins import CreatedAtMixin, URLDependentMixin
+from src.db.models.templates import StandardModel
+
+
+class URLBodyStatus(
+    CreatedAtMixin,
+    URLDependentMixin,
+    StandardModel
+):
+    """
+    Records URLs whose response body was not stored in full,
+    either because it exceeded the size cap or because its
+    content type is not parsed.
+    """
+    __tablename__ = 'url_body_statuses'
+
+    status = Column(
+        PGEnum('Complete', 'Truncated', 'Skipped', name='response_body_status'),
+        nullable=False
+    )
+    content_type = Column(String, nullable=True)
+    bytes_read = Column(Integer, nullable=False)
+
+    url = relationship(
+        "URL",
+        uselist=False,
+        back_populates="body_status"
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, LargeBinary
+from sqlalchemy import Column, LargeBinary, String, ForeignKey
 from sqlalchemy.orm import relationship
 
 from src.db.models.mixins import CreatedAtMixin, URLDependentMixin
@@ -12,10 +12,26 @@ class URLCompressedHTML(
 ):
     __tablename__ = 'url_compressed_html'
 
-    compressed_html = Column(LargeBinary, nullable=False)
+    # Null when the HTML is held in `html_content_blobs` instead
+    compressed_html = Column(LargeBinary, nullable=True)
+    content_hash = Column(
+        String,
+        ForeignKey('html_content_blobs.content_hash'),
+        nullable=True,
+        index=True
+    )
 
     url = relationship(
         "URL",
         uselist=False,
         back_populates="compressed_html"
-    )
\ No newline at end of file
+    )
+    content_blob = relationship(
+        "HTMLContentBlob",
+        uselist=False
+    )
+
+    def get_compressed_html(self) -> bytes:
+        if self.compressed_html is not None:
+            return self.compressed_html
+        return self.content_blob.compressed_html
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Text, String, JSON
+from sqlalchemy import Column, Integer, ForeignKey, Text, String, JSON, Index, text
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import relationship
 
@@ -9,6 +9,13 @@ from src.db.models.types import record_type_values
 
 class URL(UpdatedAtMixin, CreatedAtMixin, StandardModel):
     __tablename__ = 'urls'
+    __table_args__ = (
+        Index(
+            'ix_urls_pending',
+            'id',
+            postgresql_where=text("outcome = 'pending'")
+        ),
+    )
 
     # The batch this URL is associated with
     url = Column(Text, unique=True)
@@ -32,6 +39,9 @@ class URL(UpdatedAtMixin, CreatedAtMixin, StandardModel):
         nullable=False
     )
     record_type = Column(postgresql.ENUM(*record_type_values, name='record_type'), nullable=True)
+    # Which URL tasks still have work to do on this URL; see `TASK_PENDING_FLAGS`.
+    # Maintained by database triggers, so never written by the application.
+    pending_task_flags = Column(Integer, nullable=False, server_default='0')
 
     # Relationships
     batch = relationship(
@@ -86,4 +96,23 @@ class URL(UpdatedAtMixin, CreatedAtMixin, StandardModel):
         "URLCompressedHTML",
         uselist=False,
         back_populates="url"
-    )
\ No newline at end of file
+    )
+    render_decision = relationship(
+        "URLRenderDecision",
+        uselist=False,
+        back_populates="url"
+    )
+    body_status = relationship(
+        "URLBodyStatus",
+        uselist=False,
+        back_populates="url"
+    )
+    fetch_validators = relationship(
+        "URLFetchValidators",
+        uselist=False,
+        back_populates="url"
+    )
+    task_leases = relationship(
+        "URLTaskLease",
+        back_populates="url"
+    )
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, String, BigInteger
+from sqlalchemy.orm import relationship
+
+from src.db.models.mixins import URLDependentMixin, UpdatedAtMixin
+from src.db.models.templates import StandardModel
+
+
+class URLFetchValidators(
+    UpdatedAtMixin,
+    URLDependentMixin,
+    StandardModel
+):
+    """
+    HTTP validators from the last time the URL's HTML was fetched,
+    used to make conditional requests when the URL is probed again.
+    """
+    __tablename__ = 'url_fetch_validators'
+
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
+    content_length = Column(BigInteger, nullable=True)
+    content_hash = Column(String, nullable=True)
+
+    url = relationship(
+        "URL",
+        uselist=False,
+        back_populates="fetch_validators"
+    )
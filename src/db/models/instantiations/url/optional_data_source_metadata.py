@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ARRAY, String
+from sqlalchemy import Column, ARRAY, String, Index
 from sqlalchemy.orm import relationship
 
 from src.db.models.mixins import URLDependentMixin
@@ -7,6 +7,9 @@ from src.db.models.templates import StandardModel
 
 class URLOptionalDataSourceMetadata(URLDependentMixin, StandardModel):
     __tablename__ = 'url_optional_data_source_metadata'
+    __table_args__ = (
+        Index('ix_url_optional_data_source_metadata_url_id', 'url_id'),
+    )
 
     record_formats = Column(ARRAY(String), nullable=True)
     data_portal_type = Column(String, nullable=True)
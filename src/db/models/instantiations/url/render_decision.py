@@ -0,0 +1,45 @@
+from sqlalchemy import Column, Boolean, Float
+from sqlalchemy.orm import relationship
+
+from src.db.enums import PGEnum
+from src.db.models.mixins import CreatedAtMixin, URLDependentMixin
+from src.db.models.templates import StandardModel
+
+
+class URLRenderDecision(
+    CreatedAtMixin,
+    URLDependentMixin,
+    StandardModel
+):
+    """
+    Whether the HTML task rendered the URL in a browser,
+    the static HTML signal that decided it,
+    and, for rendered URLs, how long the render took.
+    """
+    __tablename__ = 'url_render_decisions'
+
+    rendered = Column(Boolean, nullable=False)
+    reason = Column(
+        PGEnum(
+            'Static',
+            'Near Empty Body',
+            'SPA Root',
+            'Noscript Warning',
+            'High Script Ratio',
+            'Unparseable',
+            name='render_decision_reason'
+        ),
+        nullable=False
+    )
+    render_profile = Column(
+        PGEnum('Full', 'Lean', name='render_profile'),
+        nullable=True
+    )
+    render_duration_seconds = Column(Float, nullable=True)
+    render_timed_out = Column(Boolean, nullable=True)
+
+    url = relationship(
+        "URL",
+        uselist=False,
+        back_populates="render_decision"
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Boolean, UniqueConstraint
+from sqlalchemy import Column, Boolean, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 
 from src.db.models.helpers import get_agency_id_foreign_column
@@ -17,4 +17,5 @@ class AutomatedUrlAgencySuggestion(URLDependentMixin, StandardModel):
 
     __table_args__ = (
         UniqueConstraint("agency_id", "url_id", name="uq_automated_url_agency_suggestions"),
+        Index("ix_automated_url_agency_suggestions_url_id", "url_id"),
     )
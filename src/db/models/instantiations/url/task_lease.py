@@ -0,0 +1,43 @@
+from sqlalchemy import Column, String, TIMESTAMP, UniqueConstraint
+from sqlalchemy.orm import relationship
+
+from src.db.enums import PGEnum, TaskType
+from src.db.models.mixins import URLDependentMixin, CreatedAtMixin
+from src.db.models.templates import StandardModel
+
+
+class URLTaskLease(
+    CreatedAtMixin,
+    URLDependentMixin,
+    StandardModel
+):
+    """
+    A worker's claim on a URL for one task type.
+    Other workers skip the URL until the lease is released or expires,
+    so leases held by crashed workers are reclaimed once `expires_at` passes.
+    """
+    __tablename__ = 'url_task_leases'
+    __table_args__ = (
+        UniqueConstraint(
+            "url_id",
+            "task_type",
+            name="uq_url_task_leases_url_id_task_type"
+        ),
+    )
+
+    task_type = Column(
+        PGEnum(
+            *[task_type.value for task_type in TaskType],
+            name='task_type',
+            create_type=False
+        ),
+        nullable=False
+    )
+    worker_id = Column(String, nullable=False)
+    expires_at = Column(TIMESTAMP, nullable=False)
+
+    url = relationship(
+        "URL",
+        uselist=False,
+        back_populates="task_leases"
+    )
@@ -0,0 +1,40 @@
+from sqlalchemy import Column, Integer, ForeignKey, String, TIMESTAMP, Index, text, Text
+
+from src.db.enums import PGEnum, WorkRequestType
+from src.db.models.mixins import CreatedAtMixin
+from src.db.models.templates import StandardModel
+
+
+class WorkRequest(CreatedAtMixin, StandardModel):
+    """
+    Work the API has asked a task worker process to carry out.
+    Unclaimed until a worker picks it up.
+    `error` is set if the worker failed to carry it out.
+    """
+    __tablename__ = 'work_requests'
+    __table_args__ = (
+        Index(
+            'ix_work_requests_unclaimed',
+            'id',
+            postgresql_where=text('claimed_at IS NULL')
+        ),
+    )
+
+    request_type = Column(
+        PGEnum(
+            *[request_type.value for request_type in WorkRequestType],
+            name='work_request_type'
+        ),
+        nullable=False
+    )
+    batch_id = Column(
+        Integer,
+        ForeignKey(
+            'batches.id',
+            ondelete="CASCADE"
+        ),
+        nullable=True
+    )
+    worker_id = Column(String, nullable=True)
+    claimed_at = Column(TIMESTAMP, nullable=True)
+    error = Column(Text, nullable=True)
@@ -0,0 +1,72 @@
+"""
+Opaque cursors for keyset pagination.
+
+A cursor holds the sort key of the last row on a page, and the next page starts
+after that key, so deep pages cost as much as the first. Clients pass cursors
+back as they were given; their contents are not part of the API.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, Optional, Sequence, TypeVar
+
+from fastapi import HTTPException
+from sqlalchemy import ColumnElement
+from starlette.status import HTTP_400_BAD_REQUEST
+
+from src.db.constants import STANDARD_ROW_LIMIT
+
+RowType = TypeVar("RowType")
+
+
+def _to_json_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _from_json_value(value: Any, column: ColumnElement) -> Any:
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is int and isinstance(value, int) and not isinstance(value, bool):
+        return value
+    raise ValueError(f"Unexpected cursor value for {column}")
+
+
+def encode_cursor(key: Sequence[Any]) -> str:
+    data = json.dumps([_to_json_value(value) for value in key], separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, key_columns: Sequence[ColumnElement]) -> list[Any]:
+    """Decode a cursor into values for the given key columns."""
+    try:
+        padded_cursor = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded_cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(key_columns):
+            raise ValueError("Cursor does not match the sort key")
+        return [
+            _from_json_value(value, column)
+            for value, column in zip(values, key_columns)
+        ]
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def get_next_cursor(
+    rows: Sequence[RowType],
+    key: Callable[[RowType], Sequence[Any]],
+    limit: int = STANDARD_ROW_LIMIT
+) -> Optional[str]:
+    """
+    Get the cursor for the page after `rows`,
+    or None if `rows` is not a full page and so is the last.
+    """
+    if len(rows) < limit:
+        return None
+    return encode_cursor(key(rows[-1]))
@@ -1,8 +1,44 @@
+from typing import Optional, Sequence
+
+from sqlalchemy import ColumnElement, tuple_
 from sqlalchemy.dialects import postgresql
 
 from src.db.constants import STANDARD_ROW_LIMIT
+from src.db.queries.cursor import decode_cursor
 
 
 def add_page_offset(statement, page, limit=STANDARD_ROW_LIMIT):
     offset = (page - 1) * limit
     return statement.limit(limit).offset(offset)
+
+
+def add_keyset_page(
+    statement,
+    key_columns: Sequence[ColumnElement],
+    cursor: str,
+    limit=STANDARD_ROW_LIMIT
+):
+    """
+    Limit the statement to the rows after the cursor's key, in key order.
+    The row comparison can be answered by an index on the key columns.
+    """
+    key = decode_cursor(cursor, key_columns)
+    return (
+        statement
+        .where(tuple_(*key_columns) > tuple_(*key))
+        .order_by(*key_columns)
+        .limit(limit)
+    )
+
+
+def add_cursor_or_page_offset(
+    statement,
+    key_columns: Sequence[ColumnElement],
+    page: int,
+    cursor: Optional[str],
+    limit=STANDARD_ROW_LIMIT
+):
+    """Page by cursor if one is given, otherwise by page number, in key order either way."""
+    if cursor is not None:
+        return add_keyset_page(statement, key_columns=key_columns, cursor=cursor, limit=limit)
+    return add_page_offset(statement.order_by(*key_columns), page=page, limit=limit)
@@ -22,6 +22,7 @@ class GetRecentBatchSummariesQueryBuilder(QueryBuilderBase):
         collector_type: Optional[CollectorType] = None,
         status: Optional[BatchStatus] = None,
         batch_id: Optional[int] = None,
+        cursor: Optional[str] = None,
     ):
         super().__init__()
         self.url_counts_cte = URLCountsCTEQueryBuilder(
@@ -30,6 +31,7 @@ class GetRecentBatchSummariesQueryBuilder(QueryBuilderBase):
             collector_type=collector_type,
             status=status,
             batch_id=batch_id,
+            cursor=cursor,
         )
 
     async def run(self, session: AsyncSession) -> list[BatchSummary]:
@@ -48,7 +50,7 @@ class GetRecentBatchSummariesQueryBuilder(QueryBuilderBase):
         ).join(
             builder.query,
             builder.get(count_labels.batch_id) == Batch.id,
-        )
+        ).order_by(Batch.id)
         raw_results = await session.execute(query)
 
         summaries: list[BatchSummary] = []
@@ -9,7 +9,7 @@ from src.db.models.instantiations.link.link_batch_urls import LinkBatchURL
 from src.db.models.instantiations.url.core import URL
 from src.db.models.instantiations.batch import Batch
 from src.db.queries.base.builder import QueryBuilderBase
-from src.db.queries.helpers import add_page_offset
+from src.db.queries.helpers import add_cursor_or_page_offset
 from src.db.queries.implementations.core.get.recent_batch_summaries.url_counts.labels import URLCountsLabels
 
 
@@ -21,10 +21,12 @@ class URLCountsCTEQueryBuilder(QueryBuilderBase):
         has_pending_urls: Optional[bool] = None,
         collector_type: Optional[CollectorType] = None,
         status: Optional[BatchStatus] = None,
-        batch_id: Optional[int] = None
+        batch_id: Optional[int] = None,
+        cursor: Optional[str] = None
     ):
         super().__init__(URLCountsLabels())
         self.page = page
+        self.cursor = cursor
         self.has_pending_urls = has_pending_urls
         self.collector_type = collector_type
         self.status = status
@@ -58,8 +60,12 @@ class URLCountsCTEQueryBuilder(QueryBuilderBase):
         query = self.apply_status_filter(query)
         query = self.apply_batch_id_filter(query)
         query = query.group_by(Batch.id)
-        query = add_page_offset(query, page=self.page)
-        query = query.order_by(Batch.id)
+        query = add_cursor_or_page_offset(
+            query,
+            key_columns=[Batch.id],
+            page=self.page,
+            cursor=self.cursor
+        )
         self.query = query.cte("url_counts")
 
     def apply_batch_id_filter(self, query: Select):
@@ -0,0 +1,146 @@
+from typing import Any
+
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.constants import URL_INSERT_CHUNK_SIZE
+from src.db.dtos.url.core import URLInfo
+from src.db.dtos.url.insert import InsertURLsInfo
+from src.db.dtos.url.mapping import URLMapping
+from src.db.models.instantiations.duplicate import Duplicate
+from src.db.models.instantiations.link.link_batch_urls import LinkBatchURL
+from src.db.models.instantiations.url.core import URL
+from src.db.queries.base.builder import QueryBuilderBase
+
+
+class InsertURLsQueryBuilder(QueryBuilderBase):
+    """
+    Inserts a batch's URLs with a handful of set-based statements per chunk:
+    new URLs are inserted and linked to the batch, and URLs which already exist,
+    whether in the database or earlier in the same list, are recorded as duplicates.
+    """
+
+    def __init__(
+        self,
+        url_infos: list[URLInfo],
+        batch_id: int,
+        chunk_size: int = URL_INSERT_CHUNK_SIZE
+    ):
+        super().__init__()
+        self.url_infos = url_infos
+        self.batch_id = batch_id
+        self.chunk_size = chunk_size
+
+    async def run(self, session: AsyncSession) -> InsertURLsInfo:
+        # The first occurrence of a URL is the one inserted; later ones are duplicates
+        first_url_infos: dict[str, URLInfo] = {}
+        for url_info in self.url_infos:
+            url_info.batch_id = self.batch_id
+            first_url_infos.setdefault(url_info.url, url_info)
+        unique_url_infos = list(first_url_infos.values())
+
+        new_url_ids: dict[str, int] = {}
+        existing_url_ids: dict[str, int] = {}
+        for start in range(0, len(unique_url_infos), self.chunk_size):
+            chunk = unique_url_infos[start:start + self.chunk_size]
+            chunk_new_url_ids = await self._insert_new_urls(session, chunk)
+            new_url_ids.update(chunk_new_url_ids)
+            existing_url_ids.update(
+                await self._get_existing_url_ids(
+                    session,
+                    urls=[
+                        url_info.url for url_info in chunk
+                        if url_info.url not in chunk_new_url_ids
+                    ]
+                )
+            )
+
+        url_mappings = [
+            URLMapping(url=url_info.url, url_id=new_url_ids[url_info.url])
+            for url_info in unique_url_infos
+            if url_info.url in new_url_ids
+        ]
+        await self._link_urls_to_batch(
+            session,
+            url_ids=[url_mapping.url_id for url_mapping in url_mappings]
+        )
+
+        all_url_ids = {**existing_url_ids, **new_url_ids}
+        seen_urls = set()
+        duplicate_url_ids = []
+        for url_info in self.url_infos:
+            if url_info.url in seen_urls or url_info.url in existing_url_ids:
+                duplicate_url_ids.append(all_url_ids[url_info.url])
+            seen_urls.add(url_info.url)
+        await self._insert_duplicates(session, original_url_ids=duplicate_url_ids)
+
+        return InsertURLsInfo(
+            url_mappings=url_mappings,
+            total_count=len(self.url_infos),
+            original_count=len(url_mappings),
+            duplicate_count=len(duplicate_url_ids),
+            url_ids=[url_mapping.url_id for url_mapping in url_mappings]
+        )
+
+    @staticmethod
+    def _get_url_row(url_info: URLInfo) -> dict[str, Any]:
+        return {
+            "url": url_info.url,
+            "collector_metadata": url_info.collector_metadata,
+            "outcome": url_info.outcome.value,
+            # Every row of a multi-row insert must name the same columns
+            "created_at": url_info.created_at if url_info.created_at is not None else func.now(),
+        }
+
+    async def _insert_new_urls(
+        self,
+        session: AsyncSession,
+        url_infos: list[URLInfo]
+    ) -> dict[str, int]:
+        statement = (
+            pg_insert(URL)
+            .values([self._get_url_row(url_info) for url_info in url_infos])
+            .on_conflict_do_nothing(index_elements=[URL.url])
+            .returning(URL.id, URL.url)
+        )
+        result = await session.execute(statement)
+        return {row.url: row.id for row in result}
+
+    @staticmethod
+    async def _get_existing_url_ids(
+        session: AsyncSession,
+        urls: list[str]
+    ) -> dict[str, int]:
+        if len(urls) == 0:
+            return {}
+        result = await session.execute(
+            select(URL.id, URL.url).where(URL.url.in_(urls))
+        )
+        return {row.url: row.id for row in result}
+
+    async def _link_urls_to_batch(
+        self,
+        session: AsyncSession,
+        url_ids: list[int]
+    ):
+        for start in range(0, len(url_ids), self.chunk_size):
+            await session.execute(
+                pg_insert(LinkBatchURL).values([
+                    {"batch_id": self.batch_id, "url_id": url_id}
+                    for url_id in url_ids[start:start + self.chunk_size]
+                ])
+            )
+
+    async def _insert_duplicates(
+        self,
+        session: AsyncSession,
+        original_url_ids: list[int]
+    ):
+        for start in range(0, len(original_url_ids), self.chunk_size):
+            await session.execute(
+                pg_insert(Duplicate).values([
+                    {"batch_id": self.batch_id, "original_url_id": url_id}
+                    for url_id in original_url_ids[start:start + self.chunk_size]
+                ])
+            )
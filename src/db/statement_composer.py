@@ -1,21 +1,10 @@
-from typing import Any
+from sqlalchemy import Select, select, exists, func, Subquery, not_, ColumnElement, literal_column
+from sqlalchemy.orm import selectinload
 
-from sqlalchemy import Select, select, exists, func, Subquery, and_, not_, ColumnElement
-from sqlalchemy.orm import aliased, selectinload
-
-from src.collectors.enums import URLStatus
-from src.core.enums import BatchStatus
-from src.db.constants import STANDARD_ROW_LIMIT
+from src.db.constants import STANDARD_ROW_LIMIT, TASK_PENDING_FLAGS
 from src.db.enums import TaskType
-from src.db.models.instantiations.confirmed_url_agency import ConfirmedURLAgency
-from src.db.models.instantiations.link.link_batch_urls import LinkBatchURL
-from src.db.models.instantiations.link.link_task_url import LinkTaskURL
-from src.db.models.instantiations.task.core import Task
-from src.db.models.instantiations.url.html_content import URLHTMLContent
-from src.db.models.instantiations.url.optional_data_source_metadata import URLOptionalDataSourceMetadata
 from src.db.models.instantiations.url.core import URL
-from src.db.models.instantiations.batch import Batch
-from src.db.models.instantiations.url.suggestion.agency.auto import AutomatedUrlAgencySuggestion
+from src.db.models.instantiations.url.task_lease import URLTaskLease
 from src.db.types import UserSuggestionType
 
 
@@ -24,41 +13,51 @@ class StatementComposer:
     Assists in the composition of SQLAlchemy statements
     """
 
+    @staticmethod
+    def url_pending_for(task_type: TaskType) -> ColumnElement[bool]:
+        """
+        True where the URL has work outstanding for the given task type,
+        per its `pending_task_flags`.
+        The flag is rendered as a literal so that the condition
+        matches the flag's partial index.
+        """
+        flag = literal_column(str(TASK_PENDING_FLAGS[task_type]))
+        return URL.pending_task_flags.op("&")(flag) != literal_column("0")
+
     @staticmethod
     def pending_urls_without_html_data() -> Select:
-        exclude_subquery = (
-            select(1).
-            select_from(LinkTaskURL).
-            join(Task, LinkTaskURL.task_id == Task.id).
-            where(LinkTaskURL.url_id == URL.id).
-            where(Task.task_type == TaskType.HTML.value).
-            where(Task.task_status == BatchStatus.READY_TO_LABEL.value)
-         )
         query = (
             select(URL).
-            outerjoin(URLHTMLContent).
-            where(URLHTMLContent.id == None).
-            where(~exists(exclude_subquery)).
-            where(URL.outcome == URLStatus.PENDING.value)
+            where(StatementComposer.url_pending_for(TaskType.HTML))
             .options(
                 selectinload(URL.batch)
             )
         )
-        return query
+        return StatementComposer.exclude_leased_urls(query, TaskType.HTML)
+
+    @staticmethod
+    def url_not_leased(task_type: TaskType) -> ColumnElement[bool]:
+        """
+        True where no worker holds an unexpired lease on the URL
+        for the given task type.
+        """
+        return ~exists(
+            select(URLTaskLease.id).
+            where(
+                URLTaskLease.url_id == URL.id,
+                URLTaskLease.task_type == task_type.value,
+                URLTaskLease.expires_at > func.now()
+            )
+        )
 
     @staticmethod
-    def exclude_urls_with_extant_model(
+    def exclude_leased_urls(
         statement: Select,
-        model: Any
-    ):
-        return (statement.where(
-                        ~exists(
-                            select(model.id).
-                            where(
-                                model.url_id == URL.id
-                            )
-                        )
-                    ))
+        task_type: TaskType
+    ) -> Select:
+        return statement.where(
+            StatementComposer.url_not_leased(task_type)
+        )
 
     @staticmethod
     def simple_count_subquery(model, attribute: str, label: str) -> Subquery:
@@ -68,41 +67,13 @@ class StatementComposer:
             func.count(attr_value).label(label)
         ).group_by(attr_value).subquery()
 
-    @staticmethod
-    def exclude_urls_with_agency_suggestions(
-            statement: Select
-    ):
-        # Aliases for clarity
-        AutomatedSuggestion = aliased(AutomatedUrlAgencySuggestion)
-
-        # Exclude if automated suggestions exist
-        statement = statement.where(
-            ~exists().where(AutomatedSuggestion.url_id == URL.id)
-        )
-        # Exclude if confirmed agencies exist
-        statement = statement.where(
-            ~exists().where(ConfirmedURLAgency.url_id == URL.id)
-        )
-        return statement
-
     @staticmethod
     def pending_urls_missing_miscellaneous_metadata_query() -> Select:
         query = select(URL).where(
-            and_(
-                    URL.outcome == URLStatus.PENDING.value,
-                    URL.name == None,
-                    URL.description == None,
-                    URLOptionalDataSourceMetadata.url_id == None
-                )
-            ).outerjoin(
-                URLOptionalDataSourceMetadata
-            ).join(
-                LinkBatchURL
-            ).join(
-                Batch
-            )
+            StatementComposer.url_pending_for(TaskType.MISC_METADATA)
+        )
 
-        return query
+        return StatementComposer.exclude_leased_urls(query, TaskType.MISC_METADATA)
 
     @staticmethod
     def user_suggestion_exists(
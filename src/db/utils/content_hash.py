@@ -0,0 +1,23 @@
+import hashlib
+import re
+
+COMMENT_PATTERN = re.compile(r"<!--.*?-->", re.DOTALL)
+# CSP nonces are regenerated on every response
+NONCE_PATTERN = re.compile(r"""\snonce\s*=\s*("[^"]*"|'[^']*'|[^\s>]+)""", re.IGNORECASE)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+INTER_TAG_WHITESPACE_PATTERN = re.compile(r">\s+<")
+
+
+def normalize_html(html: str) -> str:
+    """
+    Strip the parts of a page that differ between otherwise identical copies,
+    so that the same template served at different URLs hashes the same.
+    """
+    html = COMMENT_PATTERN.sub("", html)
+    html = NONCE_PATTERN.sub("", html)
+    html = INTER_TAG_WHITESPACE_PATTERN.sub("><", html)
+    html = WHITESPACE_PATTERN.sub(" ", html)
+    return html.strip()
+
+def get_content_hash(html: str) -> str:
+    return hashlib.sha256(normalize_html(html).encode("utf-8")).hexdigest()
@@ -1,7 +1,9 @@
 import os
+import socket
+import uuid
 from enum import Enum
 from pathlib import Path
-from typing import Type
+from typing import Type, Optional
 
 from dotenv import load_dotenv
 from pydantic import BaseModel
@@ -19,6 +21,23 @@ def project_path(*parts: str) -> Path:
 def get_enum_values(enum: Type[Enum]):
     return [item.value for item in enum]
 
+def get_worker_id() -> str:
+    """
+    Identify this process among workers sharing the database
+    """
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+def get_rss_bytes() -> Optional[int]:
+    """
+    Resident memory of this process, where `/proc` is available
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
 def get_from_env(key: str, allow_none: bool = False):
     load_dotenv()
     val = os.getenv(key)
@@ -0,0 +1,40 @@
+"""
+Runs URL tasks, scheduled tasks and collectors without serving HTTP.
+
+Start the API with `WORKER_MODE=separate` so that it records work requests
+for this process, rather than carrying out the work itself.
+URL tasks also start here when new work is announced with `NOTIFY`.
+"""
+import asyncio
+import signal
+
+from src.core.dependencies import CoreDependencies
+from src.core.env_var_manager import EnvVarManager
+from src.core.worker.core import TaskWorker
+from src.core.worker.enums import WorkerModeEnum
+
+
+async def main():
+    env_var_manager = EnvVarManager.get()
+    # The worker carries out the work it claims itself
+    dependencies = CoreDependencies(
+        env_var_manager=env_var_manager,
+        worker_mode=WorkerModeEnum.IN_PROCESS
+    )
+    await dependencies.async_scheduled_task_manager.setup()
+    await dependencies.task_notification_listener.start()
+    worker = TaskWorker(async_core=dependencies.async_core)
+
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signal_number, worker.stop)
+
+    try:
+        await worker.run()
+    finally:
+        await worker.shutdown()
+        await dependencies.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -19,6 +19,7 @@ from src.api.endpoints.batch.dtos.get.summaries.summary import BatchSummary
 from src.api.endpoints.batch.dtos.post.abort import MessageResponse
 from src.api.endpoints.batch.duplicates.dto import GetDuplicatesByBatchResponse
 from src.api.endpoints.batch.urls.dto import GetURLsByBatchResponse
+from src.api.endpoints.collector.dtos.manual_batch.bulk import ManualBatchImportInfo, ManualBatchImportDuplicateInfo
 from src.api.endpoints.collector.dtos.manual_batch.post import ManualBatchInputDTO
 from src.api.endpoints.collector.dtos.manual_batch.response import ManualBatchResponseDTO
 from src.api.endpoints.metrics.batches.aggregated.dto import GetMetricsBatchesAggregatedResponseDTO
@@ -28,6 +29,7 @@ from src.api.endpoints.metrics.dtos.get.urls.aggregated.core import GetMetricsUR
 from src.api.endpoints.metrics.dtos.get.urls.aggregated.pending import GetMetricsURLsAggregatedPendingResponseDTO
 from src.api.endpoints.metrics.dtos.get.urls.breakdown.pending import GetMetricsURLsBreakdownPendingResponseDTO
 from src.api.endpoints.metrics.dtos.get.urls.breakdown.submitted import GetMetricsURLsBreakdownSubmittedResponseDTO
+from src.api.endpoints.metrics.task_phases.dto import GetMetricsTaskPhasesResponseDTO
 from src.api.endpoints.review.approve.dto import FinalReviewApprovalInfo
 from src.api.endpoints.review.next.dto import GetNextURLForFinalReviewOuterResponse
 from src.api.endpoints.review.reject.dto import FinalReviewRejectionInfo
@@ -194,7 +196,8 @@ class RequestValidator:
             self,
             collector_type: Optional[CollectorType] = None,
             status: Optional[BatchStatus] = None,
-            has_pending_urls: Optional[bool] = None
+            has_pending_urls: Optional[bool] = None,
+            cursor: Optional[str] = None
     ) -> GetBatchSummariesResponse:
         params = {}
         update_if_not_none(
@@ -202,7 +205,8 @@ class RequestValidator:
             source={
                 "collector_type": collector_type.value if collector_type else None,
                 "status": status.value if status else None,
-                "has_pending_urls": has_pending_urls
+                "has_pending_urls": has_pending_urls,
+                "cursor": cursor
             }
         )
         data = self.get(
@@ -224,17 +228,31 @@ class RequestValidator:
         )
         return BatchSummary(**data)
 
-    def get_batch_urls(self, batch_id: int, page: int = 1) -> GetURLsByBatchResponse:
+    def get_batch_urls(
+            self,
+            batch_id: int,
+            page: int = 1,
+            cursor: Optional[str] = None
+    ) -> GetURLsByBatchResponse:
+        params = {"page": page}
+        update_if_not_none(target=params, source={"cursor": cursor})
         data = self.get(
             url=f"/batch/{batch_id}/urls",
-            params={"page": page}
+            params=params
         )
         return GetURLsByBatchResponse(**data)
 
-    def get_batch_url_duplicates(self, batch_id: int, page: int = 1) -> GetDuplicatesByBatchResponse:
+    def get_batch_url_duplicates(
+            self,
+            batch_id: int,
+            page: int = 1,
+            cursor: Optional[str] = None
+    ) -> GetDuplicatesByBatchResponse:
+        params = {"page": page}
+        update_if_not_none(target=params, source={"cursor": cursor})
         data = self.get(
             url=f"/batch/{batch_id}/duplicates",
-            params={"page": page}
+            params=params
         )
         return GetDuplicatesByBatchResponse(**data)
 
@@ -301,10 +319,17 @@ class RequestValidator:
         )
         return GetNextURLForAgencyAnnotationResponse(**data)
 
-    def get_urls(self, page: int = 1, errors: bool = False) -> GetURLsResponseInfo:
+    def get_urls(
+            self,
+            page: int = 1,
+            errors: bool = False,
+            cursor: Optional[str] = None
+    ) -> GetURLsResponseInfo:
+        params = {"page": page, "errors": errors}
+        update_if_not_none(target=params, source={"cursor": cursor})
         data = self.get(
             url=f"/url",
-            params={"page": page, "errors": errors}
+            params=params
         )
         return GetURLsResponseInfo(**data)
 
@@ -318,14 +343,16 @@ class RequestValidator:
             self,
             page: int = 1,
             task_type: Optional[TaskType] = None,
-            task_status: Optional[BatchStatus] = None
+            task_status: Optional[BatchStatus] = None,
+            cursor: Optional[str] = None
     ) -> GetTasksResponse:
         params = {"page": page}
         update_if_not_none(
             target=params,
             source={
                 "task_type": task_type.value if task_type else None,
-                "task_status": task_status.value if task_status else None
+                "task_status": task_status.value if task_status else None,
+                "cursor": cursor
             }
         )
         data = self.get(
@@ -414,6 +441,37 @@ class RequestValidator:
         )
         return ManualBatchResponseDTO(**data)
 
+    async def import_manual_batch(
+            self,
+            name: str,
+            content: bytes,
+            content_type: str
+    ) -> tuple[ManualBatchImportInfo, list[ManualBatchImportDuplicateInfo]]:
+        response = self.client.post(
+            url="/collector/manual/import",
+            params={"name": name},
+            headers={
+                "Authorization": "Bearer token",
+                "Content-Type": content_type
+            },
+            content=content
+        )
+        if response.status_code != HTTPStatus.OK:
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=response.json()
+            )
+        import_info = ManualBatchImportInfo(
+            batch_id=int(response.headers["X-Batch-ID"]),
+            url_count=int(response.headers["X-URL-Count"]),
+            duplicate_count=int(response.headers["X-Duplicate-Count"])
+        )
+        duplicates = [
+            ManualBatchImportDuplicateInfo.model_validate_json(line)
+            for line in response.text.splitlines()
+        ]
+        return import_info, duplicates
+
     async def search_url(self, url: str) -> SearchURLResponse:
         data = self.get(
             url=f"/search/url",
@@ -427,10 +485,16 @@ class RequestValidator:
         )
         return GetMetricsBatchesAggregatedResponseDTO(**data)
 
-    async def get_batches_breakdown_metrics(self, page: int) -> GetMetricsBatchesBreakdownResponseDTO:
+    async def get_batches_breakdown_metrics(
+            self,
+            page: int = 1,
+            cursor: Optional[str] = None
+    ) -> GetMetricsBatchesBreakdownResponseDTO:
+        params = {"page": page}
+        update_if_not_none(target=params, source={"cursor": cursor})
         data = self.get_v2(
             url="/metrics/batches/breakdown",
-            params={"page": page}
+            params=params
         )
         return GetMetricsBatchesBreakdownResponseDTO(**data)
 
@@ -452,6 +516,13 @@ class RequestValidator:
         )
         return GetMetricsBacklogResponseDTO(**data)
 
+    async def get_task_phases_metrics(self, days: int = 30) -> GetMetricsTaskPhasesResponseDTO:
+        data = self.get_v2(
+            url="/metrics/task-phases",
+            params={"days": days}
+        )
+        return GetMetricsTaskPhasesResponseDTO(**data)
+
     async def get_urls_aggregated_metrics(self) -> GetMetricsURLsAggregatedResponseDTO:
         data = self.get_v2(
             url="/metrics/urls/aggregate",
@@ -52,6 +52,8 @@ def client() -> Generator[TestClient, None, None]:
         task_manager.logger.disabled = True
         # Set trigger to fail immediately if called, to force it to be manually specified in tests
         task_manager.task_trigger._func = fail_task_trigger
+        # Tasks are only run when tests call for them, not on database notifications
+        c.portal.call(c.app.state.task_notification_listener.shutdown)
         yield c
 
     # Reset environment variables back to original state
@@ -97,3 +97,25 @@ async def test_get_batches_breakdown_metrics(api_test_helper):
         page=2
     )
     assert len(dto_2.batches) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_batches_breakdown_metrics_cursor(api_test_helper):
+    ath = api_test_helper
+    created_at = pendulum.parse('2021-01-01')
+
+    # Batches sharing a creation time are ordered by id
+    batch_ids = [
+        ath.db_data_creator.batch(created_at=created_at)
+        for _ in range(120)
+    ]
+
+    first_page = await ath.request_validator.get_batches_breakdown_metrics()
+    assert [batch.batch_id for batch in first_page.batches] == batch_ids[:100]
+    assert first_page.next_cursor is not None
+
+    second_page = await ath.request_validator.get_batches_breakdown_metrics(
+        cursor=first_page.next_cursor
+    )
+    assert [batch.batch_id for batch in second_page.batches] == batch_ids[100:]
+    assert second_page.next_cursor is None
@@ -0,0 +1,47 @@
+import pytest
+
+from src.db.dtos.task_phase_timing import TaskPhaseTimingInfo
+from src.db.enums import TaskType
+
+
+@pytest.mark.asyncio
+async def test_get_task_phases_metrics(api_test_helper):
+    ath = api_test_helper
+    adb_client = ath.adb_client()
+
+    durations = [1.0, 2.0, 3.0, 4.0]
+    task_ids = []
+    for duration in durations:
+        task_id = await adb_client.initiate_task(task_type=TaskType.HTML)
+        await adb_client.add_task_phase_timings(
+            task_id=task_id,
+            timings=[
+                TaskPhaseTimingInfo(phase="fetch", duration_seconds=duration, item_count=2, byte_count=100),
+                TaskPhaseTimingInfo(phase="persist", duration_seconds=0.5, item_count=2),
+            ]
+        )
+        task_ids.append(task_id)
+    # Phases saved again for the same task add up
+    await adb_client.add_task_phase_timings(
+        task_id=task_ids[0],
+        timings=[TaskPhaseTimingInfo(phase="persist", duration_seconds=0.5)]
+    )
+
+    task_info = ath.request_validator.get_task_info(task_ids[0])
+    assert {
+        timing.phase: timing.duration_seconds
+        for timing in task_info.phase_timings
+    } == {"fetch": 1.0, "persist": 1.0}
+
+    dto = await ath.request_validator.get_task_phases_metrics()
+    entries = {entry.phase: entry for entry in dto.entries}
+    assert set(entries.keys()) == {"fetch", "persist"}
+
+    fetch = entries["fetch"]
+    assert fetch.task_type == TaskType.HTML
+    assert fetch.run_count == 4
+    assert fetch.p50_seconds == 2.5
+    assert fetch.p95_seconds == pytest.approx(3.85)
+    assert fetch.p50_seconds_per_item == 1.25
+    assert fetch.item_count == 8
+    assert fetch.byte_count == 400
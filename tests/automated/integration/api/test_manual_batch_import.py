@@ -0,0 +1,97 @@
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from src.collectors.enums import CollectorType
+from src.core.enums import RecordType
+from src.db.models.instantiations.batch import Batch
+from src.db.models.instantiations.duplicate import Duplicate
+from src.db.models.instantiations.link.link_batch_urls import LinkBatchURL
+from src.db.models.instantiations.url.core import URL
+from src.db.models.instantiations.url.optional_data_source_metadata import URLOptionalDataSourceMetadata
+
+
+@pytest.mark.asyncio
+async def test_manual_batch_import(api_test_helper):
+    ath = api_test_helper
+    rv = ath.request_validator
+    adb_client = ath.adb_client()
+
+    csv_lines = ["url,name,description,collector_metadata,record_type,record_formats,supplying_entity"]
+    for i in range(50):
+        csv_lines.append(f"https://example.com/{i},,,,,,")
+    for i in range(50, 100):
+        csv_lines.append(
+            f'https://example.com/{i},Name {i},"Description\nof {i}",'
+            f'"{{""name"": ""Name {i}""}}",{RecordType.ARREST_RECORDS.value},'
+            f'CSV;PDF,Supplying Entity {i}'
+        )
+    # Repeated within the upload
+    csv_lines.append("https://example.com/3,,,,,,")
+
+    import_info, duplicates = await rv.import_manual_batch(
+        name="csv_import",
+        content="\n".join(csv_lines).encode(),
+        content_type="text/csv"
+    )
+    assert import_info.url_count == 100
+    assert import_info.duplicate_count == 1
+
+    batch: Batch = (await adb_client.get_all(Batch))[0]
+    assert batch.id == import_info.batch_id
+    assert batch.strategy == CollectorType.MANUAL.value
+    assert batch.parameters["name"] == "csv_import"
+
+    urls = {url.url: url for url in await adb_client.get_all(URL)}
+    assert len(urls) == 100
+    assert [duplicate.model_dump() for duplicate in duplicates] == [
+        {"url": "https://example.com/3", "original_url_id": urls["https://example.com/3"].id}
+    ]
+    url = urls["https://example.com/60"]
+    assert url.name == "Name 60"
+    assert url.description == "Description\nof 60"
+    assert url.collector_metadata == {"name": "Name 60"}
+    assert url.record_type == RecordType.ARREST_RECORDS.value
+    assert urls["https://example.com/0"].name is None
+
+    links = await adb_client.get_all(LinkBatchURL)
+    assert len(links) == 100
+    assert all(link.batch_id == batch.id for link in links)
+    optional_metadata = {
+        metadata.url_id: metadata
+        for metadata in await adb_client.get_all(URLOptionalDataSourceMetadata)
+    }
+    assert len(optional_metadata) == 100
+    assert optional_metadata[url.id].record_formats == ["CSV", "PDF"]
+    assert optional_metadata[url.id].supplying_entity == "Supplying Entity 60"
+
+    # A second upload, as NDJSON, overlapping the first
+    ndjson_lines = [
+        json.dumps({"url": f"https://example.com/{i}"})
+        for i in range(95, 110)
+    ]
+    second_import_info, second_duplicates = await rv.import_manual_batch(
+        name="ndjson_import",
+        content="\n".join(ndjson_lines).encode(),
+        content_type="application/x-ndjson"
+    )
+    assert second_import_info.url_count == 10
+    assert second_import_info.duplicate_count == 5
+    assert [duplicate.url for duplicate in second_duplicates] == [
+        f"https://example.com/{i}" for i in range(95, 100)
+    ]
+    duplicates = await adb_client.get_all(Duplicate)
+    assert len(duplicates) == 6
+    assert len(await adb_client.get_all(URL)) == 110
+
+    # A bad row rejects the whole upload
+    with pytest.raises(HTTPException) as e:
+        await rv.import_manual_batch(
+            name="bad_import",
+            content=b'{"url": "https://example.com/200"}\n{"name": "No URL"}\n',
+            content_type="application/x-ndjson"
+        )
+    assert e.value.status_code == 400
+    assert len(await adb_client.get_all(URL)) == 110
+    assert len(await adb_client.get_all(Batch)) == 2
@@ -1,5 +1,7 @@
 import pytest
 
+from src.core.tasks.dtos.operator_status import TaskOperatorStatusInfo
+from src.core.tasks.url.enums import TaskOperatorState
 from src.db.enums import TaskType
 from tests.helpers.api_test_helper import APITestHelper
 
@@ -46,10 +48,21 @@ async def test_get_task_status(api_test_helper):
 
     response = await ath.request_validator.get_current_task_status()
 
-    assert response.status == TaskType.IDLE
-
-    for task in [task for task in TaskType]:
-        await ath.async_core.task_manager.set_manager_status(task)
-        response = await ath.request_validator.get_current_task_status()
+    assert response.operators == []
+
+    task_manager = ath.async_core.task_manager
+    task_manager.operator_statuses = {
+        TaskType.HTML: TaskOperatorStatusInfo(
+            task_type=TaskType.HTML,
+            state=TaskOperatorState.RUNNING,
+            runs_in_progress=1,
+            last_task_id=1
+        ),
+        TaskType.RELEVANCY: TaskOperatorStatusInfo(
+            task_type=TaskType.RELEVANCY,
+            state=TaskOperatorState.BLOCKED
+        )
+    }
+    response = await ath.request_validator.get_current_task_status()
 
-        assert response.status == task
+    assert response.operators == task_manager.get_operator_statuses()
@@ -1,7 +1,10 @@
+from http import HTTPStatus
+
 import pytest
 
 from src.api.endpoints.url.get.dto import GetURLsResponseInfo
 from src.db.dtos.url.insert import InsertURLsInfo
+from tests.automated.integration.api._helpers.RequestValidator import ExpectedResponseInfo
 
 
 @pytest.mark.asyncio
@@ -44,3 +47,42 @@ async def test_get_urls(api_test_helper):
     for url in data.urls:
         assert url.id != url_id_1st
 
+
+
+@pytest.mark.asyncio
+async def test_get_urls_cursor(api_test_helper):
+    rv = api_test_helper.request_validator
+    db_data_creator = api_test_helper.db_data_creator
+
+    batch_id = db_data_creator.batch()
+    iui: InsertURLsInfo = db_data_creator.urls(batch_id=batch_id, url_count=150)
+    url_ids = [url_mapping.url_id for url_mapping in iui.url_mappings]
+
+    first_page: GetURLsResponseInfo = rv.get_urls()
+    assert [url.id for url in first_page.urls] == url_ids[:100]
+    assert first_page.next_cursor is not None
+
+    second_page: GetURLsResponseInfo = rv.get_urls(cursor=first_page.next_cursor)
+    assert [url.id for url in second_page.urls] == url_ids[100:]
+    assert second_page.next_cursor is None
+
+    # Cursor pages match page number pages
+    assert rv.get_urls(page=2).urls == second_page.urls
+
+    # The same cursor pages URLs by batch
+    batch_first_page = rv.get_batch_urls(batch_id=batch_id)
+    batch_second_page = rv.get_batch_urls(batch_id=batch_id, cursor=batch_first_page.next_cursor)
+    assert [url.id for url in batch_second_page.urls] == url_ids[100:]
+    assert batch_second_page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_urls_invalid_cursor(api_test_helper):
+    rv = api_test_helper.request_validator
+
+    for cursor in ["not-a-cursor", "WyJhIl0", "WzEsMl0"]:
+        rv.get(
+            url="/url",
+            params={"cursor": cursor},
+            expected_response=ExpectedResponseInfo(status_code=HTTPStatus.BAD_REQUEST)
+        )
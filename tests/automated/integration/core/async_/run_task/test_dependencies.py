@@ -0,0 +1,130 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.tasks.dtos.run_info import URLTaskOperatorRunInfo
+from src.core.tasks.handler import TaskHandler
+from src.core.tasks.url.enums import TaskOperatorOutcome, TaskOperatorState
+from src.core.tasks.url.manager import TaskManager
+from src.core.tasks.url.operators.url_miscellaneous_metadata.core import URLMiscellaneousMetadataTaskOperator
+from src.db.enums import TaskType
+from src.db.models.instantiations.url.core import URL
+from tests.helpers.db_data_creator import DBDataCreator
+
+
+def mock_operator(task_type: TaskType, run_count: int, events: list[str]) -> AsyncMock:
+    operator = AsyncMock()
+    operator.task_type = task_type
+    operator.meets_task_prerequisites = AsyncMock(
+        side_effect=[True] * run_count + [False]
+    )
+
+    async def run_task(task_id: int) -> URLTaskOperatorRunInfo:
+        events.append(f"{task_type.value} start")
+        await asyncio.sleep(0.01)
+        events.append(f"{task_type.value} end")
+        return URLTaskOperatorRunInfo(
+            task_id=task_id,
+            task_type=task_type,
+            outcome=TaskOperatorOutcome.SUCCESS,
+            linked_url_ids=[1]
+        )
+
+    operator.run_task = run_task
+    return operator
+
+
+def setup_task_manager(operators: list[AsyncMock], max_concurrent_runs: int):
+    adb_client = AsyncMock()
+    adb_client.count_url_errors_for_task.return_value = 0
+    task_manager = TaskManager(
+        loader=AsyncMock(),
+        handler=TaskHandler(
+            adb_client=adb_client,
+            discord_poster=AsyncMock()
+        ),
+        max_concurrent_runs=max_concurrent_runs
+    )
+    task_manager.conclude_task = AsyncMock()
+    task_manager.loader.get_task_operators = AsyncMock(return_value=operators)
+    return task_manager
+
+
+@pytest.mark.asyncio
+async def test_run_tasks_dependencies_and_concurrency():
+    events = []
+    task_manager = setup_task_manager(
+        operators=[
+            mock_operator(TaskType.HTML, run_count=2, events=events),
+            mock_operator(TaskType.RELEVANCY, run_count=1, events=events),
+            mock_operator(TaskType.SUBMIT_APPROVED, run_count=1, events=events),
+        ],
+        max_concurrent_runs=4
+    )
+    await task_manager.run_tasks()
+
+    # Independent operators run alongside each other
+    assert events.index("Submit Approved URLs start") < events.index("HTML end")
+    # Relevancy reads HTML data, so waits for every HTML run
+    assert events.index("Relevancy start") > len(events) - 1 - events[::-1].index("HTML end")
+
+    statuses = {status.task_type: status for status in task_manager.get_operator_statuses()}
+    assert statuses[TaskType.HTML].runs_completed == 2
+    assert statuses[TaskType.RELEVANCY].runs_completed == 1
+    for status in statuses.values():
+        assert status.state == TaskOperatorState.IDLE
+        assert status.last_outcome == TaskOperatorOutcome.SUCCESS
+
+
+@pytest.mark.asyncio
+async def test_run_tasks_fair_interleaving():
+    events = []
+    task_manager = setup_task_manager(
+        operators=[
+            mock_operator(TaskType.HTML, run_count=5, events=events),
+            mock_operator(TaskType.SUBMIT_APPROVED, run_count=1, events=events),
+        ],
+        max_concurrent_runs=1
+    )
+    await task_manager.run_tasks()
+
+    # A single slot is shared, but the HTML backlog does not hold it throughout
+    assert events.index("Submit Approved URLs start") < events.index("HTML start", 2)
+
+
+@pytest.mark.asyncio
+async def test_run_tasks_misc_metadata_waits_for_html(db_data_creator: DBDataCreator):
+    adb_client = db_data_creator.adb_client
+    batch_id = db_data_creator.batch()
+    url_id = db_data_creator.urls(batch_id=batch_id, url_count=1).url_ids[0]
+
+    html_operator = mock_operator(TaskType.HTML, run_count=1, events=[])
+
+    async def run_html_task(task_id: int) -> URLTaskOperatorRunInfo:
+        await asyncio.sleep(0.05)
+        await db_data_creator.html_data([url_id])
+        return URLTaskOperatorRunInfo(
+            task_id=task_id,
+            task_type=TaskType.HTML,
+            outcome=TaskOperatorOutcome.SUCCESS,
+            linked_url_ids=[url_id]
+        )
+
+    html_operator.run_task = run_html_task
+    task_manager = TaskManager(
+        loader=AsyncMock(),
+        handler=TaskHandler(
+            adb_client=adb_client,
+            discord_poster=AsyncMock()
+        )
+    )
+    task_manager.loader.get_task_operators = AsyncMock(return_value=[
+        URLMiscellaneousMetadataTaskOperator(adb_client=adb_client),
+        html_operator
+    ])
+    await task_manager.run_tasks()
+
+    # The misc metadata task names the URL from the title the HTML task scraped
+    urls = await adb_client.get_all(URL)
+    assert urls[0].name == "test html content"
@@ -2,6 +2,8 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from src.db.enums import TaskType
+
 from tests.automated.integration.core.async_.helpers import setup_async_core
 
 
@@ -14,6 +16,7 @@ async def test_run_task_prereq_not_met():
 
     mock_operator = AsyncMock()
     mock_operator.meets_task_prerequisites = AsyncMock(return_value=False)
+    mock_operator.task_type = TaskType.HTML
     core.task_manager.loader.get_task_operators = AsyncMock(return_value=[mock_operator])
     await core.run_tasks()
 
@@ -0,0 +1,129 @@
+import asyncio
+from unittest.mock import MagicMock, AsyncMock
+
+import pytest
+
+from src.collectors.enums import CollectorType
+from src.collectors.source_collectors.example.dtos.input import ExampleInputDTO
+from src.core.core import AsyncCore
+from src.core.enums import BatchStatus
+from src.core.tasks.url.enums import TaskOperatorState
+from src.core.worker.core import TaskWorker
+from src.core.worker.enums import WorkerModeEnum
+from src.db.dtos.batch import BatchInfo
+from src.db.enums import WorkRequestType, TaskType
+from src.db.models.instantiations.work_request import WorkRequest
+
+
+@pytest.mark.asyncio
+async def test_task_worker(test_async_core: AsyncCore):
+    adb_client = test_async_core.adb_client
+    test_async_core.task_manager = AsyncMock()
+    # The API only records work requests for the worker
+    api_core = AsyncCore(
+        adb_client=adb_client,
+        task_manager=MagicMock(),
+        collector_manager=MagicMock(),
+        worker_mode=WorkerModeEnum.SEPARATE
+    )
+    worker = TaskWorker(async_core=test_async_core, worker_id="worker")
+    idle_worker = TaskWorker(async_core=test_async_core, worker_id="idle-worker")
+    # The idle worker runs no collectors of its own
+    idle_worker.get_running_batch_ids = lambda: []
+
+    start_info = await api_core.initiate_collector(
+        collector_type=CollectorType.EXAMPLE,
+        user_id=1,
+        dto=ExampleInputDTO(sleep_time=10)
+    )
+    batch_id = start_info.batch_id
+    api_core.collector_manager.start_async_collector.assert_not_called()
+
+    requests = await worker.poll_once()
+    assert [request.request_type for request in requests] == [WorkRequestType.START_COLLECTOR]
+    assert worker.get_running_batch_ids() == [batch_id]
+
+    # Aborts are only claimed by the worker running the collector
+    await api_core.abort_batch(batch_id)
+    assert await idle_worker.poll_once() == []
+    requests = await worker.poll_once()
+    assert [request.request_type for request in requests] == [WorkRequestType.ABORT_COLLECTOR]
+    batch = await adb_client.get_batch_by_id(batch_id)
+    assert batch.status == BatchStatus.ABORTED
+
+    await api_core.run_tasks()
+    requests = await idle_worker.poll_once()
+    assert [request.request_type for request in requests] == [WorkRequestType.RUN_TASKS]
+    await asyncio.sleep(0)
+    test_async_core.task_manager.trigger_task_run.assert_awaited_once()
+
+    # Claimed requests are not handed out again
+    assert await worker.poll_once() == []
+
+
+@pytest.mark.asyncio
+async def test_task_worker_failed_and_unattended_requests(test_async_core: AsyncCore, monkeypatch):
+    adb_client = test_async_core.adb_client
+    test_async_core.task_manager = AsyncMock()
+    api_core = AsyncCore(
+        adb_client=adb_client,
+        task_manager=MagicMock(),
+        collector_manager=MagicMock(),
+        worker_mode=WorkerModeEnum.SEPARATE
+    )
+    worker = TaskWorker(async_core=test_async_core, worker_id="worker")
+    worker.get_running_batch_ids = lambda: []
+
+    batch_id = await adb_client.insert_batch(
+        BatchInfo(
+            strategy=CollectorType.EXAMPLE.value,
+            status=BatchStatus.IN_PROCESS,
+            parameters={"sleep_time": "not a number"},
+            user_id=1
+        )
+    )
+    # A request that fails does not stop the ones claimed with it
+    await adb_client.add_work_request(
+        request_type=WorkRequestType.START_COLLECTOR,
+        batch_id=batch_id
+    )
+    await api_core.run_tasks()
+    requests = await worker.poll_once()
+    assert [request.request_type for request in requests] == [
+        WorkRequestType.START_COLLECTOR,
+        WorkRequestType.RUN_TASKS
+    ]
+    await asyncio.sleep(0)
+    test_async_core.task_manager.trigger_task_run.assert_awaited_once()
+    work_requests = await adb_client.get_all(WorkRequest, order_by_attribute="id")
+    assert work_requests[0].error is not None
+    assert work_requests[1].error is None
+
+    # Aborts that no worker running the collector claims are closed out once expired
+    await api_core.abort_batch(batch_id)
+    assert await worker.poll_once() == []
+    monkeypatch.setattr("src.core.worker.core.ABORT_REQUEST_EXPIRY_SECONDS", 0)
+    requests = await worker.poll_once()
+    assert [request.request_type for request in requests] == [WorkRequestType.ABORT_COLLECTOR]
+    batch = await adb_client.get_batch_by_id(batch_id)
+    assert batch.status == BatchStatus.ABORTED
+
+
+@pytest.mark.asyncio
+async def test_task_status_separate_worker_mode(test_async_core: AsyncCore):
+    adb_client = test_async_core.adb_client
+    api_core = AsyncCore(
+        adb_client=adb_client,
+        task_manager=MagicMock(),
+        collector_manager=MagicMock(),
+        worker_mode=WorkerModeEnum.SEPARATE
+    )
+    task_id = await adb_client.initiate_task(task_type=TaskType.HTML)
+
+    status = await api_core.get_current_task_status()
+    assert len(status.operators) == 1
+    operator_status = status.operators[0]
+    assert operator_status.task_type == TaskType.HTML
+    assert operator_status.state == TaskOperatorState.RUNNING
+    assert operator_status.runs_in_progress == 1
+    assert operator_status.last_task_id == task_id
@@ -0,0 +1,87 @@
+import pytest
+
+from src.core.tasks.url.operators.url_miscellaneous_metadata.tdo import URLMiscellaneousMetadataTDO
+from src.collectors.enums import CollectorType
+from src.db.bulk_writer import BulkWriter
+from src.db.models.instantiations.duplicate import Duplicate
+from src.db.models.instantiations.url.core import URL
+from src.db.models.instantiations.url.optional_data_source_metadata import URLOptionalDataSourceMetadata
+from tests.helpers.db_data_creator import DBDataCreator
+
+
+@pytest.mark.asyncio
+async def test_bulk_writer_insert_and_update(db_data_creator: DBDataCreator, monkeypatch):
+    # A small parameter limit splits every statement into several chunks
+    monkeypatch.setattr("src.db.bulk_writer.MAX_BIND_PARAMETERS", 4)
+    adb_client = db_data_creator.adb_client
+    batch_id = db_data_creator.batch()
+    url_ids = [
+        url_mapping.url_id
+        for url_mapping in db_data_creator.urls(batch_id=batch_id, url_count=5).url_mappings
+    ]
+
+    async with adb_client.session_maker() as session:
+        inserted = await BulkWriter.insert(
+            session,
+            model=Duplicate,
+            rows=[
+                {"batch_id": batch_id, "original_url_id": url_id}
+                for url_id in url_ids
+            ],
+            returning=[Duplicate.original_url_id]
+        )
+        assert sorted(row.original_url_id for row in inserted) == sorted(url_ids)
+
+        await BulkWriter.update(
+            session,
+            model=URL,
+            rows=[
+                {"id": url_id, "name": f"Name {url_id}", "description": None}
+                for url_id in url_ids
+            ]
+        )
+        await session.commit()
+
+    duplicates = await adb_client.get_all(Duplicate)
+    assert len(duplicates) == 5
+
+    urls = await adb_client.get_all(URL)
+    for url in urls:
+        assert url.name == f"Name {url.id}"
+        assert url.description is None
+
+
+@pytest.mark.asyncio
+async def test_add_miscellaneous_metadata(db_data_creator: DBDataCreator):
+    adb_client = db_data_creator.adb_client
+    batch_id = db_data_creator.batch()
+    url_ids = [
+        url_mapping.url_id
+        for url_mapping in db_data_creator.urls(batch_id=batch_id, url_count=3).url_mappings
+    ]
+
+    await adb_client.add_miscellaneous_metadata([
+        URLMiscellaneousMetadataTDO(
+            url_id=url_id,
+            collector_metadata={},
+            collector_type=CollectorType.MANUAL,
+            name=f"Name {url_id}",
+            description=f"Description {url_id}",
+            record_formats=["CSV", "PDF"],
+            data_portal_type="CKAN",
+        )
+        for url_id in url_ids
+    ])
+
+    urls = await adb_client.get_all(URL)
+    assert {url.id: (url.name, url.description) for url in urls} == {
+        url_id: (f"Name {url_id}", f"Description {url_id}")
+        for url_id in url_ids
+    }
+
+    metadata = await adb_client.get_all(URLOptionalDataSourceMetadata)
+    assert sorted(row.url_id for row in metadata) == sorted(url_ids)
+    for row in metadata:
+        assert row.record_formats == ["CSV", "PDF"]
+        assert row.data_portal_type == "CKAN"
+        assert row.supplying_entity is None
@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+from sqlalchemy import update
+
+from src.db.enums import TaskType
+from src.db.models.instantiations.url.task_lease import URLTaskLease
+from tests.helpers.db_data_creator import DBDataCreator
+
+
+@pytest.mark.asyncio
+async def test_claim_urls_disjoint(db_data_creator: DBDataCreator):
+    adb_client = db_data_creator.adb_client
+    batch_id = db_data_creator.batch()
+    url_ids = [
+        mapping.url_id for mapping in
+        db_data_creator.urls(batch_id=batch_id, url_count=10).url_mappings
+    ]
+
+    claims = await asyncio.gather(*[
+        adb_client.claim_urls(
+            task_type=TaskType.HTML,
+            url_ids=url_ids,
+            worker_id=f"worker-{i}",
+            lease_seconds=60
+        )
+        for i in range(3)
+    ])
+
+    claimed = [url_id for claim in claims for url_id in claim]
+    assert sorted(claimed) == sorted(set(claimed))
+
+    # A claimed URL is no longer offered to other workers
+    pending = await adb_client.get_pending_urls_without_html_data()
+    assert {url_info.id for url_info in pending}.isdisjoint(claimed)
+
+    # Leases for one task type do not block others
+    assert await adb_client.claim_urls(
+        task_type=TaskType.PROBE_404,
+        url_ids=url_ids,
+        worker_id="worker-404",
+        lease_seconds=60
+    ) == sorted(url_ids)
+
+    for i, claim in enumerate(claims):
+        await adb_client.release_url_leases(
+            task_type=TaskType.HTML,
+            worker_id=f"worker-{i}",
+            url_ids=claim
+        )
+    assert await adb_client.claim_urls(
+        task_type=TaskType.HTML,
+        url_ids=url_ids,
+        worker_id="worker-next",
+        lease_seconds=60
+    ) == sorted(url_ids)
+
+
+@pytest.mark.asyncio
+async def test_claim_urls_reclaims_expired_lease(db_data_creator: DBDataCreator):
+    adb_client = db_data_creator.adb_client
+    batch_id = db_data_creator.batch()
+    url_ids = [
+        mapping.url_id for mapping in
+        db_data_creator.urls(batch_id=batch_id, url_count=2).url_mappings
+    ]
+
+    assert await adb_client.claim_urls(
+        task_type=TaskType.HTML,
+        url_ids=url_ids,
+        worker_id="crashed-worker",
+        lease_seconds=60
+    ) == sorted(url_ids)
+    assert await adb_client.claim_urls(
+        task_type=TaskType.HTML,
+        url_ids=url_ids,
+        worker_id="new-worker",
+        lease_seconds=60
+    ) == []
+
+    # Expire the crashed worker's lease on one URL
+    await adb_client.execute(
+        update(URLTaskLease)
+        .where(URLTaskLease.url_id == url_ids[0])
+        .values(expires_at=URLTaskLease.created_at)
+    )
+
+    assert await adb_client.claim_urls(
+        task_type=TaskType.HTML,
+        url_ids=url_ids,
+        worker_id="new-worker",
+        lease_seconds=60
+    ) == [url_ids[0]]
+    leases = await adb_client.get_all(URLTaskLease, order_by_attribute="url_id")
+    assert [lease.worker_id for lease in leases] == ["new-worker", "crashed-worker"]
+
+
+@pytest.mark.asyncio
+async def test_renew_url_leases(db_data_creator: DBDataCreator):
+    adb_client = db_data_creator.adb_client
+    batch_id = db_data_creator.batch()
+    url_ids = [
+        mapping.url_id for mapping in
+        db_data_creator.urls(batch_id=batch_id, url_count=3).url_mappings
+    ]
+
+    await adb_client.claim_urls(
+        task_type=TaskType.HTML,
+        url_ids=url_ids[:2],
+        worker_id="worker",
+        lease_seconds=60
+    )
+    await adb_client.claim_urls(
+        task_type=TaskType.HTML,
+        url_ids=url_ids[2:],
+        worker_id="other-worker",
+        lease_seconds=60
+    )
+    leases = await adb_client.get_all(URLTaskLease, order_by_attribute="url_id")
+    original_expiries = [lease.expires_at for lease in leases]
+
+    # Only the worker's own leases on the given URLs are extended
+    await adb_client.renew_url_leases(
+        task_type=TaskType.HTML,
+        worker_id="worker",
+        url_ids=url_ids[1:],
+        lease_seconds=3600
+    )
+    leases = await adb_client.get_all(URLTaskLease, order_by_attribute="url_id")
+    assert leases[0].expires_at == original_expiries[0]
+    assert leases[1].expires_at > original_expiries[1]
+    assert leases[2].expires_at == original_expiries[2]
@@ -3,6 +3,8 @@ import pytest
 from src.core.enums import BatchStatus
 from src.db.dtos.batch import BatchInfo
 from src.db.dtos.url.core import URLInfo
+from src.db.models.instantiations.duplicate import Duplicate
+from src.db.models.instantiations.link.link_batch_urls import LinkBatchURL
 
 
 @pytest.mark.asyncio
@@ -46,3 +48,33 @@ async def test_insert_urls(
 
     assert insert_urls_info.original_count == 2
     assert insert_urls_info.duplicate_count == 1
+
+    # New URLs are linked to the batch; the repeated URL is recorded as a duplicate
+    links = await adb_client_test.get_all(LinkBatchURL)
+    assert sorted(link.url_id for link in links) == sorted(insert_urls_info.url_ids)
+    assert all(link.batch_id == batch_id for link in links)
+    duplicates = await adb_client_test.get_all(Duplicate)
+    assert len(duplicates) == 1
+    assert duplicates[0].original_url_id == url_mappings[0].url_id
+
+    # URLs already in the database are duplicates of the original
+    second_batch_id = await adb_client_test.insert_batch(batch_info)
+    second_insert_urls_info = await adb_client_test.insert_urls(
+        url_infos=[
+            URLInfo(url="https://example.com/2"),
+            URLInfo(url="https://example.com/3"),
+        ],
+        batch_id=second_batch_id
+    )
+    assert [mapping.url for mapping in second_insert_urls_info.url_mappings] == [
+        "https://example.com/3"
+    ]
+    assert second_insert_urls_info.total_count == 2
+    assert second_insert_urls_info.duplicate_count == 1
+    duplicates = await adb_client_test.get_all(Duplicate)
+    second_batch_duplicates = [
+        duplicate for duplicate in duplicates
+        if duplicate.batch_id == second_batch_id
+    ]
+    assert len(second_batch_duplicates) == 1
+    assert second_batch_duplicates[0].original_url_id == url_mappings[1].url_id
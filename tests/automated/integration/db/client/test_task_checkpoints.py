@@ -0,0 +1,66 @@
+import datetime
+
+import pytest
+from sqlalchemy import update
+
+from src.core.enums import BatchStatus
+from src.db.enums import TaskType
+from src.db.models.instantiations.link.link_task_url import LinkTaskURL
+from src.db.models.instantiations.task.core import Task
+from tests.helpers.db_data_creator import DBDataCreator
+
+
+@pytest.mark.asyncio
+async def test_task_checkpoints(db_data_creator: DBDataCreator):
+    adb_client = db_data_creator.adb_client
+    batch_id = db_data_creator.batch()
+    url_ids = db_data_creator.urls(batch_id=batch_id, url_count=3).url_ids
+    task_id = await adb_client.initiate_task(task_type=TaskType.HTML)
+
+    await adb_client.checkpoint_task(task_id=task_id, url_ids=url_ids[:2])
+    # Linking at the end of the run does not duplicate checkpointed links
+    await adb_client.link_urls_to_task(task_id=task_id, url_ids=url_ids)
+
+    links = await adb_client.get_all(LinkTaskURL)
+    assert sorted(link.url_id for link in links) == sorted(url_ids)
+    task_info = await adb_client.get_task_info(task_id)
+    assert task_info.checkpointed_url_count == 2
+    assert task_info.checkpointed_at is not None
+
+
+@pytest.mark.asyncio
+async def test_mark_interrupted_tasks(db_data_creator: DBDataCreator):
+    adb_client = db_data_creator.adb_client
+    batch_id = db_data_creator.batch()
+    url_ids = db_data_creator.urls(batch_id=batch_id, url_count=2).url_ids
+
+    stale_task_id = await adb_client.initiate_task(task_type=TaskType.HTML)
+    fresh_task_id = await adb_client.initiate_task(task_type=TaskType.HTML)
+    other_type_task_id = await adb_client.initiate_task(task_type=TaskType.RELEVANCY)
+    # The stale task had checkpointed one URL before its worker died
+    await adb_client.checkpoint_task(task_id=stale_task_id, url_ids=url_ids[:1])
+    an_hour_ago = datetime.datetime.now() - datetime.timedelta(hours=1)
+    await adb_client.execute(
+        update(Task)
+        .where(Task.id.in_([stale_task_id, other_type_task_id]))
+        .values(updated_at=an_hour_ago)
+    )
+    assert await adb_client.has_pending_work(TaskType.HTML)
+
+    task_ids = await adb_client.mark_interrupted_tasks(
+        task_types=[TaskType.HTML],
+        stale_seconds=15 * 60
+    )
+    assert task_ids == [stale_task_id]
+
+    tasks = {task.id: task for task in await adb_client.get_all(Task)}
+    assert tasks[stale_task_id].task_status == BatchStatus.INTERRUPTED.value
+    assert tasks[fresh_task_id].task_status == BatchStatus.IN_PROCESS.value
+    assert tasks[other_type_task_id].task_status == BatchStatus.IN_PROCESS.value
+
+    # The checkpointed URL is done; only the other remains for the HTML task
+    counts = {
+        info.task_type: info.pending_count
+        for info in await adb_client.get_task_pending_counts()
+    }
+    assert counts[TaskType.HTML] == 1
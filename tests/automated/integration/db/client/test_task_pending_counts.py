@@ -0,0 +1,179 @@
+import asyncio
+
+import pytest
+from sqlalchemy import insert, text, update
+
+from src.collectors.enums import URLStatus
+from src.db.constants import TASK_PENDING_FLAGS
+from src.db.enums import TaskType
+from src.db.models.instantiations.url.checked_for_duplicate import URLCheckedForDuplicate
+from src.db.models.instantiations.url.core import URL
+from src.db.models.instantiations.url.probed_for_404 import URLProbedFor404
+from tests.helpers.db_data_creator import DBDataCreator
+
+
+async def get_counts(db_data_creator: DBDataCreator) -> dict[TaskType, int]:
+    task_pending_counts = await db_data_creator.adb_client.get_task_pending_counts()
+    return {
+        info.task_type: info.pending_count
+        for info in task_pending_counts
+        if info.pending_count > 0
+    }
+
+
+@pytest.mark.asyncio
+async def test_task_pending_counts(db_data_creator: DBDataCreator):
+    adb_client = db_data_creator.adb_client
+    batch_id = db_data_creator.batch()
+    url_ids = db_data_creator.urls(batch_id=batch_id, url_count=3).url_ids
+
+    assert await get_counts(db_data_creator) == {
+        TaskType.HTML: 3,
+        TaskType.AGENCY_IDENTIFICATION: 3,
+        TaskType.MISC_METADATA: 3,
+        TaskType.DUPLICATE_DETECTION: 3,
+        TaskType.PROBE_404: 3,
+    }
+    assert not await adb_client.has_pending_work(TaskType.RELEVANCY)
+
+    # Scraping HTML hands the URLs on to the relevancy and record type tasks
+    await db_data_creator.html_data(url_ids[:2])
+    await adb_client.mark_as_checked_for_duplicates(url_ids=url_ids)
+    assert await get_counts(db_data_creator) == {
+        TaskType.HTML: 1,
+        TaskType.RELEVANCY: 2,
+        TaskType.RECORD_TYPE: 2,
+        TaskType.AGENCY_IDENTIFICATION: 3,
+        TaskType.MISC_METADATA: 3,
+        TaskType.PROBE_404: 3,
+    }
+    assert await adb_client.has_pending_work(TaskType.RELEVANCY)
+    assert not await adb_client.has_pending_work(TaskType.DUPLICATE_DETECTION)
+
+    urls = await adb_client.get_all(URL, order_by_attribute="id")
+    html_flag = TASK_PENDING_FLAGS[TaskType.HTML]
+    relevancy_flag = TASK_PENDING_FLAGS[TaskType.RELEVANCY]
+    assert [url.pending_task_flags & html_flag for url in urls] == [0, 0, html_flag]
+    assert [url.pending_task_flags & relevancy_flag for url in urls] == [relevancy_flag, relevancy_flag, 0]
+
+    # Leaving the pending state leaves every pending-URL backlog
+    await adb_client.execute(
+        update(URL)
+        .where(URL.id == url_ids[2])
+        .values(outcome=URLStatus.VALIDATED.value, name="Test Name")
+    )
+    assert await get_counts(db_data_creator) == {
+        TaskType.RELEVANCY: 2,
+        TaskType.RECORD_TYPE: 2,
+        TaskType.AGENCY_IDENTIFICATION: 2,
+        TaskType.MISC_METADATA: 2,
+        TaskType.PROBE_404: 2,
+        TaskType.SUBMIT_APPROVED: 1,
+    }
+
+    # Deleting a URL takes it out of the counts
+    await adb_client.execute(URL.__table__.delete().where(URL.id == url_ids[2]))
+    assert TaskType.SUBMIT_APPROVED not in await get_counts(db_data_creator)
+
+
+@pytest.mark.asyncio
+async def test_task_pending_counts_concurrent_refresh(db_data_creator: DBDataCreator):
+    """
+    Dependent rows of one URL added by two transactions at once
+    leave the URL with the flags computed from both.
+    """
+    adb_client = db_data_creator.adb_client
+    batch_id = db_data_creator.batch()
+    url_id = db_data_creator.urls(batch_id=batch_id, url_count=1).url_ids[0]
+
+    async with adb_client.engine.connect() as first, adb_client.engine.connect() as second:
+        await first.execute(insert(URLCheckedForDuplicate).values(url_id=url_id))
+        # Waits on the URL row until the first transaction commits
+        second_insert = asyncio.create_task(
+            second.execute(insert(URLProbedFor404).values(url_id=url_id))
+        )
+        await asyncio.sleep(0.5)
+        assert not second_insert.done()
+        await first.commit()
+        await second_insert
+        await second.commit()
+
+        stored_flags, computed_flags = (await first.execute(
+            text("SELECT pending_task_flags, url_pending_task_flags(id) FROM urls WHERE id = :url_id"),
+            {"url_id": url_id}
+        )).one()
+    assert stored_flags == computed_flags
+
+    counts = await get_counts(db_data_creator)
+    assert TaskType.DUPLICATE_DETECTION not in counts
+    assert TaskType.PROBE_404 not in counts
+    assert counts[TaskType.HTML] == 1
+
+
+@pytest.mark.asyncio
+async def test_task_pending_counts_concurrent_multi_url_refresh(db_data_creator: DBDataCreator):
+    """
+    Statements refreshing overlapping sets of URLs, listed in opposite
+    orders, wait on each other rather than deadlock, and both apply.
+    """
+    adb_client = db_data_creator.adb_client
+    batch_id = db_data_creator.batch()
+    url_ids = db_data_creator.urls(batch_id=batch_id, url_count=3).url_ids
+
+    async with adb_client.engine.connect() as first, adb_client.engine.connect() as second:
+        await first.execute(
+            insert(URLCheckedForDuplicate),
+            [{"url_id": url_id} for url_id in url_ids]
+        )
+        second_insert = asyncio.create_task(
+            second.execute(
+                insert(URLProbedFor404),
+                [{"url_id": url_id} for url_id in reversed(url_ids)]
+            )
+        )
+        await asyncio.sleep(0.5)
+        assert not second_insert.done()
+        await first.commit()
+        await second_insert
+        await second.commit()
+
+        mismatched = (await first.execute(
+            text(
+                "SELECT id FROM urls "
+                "WHERE pending_task_flags <> url_pending_task_flags(id)"
+            )
+        )).all()
+        assert mismatched == []
+
+    counts = await get_counts(db_data_creator)
+    assert TaskType.DUPLICATE_DETECTION not in counts
+    assert TaskType.PROBE_404 not in counts
+    assert counts[TaskType.HTML] == 3
+
+
+@pytest.mark.asyncio
+async def test_task_pending_counts_unrelated_writes_do_not_wait(db_data_creator: DBDataCreator):
+    """
+    An uncommitted insert of new URLs does not hold up writes
+    that change the pending tasks of other URLs.
+    """
+    adb_client = db_data_creator.adb_client
+    batch_id = db_data_creator.batch()
+    url_id = db_data_creator.urls(batch_id=batch_id, url_count=1).url_ids[0]
+
+    async with adb_client.engine.connect() as first, adb_client.engine.connect() as second:
+        await first.execute(insert(URL).values(
+            url="https://example.com/uncommitted",
+            outcome=URLStatus.PENDING.value
+        ))
+        await asyncio.wait_for(
+            second.execute(insert(URLCheckedForDuplicate).values(url_id=url_id)),
+            timeout=5
+        )
+        await second.commit()
+        await first.commit()
+
+    counts = await get_counts(db_data_creator)
+    assert TaskType.DUPLICATE_DETECTION in counts
+    assert counts[TaskType.HTML] == 2
+    assert await adb_client.has_pending_work(TaskType.DUPLICATE_DETECTION)
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from src.core.tasks.url.operators.url_html.scraper.root_url_cache.core import RootURLCache
@@ -16,4 +18,72 @@ async def test_root_url_cache_happy_path(wiped_database):
 
     # Check that entry is in database
     d = await cache.adb_client.load_root_url_cache()
-    assert d["https://example.com"] == "Test Title"
\ No newline at end of file
+    assert d["https://example.com"] == "Test Title"
+
+@pytest.mark.asyncio
+async def test_root_url_cache_single_flight_and_prefetch(wiped_database):
+    requested_urls = []
+
+    async def slow_get_request(url: str) -> RootURLCacheResponseInfo:
+        requested_urls.append(url)
+        await asyncio.sleep(0.01)
+        return RootURLCacheResponseInfo(text=f"<html><head><title>{url}</title></head></html>")
+
+    cache = RootURLCache()
+    cache.get_request = slow_get_request
+    await cache.prefetch([
+        "https://example.com/a",
+        "https://example.com/b",
+        "example.com/c",
+        "https://example.org/d"
+    ])
+    # One request per distinct root
+    assert sorted(requested_urls) == ["https://example.com", "https://example.org"]
+
+    titles = await asyncio.gather(
+        cache.get_title("https://example.com/e"),
+        cache.get_title("https://example.org/f"),
+    )
+    assert titles == ["https://example.com", "https://example.org"]
+    assert len(requested_urls) == 2
+
+    # A fresh cache reads titles back from the database instead of fetching
+    fresh_cache = RootURLCache()
+    fresh_cache.get_request = slow_get_request
+    assert await fresh_cache.get_title("https://example.com/g") == "https://example.com"
+    assert len(requested_urls) == 2
+
+
+@pytest.mark.asyncio
+async def test_root_url_cache_negative_caching(wiped_database):
+    request_count = 0
+
+    async def failing_get_request(url: str) -> RootURLCacheResponseInfo:
+        nonlocal request_count
+        request_count += 1
+        return RootURLCacheResponseInfo(exception=ValueError("Connection refused"))
+
+    cache = RootURLCache(negative_ttl_seconds=60)
+    cache.get_request = failing_get_request
+    assert await cache.get_title("https://dead.example.com/a") == ""
+    assert await cache.get_title("https://dead.example.com/b") == ""
+    assert request_count == 1
+
+    # Once the negative entry expires, the root is fetched again
+    cache.cache["https://dead.example.com"].expires_at = 0
+    assert await cache.get_title("https://dead.example.com/c") == ""
+    assert request_count == 2
+
+    # Failures are not persisted
+    assert await cache.adb_client.get_root_url_title("https://dead.example.com") is None
+
+
+@pytest.mark.asyncio
+async def test_root_url_cache_is_bounded(wiped_database):
+    cache = RootURLCache(max_size=2)
+    cache.get_request = mock_get_request
+    for root in ("https://a.com", "https://b.com", "https://a.com", "https://c.com"):
+        await cache.get_title(root)
+
+    # b.com was least recently used
+    assert list(cache.cache.keys()) == ["https://a.com", "https://c.com"]
@@ -0,0 +1,49 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.tasks.url.operators.auto_relevant.core import URLAutoRelevantTaskOperator
+from src.db.dtos.url.raw_html import RawHTMLInfo
+from src.db.enums import TaskType
+from src.db.models.instantiations.url.suggestion.relevant.auto import AutoRelevantSuggestion
+from src.external.huggingface.inference.models.output import BasicOutput
+from tests.automated.integration.tasks.asserts import assert_task_has_expected_run_info
+from tests.helpers.db_data_creator import DBDataCreator
+
+
+@pytest.mark.asyncio
+async def test_url_auto_relevant_task_content_dedup(db_data_creator: DBDataCreator):
+    adb_client = db_data_creator.adb_client
+    mock_hf_client = AsyncMock()
+    mock_hf_client.get_relevancy_annotation.return_value = BasicOutput(
+        annotation=False,
+        confidence=0.9,
+        model="test_model"
+    )
+    operator = URLAutoRelevantTaskOperator(
+        adb_client=adb_client,
+        hf_client=mock_hf_client
+    )
+
+    batch_id = db_data_creator.batch()
+    url_mappings = db_data_creator.urls(batch_id=batch_id, url_count=3).url_mappings
+    url_ids = [url_info.url_id for url_info in url_mappings]
+    await adb_client.add_raw_html([
+        RawHTMLInfo(url_id=url_id, html="<html><body>Page not found</body></html>")
+        for url_id in url_ids
+    ])
+
+    task_id = await adb_client.initiate_task(task_type=TaskType.RELEVANCY)
+    run_info = await operator.run_task(task_id)
+    assert_task_has_expected_run_info(run_info, url_ids)
+
+    # Identical pages are classified once, and the result shared
+    assert mock_hf_client.get_relevancy_annotation.call_count == 1
+    suggestions = await adb_client.get_all(AutoRelevantSuggestion)
+    assert sorted(suggestion.url_id for suggestion in suggestions) == sorted(url_ids)
+    for suggestion in suggestions:
+        assert not suggestion.relevant
+        assert suggestion.confidence == 0.9
+
+    metrics = await adb_client.get_content_dedup_metrics()
+    assert metrics.relevancy_calls_saved == 2
@@ -5,6 +5,7 @@ import pytest
 
 from src.core.tasks.url.operators.url_duplicate.core import URLDuplicateTaskOperator
 from src.db.dtos.url.mapping import URLMapping
+from src.db.enums import TaskType
 from src.db.models.instantiations.url.checked_for_duplicate import URLCheckedForDuplicate
 from src.db.models.instantiations.url.core import URL
 from src.collectors.enums import URLStatus
@@ -57,7 +58,8 @@ async def test_url_duplicate_task(
             status_code=HTTPStatus.OK
         ),
     ]
-    run_info = await operator.run_task(1)
+    task_id = await db_data_creator.adb_client.initiate_task(task_type=TaskType.DUPLICATE_DETECTION)
+    run_info = await operator.run_task(task_id)
     assert run_info.outcome == TaskOperatorOutcome.SUCCESS, run_info.message
     assert make_request_mock.call_count == 2
 
@@ -1,7 +1,10 @@
 from src.collectors.enums import URLStatus
 from src.db.client.async_ import AsyncDatabaseClient
-from src.db.enums import TaskType
-from tests.automated.integration.tasks.url.html.mocks.constants import MOCK_HTML_CONTENT
+from src.db.enums import TaskType, RenderDecisionReason, RenderProfileType, ResponseBodyStatus
+from src.db.models.instantiations.url.body_status import URLBodyStatus
+from src.db.models.instantiations.url.fetch_validators import URLFetchValidators
+from src.db.models.instantiations.url.render_decision import URLRenderDecision
+from tests.automated.integration.tasks.url.html.mocks.constants import MOCK_HTML_CONTENT, MOCK_ETAG
 
 
 async def assert_success_url_has_two_html_content_entries(
@@ -29,6 +32,39 @@ async def assert_success_url_has_one_compressed_html_content_entry(
     hci = await adb.get_html_content_info(url_id=url_id)
     assert len(hci) == 1
 
+async def assert_success_url_has_render_decision(
+    adb: AsyncDatabaseClient,
+    url_id: int
+):
+    render_decisions = await adb.get_all(URLRenderDecision)
+    assert len(render_decisions) == 1
+    assert render_decisions[0].url_id == url_id
+    assert render_decisions[0].rendered
+    assert render_decisions[0].reason == RenderDecisionReason.NEAR_EMPTY_BODY.value
+    assert render_decisions[0].render_profile == RenderProfileType.LEAN.value
+    assert render_decisions[0].render_duration_seconds == 1.5
+    assert not render_decisions[0].render_timed_out
+
+async def assert_success_url_has_truncated_body_status(
+    adb: AsyncDatabaseClient,
+    url_id: int
+):
+    body_statuses = await adb.get_all(URLBodyStatus)
+    assert len(body_statuses) == 1
+    assert body_statuses[0].url_id == url_id
+    assert body_statuses[0].status == ResponseBodyStatus.TRUNCATED.value
+    assert body_statuses[0].bytes_read == len(MOCK_HTML_CONTENT)
+
+async def assert_success_url_has_fetch_validators(
+    adb: AsyncDatabaseClient,
+    url_id: int
+):
+    fetch_validators = await adb.get_all(URLFetchValidators)
+    assert len(fetch_validators) == 1
+    assert fetch_validators[0].url_id == url_id
+    assert fetch_validators[0].etag == MOCK_ETAG
+    assert fetch_validators[0].content_length == len(MOCK_HTML_CONTENT)
+
 async def assert_404_url_has_404_status(
     adb: AsyncDatabaseClient,
     url_id: int
@@ -42,6 +78,13 @@ def assert_task_has_one_url_error(task_info):
     assert task_info.url_errors[0].error == "test error"
 
 
+def assert_task_has_phase_timings(task_info, url_count: int):
+    timings = {timing.phase: timing for timing in task_info.phase_timings}
+    assert {"claim", "fetch", "persist", "checkpoint", "run"} <= set(timings.keys())
+    assert timings["fetch"].item_count == url_count
+    assert timings["run"].item_count == url_count
+
+
 def assert_task_type_is_html(task_info):
     assert task_info.task_type == TaskType.HTML
 
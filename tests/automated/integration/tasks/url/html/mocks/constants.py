@@ -1,3 +1,4 @@
 
 MOCK_HTML_CONTENT = "<html></html>"
-MOCK_CONTENT_TYPE = "text/html"
\ No newline at end of file
+MOCK_CONTENT_TYPE = "text/html"
+MOCK_ETAG = '"mock-etag"'
@@ -1,53 +1,70 @@
 from http import HTTPStatus
-from typing import Optional
-
 from aiohttp import ClientResponseError, RequestInfo
 
+from src.db.enums import RenderDecisionReason, RenderProfileType, ResponseBodyStatus
+
 from src.core.tasks.url.operators.url_html.scraper.parser.dtos.response_html import ResponseHTMLInfo
+from src.core.tasks.url.operators.url_html.scraper.render_classifier.dtos.decision import RenderDecisionInfo
+from src.core.tasks.url.operators.url_html.scraper.render_profile.dtos.timing import RenderTimingInfo
+from src.core.tasks.url.operators.url_html.scraper.request_interface.dtos.validators import FetchValidatorsInfo
 from src.core.tasks.url.operators.url_html.scraper.request_interface.dtos.url_response import URLResponseInfo
-from tests.automated.integration.tasks.url.html.mocks.constants import MOCK_CONTENT_TYPE, MOCK_HTML_CONTENT
-
-
-async def mock_make_requests(self, urls: list[str]) -> list[URLResponseInfo]:
-    results = []
-    for idx, url in enumerate(urls):
-        # Second result should produce a 404
-        if idx == 1:
-            results.append(
-                URLResponseInfo(
-                    success=False,
-                    content_type=MOCK_CONTENT_TYPE,
-                    exception=str(ClientResponseError(
-                        request_info=RequestInfo(
-                            url=url,
-                            method="GET",
-                            real_url=url,
-                            headers={},
-                        ),
-                        code=HTTPStatus.NOT_FOUND.value,
-                        history=(None,),
-                    )),
-                    status=HTTPStatus.NOT_FOUND
-                )
-            )
-            continue
-
-        if idx == 2:
-            # 3rd result should produce an error
-            results.append(
-                URLResponseInfo(
-                    success=False,
-                    exception=str(ValueError("test error")),
-                    content_type=MOCK_CONTENT_TYPE
-                ))
-        else:
-            # All other results should succeed
-            results.append(URLResponseInfo(
-                html=MOCK_HTML_CONTENT, success=True, content_type=MOCK_CONTENT_TYPE))
-    return results
-
-
-async def mock_parse(self, url: str, html_content: str, content_type: str) -> ResponseHTMLInfo:
+from tests.automated.integration.tasks.url.html.mocks.constants import MOCK_CONTENT_TYPE, MOCK_HTML_CONTENT, MOCK_ETAG
+
+
+def get_mock_response(idx: int, url: str) -> URLResponseInfo:
+    # Second result should produce a 404
+    if idx == 1:
+        return URLResponseInfo(
+            success=False,
+            content_type=MOCK_CONTENT_TYPE,
+            exception=str(ClientResponseError(
+                request_info=RequestInfo(
+                    url=url,
+                    method="GET",
+                    real_url=url,
+                    headers={},
+                ),
+                code=HTTPStatus.NOT_FOUND.value,
+                history=(None,),
+            )),
+            status=HTTPStatus.NOT_FOUND
+        )
+
+    if idx == 2:
+        # 3rd result should produce an error
+        return URLResponseInfo(
+            success=False,
+            exception=str(ValueError("test error")),
+            content_type=MOCK_CONTENT_TYPE
+        )
+
+    # All other results should succeed
+    return URLResponseInfo(
+        html=MOCK_HTML_CONTENT,
+        success=True,
+        content_type=MOCK_CONTENT_TYPE,
+        body_status=ResponseBodyStatus.TRUNCATED,
+        bytes_read=len(MOCK_HTML_CONTENT),
+        validators=FetchValidatorsInfo(
+            etag=MOCK_ETAG,
+            content_length=len(MOCK_HTML_CONTENT)
+        ),
+        render_decision=RenderDecisionInfo(
+            render=True,
+            reason=RenderDecisionReason.NEAR_EMPTY_BODY
+        ),
+        render_timing=RenderTimingInfo(
+            profile_type=RenderProfileType.LEAN,
+            duration_seconds=1.5
+        )
+    )
+
+
+async def mock_fetch_and_render(self, url: str, body_budget=None) -> URLResponseInfo:
+    return self.mock_responses[url]
+
+
+async def mock_parse(self, url: str, html_content: str, content_type: str, phase_timer=None) -> ResponseHTMLInfo:
     assert html_content == MOCK_HTML_CONTENT
     assert content_type == MOCK_CONTENT_TYPE
     return ResponseHTMLInfo(
@@ -57,5 +74,5 @@ async def mock_parse(self, url: str, html_content: str, content_type: str) -> Re
     )
 
 
-async def mock_get_from_cache(self, url: str) -> Optional[str]:
-    return None
+async def mock_get_title(self, url: str) -> str:
+    return ""
@@ -6,25 +6,29 @@ from src.core.tasks.url.operators.url_html.scraper.parser.core import HTMLRespon
 from src.core.tasks.url.operators.url_html.scraper.request_interface.core import URLRequestInterface
 from src.core.tasks.url.operators.url_html.scraper.root_url_cache.core import RootURLCache
 from src.db.client.async_ import AsyncDatabaseClient
-from tests.automated.integration.tasks.url.html.mocks.methods import mock_make_requests, mock_get_from_cache, mock_parse
+from tests.automated.integration.tasks.url.html.mocks.methods import mock_fetch_and_render, mock_get_title, mock_parse, \
+    get_mock_response
 
 
 async def setup_mocked_url_request_interface() -> URLRequestInterface:
     url_request_interface = URLRequestInterface()
-    url_request_interface.make_requests_with_html = types.MethodType(mock_make_requests, url_request_interface)
+    url_request_interface.mock_responses = {}
+    url_request_interface.fetch_and_render = types.MethodType(mock_fetch_and_render, url_request_interface)
     return url_request_interface
 
 
 async def setup_mocked_root_url_cache() -> RootURLCache:
     mock_root_url_cache = RootURLCache()
-    mock_root_url_cache.get_from_cache = types.MethodType(mock_get_from_cache, mock_root_url_cache)
+    mock_root_url_cache.get_title = types.MethodType(mock_get_title, mock_root_url_cache)
     return mock_root_url_cache
 
 
-async def setup_urls(db_data_creator) -> list[int]:
+async def setup_urls(db_data_creator, operator: URLHTMLTaskOperator) -> list[int]:
     batch_id = db_data_creator.batch()
     url_mappings = db_data_creator.urls(batch_id=batch_id, url_count=3).url_mappings
     url_ids = [url_info.url_id for url_info in url_mappings]
+    for idx, url_mapping in enumerate(url_mappings):
+        operator.url_request_interface.mock_responses[url_mapping.url] = get_mock_response(idx, url_mapping.url)
     return url_ids
 
 
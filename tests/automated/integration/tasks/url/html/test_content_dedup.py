@@ -0,0 +1,78 @@
+import types
+
+import pytest
+
+from src.core.tasks.url.operators.url_html.scraper.parser.dtos.response_html import ResponseHTMLInfo
+from src.core.tasks.url.operators.url_html.scraper.request_interface.dtos.url_response import URLResponseInfo
+from src.db.enums import TaskType
+from src.db.models.instantiations.html_content_blob import HTMLContentBlob
+from src.db.models.instantiations.url.html_content import URLHTMLContent
+from tests.automated.integration.tasks.asserts import assert_task_has_expected_run_info
+from tests.automated.integration.tasks.url.html.mocks.constants import MOCK_CONTENT_TYPE
+from tests.automated.integration.tasks.url.html.setup import setup_operator
+from tests.helpers.db_data_creator import DBDataCreator
+
+# The same login page, differing only in comments, nonces and whitespace
+LOGIN_PAGE_VARIANTS = [
+    '<html><head><script nonce="abc">x()</script></head><body><!-- 1 --><h1>Sign in</h1></body></html>',
+    '<html><head><script nonce="def">x()</script></head>\n<body><!-- 2 -->  <h1>Sign in</h1></body></html>',
+    '<html><head><script nonce="ghi">x()</script></head><body><h1>Sign in</h1></body></html>',
+]
+
+
+async def mock_parse(self, url: str, html_content: str, content_type: str, phase_timer=None) -> ResponseHTMLInfo:
+    self.parse_count += 1
+    return ResponseHTMLInfo(
+        url=url,
+        title="Sign in",
+        h1="Sign in"
+    )
+
+
+async def run_html_task(operator, db_data_creator: DBDataCreator, url_count: int) -> list[int]:
+    batch_id = db_data_creator.batch()
+    url_mappings = db_data_creator.urls(batch_id=batch_id, url_count=url_count).url_mappings
+    url_ids = [url_info.url_id for url_info in url_mappings]
+    for url_mapping in url_mappings:
+        mock_responses = operator.url_request_interface.mock_responses
+        mock_responses[url_mapping.url] = URLResponseInfo(
+            html=LOGIN_PAGE_VARIANTS[len(mock_responses)],
+            success=True,
+            content_type=MOCK_CONTENT_TYPE
+        )
+    task_id = await db_data_creator.adb_client.initiate_task(task_type=TaskType.HTML)
+    run_info = await operator.run_task(task_id)
+    assert_task_has_expected_run_info(run_info, url_ids)
+    return url_ids
+
+
+@pytest.mark.asyncio
+async def test_url_html_task_content_dedup(db_data_creator: DBDataCreator):
+    operator = await setup_operator()
+    operator.html_parser.parse_count = 0
+    operator.html_parser.parse = types.MethodType(mock_parse, operator.html_parser)
+    adb = db_data_creator.adb_client
+
+    # Two copies of the page in one run are parsed once
+    url_ids = await run_html_task(operator, db_data_creator, url_count=2)
+    assert operator.html_parser.parse_count == 1
+
+    # A later copy reuses the content already parsed
+    url_ids += await run_html_task(operator, db_data_creator, url_count=1)
+    assert operator.html_parser.parse_count == 1
+
+    # The page is stored once, but each URL still has its own HTML and content
+    blobs = await adb.get_all(HTMLContentBlob)
+    assert len(blobs) == 1
+    # Either copy from the first run may be the one stored, as they are fetched concurrently
+    stored_html = {await adb.get_html_for_url(url_id=url_id) for url_id in url_ids}
+    assert len(stored_html) == 1
+    assert stored_html.pop() in LOGIN_PAGE_VARIANTS[:2]
+    html_contents = await adb.get_all(URLHTMLContent)
+    assert sorted(html_content.url_id for html_content in html_contents) == sorted(url_ids * 2)
+
+    metrics = await adb.get_content_dedup_metrics()
+    assert metrics.distinct_pages == 1
+    assert metrics.urls_with_html == 3
+    assert metrics.storage_writes_saved == 2
+    assert metrics.parses_saved == 2
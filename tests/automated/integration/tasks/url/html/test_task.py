@@ -1,8 +1,12 @@
+import types
+
 import pytest
 
 from src.db.enums import TaskType
 from tests.automated.integration.tasks.url.html.asserts import assert_success_url_has_two_html_content_entries, assert_404_url_has_404_status, assert_task_has_one_url_error, \
-    assert_task_type_is_html, assert_task_ran_without_error, assert_url_has_one_compressed_html_content_entry
+    assert_task_type_is_html, assert_task_ran_without_error, assert_url_has_one_compressed_html_content_entry, \
+    assert_success_url_has_render_decision, assert_success_url_has_truncated_body_status, \
+    assert_success_url_has_fetch_validators, assert_task_has_phase_timings
 from tests.automated.integration.tasks.asserts import assert_prereqs_not_met, assert_task_has_expected_run_info
 from tests.automated.integration.tasks.url.html.setup import setup_urls, setup_operator
 from tests.helpers.db_data_creator import DBDataCreator
@@ -16,7 +20,7 @@ async def test_url_html_task(db_data_creator: DBDataCreator):
     # No URLs were created, the prereqs should not be met
     await assert_prereqs_not_met(operator)
 
-    url_ids = await setup_urls(db_data_creator)
+    url_ids = await setup_urls(db_data_creator, operator)
     success_url_id = url_ids[0]
     not_found_url_id = url_ids[1]
 
@@ -32,10 +36,35 @@ async def test_url_html_task(db_data_creator: DBDataCreator):
     assert_task_ran_without_error(task_info)
     assert_task_type_is_html(task_info)
     assert_task_has_one_url_error(task_info)
+    assert_task_has_phase_timings(task_info, url_count=len(url_ids))
 
     adb = db_data_creator.adb_client
     await assert_success_url_has_two_html_content_entries(adb, run_info, success_url_id)
     await assert_url_has_one_compressed_html_content_entry(adb, success_url_id)
+    await assert_success_url_has_render_decision(adb, success_url_id)
+    await assert_success_url_has_truncated_body_status(adb, success_url_id)
+    await assert_success_url_has_fetch_validators(adb, success_url_id)
     await assert_404_url_has_404_status(adb, not_found_url_id)
 
 
+
+
+@pytest.mark.asyncio
+async def test_url_html_task_prefetches_root_page_titles(db_data_creator: DBDataCreator):
+    operator = await setup_operator()
+    await setup_urls(db_data_creator, operator)
+
+    looked_up_urls = []
+
+    async def recording_get_title(self, url: str) -> str:
+        looked_up_urls.append(url)
+        return ""
+
+    root_url_cache = operator.html_parser.root_url_cache
+    root_url_cache.get_title = types.MethodType(recording_get_title, root_url_cache)
+
+    task_id = await db_data_creator.adb_client.initiate_task(task_type=TaskType.HTML)
+    await operator.run_task(task_id)
+
+    # Parsing is mocked, so every lookup came from the prefetch
+    assert looked_up_urls
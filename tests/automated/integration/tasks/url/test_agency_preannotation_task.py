@@ -22,6 +22,7 @@ from src.core.tasks.url.subtasks.agency_identification.ckan import CKANAgencyIde
 from src.core.tasks.url.subtasks.agency_identification.common_crawler import CommonCrawlerAgencyIdentificationSubtask
 from src.core.tasks.url.subtasks.agency_identification.muckrock import MuckrockAgencyIdentificationSubtask
 from src.core.enums import SuggestionType
+from src.db.enums import TaskType
 from pdap_access_manager import AccessManager
 from src.external.pdap.dtos.match_agency.response import MatchAgencyResponse
 from src.external.pdap.dtos.match_agency.post import MatchAgencyInfo
@@ -133,7 +134,8 @@ async def test_agency_preannotation_task(db_data_creator: DBDataCreator):
             # Confirm meets prerequisites
             assert await operator.meets_task_prerequisites()
             # Run task
-            run_info = await operator.run_task(1)
+            task_id = await db_data_creator.adb_client.initiate_task(task_type=TaskType.AGENCY_IDENTIFICATION)
+            run_info = await operator.run_task(task_id)
             assert run_info.outcome == TaskOperatorOutcome.SUCCESS, run_info.message
 
             # Confirm tasks are piped into the correct subtasks
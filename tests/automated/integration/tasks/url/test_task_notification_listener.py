@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from src.core.tasks.url.listener.core import TaskNotificationListener
+from src.db.helpers import get_postgres_connection_string
+from tests.helpers.db_data_creator import DBDataCreator
+
+
+@pytest.mark.asyncio
+async def test_task_notification_listener(db_data_creator: DBDataCreator):
+    work_calls = []
+    work_called = asyncio.Event()
+
+    async def on_work():
+        work_calls.append(True)
+        work_called.set()
+
+    listener = TaskNotificationListener(
+        db_url=get_postgres_connection_string(),
+        on_work=on_work,
+        debounce_seconds=0.2,
+        max_delay_seconds=1
+    )
+    await listener.start()
+    try:
+        # Work is looked for on connecting, as notifications may have been missed
+        await asyncio.wait_for(work_called.wait(), timeout=5)
+        work_calls.clear()
+        work_called.clear()
+
+        # A burst of new URLs is coalesced into one run
+        batch_id = db_data_creator.batch()
+        url_ids = db_data_creator.urls(batch_id=batch_id, url_count=2).url_ids
+        url_ids += db_data_creator.urls(batch_id=batch_id, url_count=2).url_ids
+        await asyncio.wait_for(work_called.wait(), timeout=5)
+        await asyncio.sleep(0.5)
+        assert len(work_calls) == 1
+
+        # Work that only shrinks a backlog does not start a run
+        work_calls.clear()
+        await db_data_creator.adb_client.mark_as_checked_for_duplicates(url_ids=url_ids)
+        await asyncio.sleep(0.5)
+        assert len(work_calls) == 0
+    finally:
+        await listener.shutdown()
@@ -1,5 +1,6 @@
 import types
 from http import HTTPStatus
+from typing import Optional
 
 import pendulum
 import pytest
@@ -12,6 +13,9 @@ from src.db.models.instantiations.url.core import URL
 from src.collectors.enums import URLStatus
 from src.core.tasks.url.enums import TaskOperatorOutcome
 from src.core.tasks.url.operators.url_html.scraper.request_interface.dtos.url_response import URLResponseInfo
+from src.core.tasks.url.operators.url_html.scraper.request_interface.dtos.validators import FetchValidatorsInfo
+from src.db.dtos.url.fetch_validators import URLFetchValidatorsInfo
+from src.db.enums import TaskType
 from tests.helpers.db_data_creator import DBDataCreator
 from tests.helpers.batch_creation_parameters.url_creation_parameters import TestURLCreationParameters
 from tests.helpers.batch_creation_parameters.core import TestBatchCreationParameters
@@ -22,18 +26,32 @@ async def test_url_404_probe_task(db_data_creator: DBDataCreator):
 
     mock_html_content = "<html></html>"
     mock_content_type = "text/html"
+    mock_etag = '"abc123"'
     adb_client = db_data_creator.adb_client
 
-    async def mock_make_simple_requests(self, urls: list[str]) -> list[URLResponseInfo]:
+    async def mock_make_probe_requests(
+            self,
+            urls: list[str],
+            validators: list[Optional[FetchValidatorsInfo]]
+    ) -> list[URLResponseInfo]:
         """
-        Mock make_simple_requests so that
-        - the first url returns a 200
+        Mock make_probe_requests so that
+        - the first url returns a 304, using its stored validators
         - the second url returns a 404
         - the third url returns a general error
 
         """
         results = []
         for idx, url in enumerate(urls):
+            if idx == 0 and validators[idx] is not None:
+                assert validators[idx].etag == mock_etag
+                results.append(
+                    URLResponseInfo(
+                        success=True,
+                        status=HTTPStatus.NOT_MODIFIED
+                    )
+                )
+                continue
             if idx == 1:
                 results.append(
                     URLResponseInfo(
@@ -66,7 +84,7 @@ async def test_url_404_probe_task(db_data_creator: DBDataCreator):
         return results
 
     url_request_interface = URLRequestInterface()
-    url_request_interface.make_simple_requests = types.MethodType(mock_make_simple_requests, url_request_interface)
+    url_request_interface.make_probe_requests = types.MethodType(mock_make_probe_requests, url_request_interface)
 
     operator = URL404ProbeTaskOperator(
         url_request_interface=url_request_interface,
@@ -97,16 +115,21 @@ async def test_url_404_probe_task(db_data_creator: DBDataCreator):
     meets_prereqs = await operator.meets_task_prerequisites()
     assert meets_prereqs
 
-    # Run task and validate results
-    run_info = await operator.run_task(task_id=1)
-    assert run_info.outcome == TaskOperatorOutcome.SUCCESS, run_info.message
-
-
     pending_url_mappings = creation_info.url_creation_infos[URLStatus.PENDING].url_mappings
     url_id_success = pending_url_mappings[0].url_id
     url_id_404 = pending_url_mappings[1].url_id
     url_id_error = pending_url_mappings[2].url_id
 
+    # Validators stored from an earlier HTML fetch are used for a conditional probe
+    await adb_client.upsert_url_fetch_validators([
+        URLFetchValidatorsInfo(url_id=url_id_success, etag=mock_etag)
+    ])
+
+    # Run task and validate results
+    task_id = await adb_client.initiate_task(task_type=TaskType.PROBE_404)
+    run_info = await operator.run_task(task_id=task_id)
+    assert run_info.outcome == TaskOperatorOutcome.SUCCESS, run_info.message
+
     url_id_initial_error = creation_info.url_creation_infos[URLStatus.ERROR].url_mappings[0].url_id
 
     # Check that URLProbedFor404 has been appropriately populated
@@ -147,7 +170,8 @@ async def test_url_404_probe_task(db_data_creator: DBDataCreator):
     assert meets_prereqs
 
     # Run the task and Ensure all but the URL previously marked as 404 have been checked again
-    run_info = await operator.run_task(task_id=2)
+    task_id = await adb_client.initiate_task(task_type=TaskType.PROBE_404)
+    run_info = await operator.run_task(task_id=task_id)
     assert run_info.outcome == TaskOperatorOutcome.SUCCESS, run_info.message
 
     probed_for_404_objects: list[URLProbedFor404] = await db_data_creator.adb_client.get_all(URLProbedFor404)
@@ -0,0 +1,86 @@
+import pytest
+from fastapi import HTTPException
+
+from src.api.endpoints.collector.manual.bulk.enums import ManualBatchImportFormat
+from src.api.endpoints.collector.manual.bulk.parse import iter_entries, get_import_format
+from src.core.enums import RecordType
+
+
+async def to_chunks(body: bytes, chunk_size: int):
+    for start in range(0, len(body), chunk_size):
+        yield body[start:start + chunk_size]
+
+
+async def parse(body: str, import_format: ManualBatchImportFormat, chunk_size: int = 7) -> list:
+    return [
+        entry async for entry in
+        iter_entries(to_chunks(body.encode("utf-8-sig"), chunk_size), import_format)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_parse_csv():
+    body = (
+        'url,name,description,collector_metadata,record_type,record_formats\r\n'
+        'https://example.com/1,,,,,\r\n'
+        '\r\n'
+        'https://example.com/2,"Name, with comma","Line one\r\nLine two",'
+        '"{""key"": ""value""}",Arrest Records,CSV; PDF\r\n'
+        'https://example.com/3,Café,,,,'
+    )
+    entries = await parse(body, ManualBatchImportFormat.CSV)
+
+    assert [entry.url for entry in entries] == [
+        "https://example.com/1",
+        "https://example.com/2",
+        "https://example.com/3",
+    ]
+    assert entries[0].name is None
+    assert entries[0].record_formats is None
+    assert entries[1].name == "Name, with comma"
+    assert entries[1].description == "Line one\r\nLine two"
+    assert entries[1].collector_metadata == {"key": "value"}
+    assert entries[1].record_type == RecordType.ARREST_RECORDS
+    assert entries[1].record_formats == ["CSV", "PDF"]
+    assert entries[2].name == "Café"
+
+
+@pytest.mark.asyncio
+async def test_parse_ndjson():
+    body = (
+        '{"url": "https://example.com/1"}\n'
+        '\n'
+        '{"url": "https://example.com/2", "record_formats": ["CSV"], "name": "Café "}\n'
+    )
+    entries = await parse(body, ManualBatchImportFormat.NDJSON, chunk_size=3)
+
+    assert [entry.url for entry in entries] == ["https://example.com/1", "https://example.com/2"]
+    assert entries[1].record_formats == ["CSV"]
+    assert entries[1].name == "Café "
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "body, import_format, detail",
+    [
+        ('url,unknown\nhttps://example.com,1\n', ManualBatchImportFormat.CSV, "Line 1: Unknown columns"),
+        ('name\nExample\n', ManualBatchImportFormat.CSV, "Line 1: Missing column 'url'"),
+        ('url,name\nhttps://example.com\n', ManualBatchImportFormat.CSV, "Line 2: Expected 2 cells"),
+        ('url,name\nhttps://example.com,"Unterminated\n', ManualBatchImportFormat.CSV, "Line 2: Unterminated"),
+        ('{"url": "https://example.com"}\n{"url": \n', ManualBatchImportFormat.NDJSON, "Line 2: Invalid JSON"),
+        ('{"name": "No URL"}\n', ManualBatchImportFormat.NDJSON, "Line 1:"),
+    ]
+)
+async def test_parse_errors(body: str, import_format: ManualBatchImportFormat, detail: str):
+    with pytest.raises(HTTPException) as e:
+        await parse(body, import_format)
+    assert e.value.status_code == 400
+    assert e.value.detail.startswith(detail)
+
+
+def test_get_import_format():
+    assert get_import_format("text/csv; charset=utf-8") == ManualBatchImportFormat.CSV
+    assert get_import_format("application/x-ndjson") == ManualBatchImportFormat.NDJSON
+    with pytest.raises(HTTPException) as e:
+        get_import_format("application/json")
+    assert e.value.status_code == 415
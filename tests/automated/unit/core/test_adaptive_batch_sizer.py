@@ -0,0 +1,63 @@
+from src.core.tasks.url.batch_sizer.core import AdaptiveBatchSizer
+from src.core.tasks.url.batch_sizer.dtos.limits import BatchSizeLimitsInfo
+from src.db.enums import TaskType
+
+
+def setup_sizer() -> AdaptiveBatchSizer:
+    return AdaptiveBatchSizer(
+        limits={
+            TaskType.HTML: BatchSizeLimitsInfo(min_size=10, initial_size=100, max_size=500)
+        },
+        target_run_seconds=60,
+        latency_smoothing=1,
+        max_error_rate=0.25,
+        max_rss_bytes=1000
+    )
+
+
+def record_run(
+    sizer: AdaptiveBatchSizer,
+    url_count: int,
+    duration_seconds: float,
+    error_count: int = 0,
+    rss_bytes: int = 0
+) -> int:
+    return sizer.record_run(
+        task_type=TaskType.HTML,
+        batch_size=sizer.get_batch_size(TaskType.HTML),
+        url_count=url_count,
+        error_count=error_count,
+        duration_seconds=duration_seconds,
+        rss_bytes=rss_bytes
+    )
+
+
+def test_adaptive_batch_sizer_grows_towards_target():
+    sizer = setup_sizer()
+    assert sizer.get_batch_size(TaskType.HTML) == 100
+    assert sizer.get_batch_size(TaskType.RELEVANCY) == 100
+
+    # 0.1 seconds per URL suggests 600 URLs per run, but growth is at most double
+    assert record_run(sizer, url_count=100, duration_seconds=10) == 200
+    # And bounded above
+    assert record_run(sizer, url_count=200, duration_seconds=20) == 400
+    assert record_run(sizer, url_count=400, duration_seconds=40) == 500
+
+    # A partial batch is no evidence that more URLs would be handled
+    assert record_run(sizer, url_count=50, duration_seconds=1) == 500
+
+
+def test_adaptive_batch_sizer_shrinks():
+    sizer = setup_sizer()
+
+    # Slow URLs shrink the batch, at most by half
+    assert record_run(sizer, url_count=100, duration_seconds=100) == 60
+    assert record_run(sizer, url_count=60, duration_seconds=600) == 30
+
+    # Too many errors, or too much memory, halve it, down to the lower bound
+    assert record_run(sizer, url_count=30, duration_seconds=1, error_count=10) == 15
+    assert record_run(sizer, url_count=15, duration_seconds=1, rss_bytes=2000) == 10
+    assert record_run(sizer, url_count=10, duration_seconds=1, rss_bytes=2000) == 10
+
+    # Runs with no URLs leave it as is
+    assert record_run(sizer, url_count=0, duration_seconds=1) == 10
@@ -0,0 +1,57 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from playwright.async_api import BrowserContext
+
+from src.core.tasks.url.operators.url_html.scraper.browser_pool.core import BrowserPool
+
+
+def setup_pool(**kwargs) -> tuple[BrowserPool, MagicMock]:
+    pool = BrowserPool(**kwargs)
+    mock_browser = MagicMock()
+    mock_browser.is_connected = MagicMock(return_value=True)
+
+    async def new_context():
+        context = MagicMock(spec=BrowserContext)
+        context.close = AsyncMock()
+        page = MagicMock()
+        page.close = AsyncMock()
+        page.evaluate = AsyncMock(return_value=1024)
+        context.new_page = AsyncMock(return_value=page)
+        return context
+
+    mock_browser.new_context = AsyncMock(side_effect=new_context)
+    pool._browser = mock_browser
+    return pool, mock_browser
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_reuses_and_recycles_contexts():
+    pool, mock_browser = setup_pool(pool_size=1, max_pages_per_context=2)
+
+    for _ in range(3):
+        async with pool.page():
+            metrics = pool.get_metrics()
+            assert metrics.contexts_in_use == 1
+            assert metrics.saturation == 1
+
+    # The first context served two pages before being recycled
+    assert mock_browser.new_context.call_count == 2
+    metrics = pool.get_metrics()
+    assert metrics.pages_served == 3
+    assert metrics.contexts_recycled == 1
+    assert metrics.contexts_in_use == 0
+    assert metrics.contexts_idle == 1
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_recycles_context_over_memory_threshold():
+    pool, mock_browser = setup_pool(pool_size=1, max_js_heap_bytes=512)
+
+    async with pool.page():
+        pass
+    async with pool.page():
+        pass
+
+    assert mock_browser.new_context.call_count == 2
+    assert pool.get_metrics().contexts_recycled == 2
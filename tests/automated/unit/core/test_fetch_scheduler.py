@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.core.tasks.url.operators.url_html.scraper.fetch_scheduler.core import FetchScheduler
+
+
+@pytest.mark.asyncio
+async def test_fetch_scheduler_caps_requests_per_host():
+    concurrency = {"current": 0, "max": 0}
+
+    async def handler(request: web.Request) -> web.Response:
+        concurrency["current"] += 1
+        concurrency["max"] = max(concurrency["max"], concurrency["current"])
+        await asyncio.sleep(0.01)
+        concurrency["current"] -= 1
+        return web.Response(text="<html></html>", content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+
+    scheduler = FetchScheduler(max_in_flight=10, max_per_host=2)
+
+    async def fetch(url: str):
+        async with scheduler.request("GET", url) as response:
+            return await response.text()
+
+    async with TestServer(app) as server:
+        urls = [str(server.make_url(f"/page/{i}")) for i in range(8)]
+        results = await asyncio.gather(*[fetch(url) for url in urls])
+    await scheduler.close()
+
+    assert results == ["<html></html>"] * 8
+    assert concurrency["max"] == 2
+
+    throughput = scheduler.get_host_throughput()
+    assert len(throughput) == 1
+    assert throughput[0].request_count == 8
+    assert throughput[0].error_count == 0
+    assert throughput[0].in_flight == 0
+    assert throughput[0].bytes_received == len("<html></html>") * 8
+    assert throughput[0].requests_per_second > 0
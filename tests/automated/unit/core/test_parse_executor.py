@@ -0,0 +1,78 @@
+import types
+
+import pytest
+
+from src.core.tasks.url.operators.url_html.scraper.parse_executor.core import ParseExecutor
+from src.core.tasks.url.operators.url_html.scraper.parser.core import HTMLResponseParser
+from src.core.tasks.url.operators.url_html.scraper.parser.enums import ParserTypeEnum, ParserEngineEnum
+from src.core.tasks.url.operators.url_html.scraper.parser.soup import parse_with_beautiful_soup
+from src.core.tasks.url.operators.url_html.scraper.root_url_cache.core import RootURLCache
+
+HTML_CONTENT = """
+<html>
+    <head>
+        <title> Springfield   Police Department </title>
+        <meta name="description" content="Crime statistics and reports">
+    </head>
+    <body>
+        <h1>Annual Report</h1>
+        <h2><a href="/archive">Archive</a></h2>
+        <h2>Café hours</h2>
+        <div>Incident reports are published weekly.</div>
+    </body>
+</html>
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("engine", list(ParserEngineEnum))
+async def test_parse_executor_matches_in_process_parse(engine: ParserEngineEnum):
+    parse_executor = ParseExecutor(max_workers=2)
+    try:
+        result = await parse_executor.parse(
+            html_content=HTML_CONTENT.encode("utf-8"),
+            parser_type=ParserTypeEnum.LXML,
+            engine=engine
+        )
+    finally:
+        parse_executor.shutdown()
+
+    expected = parse_with_beautiful_soup(HTML_CONTENT.encode("utf-8"), ParserTypeEnum.LXML)
+    assert result == expected
+    assert result.title == "Springfield Police Department"
+    assert result.description == "Crime statistics and reports"
+    assert result.h1 == '["Annual Report"]'
+    assert result.h2 == '["Café hours"]'
+    assert result.div == "Incident reports are published weekly. "
+
+
+@pytest.mark.asyncio
+async def test_html_response_parser_combines_executor_and_root_title():
+    async def mock_get_title(self, url: str) -> str:
+        assert url == "https://example.com/reports/"
+        return "  Example   Root "
+
+    root_url_cache = RootURLCache()
+    root_url_cache.get_title = types.MethodType(mock_get_title, root_url_cache)
+    parse_executor = ParseExecutor(max_workers=1)
+    parser = HTMLResponseParser(root_url_cache=root_url_cache, parse_executor=parse_executor)
+    try:
+        html_info = await parser.parse(
+            url="example.com/reports/",
+            html_content=HTML_CONTENT,
+            content_type="text/html"
+        )
+        unreadable_info = await parser.parse(
+            url="example.com/reports/",
+            html_content="%PDF",
+            content_type="application/pdf"
+        )
+    finally:
+        parse_executor.shutdown()
+
+    assert html_info.url == "https://example.com/reports/"
+    assert html_info.url_path == "reports"
+    assert html_info.root_page_title == "Example Root"
+    assert html_info.title == "Springfield Police Department"
+    assert unreadable_info.title == ""
+    assert unreadable_info.root_page_title == "Example Root"
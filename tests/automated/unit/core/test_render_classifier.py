@@ -0,0 +1,62 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.tasks.url.operators.url_html.scraper.render_classifier.core import RenderClassifier
+from src.core.tasks.url.operators.url_html.scraper.request_interface.core import URLRequestInterface
+from src.core.tasks.url.operators.url_html.scraper.request_interface.dtos.url_response import URLResponseInfo
+from src.db.enums import RenderDecisionReason
+
+PARAGRAPH = "<p>" + "The police department publishes its annual crime statistics here. " * 10 + "</p>"
+
+
+def page(body: str, head: str = "") -> str:
+    return f"<html><head>{head}</head><body>{body}</body></html>"
+
+
+@pytest.mark.parametrize(
+    "html,expected_reason",
+    [
+        (page(PARAGRAPH), RenderDecisionReason.STATIC),
+        (page('<div id="root"></div><script src="/bundle.js"></script>'), RenderDecisionReason.NEAR_EMPTY_BODY),
+        (page(f'<nav>{PARAGRAPH}</nav><div id="__next"></div>'), RenderDecisionReason.SPA_ROOT),
+        (page(f'<div id="app">{PARAGRAPH}</div>'), RenderDecisionReason.STATIC),
+        (
+            page(f"<noscript>You need to enable JavaScript to run this app.</noscript>{PARAGRAPH}"),
+            RenderDecisionReason.NOSCRIPT_WARNING
+        ),
+        (
+            page(PARAGRAPH, head=f"<script>{'var x = 1;' * 1000}</script>"),
+            RenderDecisionReason.HIGH_SCRIPT_RATIO
+        ),
+        ("", RenderDecisionReason.UNPARSEABLE),
+    ]
+)
+def test_render_classifier(html: str, expected_reason: RenderDecisionReason):
+    decision = RenderClassifier().classify(html)
+    assert decision.reason == expected_reason
+    assert decision.render == (expected_reason != RenderDecisionReason.STATIC)
+
+
+@pytest.mark.asyncio
+async def test_fetch_and_render_skips_static_pages():
+    interface = URLRequestInterface()
+    interface.get_dynamic_html_content = AsyncMock(
+        return_value=URLResponseInfo(success=True, html="rendered", content_type="text/html")
+    )
+
+    interface.get_response = AsyncMock(
+        return_value=URLResponseInfo(success=True, html=page(PARAGRAPH), content_type="text/html")
+    )
+    response = await interface.fetch_and_render("https://example.com/static")
+    assert response.html == page(PARAGRAPH)
+    assert not response.render_decision.render
+    interface.get_dynamic_html_content.assert_not_called()
+
+    interface.get_response = AsyncMock(
+        return_value=URLResponseInfo(success=True, html=page('<div id="root"></div>'), content_type="text/html")
+    )
+    response = await interface.fetch_and_render("https://example.com/spa")
+    assert response.html == "rendered"
+    assert response.render_decision.reason == RenderDecisionReason.NEAR_EMPTY_BODY
+    interface.get_dynamic_html_content.assert_called_once_with("https://example.com/spa")
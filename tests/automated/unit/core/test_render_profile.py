@@ -0,0 +1,113 @@
+import asyncio
+from http import HTTPStatus
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.tasks.url.operators.url_html.scraper.render_profile.constants import LEAN_RENDER_PROFILE, \
+    FULL_RENDER_PROFILE
+from src.core.tasks.url.operators.url_html.scraper.request_interface.constants import HTML_CONTENT_TYPE
+from src.core.tasks.url.operators.url_html.scraper.request_interface.core import URLRequestInterface
+from src.core.tasks.url.operators.url_html.scraper.request_interface.dtos.url_response import URLResponseInfo
+from src.db.enums import RenderProfileType
+
+
+def setup_interface(render_profile, goto=None) -> tuple[URLRequestInterface, MagicMock]:
+    page = MagicMock()
+    page.route = AsyncMock()
+    page.goto = goto or AsyncMock()
+    page.wait_for_load_state = AsyncMock()
+    page.content = AsyncMock(return_value="<html>rendered</html>")
+
+    browser_pool = MagicMock()
+
+    @asynccontextmanager
+    async def mock_page():
+        yield page
+
+    browser_pool.page = mock_page
+    interface = URLRequestInterface(
+        browser_pool=browser_pool,
+        render_profile=render_profile.model_copy(update={"settle_seconds": 0})
+    )
+    return interface, page
+
+
+@pytest.mark.asyncio
+async def test_lean_profile_blocks_resources_and_records_timing():
+    interface, page = setup_interface(LEAN_RENDER_PROFILE)
+
+    response = await interface.get_dynamic_html_content("https://example.com")
+
+    assert response.success
+    assert response.html == "<html>rendered</html>"
+    page.route.assert_called_once()
+    page.goto.assert_called_once_with("https://example.com", wait_until="domcontentloaded")
+    page.wait_for_load_state.assert_not_called()
+    assert response.render_timing.profile_type == RenderProfileType.LEAN
+    assert not response.render_timing.timed_out
+
+    # Only non-document resources are aborted
+    for resource_type, aborted in (("image", True), ("font", True), ("document", False), ("script", False)):
+        route = MagicMock()
+        route.request.resource_type = resource_type
+        route.abort = AsyncMock()
+        route.continue_ = AsyncMock()
+        await interface._block_resource(route)
+        assert route.abort.called == aborted
+        assert route.continue_.called != aborted
+
+
+@pytest.mark.asyncio
+async def test_full_profile_waits_for_network_idle():
+    interface, page = setup_interface(FULL_RENDER_PROFILE)
+
+    response = await interface.get_dynamic_html_content("https://example.com")
+
+    assert response.success
+    page.route.assert_not_called()
+    page.wait_for_load_state.assert_called_once_with("networkidle")
+    assert response.render_timing.profile_type == RenderProfileType.FULL
+
+
+@pytest.mark.asyncio
+async def test_render_budget_is_enforced():
+    async def slow_goto(*args, **kwargs):
+        await asyncio.sleep(10)
+
+    interface, page = setup_interface(
+        LEAN_RENDER_PROFILE.model_copy(update={"page_budget_seconds": 0.05}),
+        goto=slow_goto
+    )
+
+    response = await interface.get_dynamic_html_content("https://example.com")
+
+    assert not response.success
+    assert response.render_timing.timed_out
+    assert response.render_timing.duration_seconds < 1
+
+
+@pytest.mark.asyncio
+async def test_render_timeout_keeps_static_html():
+    async def slow_goto(*args, **kwargs):
+        await asyncio.sleep(10)
+
+    interface, page = setup_interface(
+        LEAN_RENDER_PROFILE.model_copy(update={"page_budget_seconds": 0.05}),
+        goto=slow_goto
+    )
+    static_response = URLResponseInfo(
+        success=True,
+        html="<html><body><div id='root'></div></body></html>",
+        content_type=HTML_CONTENT_TYPE,
+        status=HTTPStatus.OK
+    )
+    interface.get_response = AsyncMock(return_value=static_response)
+
+    response = await interface.fetch_and_render("https://example.com")
+
+    assert response.success
+    assert response.html == static_response.html
+    assert response.render_decision.render
+    assert response.render_timing.timed_out
@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.core.tasks.url.operators.url_html.pipeline.memory_budget import BodyMemoryBudget
+from src.core.tasks.url.operators.url_html.scraper.fetch_scheduler.core import FetchScheduler
+from src.core.tasks.url.operators.url_html.scraper.request_interface.core import URLRequestInterface
+from src.db.enums import ResponseBodyStatus
+
+SMALL_HTML = "<html><body>Café</body></html>"
+LARGE_HTML = "<html><body>" + "x" * 200_000 + "</body></html>"
+
+
+@pytest.mark.asyncio
+async def test_get_response_caps_and_skips_bodies():
+    routes = web.RouteTableDef()
+
+    @routes.get("/small")
+    async def small(request: web.Request) -> web.Response:
+        return web.Response(text=SMALL_HTML, content_type="text/html", charset="utf-8")
+
+    @routes.get("/large")
+    async def large(request: web.Request) -> web.Response:
+        return web.Response(text=LARGE_HTML, content_type="text/html")
+
+    @routes.get("/report.pdf")
+    async def pdf(request: web.Request) -> web.Response:
+        return web.Response(body=b"%PDF" + b"0" * 200_000, content_type="application/pdf")
+
+    app = web.Application()
+    app.add_routes(routes)
+
+    fetch_scheduler = FetchScheduler()
+    interface = URLRequestInterface(fetch_scheduler=fetch_scheduler, max_body_bytes=100_000)
+    async with TestServer(app) as server:
+        small_response = await interface.get_response(str(server.make_url("/small")))
+        large_response = await interface.get_response(str(server.make_url("/large")))
+        pdf_response = await interface.get_response(str(server.make_url("/report.pdf")))
+    await fetch_scheduler.close()
+
+    assert small_response.html == SMALL_HTML
+    assert small_response.body_status == ResponseBodyStatus.COMPLETE
+
+    assert large_response.success
+    assert large_response.body_status == ResponseBodyStatus.TRUNCATED
+    assert large_response.bytes_read == 100_000
+    assert large_response.html == LARGE_HTML[:100_000]
+
+    assert pdf_response.success
+    assert pdf_response.body_status == ResponseBodyStatus.SKIPPED
+    assert pdf_response.html is None
+    assert pdf_response.content_type == "application/pdf"
+
+
+@pytest.mark.asyncio
+async def test_get_response_reserves_body_before_reading():
+    routes = web.RouteTableDef()
+
+    @routes.get("/large")
+    async def large(request: web.Request) -> web.Response:
+        return web.Response(text=LARGE_HTML, content_type="text/html")
+
+    app = web.Application()
+    app.add_routes(routes)
+
+    fetch_scheduler = FetchScheduler()
+    interface = URLRequestInterface(fetch_scheduler=fetch_scheduler, max_body_bytes=100_000)
+    body_budget = BodyMemoryBudget(max_bytes=150_000)
+    async with TestServer(app) as server:
+        url = str(server.make_url("/large"))
+        first_response = await interface.get_response(url, body_budget=body_budget)
+        # Only the body actually read stays reserved
+        assert first_response.reserved_body_bytes == 100_000
+        assert body_budget.bytes_in_use == 100_000
+
+        # A body that may not fit is not read until there is room for it
+        second_fetch = asyncio.create_task(interface.get_response(url, body_budget=body_budget))
+        await asyncio.sleep(0.1)
+        assert not second_fetch.done()
+        await body_budget.release(first_response.reserved_body_bytes)
+        second_response = await second_fetch
+    await fetch_scheduler.close()
+
+    assert second_response.html == LARGE_HTML[:100_000]
+    assert body_budget.bytes_in_use == 100_000
@@ -0,0 +1,70 @@
+import hashlib
+from http import HTTPStatus
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.core.tasks.url.operators.url_html.scraper.fetch_scheduler.core import FetchScheduler
+from src.core.tasks.url.operators.url_html.scraper.request_interface.core import URLRequestInterface
+from src.core.tasks.url.operators.url_html.scraper.request_interface.dtos.validators import FetchValidatorsInfo
+
+HTML = "<html><body>Records</body></html>"
+ETAG = '"v1"'
+LAST_MODIFIED = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+
+@pytest.mark.asyncio
+async def test_probe_uses_validators_and_head_fallback():
+    methods = []
+    routes = web.RouteTableDef()
+
+    @routes.route("*", "/page")
+    async def page(request: web.Request) -> web.Response:
+        methods.append(request.method)
+        if request.headers.get("If-None-Match") == ETAG:
+            return web.Response(status=304)
+        return web.Response(
+            text=HTML,
+            content_type="text/html",
+            headers={"ETag": ETAG, "Last-Modified": LAST_MODIFIED}
+        )
+
+    @routes.route("*", "/no-head")
+    async def no_head(request: web.Request) -> web.Response:
+        methods.append(request.method)
+        if request.method == "HEAD":
+            return web.Response(status=405)
+        return web.Response(text=HTML, content_type="text/html")
+
+    app = web.Application()
+    app.add_routes(routes)
+
+    fetch_scheduler = FetchScheduler()
+    interface = URLRequestInterface(fetch_scheduler=fetch_scheduler)
+    async with TestServer(app) as server:
+        page_url = str(server.make_url("/page"))
+        response = await interface.get_response(page_url)
+        unchanged = await interface.probe(page_url, response.validators)
+        unconditional = await interface.probe(page_url)
+        methods.clear()
+        fallback = await interface.probe(str(server.make_url("/no-head")))
+    await fetch_scheduler.close()
+
+    assert response.validators == FetchValidatorsInfo(
+        etag=ETAG,
+        last_modified=LAST_MODIFIED,
+        content_length=len(HTML),
+        content_hash=hashlib.sha256(HTML.encode("utf-8")).hexdigest()
+    )
+
+    assert unchanged.success
+    assert unchanged.status == HTTPStatus.NOT_MODIFIED
+    assert unchanged.html is None
+
+    assert unconditional.status == HTTPStatus.OK
+    assert unconditional.html is None
+
+    assert methods == ["HEAD", "GET"]
+    assert fallback.success
+    assert fallback.status == HTTPStatus.OK
@@ -0,0 +1,48 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.core.tasks.url.operators.url_html.scraper.fetch_scheduler.core import FetchScheduler
+from src.core.tasks.url.operators.url_html.scraper.root_url_cache.core import RootURLCache
+
+LARGE_HTML = "<html><head><title>Root Title</title></head><body>" + "x" * 200_000 + "</body></html>"
+
+
+@pytest.mark.asyncio
+async def test_root_url_cache_request_caps_body_and_times_out():
+    routes = web.RouteTableDef()
+
+    @routes.get("/large")
+    async def large(request: web.Request) -> web.Response:
+        return web.Response(text=LARGE_HTML, content_type="text/html")
+
+    @routes.get("/slow")
+    async def slow(request: web.Request) -> web.Response:
+        await asyncio.sleep(2)
+        return web.Response(text=LARGE_HTML, content_type="text/html")
+
+    app = web.Application()
+    app.add_routes(routes)
+
+    fetch_scheduler = FetchScheduler()
+    cache = RootURLCache(
+        adb_client=AsyncMock(),
+        fetch_scheduler=fetch_scheduler,
+        request_timeout_seconds=0.5,
+        max_body_bytes=100_000
+    )
+    async with TestServer(app) as server:
+        large_response = await cache.get_request(str(server.make_url("/large")))
+        slow_response = await cache.get_request(str(server.make_url("/slow")))
+    await fetch_scheduler.close()
+
+    # Only the start of the page is read, which still holds its title
+    assert large_response.exception is None
+    assert large_response.text == LARGE_HTML[:100_000]
+    assert await cache.get_title_from_soup(large_response.text) == "Root Title"
+
+    assert slow_response.text is None
+    assert isinstance(slow_response.exception, asyncio.TimeoutError)
@@ -0,0 +1,77 @@
+import pytest
+
+from src.core.tasks.url.operators.url_html.scraper.parser.enums import ParserTypeEnum
+from src.core.tasks.url.operators.url_html.scraper.parser.single_pass import parse_with_lxml
+from src.core.tasks.url.operators.url_html.scraper.parser.soup import parse_with_beautiful_soup
+
+# Pages without nested divs, for which both engines must agree on every field
+PARITY_CORPUS = [
+    "",
+    "<p>No structure at all</p>",
+    """
+    <html>
+        <head>
+            <title>
+                City of Springfield -
+                Police   Department
+            </title>
+            <meta name="keywords" content="police">
+            <meta name="description" content="  Records and   reports ">
+        </head>
+        <body>
+            <h1>Police <b>Records</b></h1>
+            <h2><a href="/news">News</a></h2>
+            <h2>Contact <!-- hidden --> us</h2>
+            <h3>Café &amp; Community</h3>
+            <div>Call <span>911</span> in an emergency.<script>var tracker = 1;</script></div>
+            <div></div>
+            <div><style>.x { color: red; }</style>Office hours: 9 to 5</div>
+        </body>
+    </html>
+    """,
+    """
+    <html><head><title></title></head>
+    <body><h4>Only a heading</h4><h5> </h5><h6>Last</h6></body></html>
+    """,
+    """
+    <html><head><meta name="description"></head>
+    <body><div>""" + "record " * 300 + """</div><div>""" + "report " * 300 + """</div><div>tail</div></body></html>
+    """,
+    """
+    <html><body>
+        <svg><title>Logo</title></svg>
+        <title>Late title</title>
+        <div>Arrest logs</div><div>Crime map</div>
+    </body></html>
+    """,
+    """
+    <html><body>
+        <h1>Outer <h2>Inner <a href="/">link</a></h2> rest</h1>
+        <h2>Kept <!-- note --> heading <script>var x;</script>after</h2>
+    </body></html>
+    """,
+    """<?xml version="1.0"?>
+    <rss><channel><title>Press releases</title><div>Not really html</div></channel></rss>
+    """,
+]
+
+
+@pytest.mark.parametrize("html", PARITY_CORPUS)
+@pytest.mark.parametrize("parser_type", [ParserTypeEnum.LXML, ParserTypeEnum.LXML_XML])
+def test_single_pass_parser_parity(html: str, parser_type: ParserTypeEnum):
+    html_content = html.encode("utf-8")
+    assert parse_with_lxml(html_content, parser_type) == parse_with_beautiful_soup(html_content, parser_type)
+
+
+def test_single_pass_parser_does_not_repeat_nested_divs():
+    html_content = b"<div>outer <div>inner</div> tail</div><div>next</div>"
+    html_info = parse_with_lxml(html_content, ParserTypeEnum.LXML)
+    assert html_info.div == "outer inner tail next "
+
+
+def test_single_pass_parser_word_budget():
+    html_content = ("<div>" + "word " * 499 + "</div><div>two words</div><div>one</div>").encode("utf-8")
+    html_info = parse_with_lxml(html_content, ParserTypeEnum.LXML)
+    # The second div would exceed 500 words, so collection stops before it
+    assert len(html_info.div.split()) == 499
+    assert "one" not in html_info.div
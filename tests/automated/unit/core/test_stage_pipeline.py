@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from src.core.tasks.url.operators.url_html.pipeline.core import StagePipeline
+from src.core.tasks.url.operators.url_html.pipeline.dtos.stage import PipelineStageInfo
+from src.core.tasks.url.operators.url_html.pipeline.memory_budget import BodyMemoryBudget
+
+
+@pytest.mark.asyncio
+async def test_stage_pipeline_slow_item_does_not_hold_back_others():
+    slow_item_released = asyncio.Event()
+    persisted: list[int] = []
+
+    async def fetch(item: dict):
+        if item["id"] == 0:
+            await slow_item_released.wait()
+
+    async def parse(item: dict):
+        item["parsed"] = True
+
+    async def persist(items: list[dict]):
+        persisted.extend(item["id"] for item in items)
+        # Every other item reaches the sink while the slow one is still fetching
+        if len(persisted) == 4:
+            slow_item_released.set()
+
+    pipeline = StagePipeline(
+        stages=[
+            PipelineStageInfo(name="fetch", handler=fetch, workers=5),
+            PipelineStageInfo(name="parse", handler=parse, workers=2),
+        ],
+        sink=persist,
+        queue_size=2
+    )
+    items = [{"id": idx} for idx in range(5)]
+    await asyncio.wait_for(pipeline.run(items), timeout=5)
+
+    assert sorted(persisted[:4]) == [1, 2, 3, 4]
+    assert persisted[4] == 0
+    assert all(item["parsed"] for item in items)
+
+
+@pytest.mark.asyncio
+async def test_stage_pipeline_propagates_stage_errors():
+    async def fail(item: int):
+        raise ValueError("stage failed")
+
+    async def persist(items: list[int]):
+        pass
+
+    pipeline = StagePipeline(
+        stages=[PipelineStageInfo(name="fail", handler=fail, workers=2)],
+        sink=persist
+    )
+    with pytest.raises(ValueError, match="stage failed"):
+        await asyncio.wait_for(pipeline.run([1, 2, 3]), timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_body_memory_budget_caps_bytes_in_use():
+    budget = BodyMemoryBudget(max_bytes=100)
+    peak = 0
+
+    async def hold(size: int):
+        nonlocal peak
+        await budget.acquire(size)
+        peak = max(peak, budget.bytes_in_use)
+        await asyncio.sleep(0.01)
+        await budget.release(size)
+
+    await asyncio.gather(*[hold(40) for _ in range(6)])
+    assert peak <= 100
+    assert budget.bytes_in_use == 0
+
+    # A body larger than the budget is admitted once nothing else is held
+    await asyncio.wait_for(hold(250), timeout=1)
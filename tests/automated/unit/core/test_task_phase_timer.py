@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+
+from src.core.tasks.base.phase_timer import TaskPhaseTimer
+
+
+@pytest.mark.asyncio
+async def test_task_phase_timer():
+    timer = TaskPhaseTimer()
+
+    result = await timer.measure("fetch", asyncio.sleep(0.01, result="page"), byte_count=10)
+    assert result == "page"
+    await timer.measure("fetch", asyncio.sleep(0.01), byte_count=5)
+    with timer.phase("persist", item_count=3):
+        await asyncio.sleep(0.01)
+    timer.add("render", duration_seconds=1.5, item_count=1)
+
+    timings = {timing.phase: timing for timing in timer.get_timings()}
+    assert list(timings.keys()) == ["fetch", "persist", "render"]
+    assert timings["fetch"].item_count == 2
+    assert timings["fetch"].byte_count == 15
+    assert timings["fetch"].duration_seconds >= 0.02
+    assert timings["persist"].item_count == 3
+    assert timings["render"].duration_seconds == 1.5
+
+
+@pytest.mark.asyncio
+async def test_task_phase_timer_records_failed_phase():
+    timer = TaskPhaseTimer()
+
+    async def fail():
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        await timer.measure("classify", fail())
+
+    timings = timer.get_timings()
+    assert [timing.phase for timing in timings] == ["classify"]
+    assert timings[0].item_count == 1
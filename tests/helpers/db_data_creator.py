@@ -434,7 +434,7 @@ class DBDataCreator:
             )
             raw_html_info = RawHTMLInfo(
                 url_id=url_id,
-                html="<html></html>"
+                html=f"<html><body>{url_id}</body></html>"
             )
             raw_html_info_list.append(raw_html_info)
 
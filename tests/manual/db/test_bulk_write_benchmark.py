@@ -0,0 +1,199 @@
+"""
+Compares the `AsyncDatabaseClient` write methods moved onto `BulkWriter`
+against the per-row loops they replaced, counting the statements each sends.
+
+Run on its own against a test database, e.g.
+`pytest tests/manual/db/test_bulk_write_benchmark.py -s`
+"""
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Callable
+
+import pytest
+from sqlalchemy import event, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.collectors.enums import CollectorType, URLStatus
+from src.core.enums import BatchStatus
+from src.core.tasks.url.operators.submit_approved_url.tdo import SubmittedURLInfo
+from src.core.tasks.url.operators.url_miscellaneous_metadata.tdo import URLMiscellaneousMetadataTDO
+from src.db.client.async_ import AsyncDatabaseClient
+from src.db.dtos.batch import BatchInfo
+from src.db.dtos.log import LogInfo
+from src.db.dtos.url.core import URLInfo
+from src.db.dtos.url.error import URLErrorPydanticInfo
+from src.db.enums import TaskType
+from src.db.models.instantiations.log import Log
+from src.db.models.instantiations.url.core import URL
+from src.db.models.instantiations.url.data_source import URLDataSource
+from src.db.models.instantiations.url.error_info import URLErrorInfo
+from src.db.models.instantiations.url.optional_data_source_metadata import URLOptionalDataSourceMetadata
+
+ROW_COUNTS = [100, 1_000, 10_000]
+
+
+@contextmanager
+def count_statements(adb_client: AsyncDatabaseClient):
+    counter = {"statements": 0}
+
+    def before_cursor_execute(*args, **kwargs):
+        counter["statements"] += 1
+
+    engine = adb_client.engine.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def add_url_error_infos_one_by_one(session: AsyncSession, infos: list[URLErrorPydanticInfo]):
+    for info in infos:
+        url = (await session.scalars(select(URL).where(URL.id == info.url_id))).first()
+        url.outcome = URLStatus.ERROR.value
+        session.add(URLErrorInfo(**info.model_dump()))
+
+
+async def add_miscellaneous_metadata_one_by_one(session: AsyncSession, tdos: list[URLMiscellaneousMetadataTDO]):
+    for tdo in tdos:
+        await session.execute(
+            update(URL).where(URL.id == tdo.url_id).values(name=tdo.name, description=tdo.description)
+        )
+    for tdo in tdos:
+        session.add(
+            URLOptionalDataSourceMetadata(
+                url_id=tdo.url_id,
+                record_formats=tdo.record_formats,
+                data_portal_type=tdo.data_portal_type,
+                supplying_entity=tdo.supplying_entity
+            )
+        )
+
+
+async def mark_urls_as_submitted_one_by_one(session: AsyncSession, infos: list[SubmittedURLInfo]):
+    for info in infos:
+        session.add(URLDataSource(url_id=info.url_id, data_source_id=info.data_source_id))
+        await session.execute(
+            update(URL).where(URL.id == info.url_id).values(outcome=URLStatus.SUBMITTED.value)
+        )
+
+
+async def insert_logs_one_by_one(session: AsyncSession, infos: list[LogInfo]):
+    for info in infos:
+        session.add(Log(log=info.log, batch_id=info.batch_id))
+
+
+async def insert_batch(adb_client: AsyncDatabaseClient) -> int:
+    return await adb_client.insert_batch(
+        BatchInfo(
+            strategy="manual",
+            status=BatchStatus.IN_PROCESS,
+            parameters={},
+            user_id=1
+        )
+    )
+
+
+async def insert_url_ids(adb_client: AsyncDatabaseClient, prefix: str, count: int) -> list[int]:
+    insert_urls_info = await adb_client.insert_urls(
+        url_infos=[
+            URLInfo(url=f"https://{prefix}.example.com/{i}")
+            for i in range(count)
+        ],
+        batch_id=await insert_batch(adb_client)
+    )
+    return [url_mapping.url_id for url_mapping in insert_urls_info.url_mappings]
+
+
+async def compare(
+    adb_client: AsyncDatabaseClient,
+    method_name: str,
+    row_count: int,
+    get_rows: Callable[[list[int]], Awaitable[list]],
+    one_by_one: Callable[[AsyncSession, list], Awaitable[None]],
+    set_based: Callable[[list], Awaitable[None]]
+):
+    rows = await get_rows(await insert_url_ids(adb_client, f"{method_name}-1-{row_count}", row_count))
+    with count_statements(adb_client) as one_by_one_counter:
+        start = time.perf_counter()
+        async with adb_client.session_maker() as session:
+            await one_by_one(session, rows)
+            await session.commit()
+        one_by_one_duration = time.perf_counter() - start
+
+    rows = await get_rows(await insert_url_ids(adb_client, f"{method_name}-2-{row_count}", row_count))
+    with count_statements(adb_client) as set_based_counter:
+        start = time.perf_counter()
+        await set_based(rows)
+        set_based_duration = time.perf_counter() - start
+
+    print(
+        f"{method_name} ({row_count} rows): "
+        f"one by one {one_by_one_counter['statements']} statements in {one_by_one_duration:.4f} seconds, "
+        f"set-based {set_based_counter['statements']} statements in {set_based_duration:.4f} seconds"
+    )
+    assert set_based_counter["statements"] <= one_by_one_counter["statements"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_write_benchmark(adb_client_test: AsyncDatabaseClient):
+    adb_client = adb_client_test
+    task_id = await adb_client.initiate_task(task_type=TaskType.HTML)
+    batch_id = await insert_batch(adb_client)
+
+    async def get_error_infos(url_ids: list[int]) -> list[URLErrorPydanticInfo]:
+        return [
+            URLErrorPydanticInfo(task_id=task_id, url_id=url_id, error="Benchmark error")
+            for url_id in url_ids
+        ]
+
+    async def get_tdos(url_ids: list[int]) -> list[URLMiscellaneousMetadataTDO]:
+        return [
+            URLMiscellaneousMetadataTDO(
+                url_id=url_id,
+                collector_metadata={},
+                collector_type=CollectorType.MANUAL,
+                name=f"Name {url_id}",
+                description=f"Description {url_id}",
+                record_formats=["CSV"]
+            )
+            for url_id in url_ids
+        ]
+
+    async def get_submitted_infos(url_ids: list[int]) -> list[SubmittedURLInfo]:
+        return [
+            SubmittedURLInfo(url_id=url_id, data_source_id=url_id, request_error=None)
+            for url_id in url_ids
+        ]
+
+    async def get_log_infos(url_ids: list[int]) -> list[LogInfo]:
+        return [
+            LogInfo(log=f"Benchmark log {url_id}", batch_id=batch_id)
+            for url_id in url_ids
+        ]
+
+    for row_count in ROW_COUNTS:
+        await compare(
+            adb_client, "add_url_error_infos", row_count,
+            get_rows=get_error_infos,
+            one_by_one=add_url_error_infos_one_by_one,
+            set_based=adb_client.add_url_error_infos
+        )
+        await compare(
+            adb_client, "add_miscellaneous_metadata", row_count,
+            get_rows=get_tdos,
+            one_by_one=add_miscellaneous_metadata_one_by_one,
+            set_based=adb_client.add_miscellaneous_metadata
+        )
+        await compare(
+            adb_client, "mark_urls_as_submitted", row_count,
+            get_rows=get_submitted_infos,
+            one_by_one=mark_urls_as_submitted_one_by_one,
+            set_based=adb_client.mark_urls_as_submitted
+        )
+        await compare(
+            adb_client, "insert_logs", row_count,
+            get_rows=get_log_infos,
+            one_by_one=insert_logs_one_by_one,
+            set_based=adb_client.insert_logs
+        )
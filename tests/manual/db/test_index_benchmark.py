@@ -0,0 +1,430 @@
+"""
+Records `EXPLAIN` plans and timings for every `QueryBuilderBase` subclass
+against a large synthetic dataset, before and after the index migration.
+
+Each builder is run in a transaction which is rolled back. Every statement it
+sends is then explained in that transaction: reads with `EXPLAIN ANALYZE`,
+writes with a plain `EXPLAIN` so they are not executed twice.
+Plans are written to `index_benchmark_results.json` in the working directory.
+
+Run on its own against a test database, e.g.
+`pytest tests/manual/db/test_index_benchmark.py -s`
+"""
+import importlib
+import inspect
+import json
+import pkgutil
+import re
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, AsyncIterator
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import event, text, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import src
+from src.api.endpoints.annotate._shared.queries.get_annotation_batch_info import GetAnnotationBatchInfoQueryBuilder
+from src.api.endpoints.annotate._shared.queries.get_next_url_for_user_annotation import \
+    GetNextURLForUserAnnotationQueryBuilder
+from src.api.endpoints.annotate.agency.get.queries.agency_suggestion import GetAgencySuggestionsQueryBuilder
+from src.api.endpoints.annotate.agency.get.queries.next_for_annotation import GetNextURLAgencyForAnnotationQueryBuilder
+from src.api.endpoints.annotate.all.get.query import GetNextURLForAllAnnotationQueryBuilder
+from src.api.endpoints.annotate.relevance.get.query import GetNextUrlForRelevanceAnnotationQueryBuilder
+from src.api.endpoints.batch.duplicates.query import GetDuplicatesByBatchIDQueryBuilder
+from src.api.endpoints.batch.urls.query import GetURLsByBatchQueryBuilder
+from src.api.endpoints.collector.dtos.manual_batch.post import ManualBatchInputDTO, ManualBatchInnerInputDTO
+from src.api.endpoints.collector.manual.bulk.query import ImportManualBatchQueryBuilder
+from src.api.endpoints.collector.manual.query import UploadManualBatchQueryBuilder
+from src.api.endpoints.metrics.batches.aggregated.query import GetBatchesAggregatedMetricsQueryBuilder
+from src.api.endpoints.metrics.batches.breakdown.query import GetBatchesBreakdownMetricsQueryBuilder
+from src.api.endpoints.metrics.task_phases.query import GetTaskPhasesMetricsQueryBuilder
+from src.api.endpoints.review.approve.dto import FinalReviewApprovalInfo
+from src.api.endpoints.review.approve.query import ApproveURLQueryBuilder
+from src.api.endpoints.review.enums import RejectionReason
+from src.api.endpoints.review.next.query import GetNextURLForFinalReviewQueryBuilder
+from src.api.endpoints.review.reject.query import RejectURLQueryBuilder
+from src.api.endpoints.task.by_id.query import GetTaskInfoQueryBuilder
+from src.api.endpoints.url.get.query import GetURLsQueryBuilder
+from src.core.enums import RecordType
+from src.core.tasks.url.operators.agency_identification.queries.get_pending_urls_without_agency_suggestions import \
+    GetPendingURLsWithoutAgencySuggestionsQueryBuilder
+from src.core.tasks.url.operators.auto_relevant.queries.get_tdos import GetAutoRelevantTDOsQueryBuilder
+from src.core.tasks.url.operators.url_html.queries.get_pending_urls_without_html_data import \
+    GetPendingURLsWithoutHTMLDataQueryBuilder
+from src.core.tasks.url.operators.url_miscellaneous_metadata.queries.get_pending_urls_missing_miscellaneous_data import \
+    GetPendingURLsMissingMiscellaneousDataQueryBuilder
+from src.core.tasks.url.operators.url_miscellaneous_metadata.queries.has_pending_urls_missing_miscellaneous_data import \
+    HasPendingURsMissingMiscellaneousDataQueryBuilder
+from src.db.client.async_ import AsyncDatabaseClient
+from src.db.dtos.url.core import URLInfo
+from src.db.helpers import get_postgres_connection_string
+from src.db.models.instantiations.url.core import URL
+from src.db.models.instantiations.url.suggestion.agency.user import UserUrlAgencySuggestion
+from src.db.models.instantiations.url.suggestion.record_type.user import UserRecordTypeSuggestion
+from src.db.models.instantiations.url.suggestion.relevant.user import UserRelevantSuggestion
+from src.db.queries.base.builder import QueryBuilderBase
+from src.db.queries.implementations.core.common.annotation_exists import AnnotationExistsCTEQueryBuilder
+from src.db.queries.implementations.core.get.html_content_info import GetHTMLContentInfoQueryBuilder
+from src.db.queries.implementations.core.get.recent_batch_summaries.builder import GetRecentBatchSummariesQueryBuilder
+from src.db.queries.implementations.core.get.recent_batch_summaries.url_counts.builder import URLCountsCTEQueryBuilder
+from src.db.queries.implementations.core.insert.urls import InsertURLsQueryBuilder
+from src.db.queries.implementations.core.metrics.urls.aggregated.pending import \
+    GetMetricsURLSAggregatedPendingQueryBuilder, PendingAnnotationExistsCTEQueryBuilder
+
+URL_COUNT = 100_000
+BATCH_COUNT = 100
+TASK_COUNT = 200
+AGENCY_COUNT = 1_000
+USER_ID = 1
+
+# The index migration, and the revision before it
+INDEX_REVISION = 'b9d5f1c7e3a2'
+PREVIOUS_REVISION = 'a7c3e9f5b1d8'
+
+OUTPUT_PATH = Path("index_benchmark_results.json")
+
+SEED_TABLE_NAMES = ["urls", "batches", "tasks", "agencies", "html_content_blobs"]
+
+# Every URL's id matches its number in `generate_series`, as the seeded tables
+# are truncated with their sequences first
+SEED_STATEMENTS = [
+    f"""
+    INSERT INTO agencies (agency_id, name)
+    SELECT g, 'Agency ' || g FROM generate_series(1, {AGENCY_COUNT}) g
+    """,
+    f"""
+    INSERT INTO batches (strategy, user_id, status, parameters)
+    SELECT 'manual', {USER_ID}, 'ready to label', '{{}}' FROM generate_series(1, {BATCH_COUNT})
+    """,
+    f"""
+    INSERT INTO tasks (task_type, task_status)
+    SELECT
+        (enum_range(NULL::task_type))[1 + g % 9],
+        (ARRAY['ready to label', 'error', 'in-process']::batch_status[])[1 + g % 3]
+    FROM generate_series(1, {TASK_COUNT}) g
+    """,
+    f"""
+    INSERT INTO urls (url, name, collector_metadata, outcome)
+    SELECT
+        'https://seed.example.com/' || g,
+        'URL ' || g,
+        '{{}}',
+        (ARRAY['pending', 'pending', 'pending', 'pending', 'pending', 'pending',
+               'submitted', 'validated', 'not relevant', 'error']::url_status[])[1 + g % 10]
+    FROM generate_series(1, {URL_COUNT}) g
+    """,
+    f"""
+    INSERT INTO link_batch_urls (batch_id, url_id)
+    SELECT 1 + g % {BATCH_COUNT}, g FROM generate_series(1, {URL_COUNT}) g
+    """,
+    f"""
+    INSERT INTO link_task_urls (task_id, url_id)
+    SELECT 1 + g % {TASK_COUNT}, g FROM generate_series(1, {URL_COUNT}) g
+    """,
+    f"""
+    INSERT INTO auto_relevant_suggestions (url_id, relevant)
+    SELECT g, g % 4 <> 0 FROM generate_series(2, {URL_COUNT}, 2) g
+    """,
+    f"""
+    INSERT INTO auto_record_type_suggestions (url_id, record_type)
+    SELECT g, 'Other' FROM generate_series(3, {URL_COUNT}, 3) g
+    """,
+    f"""
+    INSERT INTO automated_url_agency_suggestions (url_id, agency_id, is_unknown)
+    SELECT g, 1 + g % {AGENCY_COUNT}, false FROM generate_series(4, {URL_COUNT}, 4) g
+    """,
+    f"""
+    INSERT INTO user_relevant_suggestions (url_id, user_id, suggested_status)
+    SELECT g, {USER_ID}, 'relevant' FROM generate_series(10, {URL_COUNT}, 10) g
+    """,
+    f"""
+    INSERT INTO user_record_type_suggestions (url_id, user_id, record_type)
+    SELECT g, {USER_ID}, 'Other' FROM generate_series(20, {URL_COUNT}, 20) g
+    """,
+    f"""
+    INSERT INTO user_url_agency_suggestions (url_id, user_id, agency_id)
+    SELECT g, {USER_ID}, 1 + g % {AGENCY_COUNT} FROM generate_series(25, {URL_COUNT}, 25) g
+    """,
+    """
+    INSERT INTO html_content_blobs (content_hash, compressed_html)
+    VALUES ('seed', '\\x00')
+    """,
+    f"""
+    INSERT INTO url_compressed_html (url_id, content_hash)
+    SELECT g, 'seed' FROM generate_series(2, {URL_COUNT}, 2) g
+    """,
+    f"""
+    INSERT INTO url_html_content (url_id, content_type, content)
+    SELECT g, 'Title', 'Title ' || g FROM generate_series(2, {URL_COUNT}, 2) g
+    """,
+    f"""
+    INSERT INTO url_checked_for_duplicate (url_id)
+    SELECT g FROM generate_series(1, {URL_COUNT}, 3) g
+    """,
+    f"""
+    INSERT INTO url_probed_for_404 (url_id)
+    SELECT g FROM generate_series(5, {URL_COUNT}, 5) g
+    """,
+    f"""
+    INSERT INTO url_optional_data_source_metadata (url_id, record_formats)
+    SELECT g, ARRAY['CSV'] FROM generate_series(1, {URL_COUNT}, 4) g
+    """,
+    f"""
+    INSERT INTO url_error_info (url_id, task_id, error)
+    SELECT g, 1 + g % {TASK_COUNT}, 'Seed error' FROM generate_series(10, {URL_COUNT}, 10) g
+    """,
+    f"""
+    INSERT INTO duplicates (batch_id, original_url_id)
+    SELECT 1 + g % {BATCH_COUNT}, g FROM generate_series(50, {URL_COUNT}, 50) g
+    """,
+    "ANALYZE",
+]
+
+# The URL used by builders taking one: pending, with HTML and suggestions
+SEED_URL_ID = 100
+
+
+async def get_import_entries() -> AsyncIterator[ManualBatchInnerInputDTO]:
+    for i in range(100):
+        yield ManualBatchInnerInputDTO(url=f"https://import.example.com/{i}")
+
+
+BUILDER_FACTORIES: dict[type[QueryBuilderBase], Callable[[], QueryBuilderBase]] = {
+    GetAnnotationBatchInfoQueryBuilder: lambda: GetAnnotationBatchInfoQueryBuilder(
+        batch_id=1,
+        models=[UserRelevantSuggestion, UserRecordTypeSuggestion, UserUrlAgencySuggestion]
+    ),
+    GetNextURLForUserAnnotationQueryBuilder: lambda: GetNextURLForUserAnnotationQueryBuilder(
+        user_suggestion_model_to_exclude=UserRelevantSuggestion,
+        auto_suggestion_relationship=URL.auto_relevant_suggestion,
+        batch_id=None
+    ),
+    GetAgencySuggestionsQueryBuilder: lambda: GetAgencySuggestionsQueryBuilder(url_id=SEED_URL_ID),
+    GetNextURLAgencyForAnnotationQueryBuilder: lambda: GetNextURLAgencyForAnnotationQueryBuilder(
+        batch_id=None,
+        user_id=USER_ID
+    ),
+    GetNextURLForAllAnnotationQueryBuilder: lambda: GetNextURLForAllAnnotationQueryBuilder(batch_id=None),
+    GetNextUrlForRelevanceAnnotationQueryBuilder: lambda: GetNextUrlForRelevanceAnnotationQueryBuilder(batch_id=None),
+    GetDuplicatesByBatchIDQueryBuilder: lambda: GetDuplicatesByBatchIDQueryBuilder(batch_id=1, page=1),
+    GetURLsByBatchQueryBuilder: lambda: GetURLsByBatchQueryBuilder(batch_id=1),
+    ImportManualBatchQueryBuilder: lambda: ImportManualBatchQueryBuilder(
+        user_id=USER_ID,
+        name="Benchmark import",
+        entries=get_import_entries()
+    ),
+    UploadManualBatchQueryBuilder: lambda: UploadManualBatchQueryBuilder(
+        user_id=USER_ID,
+        dto=ManualBatchInputDTO(
+            name="Benchmark upload",
+            entries=[
+                ManualBatchInnerInputDTO(url=f"https://upload.example.com/{i}")
+                for i in range(100)
+            ]
+        )
+    ),
+    GetBatchesAggregatedMetricsQueryBuilder: lambda: GetBatchesAggregatedMetricsQueryBuilder(),
+    GetBatchesBreakdownMetricsQueryBuilder: lambda: GetBatchesBreakdownMetricsQueryBuilder(page=1),
+    GetTaskPhasesMetricsQueryBuilder: lambda: GetTaskPhasesMetricsQueryBuilder(days=30),
+    ApproveURLQueryBuilder: lambda: ApproveURLQueryBuilder(
+        user_id=USER_ID,
+        approval_info=FinalReviewApprovalInfo(
+            url_id=SEED_URL_ID,
+            record_type=RecordType.OTHER,
+            agency_ids=[1],
+            name="Benchmark name",
+            description="Benchmark description"
+        )
+    ),
+    GetNextURLForFinalReviewQueryBuilder: lambda: GetNextURLForFinalReviewQueryBuilder(),
+    RejectURLQueryBuilder: lambda: RejectURLQueryBuilder(
+        url_id=SEED_URL_ID,
+        user_id=USER_ID,
+        rejection_reason=RejectionReason.NOT_RELEVANT
+    ),
+    GetTaskInfoQueryBuilder: lambda: GetTaskInfoQueryBuilder(task_id=1),
+    GetURLsQueryBuilder: lambda: GetURLsQueryBuilder(page=1, errors=False),
+    GetPendingURLsWithoutAgencySuggestionsQueryBuilder: lambda: GetPendingURLsWithoutAgencySuggestionsQueryBuilder(),
+    GetAutoRelevantTDOsQueryBuilder: lambda: GetAutoRelevantTDOsQueryBuilder(),
+    GetPendingURLsWithoutHTMLDataQueryBuilder: lambda: GetPendingURLsWithoutHTMLDataQueryBuilder(),
+    GetPendingURLsMissingMiscellaneousDataQueryBuilder: lambda: GetPendingURLsMissingMiscellaneousDataQueryBuilder(),
+    HasPendingURsMissingMiscellaneousDataQueryBuilder: lambda: HasPendingURsMissingMiscellaneousDataQueryBuilder(),
+    AnnotationExistsCTEQueryBuilder: lambda: AnnotationExistsCTEQueryBuilder(),
+    GetHTMLContentInfoQueryBuilder: lambda: GetHTMLContentInfoQueryBuilder(url_id=SEED_URL_ID),
+    GetRecentBatchSummariesQueryBuilder: lambda: GetRecentBatchSummariesQueryBuilder(),
+    URLCountsCTEQueryBuilder: lambda: URLCountsCTEQueryBuilder(),
+    InsertURLsQueryBuilder: lambda: InsertURLsQueryBuilder(
+        url_infos=[
+            URLInfo(url=f"https://seed.example.com/{i}" if i % 2 == 0 else f"https://insert.example.com/{i}")
+            for i in range(1, 1001)
+        ],
+        batch_id=1
+    ),
+    GetMetricsURLSAggregatedPendingQueryBuilder: lambda: GetMetricsURLSAggregatedPendingQueryBuilder(),
+    PendingAnnotationExistsCTEQueryBuilder: lambda: PendingAnnotationExistsCTEQueryBuilder(),
+}
+
+WRITE_PATTERN = re.compile(r"\b(INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+EXECUTION_TIME_PATTERN = re.compile(r"Execution Time: ([\d.]+) ms")
+
+
+def get_query_builder_classes() -> set[type[QueryBuilderBase]]:
+    for module_info in pkgutil.walk_packages(src.__path__, "src."):
+        try:
+            importlib.import_module(module_info.name)
+        except ImportError:
+            # Modules with unrelated import errors hold no query builders
+            continue
+
+    def get_subclasses(cls: type) -> set[type]:
+        subclasses = set()
+        for subclass in cls.__subclasses__():
+            subclasses.add(subclass)
+            subclasses |= get_subclasses(subclass)
+        return subclasses
+
+    return get_subclasses(QueryBuilderBase)
+
+
+def get_alembic_config() -> Config:
+    alembic_config = Config("alembic.ini")
+    alembic_config.set_main_option("sqlalchemy.url", get_postgres_connection_string())
+    return alembic_config
+
+
+@contextmanager
+def capture_statements(adb_client: AsyncDatabaseClient, statements: list[tuple[str, Any]]):
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not executemany:
+            statements.append((statement, parameters))
+
+    engine = adb_client.engine.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def run_builder(builder: QueryBuilderBase, session: AsyncSession):
+    # CTE builders have no `run` of their own; select from their CTE instead
+    if type(builder).run is not QueryBuilderBase.run:
+        return await builder.run(session)
+    result = builder.build()
+    if inspect.isawaitable(result):
+        await result
+    return (await session.execute(select(builder.query))).all()
+
+
+async def explain(session: AsyncSession, statement: str, parameters: Any) -> dict:
+    is_write = WRITE_PATTERN.search(statement) is not None
+    options = "" if is_write else "(ANALYZE, BUFFERS) "
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(f"EXPLAIN {options}{statement}", parameters)
+    plan = "\n".join(row[0] for row in result.all())
+    match = EXECUTION_TIME_PATTERN.search(plan)
+    return {
+        "statement": statement,
+        "analyzed": not is_write,
+        "execution_ms": float(match.group(1)) if match else None,
+        "plan": plan
+    }
+
+
+async def benchmark_builder(
+    adb_client: AsyncDatabaseClient,
+    builder_class: type[QueryBuilderBase]
+) -> dict:
+    statements = []
+    async with adb_client.session_maker() as session:
+        builder = BUILDER_FACTORIES[builder_class]()
+        start = time.perf_counter()
+        try:
+            with capture_statements(adb_client, statements):
+                await run_builder(builder, session)
+        except Exception as e:
+            await session.rollback()
+            return {"error": repr(e)}
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        plans = []
+        for statement, parameters in statements:
+            if WRITE_PATTERN.search(statement) is None and not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+                continue
+            plans.append(await explain(session, statement, parameters))
+        await session.rollback()
+    return {
+        "run_ms": duration_ms,
+        "execution_ms": sum(plan["execution_ms"] or 0 for plan in plans),
+        "statements": plans
+    }
+
+
+async def benchmark_all(adb_client: AsyncDatabaseClient, builder_classes: list[type[QueryBuilderBase]]) -> dict:
+    return {
+        builder_class.__name__: await benchmark_builder(adb_client, builder_class)
+        for builder_class in builder_classes
+    }
+
+
+async def seed(adb_client: AsyncDatabaseClient):
+    async with adb_client.engine.begin() as connection:
+        await connection.execute(
+            text(f"TRUNCATE {', '.join(SEED_TABLE_NAMES)} RESTART IDENTITY CASCADE")
+        )
+        for statement in SEED_STATEMENTS:
+            await connection.execute(text(statement))
+
+
+async def clear(adb_client: AsyncDatabaseClient):
+    async with adb_client.engine.begin() as connection:
+        await connection.execute(
+            text(f"TRUNCATE {', '.join(SEED_TABLE_NAMES)} RESTART IDENTITY CASCADE")
+        )
+
+
+def format_ms(result: dict, key: str) -> str:
+    if "error" in result:
+        return "error"
+    return f"{result[key]:.1f}"
+
+
+@pytest.mark.asyncio
+async def test_index_benchmark(adb_client_test: AsyncDatabaseClient):
+    builder_classes = sorted(get_query_builder_classes(), key=lambda cls: cls.__name__)
+    missing = [cls.__name__ for cls in builder_classes if cls not in BUILDER_FACTORIES]
+    assert missing == [], f"Add a factory for each query builder: {missing}"
+
+    alembic_config = get_alembic_config()
+    await seed(adb_client_test)
+    try:
+        await adb_client_test.engine.dispose()
+        command.downgrade(alembic_config, PREVIOUS_REVISION)
+        before = await benchmark_all(adb_client_test, builder_classes)
+
+        await adb_client_test.engine.dispose()
+        command.upgrade(alembic_config, INDEX_REVISION)
+        async with adb_client_test.engine.begin() as connection:
+            await connection.execute(text("ANALYZE"))
+        after = await benchmark_all(adb_client_test, builder_classes)
+    finally:
+        await adb_client_test.engine.dispose()
+        command.upgrade(alembic_config, "head")
+        await clear(adb_client_test)
+
+    OUTPUT_PATH.write_text(
+        json.dumps({"before": before, "after": after}, indent=2)
+    )
+    print(f"\n{'Query builder':<55} {'before run ms':>14} {'after run ms':>13} {'before exec ms':>15} {'after exec ms':>14}")
+    for builder_class in builder_classes:
+        name = builder_class.__name__
+        print(
+            f"{name:<55} "
+            f"{format_ms(before[name], 'run_ms'):>14} {format_ms(after[name], 'run_ms'):>13} "
+            f"{format_ms(before[name], 'execution_ms'):>15} {format_ms(after[name], 'execution_ms'):>14}"
+        )
+    print(f"Plans written to {OUTPUT_PATH.resolve()}")
@@ -0,0 +1,98 @@
+"""
+Compares the set-based `insert_urls` against inserting URLs one at a time,
+as `insert_urls` did before.
+
+Run on its own against a test database, e.g.
+`pytest tests/manual/db/test_insert_urls_benchmark.py -s`
+"""
+import time
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from src.core.enums import BatchStatus
+from src.db.client.async_ import AsyncDatabaseClient
+from src.db.dtos.batch import BatchInfo
+from src.db.dtos.duplicate import DuplicateInsertInfo
+from src.db.dtos.url.core import URLInfo
+
+URL_COUNT = 10_000
+# Share of each batch's URLs which are already in the database
+DUPLICATE_SHARE = 0.1
+
+
+async def insert_urls_one_by_one(
+    adb_client: AsyncDatabaseClient,
+    url_infos: list[URLInfo],
+    batch_id: int
+) -> int:
+    duplicates = []
+    for url_info in url_infos:
+        url_info.batch_id = batch_id
+        try:
+            await adb_client.insert_url(url_info)
+        except IntegrityError:
+            orig_url_info = await adb_client.get_url_info_by_url(url_info.url)
+            duplicates.append(
+                DuplicateInsertInfo(
+                    duplicate_batch_id=batch_id,
+                    original_url_id=orig_url_info.id
+                )
+            )
+    await adb_client.insert_duplicates(duplicates)
+    return len(duplicates)
+
+
+async def insert_batch(adb_client: AsyncDatabaseClient) -> int:
+    return await adb_client.insert_batch(
+        BatchInfo(
+            strategy="manual",
+            status=BatchStatus.IN_PROCESS,
+            parameters={},
+            user_id=1
+        )
+    )
+
+
+def get_url_infos(prefix: str, seed_urls: list[str]) -> list[URLInfo]:
+    duplicate_count = int(URL_COUNT * DUPLICATE_SHARE)
+    urls = seed_urls[:duplicate_count] + [
+        f"https://{prefix}.example.com/{i}"
+        for i in range(URL_COUNT - duplicate_count)
+    ]
+    return [
+        URLInfo(url=url, collector_metadata={"index": i})
+        for i, url in enumerate(urls)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_insert_urls_benchmark(adb_client_test: AsyncDatabaseClient):
+    seed_urls = [
+        f"https://seed.example.com/{i}"
+        for i in range(int(URL_COUNT * DUPLICATE_SHARE))
+    ]
+    await adb_client_test.insert_urls(
+        url_infos=[URLInfo(url=url) for url in seed_urls],
+        batch_id=await insert_batch(adb_client_test)
+    )
+
+    start = time.perf_counter()
+    one_by_one_duplicate_count = await insert_urls_one_by_one(
+        adb_client_test,
+        url_infos=get_url_infos("one-by-one", seed_urls),
+        batch_id=await insert_batch(adb_client_test)
+    )
+    one_by_one_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    insert_urls_info = await adb_client_test.insert_urls(
+        url_infos=get_url_infos("set-based", seed_urls),
+        batch_id=await insert_batch(adb_client_test)
+    )
+    set_based_duration = time.perf_counter() - start
+
+    assert insert_urls_info.duplicate_count == one_by_one_duplicate_count
+    print(f"One by one: {one_by_one_duration:.4f} seconds for {URL_COUNT} URLs")
+    print(f"Set-based: {set_based_duration:.4f} seconds for {URL_COUNT} URLs")
+    print(f"Speedup: {one_by_one_duration / set_based_duration:.1f}x")